@@ -3,6 +3,9 @@
 #include "randomClass.h"
 %}
 %include "std_vector.i"
+%include "pybuffer.i"
+// the random numbers are written in place in a writable buffer (e.g. a numpy array of float64)
+%pybuffer_mutable_binary(double * values, unsigned int size);
 %include "randomClass.h"
 
 namespace std {
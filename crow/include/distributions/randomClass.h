@@ -31,6 +31,7 @@ public:
   ~RandomClass();
   void seed(unsigned int seed);
   double random();
+  void fillRandom(double * values, unsigned int size); ///< fills values with the next size random numbers (same as size calls of random)
 };
 
 #endif /* RANDOMCLASS_H */
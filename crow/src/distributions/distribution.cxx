@@ -81,6 +81,33 @@ BasicDistribution::getVariableNames(){
   return paramtersNames;
 }
 
+std::vector<double>
+BasicDistribution::pdfVector(const std::vector<double> & x){
+  std::vector<double> values(x.size());
+  for (std::size_t i = 0; i < x.size(); i++){
+    values[i] = pdf(x[i]);
+  }
+  return values;
+}
+
+std::vector<double>
+BasicDistribution::cdfVector(const std::vector<double> & x){
+  std::vector<double> values(x.size());
+  for (std::size_t i = 0; i < x.size(); i++){
+    values[i] = cdf(x[i]);
+  }
+  return values;
+}
+
+std::vector<double>
+BasicDistribution::inverseCdfVector(const std::vector<double> & x){
+  std::vector<double> values(x.size());
+  for (std::size_t i = 0; i < x.size(); i++){
+    values[i] = inverseCdf(x[i]);
+  }
+  return values;
+}
+
 double
 BasicDistribution::getRandom(double x)
 {
@@ -34,6 +34,12 @@ double RandomClass::random() {
     return (_rng->_backend()-_rng->_backend.min())/_range;
   }
 
+void RandomClass::fillRandom(double * values, unsigned int size) {
+    for (unsigned int i = 0; i < size; i++){
+      values[i] = (_rng->_backend()-_rng->_backend.min())/_range;
+    }
+  }
+
 RandomClass::~RandomClass(){
   delete _rng;
 }
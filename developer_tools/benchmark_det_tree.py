@@ -0,0 +1,63 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Builds a synthetic DynamicEventTree (every branch ending in two new branches,
+  which are queued and later retrieved by job identifier as the sampler does)
+  and times the branch bookkeeping with the node index of the HierarchicalTree,
+  and with the previous scan of the whole tree for a smaller number of branches.
+  Usage: python benchmark_det_tree.py [numberOfBranches]
+"""
+from __future__ import division, print_function, unicode_literals, absolute_import
+import os
+import sys
+import time
+from collections import deque
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),os.pardir,'framework'))
+sys.path.append(frameworkDir)
+import MessageHandler
+from utils import TreeStructure as TS
+
+def buildTree(messageHandler, numberOfBranches, lookup):
+  """
+    Builds the synthetic tree, retrieving each queued branch with lookup
+    @ In, messageHandler, MessageHandler, the message handler
+    @ In, numberOfBranches, int, the number of branches to create
+    @ In, lookup, function, lookup(tree,name) returns the node of the tree named name
+    @ Out, elapsed, float, the time needed to build the tree
+  """
+  start = time.time()
+  root = TS.HierarchicalNode(messageHandler,'1')
+  tree = TS.HierarchicalTree(messageHandler,root)
+  queue = deque(['1'])
+  created = 1
+  while created < numberOfBranches:
+    parent = lookup(tree,queue.popleft())
+    parent.add('runEnded',True)
+    for branch in range(1,3):
+      name = parent.name + '-' + str(branch)
+      parent.appendBranch(TS.HierarchicalNode(messageHandler,name,{'runEnded':False}))
+      queue.append(name)
+      created += 1
+  return time.time() - start
+
+if __name__ == '__main__':
+  numberOfBranches = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+  mh = MessageHandler.MessageHandler()
+  indexed = buildTree(mh,numberOfBranches,lambda tree, name: tree.getNode(name))
+  print('indexed lookups, {} branches: {:.3f} s'.format(numberOfBranches,indexed))
+  scannedBranches = min(numberOfBranches,5000)
+  scanned = buildTree(mh,scannedBranches,lambda tree, name: list(tree.getrootnode().iter(name))[0])
+  indexed = buildTree(mh,scannedBranches,lambda tree, name: tree.getNode(name))
+  print('scanned lookups, {} branches: {:.3f} s (indexed {:.3f} s)'.format(scannedBranches,scanned,indexed))
@@ -22,6 +22,14 @@ warnings.simplefilter('default',DeprecationWarning)
 
 import os
 import sys
+import hashlib
+import collections
+from utils import utils
+
+## templates already compiled, {digest of the prefix, postfix, delimiters and file contents:(segments, varPlaces, defaults, formats)}
+_compiledTemplates = collections.OrderedDict()
+## number of compiled templates kept (the least recently used are dropped)
+_maxCompiledTemplates = 16
 
 class GenericParser():
   """
@@ -46,15 +54,46 @@ class GenericParser():
     self.acceptFormats = {"d":int,"e":float,"E":float,"f":float,"F":float,"g":float,"G":float}
     self.segments  = {} # segments[inputFile]
     self.printTag = 'GENERIC_PARSER'
+    contents = []
+    digest = hashlib.sha1()
+    for key in [prefix, postfix, defaultDelim, formatDelim]:
+      digest.update((key + '\0').encode('utf-8'))
     for inputFile in self.inputFiles:
       infileName = inputFile.getFilename()#os.path.basename(inputFile)
-      self.segments[infileName] = []
       if not os.path.exists(inputFile.getAbsFile()):
         ## Make sure to cast the inputFile to a string as it may be File object.
         raise IOError('Input file not found: ' + str(inputFile))
-      seg = ''
       lines = inputFile.readlines()
       inputFile.close()
+      contents.append((infileName, lines))
+      digest.update((infileName + '\0' + ''.join(lines) + '\0').encode('utf-8'))
+    # the templates are compiled once: the input files of the samples of a step only differ by the values
+    #   written in the wildcards, after this parsing
+    digest = digest.hexdigest()
+    if digest in _compiledTemplates:
+      template = _compiledTemplates.pop(digest)
+    else:
+      self.__compile(contents, defaultDelim, formatDelim)
+      template = self.segments, self.varPlaces, self.defaults, self.formats
+      while len(_compiledTemplates) >= _maxCompiledTemplates:
+        _compiledTemplates.popitem(last=False)
+    _compiledTemplates[digest] = template
+    segments, self.varPlaces, self.defaults, self.formats = template
+    # the substitutions are written in a copy of the segments (the rest of the template is read only)
+    self.segments = dict((infileName, list(segs)) for infileName, segs in segments.items())
+
+  def __compile(self, contents, defaultDelim, formatDelim):
+    """
+      Parses the input files, splitting them in segments at the wildcards (the segments of the wildcards
+      hold the variable names, they are replaced by the values in modifyInternalDictionary)
+      @ In, contents, list, list of (filename, list of lines) of the input files
+      @ In, defaultDelim, string, the string used between prefix and postfix to set default values
+      @ In, formatDelim, string, the string used between prefix and postfix to set the format of the value
+      @ Out, None
+    """
+    for infileName, lines in contents:
+      self.segments[infileName] = []
+      seg = ''
       for line in lines:
         while self.prefixKey in line and self.postfixKey in line:
           self.segments[infileName].append(seg)
@@ -120,7 +159,7 @@ class GenericParser():
     self.adlDict = Kwargs.get('additionalEdits',{})
     ioVars = []
     for value in self.adlDict.values():
-      if type(value)==dict:
+      if utils.isAMapping(value):
         for k in value.keys():
           ioVars.append(k)
       elif type(value)==list:
@@ -128,33 +167,40 @@ class GenericParser():
           ioVars.append(v)
       else:
         ioVars.append(value)
-    for var in self.varPlaces.keys():
-      for inputFile in self.segments.keys():
-        for place in self.varPlaces[var][inputFile] if inputFile in self.varPlaces[var].keys() else []:
-          if var in modDict.keys():
-            if var in self.formats.keys():
-              if inputFile in self.formats[var].keys():
-                if any(formVal in self.formats[var][inputFile][0] for formVal in self.acceptFormats.keys()):
-                  formatstringc = "{:"+self.formats[var][inputFile][0].strip()+"}"
-                  self.segments[inputFile][place] = formatstringc.format(self.formats[var][inputFile][1](modDict[var]))
-                else:
-                  self.segments[inputFile][place] = str(modDict[var]).strip().rjust(self.formats[var][inputFile][1](self.formats[var][inputFile][0]))
-            else:
-              self.segments[inputFile][place] = str(modDict[var])
-          elif var in self.defaults.keys():
-            if var in self.formats.keys():
-              if inputFile in self.formats[var].keys():
-                if any(formVal in self.formats[var][inputFile][0] for formVal in self.acceptFormats.keys()):
-                  formatstringc = "{:"+self.formats[var][inputFile][0].strip()+"}"
-                  self.segments[inputFile][place] = formatstringc.format(self.formats[var][inputFile][1](self.defaults[var][inputFile]))
-                else:
-                  self.segments[inputFile][place] = str(self.defaults[var][inputFile]).strip().rjust(self.formats[var][inputFile][1](self.formats[var][inputFile][0]))
-            else:
-              self.segments[inputFile][place] = self.defaults[var][inputFile]
-          elif var in ioVars:
-            continue #this gets handled in writeNewInput
-          else:
-            raise IOError('Generic Parser: Variable '+var+' was not sampled and no default given!')
+    for var, filePlaces in self.varPlaces.items():
+      for inputFile, places in filePlaces.items():
+        if var in modDict.keys():
+          value = self.__formatValue(var, inputFile, modDict[var], str(modDict[var]))
+        elif var in self.defaults.keys() and inputFile in self.defaults[var].keys():
+          value = self.__formatValue(var, inputFile, self.defaults[var][inputFile], self.defaults[var][inputFile])
+        elif var in ioVars:
+          continue #this gets handled in writeNewInput
+        else:
+          raise IOError('Generic Parser: Variable '+var+' was not sampled and no default given!')
+        if value is not None:
+          # the value is formatted once and written in all the places of the variable
+          for place in places:
+            self.segments[inputFile][place] = value
+
+  def __formatValue(self, var, inputFile, value, unformatted):
+    """
+      Formats the value of a variable as requested by its wildcards in an input file
+      @ In, var, string, the variable
+      @ In, inputFile, string, the input file name
+      @ In, value, object, the value
+      @ In, unformatted, string, the text used if no format is given for the variable
+      @ Out, text, string, the text to write in the input file (None if the variable is formatted in the
+        other input files only, then it is left as is)
+    """
+    if var not in self.formats.keys():
+      return unformatted
+    if inputFile not in self.formats[var].keys():
+      return None
+    varFormat, formatType = self.formats[var][inputFile]
+    if any(formVal in varFormat for formVal in self.acceptFormats.keys()):
+      formatstringc = "{:"+varFormat.strip()+"}"
+      return formatstringc.format(formatType(value))
+    return str(value).strip().rjust(formatType(varFormat))
 
   def writeNewInput(self,inFiles,origFiles):
     """
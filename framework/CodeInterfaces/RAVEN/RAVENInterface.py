@@ -202,7 +202,7 @@ class RAVEN(CodeInterfaceBase):
         # call conversion
         newVars = module.convertNotScalarSampledVariables(varVals)
         # check type
-        if type(newVars).__name__ != 'dict':
+        if not utils.isAMapping(newVars):
           raise IOError(self.printTag+' ERROR: convertNotScalarSampledVariables in "{}" must return a dictionary!'.format(source))
         # apply new and/or updated values
         modifDict.update(newVars)
@@ -23,6 +23,9 @@ warnings.simplefilter('default',DeprecationWarning)
 #End compatibility block for Python 3----------------------------------------------------------------
 
 import copy
+import re
+import keyword
+import operator
 
 def execCommandReturn(commandString,self=None,object=None):
   """
@@ -44,3 +47,60 @@ def execCommand(commandString,self=None,object=None):
     @ Out, None
   """
   exec(commandString)
+
+## binders of the attributes, resolved once per name, {name:function}
+_attributeSetters = {}
+_attributeGetters = {}
+_attributePath = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*$')
+
+def _isAttributePath(name):
+  """
+    Checks if a name is a (dotted) path of attributes, e.g. "a" or "a.b"
+    @ In, name, string, the name
+    @ Out, isPath, bool, True if all the parts of the name are identifiers
+  """
+  return _attributePath.match(name) is not None and not any(keyword.iskeyword(part) for part in name.split('.'))
+
+def attributeSetter(name):
+  """
+    Returns a function that sets the attribute "name" of an instance, equivalent to
+    execCommand('self.'+name+' = object', self=instance, object=value) but resolved once per name
+    @ In, name, string, the attribute name (e.g. "x", or "a.b" to set the attribute b of self.a)
+    @ Out, setter, function(instance, value), the setter (SyntaxError if name can not be an attribute)
+  """
+  if name not in _attributeSetters:
+    if _isAttributePath(name):
+      parent, _, attribute = name.rpartition('.')
+      if parent:
+        parentGetter = operator.attrgetter(parent)
+        setter = lambda instance, value: setattr(parentGetter(instance), attribute, value)
+      else:
+        setter = lambda instance, value: setattr(instance, attribute, value)
+    else:
+      code = compile('self.' + name + ' = object', '<string>', 'exec')
+      def setter(instance, value):
+        """
+          Sets the attribute through the compiled statement
+          @ In, instance, object, the instance
+          @ In, value, object, the value
+          @ Out, None
+        """
+        exec(code, globals(), {'self':instance, 'object':value})
+    _attributeSetters[name] = setter
+  return _attributeSetters[name]
+
+def attributeGetter(name):
+  """
+    Returns a function that gets the attribute "name" of an instance, equivalent to
+    execCommandReturn('self.'+name, self=instance) but resolved once per name
+    @ In, name, string, the attribute name (e.g. "x" or "a.b")
+    @ Out, getter, function(instance), the getter (SyntaxError if name can not be an attribute)
+  """
+  if name not in _attributeGetters:
+    if _isAttributePath(name):
+      getter = operator.attrgetter(name)
+    else:
+      code = compile('self.' + name, '<string>', 'eval')
+      getter = lambda instance: eval(code, globals(), {'self':instance})
+    _attributeGetters[name] = getter
+  return _attributeGetters[name]
@@ -125,7 +125,7 @@ class DataObject(utils.metaclass_insert(abc.ABCMeta,BaseType)):
     self._data            = None   # underlying data structure
     self._collector       = None   # object used to collect samples
 
-    self._inputKDTree     = None   # for finding outputs given inputs (pointset only?)
+    self._realizationIndex = None  # for finding realizations given values, built on first search (see DataSet.realization)
     self._scaleFactors    = None   # scaling factors inputs as {var:(mean,scale)}
     self.hierarchical     = False  # this flag controls the printing/plotting of the dataobject
                                    #   in case it is an hierarchical one.
@@ -42,7 +42,7 @@ try:
 except ValueError:
   from DataObject import DataObject
 from Files import StaticXMLOutput
-from utils import utils, cached_ndarray, InputData, xmlUtils, mathUtils
+from utils import utils, cached_ndarray, InputData, xmlUtils, mathUtils, realizationIndex
 
 # for profiling with kernprof
 try:
@@ -88,7 +88,6 @@ class DataSet(DataObject):
     self.type             = 'DataSet'
     self.types            = None             # list of type objects, for each realization entry
     self.printTag         = self.name
-    self.defaultDtype     = object
     self._scaleFactors    = {}               # mean, sigma for data for matching purposes
     self._alignedIndexes  = {}               # dict {index:values} of indexes with aligned coordinates (so they are not in the collector, but here instead)
     self._neededForReload = [self.sampleTag] # metavariables required to reload this data object.
@@ -162,7 +161,7 @@ class DataSet(DataObject):
     for target in xmlDict.keys():
       for metric,value in xmlDict[target].items():
         # Two options: if a dict is given, means vectorMetric case
-        if isinstance(value,dict):
+        if utils.isAMapping(value):
           destination.addVector(target,metric,value)
         # Otherwise, scalarMetric
         else:
@@ -181,50 +180,20 @@ class DataSet(DataObject):
                          "val" is a np.ndarray of values.
       @ Out, None
     """
-    # protect against back-changing realization
-    rlz = copy.deepcopy(rlz)
-    # clean out entries that aren't desired
-    try:
-      rlz = dict((var,rlz[var]) for var in self.getVars()+self.indexes)
-    except KeyError as e:
-      self.raiseADebug('Variables provided:',rlz.keys())
-      self.raiseAnError(KeyError,'Provided realization does not have all requisite values for object "{}": "{}"'.format(self.name,e.args[0]))
-    # check consistency, but make it an assertion so it can be passed over
-    if not self._checkRealizationFormat(rlz):
-      self.raiseAnError(SyntaxError,'Realization was not formatted correctly for "{}"! See warnings above.'.format(self.name))
-    # format the data
-    rlz = self._formatRealization(rlz)
-    ## establish types if not done yet
-    self._setDataTypes(rlz)
-    # perform selective collapsing/picking of data
-    rlz = self._selectiveRealization(rlz)
-
-    ## check alignment of indexes
-    self._checkAlignedIndexes(rlz)
-    #  NB If no scalar entry is made, this construction fails.  In that case,
-    #  instead of treating each dataarrray as an object, numpy.asarray calls their asarray methods,
-    #  unfolding them and making a full numpy array with more dimensions, instead of effectively
-    #  a list of realizations, where each realization is effectively a list of xr.DataArray objects.
-    #
-    #  To mitigate this behavior, we forcibly add a [0.0] entry to each realization, then exclude
-    #  it once the realizations are constructed.  This seems like an innefficient option; others
-    #  should be explored.  - talbpaul, 12/2017
-    # newData is a numpy array of realizations,
-    #   each of which is a numpy array of some combination of scalar values and/or xr.DataArrays.
-    #   This is because the cNDarray collector expects a LIST of realization, not a single realization.
-    #   Maybe the "append" method should be renamed to "extend" or changed to append one at a time.
-    ## set realizations as a list of realizations (which are ordered lists)
-    newData = np.array(list(rlz[var] for var in self._orderedVars)+[0.0],dtype=object)
-    newData = newData[:-1]
-    # if data storage isn't set up, set it up
-    if self._collector is None:
-      self._collector = self._newCollector(width=len(rlz))
-    # append
-    self._collector.append(newData)
+    self._appendRealization(self._prepareRealization(rlz))
+    # reset scaling factors
+    self._resetScaling()
 
-    # if hierarchical, clear the parent as an ending
-    self._clearParentEndingStatus(rlz)
-    # reset scaling factors, kd tree
+  def addRealizations(self,rlzs):
+    """
+      Adds several "rows" (or "samples") to this data object, for example the realizations of a batch evaluation.
+      Equivalent to calling addRealization for each realization, in order.
+      @ In, rlzs, list(dict), realizations in the format of addRealization
+      @ Out, None
+    """
+    for rlz in rlzs:
+      self._appendRealization(self._prepareRealization(rlz))
+    # reset scaling factors
     self._resetScaling()
 
   def addVariable(self,varName,values,classify='meta'):
@@ -327,6 +296,34 @@ class DataSet(DataObject):
     obj.rename(name)
     return obj
 
+  def getChunk(self,variables,start,end):
+    """
+      Casts a range of realizations of this data object as an xr.Dataset. Unlike asDataset, the collected
+      realizations are not collapsed into the data of this object, so that the whole data object is never cast
+      at once when it is read a chunk at a time.
+      @ In, variables, list(str), the variables to include (their indexes are included as coordinates)
+      @ In, start, int, the first realization of the chunk
+      @ In, end, int, the realization following the last one of the chunk
+      @ Out, chunk, xr.Dataset, the realizations of the chunk
+    """
+    end = min(end,len(self))
+    assert(0 <= start < end)
+    numData = len(self._data[self.sampleTag]) if self._data is not None else 0
+    parts = []
+    # realizations already cast (a view of the data)
+    if start < numData:
+      parts.append(self._data[variables].isel(**{self.sampleTag:slice(start,min(end,numData))}))
+    # realizations still in the collector, only this range is cast
+    if end > numData:
+      first = max(start,numData)
+      arrays = self._convertCollectorToArrays(variables,first-numData,end-numData)
+      for var in arrays:
+        arrays[var][self.sampleTag] += first
+      parts.append(xr.Dataset(arrays))
+    if len(parts) == 1:
+      return parts[0]
+    return xr.concat(parts,dim=self.sampleTag)
+
   def getDimensions(self,var=None):
     """
       Provides the independent dimensions that this variable depends on.
@@ -435,6 +432,8 @@ class DataSet(DataObject):
     # if fileToLoad in kwargs, then filename is actualle fileName/fileToLoad
     if 'fileToLoad' in kwargs.keys():
       dataIn = kwargs['fileToLoad'].getAbsFile()
+    # any existing search index is no longer valid
+    self._realizationIndex = None
     # load based on style for loading
     if style == 'netcdf':
       self._fromNetCDF(dataIn,**kwargs)
@@ -443,6 +442,8 @@ class DataSet(DataObject):
       if dataIn.endswith('.csv'):
         dataIn = dataIn[:-4]
       self._fromCSV(dataIn,**kwargs)
+    elif style == 'packed':
+      self._fromPacked(dataIn,**kwargs)
     elif style == 'dict':
       self._fromDict(dataIn,**kwargs)
     elif style == 'dataset':
@@ -465,7 +466,6 @@ class DataSet(DataObject):
       @ Out, index, int, optional, index where found (or len(self) if not found), only returned if matchDict
       @ Out, rlz, dict, realization requested (None if not found)
     """
-    # TODO convert input space to KD tree for faster searching -> XArray.DataArray has this built in?
     ## first, check that some direction was given, either an index or a match to find
     if (index is None and matchDict is None) or (index is not None and matchDict is not None):
       self.raiseAnError(TypeError,'Either "index" OR "matchDict" (not both) must be specified to use "realization!"')
@@ -504,7 +504,19 @@ class DataSet(DataObject):
     ## END select by index
     ## START collect by matching realization
     else: # matchDict must not be None
-      # if nothing in data, try collector
+      # if nothing in data OR collector, we can't have a match
+      if numInData + numInCollector == 0:
+        return 0,None
+      # use the search index if all the requested variables can be indexed
+      index = self._getRealizationIndexByValue(matchDict,tol=tol)
+      if index is not None:
+        if index >= len(self):
+          return index,None
+        elif index < numInData:
+          return index,self._getRealizationFromDataByIndex(index,unpackXArray)
+        else:
+          return index,self._getRealizationFromCollectorByIndex(index - numInData)
+      # otherwise, search directly
       if numInData == 0:
         # if nothing in data OR collector, we can't have a match
         if numInCollector == 0:
@@ -561,8 +573,9 @@ class DataSet(DataObject):
 
     if self._scaleFactors is not None:
       self._scaleFactors.pop(variable,None)
-    #either way reset kdtree
-    self.inputKDTree = None
+    # either way, stop searching on it
+    if self._realizationIndex is not None:
+      self._realizationIndex.forget(variable)
 
   def renameVariable(self,old,new):
     """
@@ -596,6 +609,8 @@ class DataSet(DataObject):
     # change scaling factor entry
     if old in self._scaleFactors:
       self._scaleFactors[new] = self._scaleFactors.pop(old)
+    # search index is keyed by the old name, so start over
+    self._realizationIndex = None
     if self._data is not None:
       self._data.rename({old:new},inplace=True)
 
@@ -611,6 +626,7 @@ class DataSet(DataObject):
     self._meta = {}
     self._alignedIndexes = {}
     self._scaleFactors = {}
+    self._realizationIndex = None
 
   def sliceByIndex(self,index):
     """
@@ -654,6 +670,11 @@ class DataSet(DataObject):
       # then the metaxml
       if 'DataSet' in self._meta.keys():
         self._toCSVXML(fileName,**kwargs)
+    elif style.lower() == 'packed':
+      if len(self.asDataset().variables)==0:
+        self.raiseAWarning('Nothing to write!')
+        return
+      self._toPacked(fileName,**kwargs)
     # TODO dask?
     else:
       self.raiseAnError(NotImplementedError,'Unrecognized write style: "{}"'.format(style))
@@ -715,6 +736,23 @@ class DataSet(DataObject):
     return list(self._pivotParams.keys())
 
   ### INTERNAL USE FUNCTIONS ###
+  def _appendRealization(self,rlz):
+    """
+      Appends a realization, already formatted by _prepareRealization, to the collector.
+      @ In, rlz, dict, {var:val} formatted realization
+      @ Out, None
+    """
+    # if data storage isn't set up, set it up
+    if self._collector is None:
+      self._collector = self._newCollector(width=len(rlz))
+    # append, each variable goes in its own (typed) column
+    self._collector.append(list(rlz[var] for var in self._orderedVars))
+    # keep the search index (if any) up to date
+    if self._realizationIndex is not None:
+      self._realizationIndex.append(rlz)
+    # if hierarchical, clear the parent as an ending
+    self._clearParentEndingStatus(rlz)
+
   def _changeVariableValue(self,index,var,value):
     """
       Changes the value of a variable for a particular realization in the data object, in collector or data.
@@ -734,9 +772,11 @@ class DataSet(DataObject):
       self._data[var].values[index] = value
     # if it's in the collector ...
     elif index < lenColl + lenData:
-      self._collector[index][self._orderedVars.index(var)] = value
+      self._collector.setValue(index-lenData,self._orderedVars.index(var),value)
     else:
       self.raiseAnError(IndexError,'Requested value change for realization "{}", which is past the end of the data object!'.format(index))
+    if self._realizationIndex is not None:
+      self._realizationIndex.setValue(index,var,value)
 
   def _checkAlignedIndexes(self,rlz,tol=1e-15):
     """
@@ -791,7 +831,7 @@ class DataSet(DataObject):
       @ In, rlz, dict, realization with {key:value} pairs.
       @ Out, okay, bool, True if acceptable or False if not
     """
-    if not isinstance(rlz,dict):
+    if not utils.isAMapping(rlz):
       self.raiseAWarning('Realization is not a "dict" instance!')
       return False
     for key,value in rlz.items():
@@ -880,7 +920,7 @@ class DataSet(DataObject):
     # method = 'once' # see below, parallelization is possible but not implemented
     # first case: single entry per node: floats, strings, ints, etc
     if mathUtils.isSingleValued(data[i]):
-      data = np.array(data,dtype=dataType)
+      data = np.asarray(data,dtype=dataType)
       array = xr.DataArray(data,
                            dims=[self.sampleTag],
                            coords={self.sampleTag:labels},
@@ -1039,7 +1079,8 @@ class DataSet(DataObject):
     """
       Casts this dataobject as an xr.Dataset and returns a REFERENCE to the underlying data structure.
       Functionally, typically collects the data from self._collector and places it in self._data.
-      Efficiency note: this is the slowest part of typical data collection.
+      The collector stores each variable in its own column, so that scalars and aligned histories are
+      turned into xr.DataArrays without copying the data when the types match.
       @ In, None
       @ Out, xarray.Dataset, all the data from this data object.
     """
@@ -1048,62 +1089,9 @@ class DataSet(DataObject):
     if self._collector is not None and len(self._collector) > 0:
       # keep track of the first sampling index, if we already have some samples (otherwise 0)
       firstSample = int(self._data[self.sampleTag][-1])+1 if self._data is not None else 0
-      # storage array for each variable's xr.DataArray with all rlz data from every rlz
-      arrays = {}
-      # loop over variables IN ORDER of collector storage to collapse data into nice xr.DataArray of realization data
-      for v,var in enumerate(self._orderedVars):
-        # only converting variables, so ignore indexes (they'll be used by the variables)
-        if var in self.indexes:
-          continue
-        # gather the data type from first realization: if np.array, it's ND; otherwise singular
-        dtype = self.types[v]
-        if isinstance(self._collector[0,v],np.ndarray):
-          # for each index, determine if all aligned; make data arrays as required
-          dims = self.getDimensions(var)[var]
-          # make sure "dims" isn't polluted
-          assert(self.sampleTag not in dims)
-          # TODO not ready for ND; this only uses single-dependency cases, but should be easily extensible
-          if len(dims) > 1:
-            self.raiseAnError(NotImplementedError,'Currently cannot handle more than 1 pivot per variable')
-          # loop over indexes (just one for now) and create data
-          for index in dims:
-            # if aligned, grab the data into one large chunk and make a datarray with all rlzs
-            if index in self._alignedIndexes.keys():
-              data = np.vstack(self._collector[:,v]).astype(dtype)
-              coords = dict((idx,self._alignedIndexes[idx]) for idx in dims)
-              arrays[var] = self.constructNDSample(data,dims=[self.sampleTag]+dims,coords=coords)
-            # otherwise, we're better off making one dataarray for each rlz, then collapsing
-            else:
-              # first make a datarray out of each realization value
-              for r in range(len(self._collector)):
-                values = self._collector[r,v]
-                dtype = self._getCompatibleType(values[0])
-                values = np.array(values,dtype=dtype)
-                coords = dict((idx,self._collector[r,self._orderedVars.index(idx)]) for idx in dims)
-                self._collector[r][v] = self.constructNDSample(values,dims,coords,name=str(r))
-              # then collapse these entries into a single datarray
-              arrays[var] = self._collapseNDtoDataArray(self._collector[:,v],var,dtype=dtype)
-        # if it's a dataarray, then that's old-style histories, no-can do right now
-        elif isinstance(self._collector[0,v],xr.DataArray):
-          self.raiseAnError(NotImplementedError,'History entries should be numpy arrays, not data arrays!')
-        # if not ND, then it's a simple data array construction
-        else:
-          try:
-            varData = np.array(self._collector[:,v],dtype=dtype)
-          except ValueError as e:
-            # infinte/missing data can't be cast to anything but floats or objects, as far as I can tell
-            if dtype != float and pd.isnull(self._collector[:,v]).sum() != 0:
-              self.raiseAWarning('NaN detected, but no safe casting NaN to "{}" so switching to "object" type. '.format(dtype) \
-                  + ' This may cause problems with other entities in RAVEN.')
-              varData = self._collector[:,v][:]
-              dtype=object
-            # otherwise, let error be raised.
-            else:
-              raise e
-          # create single dataarrays
-          arrays[var] = self._collapseNDtoDataArray(varData,var,dtype=dtype)
-        # END if for variable data type (ndarray, xarray, or scalar)
-        # re-index samples
+      arrays = self._convertCollectorToArrays()
+      # re-index samples
+      for var in arrays:
         arrays[var][self.sampleTag] += firstSample
       # collect all data into dataset, and update self._data
       self._convertArrayListToDataset(arrays,action='extend')
@@ -1117,6 +1105,82 @@ class DataSet(DataObject):
       self._clearAlignment()
     return self._data
 
+  def _convertCollectorToArrays(self,variables=None,start=0,end=None):
+    """
+      Casts the realizations stored in self._collector (or a range of them) as one xr.DataArray for each variable.
+      The collector stores each variable in its own column, so that scalars and aligned histories are
+      turned into xr.DataArrays without copying the data when the types match.
+      @ In, variables, list(str), optional, the variables to convert (all if None)
+      @ In, start, int, optional, the first realization of the collector to convert
+      @ In, end, int, optional, the realization following the last one to convert (all the following ones if None)
+      @ Out, arrays, dict, {var:xr.DataArray} the data of each variable, the realizations being numbered from 0
+        along the sample tag (see the re-indexing of the callers)
+    """
+    # storage array for each variable's xr.DataArray with all rlz data from every rlz
+    arrays = {}
+    # loop over variables IN ORDER of collector storage to collapse data into nice xr.DataArray of realization data
+    for v,var in enumerate(self._orderedVars):
+      # only converting variables, so ignore indexes (they'll be used by the variables)
+      if var in self.indexes or (variables is not None and var not in variables):
+        continue
+      # gather the data type from first realization: if np.array, it's ND; otherwise singular
+      dtype = self.types[v]
+      first = self._collector.getValue(start,v)
+      if isinstance(first,np.ndarray):
+        # for each index, determine if all aligned; make data arrays as required
+        dims = self.getDimensions(var)[var]
+        # make sure "dims" isn't polluted
+        assert(self.sampleTag not in dims)
+        # TODO not ready for ND; this only uses single-dependency cases, but should be easily extensible
+        if len(dims) > 1:
+          self.raiseAnError(NotImplementedError,'Currently cannot handle more than 1 pivot per variable')
+        # loop over indexes (just one for now) and create data
+        for index in dims:
+          # if aligned, the collector already has the data in one large chunk, make a datarray with all rlzs
+          if index in self._alignedIndexes.keys():
+            data = self._collector.getStacked(v,start,end)
+            if data is None:
+              data = np.vstack(self._collector.getColumn(v,start,end))
+            data = data.astype(dtype,copy=False)
+            coords = dict((idx,self._alignedIndexes[idx]) for idx in dims)
+            arrays[var] = self.constructNDSample(data,dims=[self.sampleTag]+dims,coords=coords)
+          # otherwise, we're better off making one dataarray for each rlz, then collapsing
+          else:
+            # first make a datarray out of each realization value
+            samples = self._collector.getColumn(v,start,end)
+            indexValues = dict((idx,self._collector.getColumn(self._orderedVars.index(idx),start,end)) for idx in dims)
+            for r in range(len(samples)):
+              values = samples[r]
+              dtype = self._getCompatibleType(values[0])
+              values = np.array(values,dtype=dtype)
+              coords = dict((idx,indexValues[idx][r]) for idx in dims)
+              samples[r] = self.constructNDSample(values,dims,coords,name=str(r))
+            # then collapse these entries into a single datarray
+            arrays[var] = self._collapseNDtoDataArray(samples,var,dtype=dtype)
+      # if it's a dataarray, then that's old-style histories, no-can do right now
+      elif isinstance(first,xr.DataArray):
+        self.raiseAnError(NotImplementedError,'History entries should be numpy arrays, not data arrays!')
+      # if not ND, then it's a simple data array construction
+      else:
+        column = self._collector.getColumn(v,start,end)
+        try:
+          # no copy if the column already has the right type
+          varData = np.asarray(column,dtype=dtype)
+        except ValueError as e:
+          # infinte/missing data can't be cast to anything but floats or objects, as far as I can tell
+          if dtype != float and pd.isnull(column).sum() != 0:
+            self.raiseAWarning('NaN detected, but no safe casting NaN to "{}" so switching to "object" type. '.format(dtype) \
+                + ' This may cause problems with other entities in RAVEN.')
+            varData = np.asarray(column,dtype=object)
+            dtype=object
+          # otherwise, let error be raised.
+          else:
+            raise e
+        # create single dataarrays
+        arrays[var] = self._collapseNDtoDataArray(varData,var,dtype=dtype)
+      # END if for variable data type (ndarray, xarray, or scalar)
+    return arrays
+
   def _formatRealization(self,rlz):
     """
       Formats realization without truncating data
@@ -1262,22 +1326,9 @@ class DataSet(DataObject):
                                   self.name.strip(),'":',",".join(missing))
     # set orderedVars to all vars, for now don't be fancy with alignedIndexes
     self._orderedVars = self.vars + self.indexes
-    # make a collector from scratch
-    rows = len(utils.first(source.values()))
-    cols = len(self._orderedVars)
-    # can this for-loop be done in a comprehension?  The dtype seems to be a bit of an issue.
-    data = np.zeros([rows,cols],dtype=object)
-    for v,var in enumerate(self._orderedVars):
-      if len(source[var].shape) > 1:
-        # we can't set all at once, because the user gave us an ND array instead of a np.array(dtype=object) of np.array.
-        #    if we try -> ValueError: "could not broadcast input array from shape (#rlz,#time) into shape (#rlz)
-        for i in range(len(data)):
-          data[i,v] = source[var][i]
-      else:
-        # we can set it at once, the fast way.
-        data[:,v] = source[var]
-    # set up collector as cached nd array of values -> TODO might be some wasteful copying here
-    self._collector = cached_ndarray.cNDarray(values=data,dtype=object)
+    # make a collector from scratch, using copies of the provided arrays as columns
+    #   histories can be given as a np.array(dtype=object) of np.array or as an ND array (#rlz,#time)
+    self._collector = cached_ndarray.cColumnarArray.fromColumns(list(np.array(source[var]) for var in self._orderedVars))
     # set datatypes for each variable
     rlz = self.realization(index=0)
     self._setDataTypes(rlz)
@@ -1301,6 +1352,15 @@ class DataSet(DataObject):
     for key,val in self._data.attrs.items():
       self._meta[key] = pk.loads(val.encode('utf-8'))
 
+  def _fromPacked(self,fileName,**kwargs):
+    """
+      Reads this data object from a packed file (only available for histories, see HistorySet).
+      @ In, fileName, str, path/name to read file
+      @ In, kwargs, dict, optional, additional arguments
+      @ Out, None
+    """
+    self.raiseAnError(NotImplementedError,'The packed style is only available for HistorySet data objects!')
+
   def _fromXarrayDataset(self,dataset):
     """
     """
@@ -1362,6 +1422,25 @@ class DataSet(DataObject):
       _type = object
     return _type
 
+  def _getMatchScaling(self,var):
+    """
+      Obtains the shift and scale used to compare float values of a variable when matching realizations.
+      @ In, var, str, name of variable
+      @ Out, loc, float, shift
+      @ Out, scale, float, scale
+    """
+    try:
+      loc,scale = self._scaleFactors[var]
+    except KeyError: # IndexError?
+      # variable doesn't have a scale factor (yet? Why not?)
+      loc = 0.0
+      scale = 1.0
+    if scale == 0:
+      # TODO: Seem to me, we need to find a better way to compare data
+      # The scale will be zero if Grid Sampler is used, reset to 1.0
+      scale = 1.0
+    return loc,scale
+
   def _getRealizationFromCollectorByIndex(self,index):
     """
       Obtains a realization from the collector storage using the provided index.
@@ -1370,7 +1449,7 @@ class DataSet(DataObject):
     """
     assert(self._collector is not None)
     assert(index < len(self._collector))
-    rlz = dict(zip(self._orderedVars,self._collector[index]))
+    rlz = dict(zip(self._orderedVars,self._collector.getRow(index)))
     # don't forget the aligned indices! If indexes stored there instead of in collector, retrieve them
     for var,vals in self._alignedIndexes.items():
       rlz[var] = vals
@@ -1385,10 +1464,10 @@ class DataSet(DataObject):
       @ Out, rlz, dict, realization as {var:value} OR None if not found
     """
     assert(self._collector is not None)
-    # TODO KD Tree for faster values -> still want in collector?
-    # TODO slow double loop
+    # NOTE this is the unindexed search; see _getRealizationIndexByValue
     lookingFor = list(toMatch.values())
-    for r,row in enumerate(self._collector[:,tuple(self._orderedVars.index(var) for var in toMatch.keys())]):
+    columns = list(self._collector.getColumn(self._orderedVars.index(var)) for var in toMatch.keys())
+    for r,row in enumerate(zip(*columns)):
       match = True
       for e,element in enumerate(row):
         # check for matching based on if a number or not
@@ -1430,25 +1509,13 @@ class DataSet(DataObject):
       @ Out, rlz, dict, realization as {var:value} OR None if not found
     """
     assert(self._data is not None)
-    # TODO this could be slow, should do KD tree instead
+    # NOTE this is the unindexed search; see _getRealizationIndexByValue
     mask = 1.0
     for var,val in match.items():
       # float instances are relative, others are absolute
       if mathUtils.isAFloatOrInt(val):
         # scale if we know how
-        try:
-          loc,scale = self._scaleFactors[var]
-        #except TypeError:
-        #  # self._scaleFactors is None, so set them
-        #  self._setScalingFactors(var)
-        except KeyError: # IndexError?
-        # variable doesn't have a scale factor (yet? Why not?)
-          loc = 0.0
-          scale = 1.0
-        if scale == 0:
-          # TODO: Seem to me, we need to find a better way to compare data
-          # The scale will be zero if Grid Sampler is used, reset to 1.0
-          scale = 1.0
+        loc,scale = self._getMatchScaling(var)
         scaleVal = (val-loc)/scale
         # create mask of where the dataarray matches the desired value
         mask *= abs((self._data[var]-loc)/scale - scaleVal) < tol
@@ -1461,6 +1528,57 @@ class DataSet(DataObject):
       return len(self),None
     return idx,self._getRealizationFromDataByIndex(idx,unpackXArray)
 
+  def _getRealizationIndexByValue(self,toMatch,tol=1e-15):
+    """
+      Finds the first realization matching the provided values using the search index, which is built on the
+      first search and then maintained as realizations are added.
+      Matches are judged as in _getRealizationFromDataByValue for realizations in the data and
+      as in _getRealizationFromCollectorByValue for realizations in the collector.
+      @ In, toMatch, dict, elements to match
+      @ In, tol, float, optional, tolerance to which match should be made
+      @ Out, index, int, index where match was found OR size of data if not found OR None if the
+                         requested variables can't be indexed (e.g. they are not scalars)
+    """
+    searchIndex = self._realizationIndex
+    if searchIndex is None or searchIndex.size != len(self):
+      searchIndex = realizationIndex.RealizationIndex(size=len(self))
+      self._realizationIndex = searchIndex
+    numInData = len(self._data[self.sampleTag]) if self._data is not None else 0
+    exact = {} # hash-indexed entries, {var:val}
+    near = {}  # float entries, {var:(val,radius)}
+    for var,val in toMatch.items():
+      if var not in searchIndex:
+        values = self._getScalarValues(var)
+        if values is None or not searchIndex.register(var,values):
+          return None
+      if searchIndex.isFloat(var):
+        if not mathUtils.isAFloatOrInt(val):
+          return len(self)
+        # the largest difference either matching rule could accept
+        radius = 0.0
+        if numInData > 0:
+          radius = tol*self._getMatchScaling(var)[1]
+        if numInData < len(self):
+          radius = max(radius,realizationIndex.relativeRadius(val,tol))
+        near[var] = (val,radius)
+      else:
+        exact[var] = val
+    candidates = searchIndex.candidates(exact,near)
+    # check float entries exactly, since the index only narrows down the search
+    for var,(val,_) in near.items():
+      if len(candidates) == 0:
+        break
+      values = searchIndex.floatValues(var,candidates)
+      inData = candidates < numInData
+      match = np.zeros(len(candidates),dtype=bool)
+      loc,scale = self._getMatchScaling(var)
+      match[inData] = abs((values[inData]-loc)/scale - (val-loc)/scale) < tol
+      match[~inData] = list(mathUtils.compareFloats(val,value,tol=tol) for value in values[~inData])
+      candidates = candidates[match]
+    if len(candidates) == 0:
+      return len(self)
+    return int(candidates[0])
+
   def _getRequestedElements(self,options):
     """
       Obtains a list of the elements to be written, based on defaults and options[what]
@@ -1489,6 +1607,25 @@ class DataSet(DataObject):
       keep = set(self._inputs + self._outputs + self._metavars + self._neededForReload)
     return keep
 
+  def _getScalarValues(self,var):
+    """
+      Collects the values of a variable for every realization, first from the data then from the collector.
+      @ In, var, str, name of variable
+      @ Out, values, np.ndarray, values (object type) or None if "var" is not stored as a column
+    """
+    if var not in self._orderedVars:
+      return None
+    values = []
+    if self._data is not None:
+      if self._data[var].dims != (self.sampleTag,):
+        return None
+      values.append(np.asarray(self._data[var].values,dtype=object))
+    if self._collector is not None and len(self._collector) > 0:
+      values.append(np.asarray(self._collector.getColumn(self._orderedVars.index(var)),dtype=object))
+    if len(values) == 0:
+      return np.zeros(0,dtype=object)
+    return np.concatenate(values)
+
   def _getVariableIndex(self,var):
     """
       Obtains the index in the list of variables for the requested var.
@@ -1540,16 +1677,14 @@ class DataSet(DataObject):
     # otherwise, return happily and continue loading the CSV
     return dims
 
-  def _newCollector(self,width=1,length=100,dtype=None):
+  def _newCollector(self,width=1,length=100):
     """
       Creates a new collector object and returns it.
       @ In, width, int, optional, width of collector
       @ In, length, int, optional, initial length of (allocated) collector
-      @ In, dtype, type, optional, type of entires (float if all float, usually should be object)
+      @ Out, collector, cached_ndarray.cColumnarArray, the collector
     """
-    if dtype is None:
-      dtype = self.defaultDtype # set in subclasses if different
-    return cached_ndarray.cNDarray(width=width,length=length,dtype=dtype)
+    return cached_ndarray.cColumnarArray(width=width,length=length)
 
   def _readPandasCSV(self,fname,nullOK=None):
     """
@@ -1579,14 +1714,42 @@ class DataSet(DataObject):
       self.raiseAnError(IOError,'Invalid data in input file: row "{}" in "{}"'.format(bad+1,fname))
     return df
 
+  def _prepareRealization(self,rlz):
+    """
+      Selects and formats the entries of a realization for this data object (see addRealization).
+      @ In, rlz, dict, {var:val} realization, which can include more variables than this data object wants
+      @ Out, rlz, dict, {var:val} formatted copy of the realization, ready for _appendRealization
+    """
+    # clean out entries that aren't desired
+    #   the realization itself is not copied: a new dict is built here, and the collector copies the values
+    #   of the arrays (and the mutable single values) in its own storage, so that changes to the passed-in
+    #   entries don't back-change the data
+    try:
+      rlz = dict((var,rlz[var]) for var in self.getVars()+self.indexes)
+    except KeyError as e:
+      self.raiseADebug('Variables provided:',rlz.keys())
+      self.raiseAnError(KeyError,'Provided realization does not have all requisite values for object "{}": "{}"'.format(self.name,e.args[0]))
+    # check consistency, but make it an assertion so it can be passed over
+    if not self._checkRealizationFormat(rlz):
+      self.raiseAnError(SyntaxError,'Realization was not formatted correctly for "{}"! See warnings above.'.format(self.name))
+    # format the data
+    rlz = self._formatRealization(rlz)
+    ## establish types if not done yet
+    self._setDataTypes(rlz)
+    # perform selective collapsing/picking of data
+    rlz = self._selectiveRealization(rlz)
+    ## check alignment of indexes
+    self._checkAlignedIndexes(rlz)
+    return rlz
+
   def _resetScaling(self):
     """
-      Removes the KDTree and scaling factors, usually because the data changed in some way
+      Removes the scaling factors, usually because the data changed in some way.
+      Note the search index is kept, since it is updated with each new realization.
       @ In, None
       @ Out, None
     """
     self._scaleFactors = {}
-    self._inputKDTree = None
 
   def _selectiveRealization(self,rlz):
     """
@@ -1625,7 +1788,6 @@ class DataSet(DataObject):
         del self._scaleFactors[var]
       except KeyError:
         pass
-    # TODO someday make KDTree too!
     assert(self._data is not None) # TODO check against collector entries?
     for var in varList:
       ## commented code. We use a try now for speed. It probably needs to be modified for ND arrays
@@ -1765,6 +1927,15 @@ class DataSet(DataObject):
     self._data.attrs = dict((key,pk.dumps(val)) for key,val in self._meta.items())
     self._data.to_netcdf(fileName,**kwargs)
 
+  def _toPacked(self,fileName,**kwargs):
+    """
+      Writes this data object to a packed file (only available for histories, see HistorySet).
+      @ In, fileName, str, path/name to write file
+      @ In, kwargs, dict, optional, additional arguments
+      @ Out, None
+    """
+    self.raiseAnError(NotImplementedError,'The packed style is only available for HistorySet data objects!')
+
   def _usePandasWriteCSV(self,fileName,data,ordered,keepSampleTag=False,keepIndex=False,mode='w'):
     """
       Uses Pandas to write a CSV.
@@ -1922,9 +2093,9 @@ class DataSet(DataObject):
     # get from the collector first
     if self._collector is not None and len(self._collector) > 0:
       # first get rows from collector
-      fromColl = self._collector[np.where(self._collector[:,self._orderedVars.index('RAVEN_isEnding')])]
+      endings = np.where(np.asarray(self._collector.getColumn(self._orderedVars.index('RAVEN_isEnding')),dtype=bool))[0]
       # then turn them into realization-like
-      fromColl = list( dict(zip(self._orderedVars,c)) for c in fromColl )
+      fromColl = list( dict(zip(self._orderedVars,self._collector.getRow(r))) for r in endings )
     else:
       fromColl = []
     # then get from data
@@ -37,7 +37,7 @@ import xarray as xr
 
 from BaseClasses import BaseType
 from Files import StaticXMLOutput
-from utils import utils, cached_ndarray, InputData, xmlUtils, mathUtils
+from utils import utils, cached_ndarray, InputData, xmlUtils, mathUtils, historyUtils
 try:
   from .DataSet import DataSet
 except ValueError: #attempted relative import in non-package
@@ -156,6 +156,32 @@ class HistorySet(DataSet):
     # construct final data object
     self.load(data,style='dict',dims=self.getDimensions())
 
+  def _fromPacked(self,fileName,**kwargs):
+    """
+      Loads a dataset from a packed HistorySet file (see _toPacked).
+      @ In, fileName, str, filename to load from (the extension .packed is added if missing)
+      @ In, kwargs, dict, optional arguments
+      @ Out, None
+    """
+    if not fileName.endswith('.packed'):
+      fileName += '.packed'
+    packed = historyUtils.PackedHistories(fileName)
+    # check the variables needed are provided
+    missing = set(self._orderedVars) - set(packed.scalars.keys()) - set(packed.histories.keys())
+    if len(missing) > 0:
+      self.raiseAnError(IOError,'Not all variables requested for data object "{}" were found in "{}"! Missing: {}'.format(self.name,fileName,missing))
+    self.addExpectedMeta(packed.info.get('metavars',[]))
+    data = {}
+    for var,values in packed.scalars.items():
+      # strings are stored as unicode arrays
+      data[var] = values.astype(object) if values.dtype.kind == 'U' else values
+    for var,values in packed.histories.items():
+      data[var] = historyUtils.unpackHistories(values,packed.offsets)
+    if 'metadata' in packed.extra:
+      for key,target in pk.loads(packed.extra['metadata'].tobytes()).items():
+        self._meta.setdefault(key,target)
+    self.load(data,style='dict',dims=self.getDimensions())
+
   def _identifyVariablesInCSV(self,fileName):
     """
       Gets the list of available variables from the file "fileName.csv".
@@ -301,3 +327,41 @@ class HistorySet(DataSet):
           self._usePandasWriteCSV(filename,rlz,ordered,keepIndex=True)
     else:
       self.raiseAWarning('No output space variables have been requested for DataObject "{}"! No history files will be printed!'.format(self.name))
+
+  def _toPacked(self,fileName,**kwargs):
+    """
+      Writes this data object to a single packed file: the offsets of the histories and the contiguous values
+      of each variable (see historyUtils.writePackedHistories), that is memory-mapped when it is read.
+      The file is always rewritten entirely.
+      @ In, fileName, str, path/name to write file (the extension .packed is added if missing)
+      @ In, kwargs, dict, optional, keywords for options
+      @ Out, None
+    """
+    if not self.hierarchical and 'RAVEN_isEnding' in self.getVars():
+      self.raiseAnError(NotImplementedError,'The reconstructed histories of the hierarchical DataObject "{}" can not be packed! Use the CSV style instead.'.format(self.name))
+    if not fileName.endswith('.packed'):
+      fileName += '.packed'
+    keep = self._getRequestedElements(kwargs)
+    pivot = self.indexes[0]
+    data = self._data
+    self.raiseADebug('Printing data to packed file: "{}"'.format(fileName))
+    scalars = dict((var,data[var].values) for var in itertools.chain(self._inputs,self._metavars) if var in keep)
+    outputs = list(var for var in self._outputs if var in keep)
+    values = dict((var,data[var].transpose(self.sampleTag,pivot).values) for var in outputs)
+    # as in the history CSVs, a history holds the pivot values where at least one of its outputs is defined
+    defined = np.zeros((len(data[self.sampleTag]),len(data[pivot])),dtype=bool)
+    for var in outputs:
+      defined |= ~pd.isnull(values[var])
+    offsets = np.zeros(len(defined)+1,dtype=int)
+    np.cumsum(defined.sum(axis=1),out=offsets[1:])
+    # row-major selection: the values of each history are contiguous
+    histories = {pivot:np.broadcast_to(data[pivot].values,defined.shape)[defined]}
+    for var in outputs:
+      histories[var] = values[var][defined]
+    metadata = dict((key,target) for key,target in self._meta.items() if key != 'DataSet')
+    extra = {'metadata':np.frombuffer(pk.dumps(metadata),dtype=np.uint8)}
+    info = {'inputs':list(var for var in self._inputs if var in keep),
+            'outputs':outputs,
+            'metavars':list(var for var in self._metavars if var in keep),
+            'pivotParameter':pivot}
+    historyUtils.writePackedHistories(fileName,scalars,histories,offsets,extra=extra,info=info)
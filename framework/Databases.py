@@ -242,12 +242,34 @@ class HDF5(DateBase):
       @ Out, None
     """
     # realization must be a dictionary
-    assert(type(rlz).__name__ == "dict")
+    assert(utils.isAMapping(rlz))
     # prefix must be present
     assert('prefix' in rlz)
     self.database.addGroup(rlz)
     self.built = True
 
+  def addRealizations(self,rlzs):
+    """
+      Adds several "rows" (or "samples") to this database, e.g. the realizations of a batch evaluation.
+      Equivalent to calling addRealization for each realization, in order, but the realizations are
+      written to the database all at once.
+      @ In, rlzs, list(dict), realizations in the format of addRealization
+      @ Out, None
+    """
+    # realizations must be dictionaries with a prefix
+    assert(all(utils.isAMapping(rlz) and 'prefix' in rlz for rlz in rlzs))
+    self.database.addGroups(rlzs)
+    self.built = True
+
+  def flush(self):
+    """
+      Writes the realizations buffered by the database to the file (e.g. at the end of a step).
+      @ In, None
+      @ Out, None
+    """
+    if self.database.fileOpen:
+      self.database.flush()
+
   def addExpectedMeta(self,keys):
     """
       Registers meta to look for in realizations.
@@ -294,10 +316,12 @@ class HDF5(DateBase):
       @ In, None
       @ Out, allData, list of arrays, all the data from this data object.
     """
-    allRealizationNames = self.database.retrieveAllHistoryNames()
+    if (not self.exist) and (not self.built):
+      self.raiseAnError(Exception,'Can not retrieve a realization from Database' + self.name + '.It has not been built yet!')
+    allRealizations = self.database.retrieveAllRealizations()
     # instead to use a OrderedDict in the database, I sort the names here (it is much faster)
-    allRealizationNames.sort()
-    allData = [self.realization(name) for name in allRealizationNames]
+    allRealizations.sort(key=lambda namedRlz: namedRlz[0])
+    allData = [rlz for _,rlz in allRealizations]
     return allData
 
   def realization(self,index=None,matchDict=None,tol=1e-15):
@@ -33,6 +33,7 @@ import operator
 from collections import OrderedDict
 import csv
 from scipy.interpolate import UnivariateSpline
+from scipy import special
 from numpy import linalg as LA
 import copy
 import math as math
@@ -57,6 +58,19 @@ def factorial(x):
   fact = gamma(x+1)
   return fact
 
+def transformedSpaceCoordinates(size):
+  """
+    Draws several coordinates in the transformed space of the multivariate normal distributions at once: the
+    values are the ones that calls to MultivariateNormal.coordinateInTransformedSpace totalling "size" coordinates
+    would give, drawn in one pass from the random stream of the distributions and mapped through the standard normal
+    inverse CDF together
+    @ In, size, int, the number of coordinates
+    @ Out, coordinates, np.array, shape = [size], the coordinates
+  """
+  container = distribution1D.DistributionContainer.instance()
+  uniforms = np.fromiter((container.random() for _ in range(size)), dtype=float, count=size)
+  return special.ndtri(uniforms)
+
 """
   Mapping between internal framework and Crow distribution name
 """
@@ -378,11 +392,11 @@ class BoostDistribution(Distribution):
   def cdf(self,x):
     """
       Function to get the cdf at a provided coordinate
-      @ In, x, float, value to get the cdf at
-      @ Out, retunrCdf, float, requested cdf
+      @ In, x, float or np.array, value(s) to get the cdf at
+      @ Out, retunrCdf, float or np.array, requested cdf
     """
     if hasattr(x,'__len__'):
-      returnCdf = np.array([self.cdf(i) for i in x])
+      returnCdf = self._evaluateArray(self._distribution.cdfVector,x)
     else:
       returnCdf = self._distribution.cdf(x)
     return returnCdf
@@ -390,12 +404,11 @@ class BoostDistribution(Distribution):
   def ppf(self,x):
     """
       Function to get the inverse cdf at a provided coordinate
-      @ In, x, float, value to get the inverse cdf at
-      @ Out, retunrPpf, float, requested inverse cdf
+      @ In, x, float or np.array, value(s) to get the inverse cdf at
+      @ Out, retunrPpf, float or np.array, requested inverse cdf
     """
-    # TODO speed this up by doing it in Crow, not in python
     if hasattr(x,'__len__'):
-      returnPpf = np.array([self.ppf(i) for i in x])
+      returnPpf = self._evaluateArray(self._distribution.inverseCdfVector,x)
     else:
       returnPpf = self._distribution.inverseCdf(x)
     return returnPpf
@@ -403,12 +416,26 @@ class BoostDistribution(Distribution):
   def pdf(self,x):
     """
       Function to get the pdf at a provided coordinate
-      @ In, x, float, value to get the pdf at
-      @ Out, returnPdf, float, requested pdf
+      @ In, x, float or np.array, value(s) to get the pdf at
+      @ Out, returnPdf, float or np.array, requested pdf
     """
-    returnPdf = self._distribution.pdf(x)
+    if hasattr(x,'__len__'):
+      returnPdf = self._evaluateArray(self._distribution.pdfVector,x)
+    else:
+      returnPdf = self._distribution.pdf(x)
     return returnPdf
 
+  def _evaluateArray(self,method,x):
+    """
+      Evaluates one of the crow vector methods for all the entries in x with a single call into crow.
+      @ In, method, instance method, crow method taking and returning a vectord_cxx (e.g. cdfVector)
+      @ In, x, np.array or list, coordinates
+      @ Out, values, np.array, requested values, with the same shape as x
+    """
+    x = np.asarray(x,dtype=float)
+    values = np.array(method(distribution1D.vectord_cxx(x.ravel().tolist())),dtype=float)
+    return values.reshape(x.shape)
+
   def untruncatedCdfComplement(self, x):
     """
       Function to get the untruncated  cdf complement at a provided coordinate
@@ -468,8 +495,9 @@ class BoostDistribution(Distribution):
     if size is None:
       rvsValue = self.ppf(random())
     else:
-      # TODO to speed up, do this on the C side instead of in python
-      rvsValue = np.array([self.rvs() for _ in range(size)])
+      # draw all the samples before inverting them, so that the generator is used in the same order as for
+      #   "size" independent calls to rvs()
+      rvsValue = self.ppf(np.atleast_1d(random(size)))
     return rvsValue
 
 class Uniform(BoostDistribution):
@@ -1659,9 +1687,11 @@ class Categorical(Distribution):
   def pdf(self,x):
     """
       Function that calculates the pdf value of x
-      @ In, x, float/string, value to get the pdf at
-      @ Out, pdfValue, float, requested pdf
+      @ In, x, float/string or np.array, value(s) to get the pdf at
+      @ Out, pdfValue, float or np.array, requested pdf
     """
+    if hasattr(x,'__len__'):
+      return np.array(list(self.pdf(value) for value in x))
     if x in self.values:
       pdfValue =  self.mapping[x]
     else:
@@ -1687,23 +1717,32 @@ class Categorical(Distribution):
   def ppf(self,x):
     """
       Function that calculates the inverse of the cdf given 0 =< x =< 1
-      @ In, x, float, value to get the ppf at
-      @ Out, element[0], float/string, requested inverse cdf
+      @ In, x, float or np.array, value(s) to get the ppf at
+      @ Out, element[0], float/string or np.array, requested inverse cdf
     """
     sortedMapping = sorted(self.mapping.items(), key=operator.itemgetter(0))
+    if hasattr(x,'__len__'):
+      outcomes = np.array(list(float(element[0]) for element in sortedMapping))
+      cumulative = np.cumsum(list(element[1] for element in sortedMapping))
+      # first outcome whose cumulative probability reaches x, as in the scalar search below
+      indices = np.searchsorted(cumulative,np.asarray(x,dtype=float),side='left')
+      return outcomes[np.minimum(indices,len(outcomes)-1)]
     cumulative=0.0
     for element in sortedMapping:
       cumulative += element[1]
       if cumulative >= x:
         return float(element[0])
 
-  def rvs(self):
+  def rvs(self, size=None):
     """
       Return a random state of the categorical distribution
-      @ In, None
-      @ Out, rvsValue, float/string, the random state
+      @ In, size, int, optional, number of entries to return (one if None)
+      @ Out, rvsValue, float/string or np.array, the random state(s)
     """
-    rvsValue = self.ppf(random())
+    if size is None:
+      rvsValue = self.ppf(random())
+    else:
+      rvsValue = self.ppf(np.atleast_1d(random(size)))
     return rvsValue
 
 DistributionsCollection.addSub(Categorical.getInputSpecification())
@@ -2559,13 +2598,16 @@ class Custom1D(Distribution):
     ppfValue = self.invCDF(x)
     return ppfValue
 
-  def rvs(self):
+  def rvs(self, size=None):
     """
       Return a random state of the custom1D distribution
-      @ In, None
-      @ Out, rvsValue, float/string, the random state
+      @ In, size, int, optional, number of entries to return (one if None)
+      @ Out, rvsValue, float/string or np.array, the random state(s)
     """
-    rvsValue = self.ppf(random())
+    if size is None:
+      rvsValue = self.ppf(random())
+    else:
+      rvsValue = self.ppf(np.atleast_1d(random(size)))
     return rvsValue
 
 DistributionsCollection.addSub(Custom1D.getInputSpecification())
@@ -2652,10 +2694,11 @@ class LogUniform(Distribution):
       @ In, x, float , coordinates to get the cdf at
       @ Out, pdfValue, float, requested pdf
     """
-    if self.base == 'natural':
-      cdfValue = (math.log(x)-self.lowerBound)/(self.upperBound-self.lowerBound)
+    if hasattr(x,'__len__'):
+      logValue = np.log(x) if self.base == 'natural' else np.log10(x)
     else:
-      cdfValue = (math.log10(x)-self.lowerBound)/(self.upperBound-self.lowerBound)
+      logValue = math.log(x) if self.base == 'natural' else math.log10(x)
+    cdfValue = (logValue-self.lowerBound)/(self.upperBound-self.lowerBound)
     return cdfValue
 
   def ppf(self,x):
@@ -2664,19 +2707,26 @@ class LogUniform(Distribution):
       @ In, x, float, the x coordinates
       @ Out, ppfValue, float, ppf values
     """
-    if self.base == 'natural':
+    if hasattr(x,'__len__'):
+      x = np.asarray(x,dtype=float)
+      exponent = (self.upperBound-self.lowerBound)*x + self.lowerBound
+      ppfValue = np.exp(exponent) if self.base == 'natural' else 10.**exponent
+    elif self.base == 'natural':
       ppfValue = math.exp((self.upperBound-self.lowerBound)*x + self.lowerBound)
     else:
       ppfValue = 10.**((self.upperBound-self.lowerBound)*x + self.lowerBound)
     return ppfValue
 
-  def rvs(self):
+  def rvs(self, size=None):
     """
       Return a random value
-      @ In, None
-      @ Out, rvsValue, float, the random value
+      @ In, size, int, optional, number of entries to return (one if None)
+      @ Out, rvsValue, float or np.array, the random value(s)
     """
-    rvsValue = self.ppf(random())
+    if size is None:
+      rvsValue = self.ppf(random())
+    else:
+      rvsValue = self.ppf(np.atleast_1d(random(size)))
     return rvsValue
 
 DistributionsCollection.addSub(LogUniform.getInputSpecification())
@@ -2791,6 +2841,24 @@ class NDimensionalDistributions(Distribution):
     """
     return self._distribution.marginal(x, variable)
 
+  def numberOfUniforms(self):
+    """
+      Function to get the number of uniform random numbers needed to draw a random coordinate (see rvsFromUniforms)
+      @ In, None
+      @ Out, numberOfUniforms, int, the number of uniform random numbers
+    """
+    return 2
+
+  def rvsFromUniforms(self, uniforms):
+    """
+      Function to get the random coordinate corresponding to given uniform random numbers, as rvs does with the
+      random numbers it draws
+      @ In, uniforms, np.array, the uniform random numbers on [0,1] (see numberOfUniforms)
+      @ Out, rvsValue, np.array, the random coordinate
+    """
+    rvsValue = self._distribution.inverseCdf(float(uniforms[0]),float(uniforms[1]))
+    return rvsValue
+
 DistributionsCollection.addSub(NDimensionalDistributions.getInputSpecification())
 
 class NDInverseWeight(NDimensionalDistributions):
@@ -3611,6 +3679,36 @@ class MultivariateNormal(NDimensionalDistributions):
       self.raiseAnError(NotImplementedError,'rvs is not yet implemented for ' + self.method + ' method')
     return rvsValue
 
+  def numberOfUniforms(self):
+    """
+      Function to get the number of uniform random numbers needed to draw a random coordinate (see rvsFromUniforms)
+      @ In, None
+      @ Out, numberOfUniforms, int, the number of uniform random numbers
+    """
+    if self.method == 'pca':
+      return self.rank
+    return NDimensionalDistributions.numberOfUniforms(self)
+
+  def rvsFromUniforms(self, uniforms):
+    """
+      Function to get the random coordinate corresponding to given uniform random numbers, as rvs does with the
+      random numbers it draws (for the pca method, the coordinate in the transformed space is made of the
+      standard normal values of the uniforms)
+      @ In, uniforms, np.array, the uniform random numbers on [0,1] (see numberOfUniforms)
+      @ Out, rvsValue, np.array, the random coordinate
+    """
+    if self.method == 'spline':
+      rvsValue = NDimensionalDistributions.rvsFromUniforms(self, uniforms)
+    elif self.method == 'pca':
+      coordinate = special.ndtri(np.asarray(uniforms,dtype=float)[:self.rank])
+      if self.transformation:
+        rvsValue = coordinate
+      else:
+        rvsValue = self._distribution.coordinateInverseTransformed(distribution1D.vectord_cxx(coordinate.tolist()))
+    else:
+      self.raiseAnError(NotImplementedError,'rvs is not yet implemented for ' + self.method + ' method')
+    return rvsValue
+
 DistributionsCollection.addSub(MultivariateNormal.getInputSpecification())
 
 __base                                = 'Distribution'
@@ -39,6 +39,11 @@ import traceback
 os.environ["MV2_ENABLE_AFFINITY"]="0"
 
 frameworkDir = os.path.dirname(os.path.abspath(__file__))
+from utils import importerUtils
+## the "profileimports" command line option reports the time spent importing each module at the end of the run
+profileImports = any(item.lower() == 'profileimports' for item in sys.argv[1:])
+if profileImports:
+  importerUtils.startImportProfiling()
 from utils import utils
 import utils.TreeStructure as TS
 utils.find_crow(frameworkDir)
@@ -147,6 +152,8 @@ if __name__ == '__main__':
     elif item.lower() == 'interfacecheck':
       interfaceCheck = True
       itemsToRemove.append(item)
+    elif item.lower() == 'profileimports':
+      itemsToRemove.append(item)
     elif item.lower() == 'interactive':
       if __QtAvailable:
         interactive = Interaction.Yes
@@ -282,3 +289,7 @@ if __name__ == '__main__':
       print ('\n\n! Exit called, exiting RAVEN.\n\n')
   else:
     raven()
+
+  if profileImports:
+    importerUtils.stopImportProfiling()
+    print(importerUtils.importProfilingReport())
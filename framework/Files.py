@@ -53,6 +53,7 @@ class File(BaseType):
     self.__linkedModel      = None  # hard link to a certain Code subtype (e.g. RELAP-7, MooseBasedApp, etc,)
     self.type               = None  # type ("type" in the input) to label a file to any particular subcode in the code interface
     self.perturbable        = False # is this file perturbable by a sampling strategy?
+    self.staging            = 'copy'# how the file is placed in the run directories of a Code: copy, hardlink or symlink
 
   def __del__(self):
     """
@@ -100,6 +101,7 @@ class File(BaseType):
                'base':self.__base,
                'ext' :self.__ext,
                'type':self.type,
+               'staging':self.staging,
                'linkedModel':self.__linkedModel}
     return stateDict
 
@@ -114,6 +116,7 @@ class File(BaseType):
     self.__base  = stateDict['base']
     self.__ext   = stateDict['ext' ]
     self.type    = stateDict['type' ]
+    self.staging = stateDict.get('staging','copy')
     self.__linkedModel = stateDict['linkedModel' ]
 
   def __repr__(self):
@@ -255,6 +258,14 @@ class File(BaseType):
     type = '' if self.type is None else self.type
     return type
 
+  def getStaging(self):
+    """
+      Retrieves how the file is placed in the run directories of a Code: "copy", "hardlink" or "symlink".
+      @ In, None
+      @ Out, staging, string, staging
+    """
+    return self.staging
+
   def getPerturbable(self):
     """
       Retrieves the "perturbable" boolean attribute.  Defaults to True for UserGenerated, False for others.
@@ -783,6 +794,9 @@ class UserGenerated(File):
     self.__linkedModel = node.attrib.get('linkedCode' ,None)
     self.perturbed     = node.attrib.get('perturbable',True)
     self.subDirectory  = node.attrib.get('subDirectory',"")
+    self.staging       = node.attrib.get('staging','copy').strip().lower()
+    if self.staging not in ['copy','hardlink','symlink']:
+      self.raiseAnError(IOError,'Unknown staging "'+self.staging+'" for file '+node.text.strip()+'! Available are "copy", "hardlink" and "symlink".')
     self.setAbsFile(os.path.join(self.subDirectory,node.text.strip()))
     self.alias         = node.attrib.get('name'       ,self.getFilename())
 
@@ -26,13 +26,13 @@ warnings.simplefilter('default',DeprecationWarning)
 #End compatibility block for Python 3----------------------------------------------------------------
 
 #External Modules------------------------------------------------------------------------------------
-
+import numpy as np
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
 from BaseClasses import BaseType
 from utils import utils
-from CustomCommandExecuter import execCommand
+from CustomCommandExecuter import attributeSetter, attributeGetter
 #Internal Modules End--------------------------------------------------------------------------------
 
 class Function(BaseType):
@@ -107,7 +107,7 @@ class Function(BaseType):
     cnt = 0
     for child in xmlNode:
       if child.tag=='variable':
-        execCommand('self.'+child.text+' = None',self=self)
+        attributeSetter(child.text)(self,None)
         self.__inputVariables.append(child.text)
         cnt +=1
         if len(child.attrib.keys()) > 0:
@@ -147,7 +147,7 @@ class Function(BaseType):
     """
     paramDict = {}
     for key in self.__inputVariables:
-      execCommand("object['variable "+str(key)+" has value']=self."+key,self=self,object=paramDict)
+      paramDict['variable '+str(key)+' has value'] = attributeGetter(key)(self)
     return paramDict
 
   def __importValues(self,myInput):
@@ -156,7 +156,7 @@ class Function(BaseType):
       @ In, myInput, object (dataObjects,dict), object from which the data need to be imported
       @ Out, None
     """
-    if type(myInput)==dict:
+    if utils.isAMapping(myInput):
       self.__inputFromWhat['dict'](myInput)
     else:
       self.raiseAnError(IOError,'Unknown type of input provided to the function '+str(self.name))
@@ -174,8 +174,8 @@ class Function(BaseType):
     else:
       inDict = myInputDict
     for name in self.__inputVariables:
-      if name in inDict.keys():
-        execCommand('self.'+name+'=object["'+name+'"]',self=self,object=inDict)
+      if name in inDict:
+        attributeSetter(name)(self,inDict[name])
       else:
         self.raiseAnError(IOError,'The input variable '+name+' in external function seems not to be passed in')
 
@@ -192,6 +192,42 @@ class Function(BaseType):
     response = self.__actionDictionary[what](self)
     return response
 
+  def evaluateBatch(self,what,myInput):
+    """
+      Method that returns the results of the action described by 'what' for a batch of samples.
+      If the method of the module is flagged as vectorized (e.g. "residuumSign.vectorized = True" in the
+      module), it is called once with the arrays of all the samples bound to the variables, otherwise
+      it is called once per sample.
+      @ In, what, string, what action needs to be performed
+      @ In, myInput, dict, {variable name:np.array} the values of the variables, one entry per sample
+      @ Out, response, np.array, the response of the action for each sample
+    """
+    if what not in self.__actionDictionary:
+      self.raiseAnError(IOError,'Method ' + what + ' not defined in ' + self.name)
+    method = self.__actionDictionary[what]
+    for name in self.__inputVariables:
+      if name not in myInput:
+        self.raiseAnError(IOError,'The input variable '+name+' in external function seems not to be passed in')
+    values = dict((name,np.asarray(myInput[name])) for name in self.__inputVariables)
+    # the number of samples is given by the variables, or by the arrays passed in if the function has none
+    sizes = [len(value) for value in values.values()] or [len(np.atleast_1d(value)) for value in myInput.values()]
+    numSamples = sizes[0] if len(sizes) > 0 else 0
+    if getattr(method,'vectorized',False):
+      self.__inputFromDict(values)
+      response = np.asarray(method(self))
+      if response.ndim == 0:
+        response = np.full(numSamples,response[()])
+      elif len(response) != numSamples:
+        self.raiseAnError(ValueError,'The vectorized method ' + what + ' of ' + self.name + ' returned ' + str(len(response)) +
+                                     ' values for ' + str(numSamples) + ' samples!')
+    else:
+      responses = []
+      for index in range(numSamples):
+        self.__inputFromDict(dict((name,value[index]) for name,value in values.items()))
+        responses.append(method(self))
+      response = np.asarray(responses)
+    return response
+
   def availableMethods(self):
     """
       Get a list of the callable methods this interface provides
@@ -32,7 +32,7 @@ import itertools
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
-from utils.utils import UreturnPrintTag,partialEval,compare, metaclass_insert
+from utils.utils import UreturnPrintTag,partialEval,compare, metaclass_insert, isAMapping
 from BaseClasses import BaseType
 import utils.TreeStructure as ETS
 from utils.RAVENiterators import ravenArrayIterator
@@ -402,19 +402,19 @@ class GridEntity(GridBase):
     if  len(self.gridInitDict.keys()) != 0:
       readKeys = list(self.gridInitDict.keys())
     if initDict != None:
-      if type(initDict).__name__ != "dict":
+      if not isAMapping(initDict):
         self.raiseAnError(Exception,'The in argument is not a dictionary!')
     if "dimensionNames" not in list(initDict.keys())+readKeys:
       self.raiseAnError(Exception,'"dimensionNames" key is not present in the initialization dictionary!')
     if "lowerBounds" not in list(initDict.keys())+readKeys:
       self.raiseAnError(Exception,'"lowerBounds" key is not present in the initialization dictionary')
     if "lowerBounds" not in readKeys:
-      if type(initDict["lowerBounds"]).__name__ != "dict":
+      if not isAMapping(initDict["lowerBounds"]):
         self.raiseAnError(Exception,'The lowerBounds entry is not a dictionary')
     if "upperBounds" not in list(initDict.keys())+readKeys:
       self.raiseAnError(Exception,'"upperBounds" key is not present in the initialization dictionary')
     if "upperBounds" not in readKeys:
-      if type(initDict["upperBounds"]).__name__ != "dict":
+      if not isAMapping(initDict["upperBounds"]):
         self.raiseAnError(Exception,'The upperBounds entry is not a dictionary')
     if "transformationMethods" in initDict.keys():
       self.gridContainer['transformationMethods'] = initDict["transformationMethods"]
@@ -443,7 +443,7 @@ class GridEntity(GridBase):
         stepLength.append([ratioRelative*(self.gridContainer['bounds']["upperBounds" ][self.gridContainer['dimensionNames'][varId]] - self.gridContainer['bounds']["lowerBounds" ][self.gridContainer['dimensionNames'][varId]])])
     else:
       if "stepLength" not in readKeys:
-        if type(initDict["stepLength"]).__name__ != "dict":
+        if not isAMapping(initDict["stepLength"]):
           self.raiseAnError(Exception,'The stepLength entry is not a dictionary')
       stepLength = []
       for dimName in self.gridContainer['dimensionNames']:
@@ -965,7 +965,7 @@ class MultiGridEntity(GridBase):
     """
     if   type(coords) == tuple:
       level, coordinates = coords[0], coords[1]
-    elif type(coords) == dict:
+    elif isAMapping(coords):
       level, coordinates = self.multiGridIterator[0], coords
     else:
       self.raiseAnError(Exception,"returnShiftedCoordinate method accepts a coords or tuple only!")
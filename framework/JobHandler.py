@@ -23,8 +23,8 @@ warnings.simplefilter('default',DeprecationWarning)
 #End compatibility block for Python 3-------------------------------------------
 
 #External Modules---------------------------------------------------------------
-import time
 import collections
+import itertools
 import subprocess
 
 import os
@@ -37,11 +37,12 @@ import socket
 #External Modules End-----------------------------------------------------------
 
 #Internal Modules---------------------------------------------------------------
-from utils import utils
+from utils import utils, importerUtils
 from BaseClasses import BaseType
 import MessageHandler
 import Runners
-import Models
+## only needed to recognize the jobs of the models, which are imported by then
+Models = importerUtils.importModuleLazy('Models')
 # for internal parallel
 import pp
 import ppserver
@@ -68,6 +69,12 @@ class JobHandler(MessageHandler.MessageUser):
 
     self.isParallelPythonInitialized = False
 
+    ## Pool of local processes running the ExternalModel and ROM jobs, created
+    ## with the first job if RunInfo asks for it (internalRunner = processes)
+    self.processPool = None
+
+    ## Polling interval, only used while running jobs that cannot notify their
+    ## completion (all the current runners notify it, see Runner.notifiesCompletion)
     self.sleepTime  = 0.005
     self.completed = False
 
@@ -102,10 +109,19 @@ class JobHandler(MessageHandler.MessageUser):
     ## something from the main thread can remove them.
     self.__finished = []
 
+    ## Pending events for the startLoop thread (jobs added or finished) and for
+    ## the thread driving the step (jobs started or finished), see waitForEvent
+    self.__handlerEvent = False
+    self.__clientEvent  = False
+
     ## End block of __queueLock protected variables
     ############################################################################
 
     self.__queueLock = threading.RLock()
+    ## Signaled (under the __queueLock) every time the state of the queues
+    ## changes, so that the threads waiting on the JobHandler can sleep until
+    ## there is something for them to do
+    self.__queueChanged = threading.Condition(self.__queueLock)
 
     ## List of submitted job identifiers, includes jobs that have completed as
     ## this list is not cleared until a new step is entered
@@ -202,6 +218,41 @@ class JobHandler(MessageHandler.MessageUser):
 
     self.isParallelPythonInitialized = True
 
+  def getProcessPool(self):
+    """
+      Returns the pool of local processes, creating it if needed, if RunInfo asks
+      for it (internalRunner = processes). Other entities can use it to run their
+      own vectorized chunks of work (see ProcessPool.map).
+      @ In, None
+      @ Out, processPool, Runners.ProcessPool, the pool of processes (None if not requested)
+    """
+    if self.runInfoDict.get('internalRunner','threads') != 'processes':
+      return None
+    # the step and the client threads can both add jobs, only one of them must build the pool
+    with self.__queueLock:
+      if self.processPool is None:
+        self.processPool = Runners.ProcessPool(self.runInfoDict['batchSize'])
+    return self.processPool
+
+  def __usesProcessPool(self, args):
+    """
+      Checks if a job is run on the pool of local processes (see ProcessPoolRunner).
+      Only ExternalModel and ROM evaluations are sent to the pool, since the other
+      models either run their own processes (Code) or submit jobs themselves.
+      @ In, args, tuple, the arguments of the job (the model is the first one)
+      @ Out, usesProcessPool, bool, True if the job is run on the pool
+    """
+    if self.runInfoDict.get('internalRunner','threads') != 'processes':
+      return False
+    if len(args) == 0 or not isinstance(args[0], (Models.ExternalModel, Models.ROM)):
+      return False
+    try:
+      self.getProcessPool().share(args[0])
+    except Exception as ae:
+      self.raiseAWarning('Model "{}" cannot be sent to the process pool ({}), its jobs are run on threads instead'.format(args[0].name, ae))
+      return False
+    return True
+
   def __getLocalAndRemoteMachineNames(self):
     """
       Method to get the qualified host and remote nodes' names
@@ -282,17 +333,133 @@ class JobHandler(MessageHandler.MessageUser):
 
   def startLoop(self):
     """
-    This function begins the polling loop for the JobHandler where it will
-    constantly fill up its running queue with jobs in its pending queue and
-    unload finished jobs into its finished queue to be extracted by
+    This function begins the loop for the JobHandler where it will fill up its
+    running queue with jobs in its pending queue and unload finished jobs into
+    its finished queue to be extracted by the other threads. Between two
+    iterations the loop sleeps until a job is added or finished.
+    @ In, None
+    @ Out, None
     """
     while not self.completed:
       self.fillJobQueue()
       self.cleanJobQueue()
-      ## TODO May want to revisit this:
-      ## http://stackoverflow.com/questions/29082268/python-time-sleep-vs-event-wait
-      ## probably when we move to Python 3.
-      time.sleep(self.sleepTime)
+      with self.__queueLock:
+        if not self.__handlerEvent and not self.completed:
+          self.__queueChanged.wait(self.__waitingTime(self.sleepTime))
+        self.__handlerEvent = False
+
+  def __signalEvent(self, handler=True, client=True):
+    """
+      Wakes up the threads waiting for a change in the queues.
+      @ In, handler, bool, optional, True if the startLoop thread has something
+        to do (a job has been added or has finished)
+      @ In, client, bool, optional, True if the threads submitting and
+        collecting jobs may have something to do (a job started or finished)
+      @ Out, None
+    """
+    with self.__queueLock:
+      self.__handlerEvent = self.__handlerEvent or handler
+      self.__clientEvent = self.__clientEvent or client
+      self.__queueChanged.notify_all()
+
+  def __jobFinished(self):
+    """
+      Completion callback of the runners, called from the thread running the job.
+      @ In, None
+      @ Out, None
+    """
+    self.__signalEvent(handler=True, client=False)
+
+  def __waitingTime(self, pollingTime):
+    """
+      Determines how long a thread can wait for a change in the queues before
+      checking them again. Must be called with the __queueLock held.
+      @ In, pollingTime, float, the polling interval to use if any running job
+        cannot notify its completion
+      @ Out, timeout, float, the waiting time (None to wait for the next event)
+    """
+    for run in self.__running + self.__clientRunning:
+      if run is not None and not run.notifiesCompletion:
+        return pollingTime
+    return None
+
+  def __waitFor(self, condition, pollingTime):
+    """
+      Blocks the calling thread until the condition is satisfied. The condition
+      is checked with the __queueLock held, every time the queues change.
+      @ In, condition, function, function without arguments returning True when
+        the wait is over
+      @ In, pollingTime, float, the polling interval to use if any running job
+        cannot notify its completion (if None, the sleepTime is used)
+      @ Out, None
+    """
+    if pollingTime is None:
+      pollingTime = self.sleepTime
+    with self.__queueLock:
+      while not condition():
+        self.__queueChanged.wait(self.__waitingTime(pollingTime))
+
+  def waitForEvent(self, pollingTime=None):
+    """
+      Blocks the calling thread until a job has been started or has finished
+      since the last call, i.e. until new jobs can be submitted or finished jobs
+      collected. This is meant to be used by the single thread driving a step
+      (the events are consumed by the call); the client jobs should use
+      waitForAvailability and waitForFinished instead.
+      @ In, pollingTime, float, optional, the polling interval to use if any
+        running job cannot notify its completion (if None, the sleepTime is used)
+      @ Out, None
+    """
+    if pollingTime is None:
+      pollingTime = self.sleepTime
+    with self.__queueLock:
+      if not self.__clientEvent:
+        self.__queueChanged.wait(self.__waitingTime(pollingTime))
+      self.__clientEvent = False
+
+  def waitForAvailability(self, client=False, pollingTime=None):
+    """
+      Blocks the calling thread until a new job can be added (see availability).
+      @ In, client, bool, optional, if true, then wait for the __clientQueue,
+        otherwise use __queue
+      @ In, pollingTime, float, optional, the polling interval to use if any
+        running job cannot notify its completion (if None, the sleepTime is used)
+      @ Out, None
+    """
+    self.__waitFor(lambda: self.availability(client) > 0, pollingTime)
+
+  def waitForFinished(self, jobIdentifier='', uniqueHandler='any', pollingTime=None):
+    """
+      Blocks the calling thread until a job matching the request can be
+      collected with getFinished, or until no matching job is left to run.
+      @ In, jobIdentifier, string, optional, if specified, only considers the
+        runs whose identifier starts with this text.
+      @ In, uniqueHandler, string, optional, the uniqueHandler of the runs to
+        consider (see getFinished)
+      @ In, pollingTime, float, optional, the polling interval to use if any
+        running job cannot notify its completion (if None, the sleepTime is used)
+      @ Out, None
+    """
+    def matches(run):
+      """
+        Checks if a run is part of the request.
+        @ In, run, Runner, the run to check
+        @ Out, matches, bool, True if the run matches
+      """
+      return run is not None and run.identifier.startswith(jobIdentifier) and run.uniqueHandler == uniqueHandler
+
+    def ready():
+      """
+        Checks if the wait is over.
+        @ In, None
+        @ Out, ready, bool, True if a matching job finished or none is pending
+      """
+      if any(matches(run) for run in self.__finished):
+        return True
+      pending = itertools.chain(self.__queue, self.__clientQueue, self.__running, self.__clientRunning)
+      return not any(matches(run) for run in pending)
+
+    self.__waitFor(ready, pollingTime)
 
   def addJob(self, args, functionToRun, identifier, metadata=None, modulesToImport = [], forceUseThreads = False, uniqueHandler="any", clientQueue = False):
     """
@@ -322,7 +489,14 @@ class JobHandler(MessageHandler.MessageUser):
     if not self.isParallelPythonInitialized:
       self.__initializeParallelPython()
 
-    if self.ppserver is None or forceUseThreads:
+    if self.ppserver is None and not forceUseThreads and self.__usesProcessPool(args):
+      internalJob = Runners.ProcessPoolRunner(self.messageHandler,
+                                              self.processPool, args,
+                                              functionToRun,
+                                              identifier, metadata,
+                                              uniqueHandler,
+                                              profile=self.__profileJobs)
+    elif self.ppserver is None or forceUseThreads:
       internalJob = Runners.SharedMemoryRunner(self.messageHandler, args,
                                                functionToRun,
                                                identifier, metadata,
@@ -340,6 +514,8 @@ class JobHandler(MessageHandler.MessageUser):
 
     # set the client info
     internalJob.clientRunner = clientQueue
+    # let the runner wake up the JobHandler as soon as it is done
+    internalJob.setCompletionCallback(self.__jobFinished)
     # add the runner in the Queue
     self.reAddJob(internalJob)
 
@@ -357,6 +533,7 @@ class JobHandler(MessageHandler.MessageUser):
       if self.__profileJobs:
         runner.trackTime('queue')
       self.__submittedJobs.append(runner.identifier)
+      self.__signalEvent(handler=True, client=False)
 
   def addClientJob(self, args, functionToRun, identifier, metadata=None, modulesToImport = [], uniqueHandler="any"):
     """
@@ -547,6 +724,9 @@ class JobHandler(MessageHandler.MessageUser):
       for i in reversed(runsToBeRemoved):
         self.__finished[i].trackTime('collected')
         del self.__finished[i]
+      ## Collecting jobs frees up space (see availability)
+      if len(runsToBeRemoved) > 0:
+        self.__signalEvent(handler=False, client=True)
     ## end with self.__queueLock
 
     return finished
@@ -648,6 +828,8 @@ class JobHandler(MessageHandler.MessageUser):
             self.__nextId += 1
           else:
             break
+        ## The queue has room for more jobs (see availability)
+        self.__signalEvent(handler=False, client=True)
 
     ## Repeat the same process above, only for the clientQueue
     emptySlots = [i for i,run in enumerate(self.__clientRunning) if run is None]
@@ -661,6 +843,7 @@ class JobHandler(MessageHandler.MessageUser):
             self.__nextId += 1
           else:
             break
+        self.__signalEvent(handler=False, client=True)
 
   def cleanJobQueue(self):
     """
@@ -683,6 +866,7 @@ class JobHandler(MessageHandler.MessageUser):
             self.__finished.append(run)
             self.__finished[-1].trackTime('jobHandler_finished')
             runList[i] = None
+            self.__signalEvent(handler=False, client=True)
 
   def setProfileJobs(self,profile=False):
     """
@@ -700,6 +884,9 @@ class JobHandler(MessageHandler.MessageUser):
     """
     with self.__queueLock:
       self.__submittedJobs = []
+    ## the models may have changed since the previous step
+    if self.processPool is not None:
+      self.processPool.reset()
 
   def shutdown(self):
     """
@@ -709,6 +896,11 @@ class JobHandler(MessageHandler.MessageUser):
     @ Out, None
     """
     self.completed = True
+    self.__signalEvent(handler=True, client=True)
+    with self.__queueLock:
+      if self.processPool is not None:
+        self.processPool.terminate()
+        self.processPool = None
 
   def terminateAll(self):
     """
@@ -724,3 +916,8 @@ class JobHandler(MessageHandler.MessageUser):
         unfinishedRuns = [run for run in runList if run is not None]
         for run in unfinishedRuns:
           run.kill()
+      ## the jobs running on the process pool can only be stopped with the pool
+      if self.processPool is not None:
+        self.processPool.terminate()
+        self.processPool = None
+      self.__signalEvent()
@@ -35,8 +35,22 @@ from utils import mathUtils
 from utils import utils
 import SupervisedLearning
 import MessageHandler
+import Runners
 #Internal Modules End--------------------------------------------------------------------------------
 
+def _trainChain(rom, trainingSets):
+  """
+    Trains a copy of a ROM for each slice of the pivot parameter (at module level, so that it can be run by a pool of processes)
+    @ In, rom, supervisedLearning instance, the (untrained) ROM to copy
+    @ In, trainingSets, list(dict), the training set of each slice
+    @ Out, chain, list, the trained ROMs, one for each slice
+  """
+  chain = []
+  for trainingSet in trainingSets:
+    chain.append(copy.deepcopy(rom))
+    chain[-1].train(trainingSet)
+  return chain
+
 class supervisedLearningGate(utils.metaclass_insert(abc.ABCMeta,BaseType),MessageHandler.MessageUser):
   """
     This class represents an interface with all the supervised learning algorithms
@@ -65,6 +79,8 @@ class supervisedLearningGate(utils.metaclass_insert(abc.ABCMeta,BaseType),Messag
         self.raiseAnError(IOError,'No Targets specified!!!')
     # check if pivotParameter is specified and in case store it
     self.pivotParameterId     = self.initializationOptions.get("pivotParameter",'time')
+    # number of processes used to train the chain of ROMs (one per pivot value) of the ROMs that can not handle dynamic data
+    self.trainingProcesses    = self.initializationOptions.pop('trainingProcesses',1)
     # return instance of the ROMclass
     modelInstance = SupervisedLearning.returnInstance(ROMclass,self,**self.initializationOptions)
     # check if the model can autonomously handle the time-dependency
@@ -74,6 +90,8 @@ class supervisedLearningGate(utils.metaclass_insert(abc.ABCMeta,BaseType),Messag
     self.isADynamicModel      = False
     # if it is dynamic and time series are passed in, self.supervisedContainer is not going to be expanded, else it is going to
     self.supervisedContainer     = [modelInstance]
+    # are the ROMs of the chain sharing the same trained model, so that they can be evaluated at once?
+    self.slicesTrainedTogether   = False
 
     #
     self.historySteps         = []
@@ -103,6 +121,9 @@ class supervisedLearningGate(utils.metaclass_insert(abc.ABCMeta,BaseType),Messag
       @ Out, None
     """
     self.__dict__.update(newstate)
+    # ROMs pickled before the chains of ROMs could be trained at once or in parallel
+    self.__dict__.setdefault('slicesTrainedTogether',False)
+    self.__dict__.setdefault('trainingProcesses',1)
     if not self.amITrained:
       # NOTE this will fail if the ROM requires the paramInput spec! Fortunately, you shouldn't pickle untrained.
       modelInstance             = SupervisedLearning.returnInstance(self.ROMclass,self,**self.initializationOptions)
@@ -117,6 +138,16 @@ class supervisedLearningGate(utils.metaclass_insert(abc.ABCMeta,BaseType),Messag
     for rom in self.supervisedContainer:
       rom.reset()
     self.amITrained = False
+    self.slicesTrainedTogether = False
+
+  def canWarmStart(self):
+    """
+      This method tells if the linked ROM can be retrained starting from its current trained state, without being reset.
+      The chains of ROMs (one per pivot value) are always reset.
+      @ In, None
+      @ Out, canWarmStart, bool, True if the ROM does not need to be reset before being retrained
+    """
+    return not self.isADynamicModel and len(self.supervisedContainer) == 1 and self.supervisedContainer[0].canWarmStart()
 
   def getInitParams(self):
     """
@@ -136,10 +167,11 @@ class supervisedLearningGate(utils.metaclass_insert(abc.ABCMeta,BaseType),Messag
       @ In, trainingSet, dict or list, data used to train the ROM; if a list is provided a temporal ROM is generated.
       @ Out, None
     """
-    if type(trainingSet).__name__ not in  'dict':
+    if not utils.isAMapping(trainingSet):
       self.raiseAnError(IOError,"The training set is not a dictionary!")
     if len(trainingSet.keys()) == 0:
       self.raiseAnError(IOError,"The training set is empty!")
+    self.slicesTrainedTogether = False
 
     if any(type(x).__name__ == 'list' for x in trainingSet.values()):
       # we need to build a "time-dependent" ROM
@@ -163,16 +195,69 @@ class supervisedLearningGate(utils.metaclass_insert(abc.ABCMeta,BaseType),Messag
         # copy the original ROM
         originalROM = self.supervisedContainer[0]
         # start creating and training the time-dep ROMs
-        self.supervisedContainer = [] # [copy.deepcopy(originalROM) for _ in range(len(self.historySteps))]
-        # train
-        for ts in range(len(self.historySteps)):
-          self.supervisedContainer.append(copy.deepcopy(originalROM))
-          self.supervisedContainer[-1].train(newTrainingSet[ts])
+        sharedFeatures = not any(type(trainingSet.get(feat)).__name__ == 'list' for feat in originalROM.features)
+        if sharedFeatures and originalROM.canTrainSlicesTogether():
+          # the feature values are the same for all the slices, the whole chain is trained at once
+          self.supervisedContainer = originalROM.trainSlices(newTrainingSet)
+          self.slicesTrainedTogether = True
+        elif self.trainingProcesses > 1 and len(newTrainingSet) > 1:
+          self.supervisedContainer = self.__trainChainInParallel(originalROM,newTrainingSet)
+        else:
+          self.supervisedContainer = _trainChain(originalROM,newTrainingSet)
     else:
       #self._replaceVariablesNamesWithAliasSystem(self.trainingSet, 'inout', False)
       self.supervisedContainer[0].train(trainingSet)
     self.amITrained = True
 
+  def __trainChainInParallel(self, originalROM, trainingSets):
+    """
+      Trains the chain of ROMs (one per slice of the pivot parameter) on a pool of processes.
+      The slices are split in contiguous chunks, one for each process, so that the
+      original ROM is pickled only once for each process.
+      @ In, originalROM, supervisedLearning instance, the (untrained) ROM to copy
+      @ In, trainingSets, list(dict), the training set of each slice
+      @ Out, chain, list, the trained ROMs, one for each slice
+    """
+    numProcesses = min(self.trainingProcesses,len(trainingSets))
+    bounds = np.linspace(0,len(trainingSets),numProcesses+1).astype(int)
+    chunks = list((trainingSets[bounds[p]:bounds[p+1]],) for p in range(numProcesses))
+    self.raiseADebug('Training',len(trainingSets),'ROMs on',numProcesses,'processes')
+    pool = Runners.ProcessPool(numProcesses)
+    try:
+      responses = pool.map(_trainChain,originalROM,chunks)
+    except Exception as e:
+      # e.g. the ROM can not be pickled
+      self.raiseAWarning('The ROMs can not be trained in parallel ('+str(e)+'), they are trained serially!')
+      return _trainChain(originalROM,trainingSets)
+    finally:
+      pool.terminate()
+    chain = []
+    for succeeded, response in responses:
+      if not succeeded:
+        self.raiseAnError(RuntimeError,'Training of the ROMs failed:\n'+response)
+      chain.extend(response)
+    # the trained ROMs come back with a copy of the message handler
+    for rom in chain:
+      rom.messageHandler = self.messageHandler
+    return chain
+
+  def __gatherSlices(self, method, request):
+    """
+      Calls a method (evaluate or confidence) of each ROM of the chain and gathers the slices,
+      that are concatenated (one after the other) for each key.
+      @ In, method, string, the name of the method to call
+      @ In, request, dict, realizations request ({'feature1':np.array(n_realizations),'feature2',np.array(n_realizations)})
+      @ Out, gathered, dict, {key:np.array}, the concatenated slices
+    """
+    if self.slicesTrainedTogether and method == 'evaluate':
+      # the ROMs share the same trained model, all the slices are evaluated at once
+      evaluation = self.supervisedContainer[0].evaluateSlices(request)
+      return dict((key,values.T.ravel()) for key,values in evaluation.items())
+    slices = list(getattr(rom,method)(request) for rom in self.supervisedContainer)
+    if len(slices) == 1:
+      return slices[0]
+    return dict((key,np.concatenate(list(np.ravel(sliceEvaluation[key]) for sliceEvaluation in slices))) for key in slices[0].keys())
+
   def confidence(self, request):
     """
       This is to get a value that is inversely proportional to the confidence that we have
@@ -183,14 +268,7 @@ class supervisedLearningGate(utils.metaclass_insert(abc.ABCMeta,BaseType),Messag
     """
     if not self.amITrained:
       self.raiseAnError(RuntimeError, "ROM "+self.initializationOptions['name']+" has not been trained yet and, consequentially, can not be evaluated!")
-    confidenceDict = {}
-    for rom in self.supervisedContainer:
-      sliceEvaluation = rom.confidence(request)
-      if len(confidenceDict.keys()) == 0:
-        confidenceDict.update(sliceEvaluation)
-      else:
-        for key in confidenceDict.keys():
-          confidenceDict[key] = np.append(confidenceDict[key],sliceEvaluation[key])
+    confidenceDict = self.__gatherSlices('confidence',request)
     return confidenceDict
 
   def evaluate(self,request):
@@ -203,14 +281,7 @@ class supervisedLearningGate(utils.metaclass_insert(abc.ABCMeta,BaseType),Messag
       self.raiseAnError(RuntimeError,'ROM "'+self.initializationOptions['name']+'" has not been loaded yet!  Use an IOStep to load it.')
     if not self.amITrained:
       self.raiseAnError(RuntimeError, "ROM "+self.initializationOptions['name']+" has not been trained yet and, consequentially, can not be evaluated!")
-    resultsDict = {}
-    for rom in self.supervisedContainer:
-      sliceEvaluation = rom.evaluate(request)
-      if len(resultsDict.keys()) == 0:
-        resultsDict.update(sliceEvaluation)
-      else:
-        for key in resultsDict.keys():
-          resultsDict[key] = np.append(resultsDict[key],sliceEvaluation[key])
+    resultsDict = self.__gatherSlices('evaluate',request)
     return resultsDict
 
   def reseed(self,seed):
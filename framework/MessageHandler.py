@@ -24,8 +24,13 @@ warnings.simplefilter('default',DeprecationWarning)
 
 #External Modules------------------------------------------------------------------------------------
 import sys
+import copy
+import json
 import time
+import atexit
 import bisect
+import threading
+import collections
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
@@ -110,6 +115,10 @@ class MessageUser(object):
     verbosity = kwargs.get('verbosity','quiet'  )
     tag       = kwargs.get('tag'      ,'Warning')
     color     = kwargs.get('color'    ,None     )
+    # the arguments are only converted to strings if the warning is printed
+    if not self.messageHandler.isEnabled(self,verbosity):
+      self.messageHandler.skipMessage(self,str(tag))
+      return
     msg = ' '.join(str(a) for a in args)
     self.messageHandler.message(self,msg,str(tag),verbosity,color)
 
@@ -126,6 +135,10 @@ class MessageUser(object):
     tag        = kwargs.get('tag'       ,'Message')
     color      = kwargs.get('color'     ,None     )
     forcePrint = kwargs.get('forcePrint',False     )
+    # the arguments are only converted to strings if the message is printed
+    if not self.messageHandler.isEnabled(self,verbosity,forcePrint):
+      self.messageHandler.skipMessage(self,str(tag))
+      return
     msg = ' '.join(str(a) for a in args)
     self.messageHandler.message(self,msg,str(tag),verbosity,color,forcePrint=forcePrint)
 
@@ -141,6 +154,10 @@ class MessageUser(object):
     verbosity = kwargs.get('verbosity','debug')
     tag       = kwargs.get('tag'      ,'DEBUG')
     color     = kwargs.get('color'    ,None   )
+    # the arguments are only converted to strings if the message is printed
+    if not self.messageHandler.isEnabled(self,verbosity):
+      self.messageHandler.skipMessage(self,str(tag))
+      return
     msg = ' '.join(str(a) for a in args)
     self.messageHandler.message(self,msg,str(tag),verbosity,color)
 
@@ -156,6 +173,75 @@ class MessageUser(object):
       return default
 
 
+class MessageWriter(object):
+  """
+    Writes the messages from a background thread, so that printing a message only appends it to a queue.
+    The queued messages are written, and the streams flushed, every flushInterval seconds, when flush is
+    called, and at exit.
+  """
+  def __init__(self,flushInterval):
+    """
+      Constructor
+      @ In, flushInterval, float, the time in seconds between two flushes of the queued messages
+      @ Out, None
+    """
+    self.flushInterval = flushInterval
+    self.__queue       = collections.deque() # (stream,text) pairs waiting to be written
+    self.__lock        = threading.Lock()    # only one thread writes at a time, to preserve the order
+    self.__stopped     = threading.Event()
+    self.__thread      = threading.Thread(target=self.__run,name='MessageWriter')
+    self.__thread.daemon = True
+    self.__thread.start()
+    atexit.register(self.stop)
+
+  def write(self,stream,text):
+    """
+      Queues a text to be written
+      @ In, stream, file, the stream to write to
+      @ In, text, string, the text to write
+      @ Out, None
+    """
+    if self.__stopped.is_set():
+      stream.write(text)
+    else:
+      self.__queue.append((stream,text))
+
+  def flush(self):
+    """
+      Writes the queued texts and flushes the streams
+      @ In, None
+      @ Out, None
+    """
+    with self.__lock:
+      streams = []
+      while self.__queue:
+        stream,text = self.__queue.popleft()
+        stream.write(text)
+        if stream not in streams:
+          streams.append(stream)
+      for stream in streams:
+        stream.flush()
+
+  def stop(self):
+    """
+      Stops the background thread, writing the queued texts
+      @ In, None
+      @ Out, None
+    """
+    self.__stopped.set()
+    if self.__thread is not threading.current_thread():
+      self.__thread.join()
+    self.flush()
+
+  def __run(self):
+    """
+      Body of the background thread
+      @ In, None
+      @ Out, None
+    """
+    while not self.__stopped.wait(self.flushInterval):
+      self.flush()
+
 class MessageHandler(object):
   """
     Class for handling messages, warnings, and errors in RAVEN.  One instance of this
@@ -186,6 +272,37 @@ class MessageHandler(object):
       'cyan'    : '\033[36m'}
     self.warnings     = [] #collection of warnings that were raised during this run
     self.warningCount = [] #count of the collections of warning above
+    self.suppressedWarnings = {} #count of the warnings suppressed by the verbosity (not formatted), by caller
+    self.writer       = None #MessageWriter of the buffered output, None to print each message when raised
+    self.messageLog   = None #file of the structured (JSON lines) log of the printed messages, if requested
+
+  def __deepcopy__(self,memo):
+    """
+      Deep copy method hook. The background writer (a thread) and the message log (a file) can not be
+      copied, so the copies print through the same writer and log as the original.
+      @ In, memo, dict, dictionary to fill (see copy module documentation)
+      @ Out, newHandler, MessageHandler, the copy
+    """
+    newHandler = self.__class__.__new__(self.__class__)
+    memo[id(self)] = newHandler
+    for key,value in self.__dict__.items():
+      if key in ['writer','messageLog']:
+        newHandler.__dict__[key] = value
+      else:
+        newHandler.__dict__[key] = copy.deepcopy(value,memo)
+    return newHandler
+
+  def __getstate__(self):
+    """
+      Pickle dump method hook. The background writer and the message log stay with this process, the
+      unpickled instances print each message when raised.
+      @ In, None
+      @ Out, stateDict, dict, dict of objets needed to restore instance
+    """
+    stateDict = self.__dict__.copy()
+    stateDict['writer'] = None
+    stateDict['messageLog'] = None
+    return stateDict
 
   def initialize(self,initDict):
     """
@@ -197,6 +314,59 @@ class MessageHandler(object):
     self.callerLength  = initDict.get('callerLength',40)
     self.tagLength     = initDict.get('tagLength',30)
     self.suppressErrs  = initDict['suppressErrs'] in utils.stringsThatMeanTrue() if 'suppressErrs' in initDict.keys() else False
+    if 'flushInterval' in initDict:
+      self.setFlushInterval(initDict['flushInterval'])
+    if initDict.get('messageLog') is not None:
+      self.setMessageLog(initDict['messageLog'])
+
+  def setFlushInterval(self,flushInterval):
+    """
+      Sets how the printed messages are written. If flushInterval is positive, the messages are queued and
+      written by a background thread every flushInterval seconds; otherwise each message is handed to the output
+      stream when raised.
+      @ In, flushInterval, float, the time in seconds between two flushes of the messages
+      @ Out, None
+    """
+    if self.writer is not None:
+      self.writer.stop()
+      self.writer = None
+    if float(flushInterval) > 0:
+      self.writer = MessageWriter(float(flushInterval))
+
+  def setMessageLog(self,filename):
+    """
+      Requests a structured log of the printed messages, written as one JSON object per line with the
+      keys "time" (seconds since the epoch), "elapsed" (seconds since the start of the run), "caller", "tag",
+      "verbosity", "message", "job" (the identifier of the job raising the message, if any) and "thread".
+      @ In, filename, string, the name of the log file
+      @ Out, None
+    """
+    self.closeMessageLog()
+    self.messageLog = open(filename,'w')
+    atexit.register(self.closeMessageLog)
+
+  def closeMessageLog(self):
+    """
+      Closes the structured log of the messages, if any
+      @ In, None
+      @ Out, None
+    """
+    if self.messageLog is not None:
+      messageLog, self.messageLog = self.messageLog, None
+      if self.writer is not None:
+        self.writer.flush()
+      messageLog.close()
+
+  def flush(self):
+    """
+      Writes all the messages queued so far
+      @ In, None
+      @ Out, None
+    """
+    if self.writer is not None:
+      self.writer.flush()
+    if self.messageLog is not None:
+      self.messageLog.flush()
 
   def printWarnings(self):
     """
@@ -204,19 +374,24 @@ class MessageHandler(object):
       @ In, None
       @ Out, None
     """
-    if len(self.warnings)>0:
+    self.flush()
+    numSuppressed = sum(self.suppressedWarnings.values())
+    if len(self.warnings)>0 or numSuppressed>0:
+      numWarnings = sum(self.warningCount)+numSuppressed
       if self.verbCode[self.verbosity]>0:
         print('-'*50)
-        print('There were %i warnings during the simulation run:' %sum(self.warningCount))
+        print('There were %i warnings during the simulation run:' %numWarnings)
         for w,warning in enumerate(self.warnings):
           count = self.warningCount[w]
           time = 'time'
           if count > 1:
             time += 's'
           print('(%i %s) %s' %(self.warningCount[w],time,warning))
+        for caller in sorted(self.suppressedWarnings.keys()):
+          print('(%i not printed for the verbosity) raised by %s' %(self.suppressedWarnings[caller],caller))
         print('-'*50)
       else:
-        print('There were %i warnings during the simulation run.' %sum(self.warningCount))
+        print('There were %i warnings during the simulation run.' %numWarnings)
 
   def paint(self,str,color):
     """
@@ -280,6 +455,28 @@ class MessageHandler(object):
     desVerbosity = self.checkVerbosity(localVerb)
     return desVerbosity
 
+  def isEnabled(self,caller,verbosity,forcePrint=False):
+    """
+      Checks if a message would be printed, so that the callers can skip building messages that are not
+      @ In, caller, object, the entity desiring to print a message
+      @ In, verbosity, string, the print priority of the message
+      @ In, forcePrint, bool, optional, force the print independetly on the verbosity level? Defaul False
+      @ Out, isEnabled, bool, True if the message would be printed
+    """
+    return forcePrint or self.checkVerbosity(verbosity) <= self.getDesiredVerbosity(caller)
+
+  def skipMessage(self,caller,tag):
+    """
+      Records a message that is not printed for the verbosity (see isEnabled), without formatting it: the
+      suppressed warnings are only counted (by caller) for the summary of the run.
+      @ In, caller, object, the entity that raised the message
+      @ In, tag, string, the message type
+      @ Out, None
+    """
+    if tag.lower().strip() == 'warning':
+      name = self.getStringFromCaller(caller)
+      self.suppressedWarnings[name] = self.suppressedWarnings.get(name,0)+1
+
   def checkVerbosity(self,verb):
     """
       Converts English-readable verbosity to computer-legible integer
@@ -304,6 +501,7 @@ class MessageHandler(object):
     """
     verbval = max(self.getDesiredVerbosity(caller),self.checkVerbosity(self.verbosity))
     self.message(caller,message,tag,verbosity,color=color)
+    self.flush()
     if not self.suppressErrs:
       self.printWarnings()
       # debug mode gets full traceback, others quieted
@@ -328,8 +526,41 @@ class MessageHandler(object):
     if tag.lower().strip() == 'warning':
       self.addWarning(message)
     if okay:
-      print(msg,file=writeTo)
-    sys.stdout.flush()
+      if self.writer is None:
+        print(msg,file=writeTo)
+      else:
+        self.writer.write(writeTo,msg+'\n')
+      if self.messageLog is not None:
+        self._logMessage(caller,message,tag,verbosity)
+
+  def _logMessage(self,caller,message,tag,verbosity):
+    """
+      Writes a message in the structured log (see setMessageLog)
+      @ In, caller, object, the entity desiring to print a message
+      @ In, message, string, the message to print
+      @ In, tag, string, the printed message type
+      @ In, verbosity, string, the print priority of the message
+      @ Out, None
+    """
+    now = time.time()
+    thread = threading.current_thread().name
+    job = getattr(caller,'identifier',None)
+    if job is None and thread not in ['MainThread','MessageWriter']:
+      # the internal jobs run in threads named after their identifiers
+      job = thread
+    record = {'time':now,
+              'elapsed':now-self.starttime,
+              'caller':self.getStringFromCaller(caller),
+              'tag':tag,
+              'verbosity':verbosity,
+              'message':message,
+              'job':job if job is None else str(job),
+              'thread':thread}
+    text = json.dumps(record)+'\n'
+    if self.writer is None:
+      self.messageLog.write(text)
+    else:
+      self.writer.write(self.messageLog,text)
 
   def addWarning(self,msg):
     """
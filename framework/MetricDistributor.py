@@ -59,6 +59,8 @@ class MetricDistributor(utils.metaclass_insert(abc.ABCMeta,BaseType),MessageHand
     self.canHandleDynamicData = self.estimator.isDynamic()
     # True if the instance of given metric, i.e. 'estimator', can handle pairwise data, else False
     self.canHandlePairwiseData = self.estimator.isPairwise()
+    # True if the given metric compares many pairs of data at once (see Metric.evaluatePairs), else False
+    self.canHandleManyPairs = self.estimator.type in ['CDFAreaDifference', 'PDFCommonArea']
 
   def getInitParams(self):
     """
@@ -90,6 +92,85 @@ class MetricDistributor(utils.metaclass_insert(abc.ABCMeta,BaseType),MessageHand
     output = self.estimator.evaluate(feat,targ)
     return output
 
+  def evaluatePairwiseHistories(self, histories, pool=None):
+    """
+      Method to compute the metric between each pair of histories
+      @ In, histories, list(numpy.ndarray), the histories, each one is a 2D numpy array with shape
+        (numParameters, numHistorySteps), all the histories have the same number of parameters
+      @ In, pool, Runners.ProcessPool, optional, pool of processes the metric can use to compute the pairs
+      @ Out, output, numpy.ndarray, 2D array, with shape (numHistories, numHistories)
+    """
+    if self.canHandleDynamicData:
+      return self.estimator.evaluatePairwiseHistories(histories, pool)
+    output = np.zeros((len(histories), len(histories)))
+    for i in range(len(histories)):
+      for j in range(i, len(histories)):
+        output[i, j] = self.evaluate(((histories[i], None), (histories[j], None)))[0]
+        output[j, i] = output[i, j]
+    return output
+
+  def _pairsOfSteps(self, pairedData):
+    """
+      Method to split the given paired data in the pairs of data of each time step
+      @ In, pairedData, tuple, ((featureValues, probabilityWeight), (targetValues, probabilityWeight)), see evaluate
+      @ Out, pairs, list(tuple), the pairs (featureData, targetData) of each time step
+    """
+    feat, targ = pairedData
+    featIsDistribution = isinstance(feat, Distributions.Distribution)
+    targIsDistribution = isinstance(targ, Distributions.Distribution)
+    if featIsDistribution and targIsDistribution:
+      return [(feat, targ)]
+    numSteps = np.asarray(targ[0] if featIsDistribution else feat[0]).shape[1]
+    pairs = []
+    for hist in range(numSteps):
+      pair = []
+      for data in pairedData:
+        if isinstance(data, Distributions.Distribution):
+          pair.append(data)
+          continue
+        values = np.asarray(data[0])
+        if data[1] is not None:
+          assert(len(values[:,hist]) == len(data[1]))
+          pair.append((values[:,hist], data[1]))
+        else:
+          pair.append(values[:,hist])
+      pairs.append(tuple(pair))
+    return pairs
+
+  def _checkDistributions(self, pairedData):
+    """
+      Method to check that the estimator can handle the distributions in the given paired data
+      @ In, pairedData, tuple, the paired data, see evaluate
+      @ Out, None
+    """
+    for pData in pairedData:
+      if not self.estimator.acceptsDistribution and isinstance(pData, Distributions.Distribution):
+        self.raiseAnError(IOError, "Distribution is provided, but the metric ", self.estimator.name, " can not handle it!")
+
+  def evaluateAll(self, pairedDataList, weights = None, multiOutput='mean'):
+    """
+      Method to perform the evaluation of many paired data. If the metric can compare many pairs at once
+      (see Metric.evaluatePairs), the time steps of all the paired data are compared in a single call.
+      @ In, pairedDataList, list(tuple), the paired data, see evaluate
+      @ In, weights, array_like (numpy.ndarray or list), optional,  An array of weights associated with the pairedData
+      @ In, multiOutput, string, optional, 'mean', 'max', 'min' or 'raw_values'
+      @ Out, outputs, list(numpy.ndarray), the processed output of each paired data, see evaluate
+    """
+    if not self.canHandleManyPairs:
+      return [self.evaluate(pairedData, weights=weights, multiOutput=multiOutput) for pairedData in pairedDataList]
+    pairsList = []
+    for pairedData in pairedDataList:
+      assert(type(pairedData).__name__ == 'tuple')
+      self._checkDistributions(pairedData)
+      pairsList.append(self._pairsOfSteps(pairedData))
+    values = self.estimator.evaluatePairs([pair for pairs in pairsList for pair in pairs])
+    outputs = []
+    start = 0
+    for pairs in pairsList:
+      outputs.append(self._processOutput(list(values[start:start+len(pairs)]), weights, multiOutput))
+      start += len(pairs)
+    return outputs
+
   def evaluate(self,pairedData, weights = None, multiOutput='mean'):
     """
       Method to perform the evaluation of given paired data
@@ -100,13 +181,14 @@ class MetricDistributor(utils.metaclass_insert(abc.ABCMeta,BaseType),MessageHand
       @ Out, output, numpy.ndarray, 1D array, processed output from the estimator
     """
     assert(type(pairedData).__name__ == 'tuple')
-    # Error check for input data
     dynamicOutput = []
-    for pData in pairedData:
-      if not self.estimator.acceptsDistribution and isinstance(pData, Distributions.Distribution):
-        self.raiseAnError(IOError, "Distribution is provided, but the metric ", self.estimator.name, " can not handle it!")
+    # Error check for input data
+    self._checkDistributions(pairedData)
     feat, targ = pairedData
-    if isinstance(feat, Distributions.Distribution) and isinstance(targ, Distributions.Distribution):
+    if self.canHandleManyPairs:
+      # all the time steps are compared at once
+      dynamicOutput = list(self.estimator.evaluatePairs(self._pairsOfSteps(pairedData)))
+    elif isinstance(feat, Distributions.Distribution) and isinstance(targ, Distributions.Distribution):
       out = self.estimator.evaluate(feat, targ)
       dynamicOutput.append(out)
     elif isinstance(feat, Distributions.Distribution):
@@ -129,21 +211,6 @@ class MetricDistributor(utils.metaclass_insert(abc.ABCMeta,BaseType),MessageHand
           featIn = featVals[:,hist]
         out = self.estimator.evaluate(featIn, targ)
         dynamicOutput.append(out)
-    elif self.estimator.type in ['CDFAreaDifference', 'PDFCommonArea']:
-      featVals = np.asarray(feat[0])
-      targVals = np.asarray(targ[0])
-      for hist in range(featVals.shape[1]):
-        if feat[1] is not None:
-          featIn = (featVals[:,hist], feat[1])
-        else:
-          featIn = featVals[:,hist]
-        if targ[1] is not None:
-          assert(len(targVals[:,hist]) == len(targ[1]))
-          targIn = (targVals[:,hist], targ[1])
-        else:
-          targIn = targVals[:,hist]
-        out = self.estimator.evaluate(featIn, targIn)
-        dynamicOutput.append(out)
     else:
       featVals = np.asarray(feat[0])
       targVals = np.asarray(targ[0])
@@ -162,6 +229,16 @@ class MetricDistributor(utils.metaclass_insert(abc.ABCMeta,BaseType),MessageHand
         for hist in range(featVals.shape[1]):
           out = self.estimator.evaluate(featVals[:,hist], targVals[:,hist], dataWeight)
           dynamicOutput.append(out)
+    return self._processOutput(dynamicOutput, weights, multiOutput)
+
+  def _processOutput(self, dynamicOutput, weights, multiOutput):
+    """
+      Method to combine the outputs of the time steps as requested
+      @ In, dynamicOutput, list, the outputs of the estimator for each time step
+      @ In, weights, array_like (numpy.ndarray or list), An array of weights associated with the time steps
+      @ In, multiOutput, string, 'mean', 'max', 'min' or 'raw_values'
+      @ Out, output, numpy.ndarray, 1D array, processed output from the estimator
+    """
     if multiOutput == 'mean':
       output = [np.average(dynamicOutput, weights = weights)]
     elif multiOutput == 'max':
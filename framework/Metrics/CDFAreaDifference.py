@@ -81,3 +81,12 @@ class CDFAreaDifference(Metric):
     """
     value = Metrics.MetricUtilities._getCDFAreaDifference(x,y)
     return float(value)
+
+  def evaluatePairs(self, pairs):
+    """
+      This method computes the metric for many pairs of data at once (the empirical distributions of all the
+      pairs are integrated together)
+      @ In, pairs, list(tuple), the pairs (x, y), see __evaluateLocal__
+      @ Out, values, numpy.ndarray, metric results, CDF area differences
+    """
+    return Metrics.MetricUtilities._getCDFAreaDifferences(pairs)
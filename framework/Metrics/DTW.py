@@ -26,6 +26,7 @@ warnings.simplefilter('default',DeprecationWarning)
 import numpy as np
 import copy
 import scipy.spatial.distance as spatialDistance
+from scipy.ndimage import minimum_filter1d, maximum_filter1d
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
@@ -33,12 +34,30 @@ from .Metric import Metric
 from utils import InputData
 #Internal Modules End--------------------------------------------------------------------------------
 
+def pairwiseBatches(shared, batches):
+  """
+    Computes the DTW distances of some batches of pairs of histories (a chunk of the pairwise distance matrix,
+    run by a worker of a pool of processes, see DTW.evaluatePairwiseHistories)
+    @ In, shared, tuple, (metric, histories), the DTW metric and the preprocessed histories
+    @ In, batches, list(tuple), (rows, cols) indices of the histories of the pairs of each batch
+    @ Out, values, list(numpy.ndarray), the distances of the pairs of each batch
+  """
+  metric, histories = shared
+  return metric._evaluateBatches(histories, batches)
+
 class DTW(Metric):
   """
     Dynamic Time Warping Metric
     Class for measuring similarity between two variables X and Y, i.e. two temporal sequences
   """
 
+  # local distances that are norms of the difference of the points, {localDistance:norm order}
+  __normOrders = {'euclidean':2, 'l2':2, 'sqeuclidean':'sq', 'cityblock':1, 'manhattan':1, 'l1':1, 'chebyshev':np.inf}
+  # maximum number of cells of the cost matrices of a batch of pairs (see evaluatePairwiseHistories)
+  __maxChunkCells = 2**18
+  # number of pairs above which the pairwise distance matrix is computed on a pool of processes (if any)
+  pooledPairs = 2000
+
   @classmethod
   def getInputSpecification(cls):
     """
@@ -52,6 +71,7 @@ class DTW(Metric):
     orderInputType = InputData.makeEnumType("order","orderType",["0","1"])
     inputSpecification.addSub(InputData.parameterInputFactory("order",contentType=orderInputType),quantity=InputData.Quantity.one)
     inputSpecification.addSub(InputData.parameterInputFactory("localDistance",contentType=InputData.StringType),quantity=InputData.Quantity.one)
+    inputSpecification.addSub(InputData.parameterInputFactory("window",contentType=InputData.IntegerType),quantity=InputData.Quantity.zero_to_one)
 
     return inputSpecification
 
@@ -67,6 +87,8 @@ class DTW(Metric):
     # the ID of distance function to be employed to determine the local distance evaluation of two time series
     # Available options are provided by scipy pairwise distances, i.e. cityblock, cosine, euclidean, manhattan.
     self.localDistance    = None
+    # half width (in time steps) of the Sakoe-Chiba band the warping path is constrained to, None for no constraint
+    self.window           = None
     # True indicates the metric needs to be able to handle dynamic data
     self._dynamicHandling = True
     # True indicates the metric needs to be able to handle pairwise data
@@ -86,6 +108,10 @@ class DTW(Metric):
         self.order = int(child.value)
       elif child.getName() == "localDistance":
         self.localDistance = child.value
+      elif child.getName() == "window":
+        self.window = child.value
+        if self.window < 0:
+          self.raiseAnError(IOError, 'The "window" of the DTW metric', self.name, 'must be a non negative integer!')
 
   def __evaluateLocal__(self, x, y, weights = None, axis = 0, **kwargs):
     """
@@ -123,42 +149,192 @@ class DTW(Metric):
       tempX = tempX.reshape(1,-1)
     if len(tempY.shape) == 1:
       tempY = tempY.reshape(1,-1)
-    X = np.empty(tempX.shape)
-    Y = np.empty(tempY.shape)
-    for index in range(len(tempX)):
-      if self.order == 1:
-        X[index] = np.gradient(tempX[index])
-        Y[index] = np.gradient(tempY[index])
-      else:
-        X[index] = tempX[index]
-        Y[index] = tempY[index]
+    X, Y = self.__preprocess(tempX), self.__preprocess(tempY)
     value = self.dtwDistance(X, Y)
     return value
 
-  def dtwDistance(self, x, y):
+  def evaluatePairwiseHistories(self, histories, pool=None):
+    """
+      This method computes the DTW distance between each pair of histories. The pairs of histories with the
+      same lengths are processed together, sweeping the anti-diagonals of all their cost matrices at once;
+      the batches of pairs are shared among the workers of the pool of processes, if any.
+      @ In, histories, list(numpy.ndarray), the histories, each one with shape (n_variables, n_time_steps)
+      @ In, pool, Runners.ProcessPool, optional, pool of processes computing the batches of pairs
+      @ Out, distances, numpy.ndarray, the (symmetric) matrix of the distances, shape (n_histories, n_histories)
+    """
+    histories = [self.__preprocess(np.atleast_2d(history)) for history in histories]
+    numHistories = len(histories)
+    distances = np.zeros((numHistories, numHistories))
+    rows, cols = np.triu_indices(numHistories, k=1)
+    if pool is not None and len(rows) <= self.pooledPairs:
+      pool = None
+    # group the pairs by lengths of the two histories
+    lengths = np.asarray([history.shape[1] for history in histories])
+    groups = {}
+    for pair, key in enumerate(zip(lengths[rows], lengths[cols])):
+      groups.setdefault(key, []).append(pair)
+    batches = []
+    for (rLen, cLen), pairs in groups.items():
+      pairs = np.asarray(pairs)
+      # bound the memory used by a batch (cost matrices, or histories if the local distances are computed on the fly)
+      cells = rLen*cLen if self.__normOrder() is None else (rLen+cLen)*histories[0].shape[0]
+      chunkSize = max(1, int(self.__maxChunkCells // max(cells, 1)))
+      if pool is not None:
+        # at least one batch per worker
+        chunkSize = min(chunkSize, -(-len(rows) // pool.numWorkers))
+      for start in range(0, len(pairs), chunkSize):
+        chunk = pairs[start:start+chunkSize]
+        batches.append((rows[chunk], cols[chunk]))
+    values = None
+    if pool is not None:
+      chunks = list(batches[w::pool.numWorkers] for w in range(pool.numWorkers))
+      responses = pool.map(pairwiseBatches, (self, histories), list((chunk,) for chunk in chunks if len(chunk)))
+      if all(succeeded for succeeded, _ in responses):
+        values = [None]*len(batches)
+        for w, (_, response) in enumerate(responses):
+          values[w::pool.numWorkers] = response
+      else:
+        self.raiseAWarning('The DTW distances could not be computed on the pool of processes, they are computed in process.')
+    if values is None:
+      values = self._evaluateBatches(histories, batches)
+    for (batchRows, batchCols), batchValues in zip(batches, values):
+      distances[batchRows, batchCols] = batchValues
+      distances[batchCols, batchRows] = batchValues
+    return distances
+
+  def _evaluateBatches(self, histories, batches):
+    """
+      Computes the DTW distances of batches of pairs of histories with the same lengths
+      @ In, histories, list(numpy.ndarray), the preprocessed histories, each one with shape (n_variables, n_time_steps)
+      @ In, batches, list(tuple), (rows, cols) indices of the histories of the pairs of each batch
+      @ Out, values, list(numpy.ndarray), the distances of the pairs of each batch
+    """
+    values = []
+    for batchRows, batchCols in batches:
+      X = np.asarray([histories[i] for i in batchRows])
+      Y = np.asarray([histories[j] for j in batchCols])
+      values.append(self.__dtwBatch(X, Y))
+    return values
+
+  def dtwDistance(self, x, y, cutoff=np.inf):
     """
       This method actually calculates the distance between two histories x and y
-      @ In, x, numpy.ndarray, data matrix for x
-      @ In, y, numpy.ndarray, data matrix for y
+      @ In, x, numpy.ndarray, data matrix for x, shape (n_variables, n_time_steps)
+      @ In, y, numpy.ndarray, data matrix for y, shape (n_variables, n_time_steps)
+      @ In, cutoff, float, optional, if the distance is proven to be larger than cutoff (by the LB_Keogh lower
+        bound, or while it is computed) the calculation is abandoned and inf is returned
       @ Out, value, float, distance between x and y
     """
-    r, c = len(x[0,:]), len(y[0,:])
-    D0 = np.zeros((r + 1, c + 1))
-    D0[0, 1:] = np.inf
-    D0[1:, 0] = np.inf
-    D1 = D0[1:, 1:]
-    D1 = spatialDistance.cdist(x.T,y.T, metric=self.localDistance)
-    C = D1.copy()
-    for i in range(r):
-      for j in range(c):
-        D1[i, j] += min(D0[i, j], D0[i, j+1], D0[i+1, j])
-    if len(x)==1:
-      path = np.zeros(len(y)), range(len(y))
-    elif len(y) == 1:
-      path = range(len(x)), np.zeros(len(x))
+    x, y = np.atleast_2d(x), np.atleast_2d(y)
+    if np.isfinite(cutoff) and self.lbKeogh(x, y) > cutoff:
+      return np.inf
+    return self.__dtwBatch(x[np.newaxis], y[np.newaxis], cutoff)[0]
+
+  def lbKeogh(self, x, y):
+    """
+      This method computes the LB_Keogh lower bound of the DTW distance between x and y: the sum of the
+      distances of each point of x from the envelope of the points of y it can be aligned to.
+      @ In, x, numpy.ndarray, data matrix for x, shape (n_variables, n_time_steps)
+      @ In, y, numpy.ndarray, data matrix for y, shape (n_variables, n_time_steps)
+      @ Out, bound, float, the lower bound (0 if it is not available for the local distance or the lengths)
+    """
+    order = self.__normOrder()
+    if order is None or x.shape[1] != y.shape[1]:
+      return 0.0
+    window = x.shape[1] if self.window is None else self.window
+    size = 2*window+1
+    lower = minimum_filter1d(y, size, axis=1, mode='nearest')
+    upper = maximum_filter1d(y, size, axis=1, mode='nearest')
+    return np.sum(self.__localDistance(x - np.clip(x, lower, upper), order))
+
+  def __preprocess(self, data):
+    """
+      Applies the order of the DTW (derivative DTW uses the gradients of the histories)
+      @ In, data, numpy.ndarray, data matrix, shape (n_variables, n_time_steps)
+      @ Out, data, numpy.ndarray, the processed data matrix
+    """
+    if self.order == 1:
+      return np.gradient(data, axis=-1)
+    return np.asarray(data, dtype=float)
+
+  def __normOrder(self):
+    """
+      Returns the order of the norm equivalent to the local distance, if any, so that the local distances
+      can be computed on the fly (and the LB_Keogh lower bound is valid)
+      @ In, None
+      @ Out, order, float or str, the norm order (np.inf for chebyshev, 'sq' for sqeuclidean) or None
+    """
+    return self.__normOrders.get(self.localDistance)
+
+  def __localDistance(self, difference, order):
+    """
+      Computes the local distances from the differences of the points (along the first axis, the variables)
+      @ In, difference, numpy.ndarray, the differences, shape (n_variables, ...)
+      @ In, order, float or str, the norm order (see __normOrder)
+      @ Out, distance, numpy.ndarray, the distances, shape (...)
+    """
+    if order == 'sq':
+      return np.sum(difference**2, axis=0)
+    if order == 1:
+      return np.sum(np.abs(difference), axis=0)
+    if order == np.inf:
+      return np.max(np.abs(difference), axis=0)
+    return np.sqrt(np.sum(difference**2, axis=0))
+
+  def __dtwBatch(self, X, Y, cutoff=np.inf):
+    """
+      Computes the DTW distances of a batch of pairs of histories with the same lengths, sweeping the
+      anti-diagonals of their cumulative cost matrices (restricted to the Sakoe-Chiba band, if requested)
+      @ In, X, numpy.ndarray, the first histories of the pairs, shape (n_pairs, n_variables, r)
+      @ In, Y, numpy.ndarray, the second histories of the pairs, shape (n_pairs, n_variables, c)
+      @ In, cutoff, float, optional, the pairs whose distance exceeds cutoff are abandoned (distance inf)
+      @ Out, values, numpy.ndarray, the distances, shape (n_pairs)
+    """
+    numPairs, r, c = X.shape[0], X.shape[2], Y.shape[2]
+    # the band must contain the end of the path
+    window = max(r, c) if self.window is None else max(self.window, abs(r-c))
+    order = self.__normOrder()
+    if order is None:
+      cost = np.asarray([spatialDistance.cdist(x.T, y.T, metric=self.localDistance) for x, y in zip(X, Y)])
     else:
-      path = self.tracePath(D0)
-    return D1[-1, -1]
+      # pairs along the last axis, so that the slices of a diagonal are contiguous; Y is reversed in time,
+      #   so that the points (k-i) of Y aligned to the points i of X on diagonal k are increasing as well
+      X = np.ascontiguousarray(np.moveaxis(X, 0, -1))
+      Y = np.ascontiguousarray(np.moveaxis(Y[:, :, ::-1], 0, -1))
+    # the last three anti-diagonals, indexed by i+1 (index 0 stands for i=-1, i.e. outside the matrix)
+    diagonals = np.full((3, r+1, numPairs), np.inf)
+    diagonals[0, 0] = 0.0 # cumulative cost before the first cell
+    ranges = [(0, 0), (0, -1), (0, -1)] # filled index range of each diagonal
+    abandoned = np.zeros(numPairs, dtype=bool)
+    for k in range(r+c-1):
+      previous2, previous1, current = diagonals[k % 3], diagonals[(k+1) % 3], diagonals[(k+2) % 3]
+      # reset the diagonal k-3 before reusing it
+      start, end = ranges[(k+2) % 3]
+      current[start:end+1] = np.inf
+      # cells (i, k-i) of the diagonal inside the matrix and the band |i-j| <= window
+      low = max(0, k-c+1, (k-window+1)//2)
+      high = min(r-1, k, (k+window)//2)
+      ranges[(k+2) % 3] = (low+1, high+1)
+      if low > high:
+        continue
+      if order is None:
+        i = np.arange(low, high+1)
+        local = cost[:, i, k-i].T
+      else:
+        local = self.__localDistance(X[:, low:high+1] - Y[:, c-1-k+low:c-k+high], order)
+      # predecessors: (i-1, j-1) on diagonal k-2, (i-1, j) and (i, j-1) on diagonal k-1
+      cell = current[low+1:high+2]
+      np.minimum(previous2[low:high+1], previous1[low:high+1], out=cell)
+      np.minimum(cell, previous1[low+1:high+2], out=cell)
+      cell += local
+      if np.isfinite(cutoff):
+        # every path crosses either this diagonal or the previous one, and costs are not negative
+        abandoned |= np.minimum(cell.min(axis=0), previous1.min(axis=0)) > cutoff
+        if abandoned.all():
+          break
+    values = diagonals[(r+c) % 3, r].copy()
+    values[abandoned | (values > cutoff)] = np.inf
+    return values
 
   def tracePath(self, D):
     """
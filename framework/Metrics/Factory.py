@@ -22,31 +22,22 @@ import warnings
 warnings.simplefilter('default',DeprecationWarning)
 #End compatibility block for Python 3-------------------------------------------
 
-################################################################################
-from utils import utils
-from .Metric import Metric
-from .DTW import DTW
-from .SklMetric import SKL
-from .PairwiseMetric import PairwiseMetric
-from .CDFAreaDifference import CDFAreaDifference
-from .PDFCommonArea import PDFCommonArea
-from .ScipyMetric import ScipyMetric
-## [ Add new class here ]
-################################################################################
-## Alternatively, to fully automate this file:
-# from OutStreamManagers import *
-################################################################################
+from utils import importerUtils
 
 """
   Interface Dictionary (factory) (private)
 """
-# This machinery will automatically populate the "knownTypes" given the
-# imports defined above.
+# The metrics are registered by the path of their definition, so that their modules (and the
+# libraries they need, e.g. scikit-learn) are only imported if an input uses them.
 __base = 'Metric'
-__interFaceDict = {}
-
-for classObj in utils.getAllSubclasses(eval(__base)):
-  __interFaceDict[classObj.__name__] = classObj
+__interFaceDict = importerUtils.LazyClassRegistry()
+__interFaceDict['DTW'              ] = 'Metrics.DTW.DTW'
+__interFaceDict['SKL'              ] = 'Metrics.SklMetric.SKL'
+__interFaceDict['PairwiseMetric'   ] = 'Metrics.PairwiseMetric.PairwiseMetric'
+__interFaceDict['CDFAreaDifference'] = 'Metrics.CDFAreaDifference.CDFAreaDifference'
+__interFaceDict['PDFCommonArea'    ] = 'Metrics.PDFCommonArea.PDFCommonArea'
+__interFaceDict['ScipyMetric'      ] = 'Metrics.ScipyMetric.ScipyMetric'
+## [ Add new class here ]
 
 def knownTypes():
   """
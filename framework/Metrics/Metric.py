@@ -24,6 +24,7 @@ warnings.simplefilter('default',DeprecationWarning)
 
 #External Modules------------------------------------------------------------------------------------
 import abc
+import numpy as np
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
@@ -104,6 +105,31 @@ class Metric(utils.metaclass_insert(abc.ABCMeta,BaseType)):
 
     return value
 
+  def evaluatePairs(self, pairs):
+    """
+      This method computes the metric for many pairs of data at once. Metrics that can process several
+      pairs together should override it.
+      @ In, pairs, list(tuple), the pairs (x, y) of data, see evaluate
+      @ Out, values, numpy.ndarray, the metric result for each pair
+    """
+    return np.asarray([self.evaluate(x, y) for x, y in pairs])
+
+  def evaluatePairwiseHistories(self, histories, pool=None):
+    """
+      This method computes the metric between each pair of histories. Metrics that can process several pairs
+      at once should override it.
+      @ In, histories, list(numpy.ndarray), the histories, each one with shape (n_variables, n_time_steps)
+      @ In, pool, Runners.ProcessPool, optional, pool of processes the metric can use (not used by this loop)
+      @ Out, values, numpy.ndarray, the (symmetric) matrix of the metric values, shape (n_histories, n_histories)
+    """
+    numHistories = len(histories)
+    values = np.zeros((numHistories, numHistories))
+    for i in range(numHistories):
+      for j in range(i, numHistories):
+        values[i, j] = self.evaluate(histories[i], histories[j])
+        values[j, i] = values[i, j]
+    return values
+
   def isDynamic(self):
     """
       This method is utility function that tells if the metric is able to
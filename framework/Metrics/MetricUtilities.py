@@ -58,102 +58,90 @@ def _countWeightInBins(sortedData, binBoundaries):
   return ret
 
 
-def _getPDFandCDFfromWeightedData(data, weights, numBins, uniformBins, interpolation):
+def _getPiecewiseFromWeightedData(data, weights, numBins, uniformBins, interpolation):
   """
-    This method is used to convert weighted data into a PDF and CDF function.
-    Basically, this does kernel density estimation of weighted data.
+    This method is used to convert weighted data into the values of the CDF and PDF at the midpoints of
+    the histogram bins (see _getPDFandCDFfromWeightedData).
     @ In, data, np.array,  one dimentional array of the data to process
     @ In, weights, np.array, one dimentional array of the weights for the data
     @ In, numBins, int, the number of bins to use.
     @ In, uniformBins, bool, if True, use uniformly sized bins, otherwise use equal probability bins.
     @ In, interpolation, str, "linear" or "quadratic", depending on which interpolation is used
-    @ Out, (dataStats, cdfFunc, pdfFunc), tuple, dataStats is dictionary with things like "mean" and "stdev", cdfFunction is a function that returns the CDF value and pdfFunc is a function that returns the PDF value.
+    @ Out, (dataStats, midpoints, cdf, pdf), tuple, dataStats is dictionary with things like "mean" and "stdev",
+      midpoints is the np.array of the midpoints of the bins, cdf and pdf are the np.array of the CDF and PDF values there
   """
-  # Sort the data
-  sortedData = list(zip(data, weights))
-  sortedData.sort() #Sort the data.
-  weightSum = sum(weights)
-  value = 0 #Read only
-  weight = 1 #Read only
+  data = np.asarray(data, dtype=float)
+  weights = np.asarray(weights, dtype=float)
+  # Sort the data (by value, then by weight)
+  order = np.lexsort((weights, data))
+  values = data[order]
+  sortedWeights = weights[order]
+  cumulativeWeights = np.cumsum(sortedWeights)
+  weightSum = cumulativeWeights[-1]
   # Find data range
-  low = sortedData[0][value]
-  high = sortedData[-1][value]
+  low = values[0]
+  high = values[-1]
   dataRange = high - low
   #Find the values to use between the histogram bins
   if uniformBins:
     minBinSize = dataRange/numBins
-    bins = [low + x * minBinSize for x in range(1, numBins)]
+    bins = low + np.arange(1, numBins) * minBinSize
   else:
-    #Equal probability bins
+    #Equal probability bins: the first value where the cumulative weight reaches each probability level
     probPerBin = weightSum/numBins
-    probSum = 0.0
-    bins = [None]*(numBins-1)
-    searchIndex = 0
-    #Look thru the array, and find the next place where probSum > nextProb
-    for i in range(numBins-1):
-      nextProb = (i + 1) * probPerBin
-      while probSum + sortedData[searchIndex][weight] < nextProb:
-        probSum += sortedData[searchIndex][weight]
-        searchIndex += 1
-      bins[i] = sortedData[searchIndex][value]
+    indices = np.searchsorted(cumulativeWeights, np.arange(1, numBins) * probPerBin, side='left')
+    bins = values[np.minimum(indices, len(values)-1)]
     #Remove duplicates
-    for i in reversed(range(len(bins))):
-      if i > 1 and bins[i-1] == bins[i]:
-        bins.pop(i)
+    keep = np.ones(len(bins), dtype=bool)
+    keep[2:] = bins[2:] != bins[1:-1]
+    bins = bins[keep]
     if len(bins) > 1:
-      minBinSize = min(map(lambda x, y: x - y, bins[1:], bins[:-1]))
+      minBinSize = np.min(bins[1:] - bins[:-1])
     else:
       minBinSize = dataRange
-  #Count the amount of weight in each bin
-  counts = _countWeightInBins(sortedData, bins)
-  binBoundaries = [low] + bins + [high]
-  countSum = sum(counts)
+  #Count the amount of weight in each bin (bin k holds the values in (bins[k-1],bins[k]])
+  counts = np.bincount(np.searchsorted(bins, values, side='left'), weights=sortedWeights, minlength=len(bins)+1)
+  binBoundaries = np.concatenate(([low], bins, [high]))
+  countSum = np.cumsum(counts)[-1]
   assert -1e-4 < countSum - weightSum < 1e-4
   # Create CDF
-  cdf = [0.0] * len(counts)
-  midpoints = [0.0] * len(counts)
-  cdfSum = 0.0
-  for i in range(len(counts)):
-    f0 = counts[i] / countSum
-    cdfSum += f0
-    cdf[i] = cdfSum
-    midpoints[i] = (binBoundaries[i] + binBoundaries[i + 1]) / 2.0
-  cdfFunc = mathUtils.createInterp(midpoints, cdf, 0.0, 1.0, interpolation)
+  cdf = np.cumsum(counts / countSum)
+  midpoints = (binBoundaries[:-1] + binBoundaries[1:]) / 2.0
   #Create PDF
-  fPrimeData = [0.0] * len(counts)
-  for i in range(len(counts)):
-    h = binBoundaries[i + 1] - binBoundaries[i]
-    nCount = counts[i] / countSum  # normalized count
-    f0 = cdf[i]
-    if i + 1 < len(counts):
-      f1 = cdf[i + 1]
-    else:
-      f1 = 1.0
-    if i + 2 < len(counts):
-      f2 = cdf[i + 2]
-    else:
-      f2 = 1.0
-    if interpolation == 'linear':
-      fPrime = (f1 - f0) / h
-    else:
-      fPrime = (-1.5 * f0 + 2.0 * f1 + -0.5 * f2) / h
-    fPrimeData[i] = fPrime
-  pdfFunc = mathUtils.createInterp(midpoints, fPrimeData, 0.0, 0.0, interpolation)
+  h = binBoundaries[1:] - binBoundaries[:-1]
+  f0 = cdf
+  f1 = np.concatenate((cdf[1:], [1.0]))
+  f2 = np.concatenate((cdf[2:], [1.0, 1.0]))[:len(cdf)]
+  if interpolation == 'linear':
+    fPrime = (f1 - f0) / h
+  else:
+    fPrime = (-1.5 * f0 + 2.0 * f1 + -0.5 * f2) / h
   mean = np.average(data, weights = weights)
   dataStats = {"mean":mean,"minBinSize":minBinSize,"low":low,"high":high}
-  return dataStats, cdfFunc, pdfFunc
+  return dataStats, midpoints, cdf, fPrime
 
+def _getPDFandCDFfromWeightedData(data, weights, numBins, uniformBins, interpolation):
+  """
+    This method is used to convert weighted data into a PDF and CDF function.
+    Basically, this does kernel density estimation of weighted data.
+    @ In, data, np.array,  one dimentional array of the data to process
+    @ In, weights, np.array, one dimentional array of the weights for the data
+    @ In, numBins, int, the number of bins to use.
+    @ In, uniformBins, bool, if True, use uniformly sized bins, otherwise use equal probability bins.
+    @ In, interpolation, str, "linear" or "quadratic", depending on which interpolation is used
+    @ Out, (dataStats, cdfFunc, pdfFunc), tuple, dataStats is dictionary with things like "mean" and "stdev", cdfFunction is a function that returns the CDF value and pdfFunc is a function that returns the PDF value.
+  """
+  dataStats, midpoints, cdf, fPrimeData = _getPiecewiseFromWeightedData(data, weights, numBins, uniformBins, interpolation)
+  cdfFunc = mathUtils.createInterp(midpoints, cdf, 0.0, 1.0, interpolation)
+  pdfFunc = mathUtils.createInterp(midpoints, fPrimeData, 0.0, 0.0, interpolation)
+  return dataStats, cdfFunc, pdfFunc
 
-def _convertToCommonFormat(data):
+def _getWeightedPoints(data):
   """
-    Convert either a distribution or a set of data to a (stats, cdf, pdf) pair
+    Convert a set of data to the points and their weights
+    @ In, data, tuple or list, either (points,weights) or the points (with uniform weights)
+    @ Out, (points, weights, numBins), tuple, the points, their weights and the number of bins of their histogram
   """
-  if isinstance(data, Distributions.Distribution):
-    # data is a subclass of BoostDistribution, generate needed stats, and pass in cdf and pdf.
-    stats = {"mean":data.untruncatedMean(),"stdev":data.untruncatedStdDev()}
-    cdf = lambda x:data.cdf(x)
-    pdf = lambda x:data.pdf(x)
-    return stats, cdf, pdf
   if type(data).__name__ == "tuple":
     # data is (list,list), then it is a list of weights
     assert len(data) == 2
@@ -167,8 +155,30 @@ def _convertToCommonFormat(data):
     raise IOError("Unknown type in _convertToCommonFormat")
   #Sturges method for determining number of bins
   numBins = int(math.ceil(mathUtils.log2(len(points)) + 1))
+  return points, weights, numBins
+
+def _convertToCommonFormat(data):
+  """
+    Convert either a distribution or a set of data to a (stats, cdf, pdf) pair
+  """
+  if isinstance(data, Distributions.Distribution):
+    # data is a subclass of BoostDistribution, generate needed stats, and pass in cdf and pdf.
+    stats = {"mean":data.untruncatedMean(),"stdev":data.untruncatedStdDev()}
+    cdf = lambda x:data.cdf(x)
+    pdf = lambda x:data.pdf(x)
+    return stats, cdf, pdf
+  points, weights, numBins = _getWeightedPoints(data)
   return _getPDFandCDFfromWeightedData(points, weights, numBins, False, 'linear')
 
+def _convertToPiecewise(data):
+  """
+    Convert a set of data to the piecewise linear representation of its CDF and PDF
+    @ In, data, tuple or list, either (points,weights) or the points (with uniform weights)
+    @ Out, (stats, midpoints, cdf, pdf), tuple, see _getPiecewiseFromWeightedData
+  """
+  points, weights, numBins = _getWeightedPoints(data)
+  return _getPiecewiseFromWeightedData(points, weights, numBins, False, 'linear')
+
 
 def _getBounds(stats1, stats2):
   """
@@ -202,6 +212,127 @@ def _getBounds(stats1, stats2):
   high = max(getHighBound(stats1), getHighBound(stats2))
   return (low,high)
 
+def _getPiecewiseLimits(x, y, lowFill, highFill, grid):
+  """
+    Evaluates a piecewise linear function (filled with constants outside of its knots, see
+    mathUtils.createInterp) at the two ends of each interval of a grid that contains all its knots
+    @ In, x, np.array, the knots of the function
+    @ In, y, np.array, the values of the function at the knots
+    @ In, lowFill, float, the value below the first knot
+    @ In, highFill, float, the value above the last knot
+    @ In, grid, np.array, the sorted grid (including all the knots)
+    @ Out, (start, end), tuple, np.array of the limit of the function at the start of each interval (from
+      the right) and at the end of each interval (from the left), so that it is linear between them
+  """
+  start = np.interp(grid[:-1], x, y)
+  end = np.interp(grid[1:], x, y)
+  start = np.where(grid[:-1] < x[0], lowFill, np.where(grid[:-1] >= x[-1], highFill, start))
+  end = np.where(grid[1:] <= x[0], lowFill, np.where(grid[1:] > x[-1], highFill, end))
+  return start, end
+
+def _integrateAbsLinear(start, end, width):
+  """
+    Integrates exactly the absolute value of linear functions over intervals
+    @ In, start, np.array, the values at the start of each interval
+    @ In, end, np.array, the values at the end of each interval
+    @ In, width, np.array, the width of each interval
+    @ Out, integral, np.array, the integral of the absolute value on each interval
+  """
+  absStart = np.abs(start)
+  absEnd = np.abs(end)
+  total = absStart + absEnd
+  # when the function changes sign, the two triangles on the two sides of the root
+  crossing = start * end < 0.0
+  safeTotal = np.where(crossing, total, 1.0)
+  return np.where(crossing, (start**2 + end**2) / (2.0 * safeTotal), total / 2.0) * width
+
+def _comparePiecewise(pairs, comparison):
+  """
+    Computes exactly, for many pairs of data at once, the area between the two CDFs or the area shared by
+    the two PDFs: the empirical CDFs and PDFs are piecewise linear, so their knots are merged and each
+    interval is integrated analytically.
+    @ In, pairs, list, the pairs (data1, data2) of data (no distributions), see _convertToCommonFormat
+    @ In, comparison, str, "cdfAreaDifference" or "pdfCommonArea"
+    @ Out, values, np.array, the value for each pair
+  """
+  if len(pairs) == 0:
+    return np.zeros(0)
+  starts, ends, widths, lengths = [], [], [], []
+  for data1, data2 in pairs:
+    stats1, x1, cdf1, pdf1 = _convertToPiecewise(data1)
+    stats2, x2, cdf2, pdf2 = _convertToPiecewise(data2)
+    low, high = _getBounds(stats1, stats2)
+    if comparison == "cdfAreaDifference":
+      y1, y2, highFill = cdf1, cdf2, 1.0
+    else:
+      # the bins of zero width have no finite density (0/0 if empty, a point mass otherwise): skip them
+      finite1, finite2 = np.isfinite(pdf1), np.isfinite(pdf2)
+      x1, y1 = (x1[finite1], pdf1[finite1]) if finite1.any() else (np.array([low]), np.zeros(1))
+      x2, y2 = (x2[finite2], pdf2[finite2]) if finite2.any() else (np.array([low]), np.zeros(1))
+      highFill = 0.0
+    grid = np.unique(np.concatenate(([low], x1, x2, [high])))
+    start1, end1 = _getPiecewiseLimits(x1, y1, 0.0, highFill, grid)
+    start2, end2 = _getPiecewiseLimits(x2, y2, 0.0, highFill, grid)
+    starts.append(np.stack((start1, start2)))
+    ends.append(np.stack((end1, end2)))
+    widths.append(grid[1:] - grid[:-1])
+    lengths.append(len(grid)-1)
+  # integrate the intervals of all the pairs together
+  start = np.concatenate(starts, axis=1)
+  end = np.concatenate(ends, axis=1)
+  width = np.concatenate(widths)
+  difference = _integrateAbsLinear(start[0] - start[1], end[0] - end[1], width)
+  if comparison == "cdfAreaDifference":
+    areas = difference
+  else:
+    # min(f,g) = (f+g)/2 - |f-g|/2
+    areas = (start.sum(axis=0) + end.sum(axis=0)) / 4.0 * width - difference / 2.0
+  pairIndex = np.repeat(np.arange(len(pairs)), lengths)
+  return np.bincount(pairIndex, weights=areas, minlength=len(pairs))
+
+def _comparePairs(pairs, comparison):
+  """
+    Computes the area between the two CDFs or the area shared by the two PDFs of many pairs of data or
+    distributions. The pairs of data are integrated exactly (see _comparePiecewise), the pairs with a
+    distribution numerically.
+    @ In, pairs, list, the pairs (data1, data2), see _convertToCommonFormat
+    @ In, comparison, str, "cdfAreaDifference" or "pdfCommonArea"
+    @ Out, values, np.array, the value for each pair
+  """
+  values = np.zeros(len(pairs))
+  empirical = []
+  for index, (data1, data2) in enumerate(pairs):
+    if not isinstance(data1, Distributions.Distribution) and not isinstance(data2, Distributions.Distribution):
+      empirical.append(index)
+      continue
+    stats1, cdf1, pdf1 =_convertToCommonFormat(data1)
+    stats2, cdf2, pdf2 =_convertToCommonFormat(data2)
+    low, high = _getBounds(stats1, stats2)
+    #for some earlier tests, simpson was more reliable, but much slower
+    #return mathUtils.simpson(lambda x:abs(cdf1(x)-cdf2(x)),low,high,100000)
+    if comparison == "cdfAreaDifference":
+      values[index] = scipy.integrate.quad(lambda x:abs(cdf1(x)-cdf2(x)),low,high,limit=1000)[0]
+    else:
+      values[index] = scipy.integrate.quad(lambda x:min(pdf1(x),pdf2(x)),low,high,limit=1000)[0]
+  values[empirical] = _comparePiecewise([pairs[index] for index in empirical], comparison)
+  return values
+
+def _getCDFAreaDifferences(pairs):
+  """
+    Gets the area between the two CDFs of each pair of data, see _getCDFAreaDifference.
+    @ In, pairs, list, the pairs (data1, data2), see _convertToCommonFormat
+    @ Out, cdfAreaDifferences, np.array, the area difference between the CDFs of each pair.
+  """
+  return _comparePairs(pairs, "cdfAreaDifference")
+
+def _getPDFCommonAreas(pairs):
+  """
+    Gets the area that the PDFs of each pair of data overlap, see _getPDFCommonArea.
+    @ In, pairs, list, the pairs (data1, data2), see _convertToCommonFormat
+    @ Out, pdfCommonAreas, np.array, the common area between the PDFs of each pair.
+  """
+  return _comparePairs(pairs, "pdfCommonArea")
+
 def _getCDFAreaDifference(data1, data2):
   """
     Gets the area between the two CDFs in data1 and data2.
@@ -210,12 +341,7 @@ def _getCDFAreaDifference(data1, data2):
     @ In, data2, varies, The second data to use, see _convertToCommonFormat
     @ Out, cdfAreaDifference, float, the area difference between the CDFs.
   """
-  stats1, cdf1, pdf1 =_convertToCommonFormat(data1)
-  stats2, cdf2, pdf2 =_convertToCommonFormat(data2)
-  low, high = _getBounds(stats1, stats2)
-  #for some earlier tests, simpson was more reliable, but much slower
-  #return mathUtils.simpson(lambda x:abs(cdf1(x)-cdf2(x)),low,high,100000)
-  return scipy.integrate.quad(lambda x:abs(cdf1(x)-cdf2(x)),low,high,limit=1000)[0]
+  return _getCDFAreaDifferences([(data1, data2)])[0]
 
 def _getPDFCommonArea(data1, data2):
   """
@@ -225,10 +351,4 @@ def _getPDFCommonArea(data1, data2):
     @ In, data2, varies, The second data to use, see _convertToCommonFormat
     @ Out, pdfCommonArea, float, the common area between the PDFs.
   """
-  stats1, cdf1, pdf1 =_convertToCommonFormat(data1)
-  stats2, cdf2, pdf2 =_convertToCommonFormat(data2)
-  low, high = _getBounds(stats1, stats2)
-  #for some earlier tests, simpson was more reliable, but much slower
-  #return mathUtils.simpson(lambda x:min(pdf1(x),pdf2(x)),low,high,100000)
-  return scipy.integrate.quad(lambda x:min(pdf1(x),pdf2(x)),low,high,limit=1000)[0]
-
+  return _getPDFCommonAreas([(data1, data2)])[0]
@@ -21,15 +21,11 @@ from __future__ import absolute_import
 ## These lines ensure that we do not have to do something like:
 ## 'from OutStreamManagers.OutStreamPlot import OutStreamPlot' outside
 ## of this submodule
+## Only the base class is imported here, the specific metrics are imported
+## by the Factory when an input asks for them
 from .Metric import Metric
-from .DTW import DTW
-from .SklMetric import SKL
-from .PairwiseMetric import PairwiseMetric
-from .CDFAreaDifference import CDFAreaDifference
-from .PDFCommonArea import PDFCommonArea
-from .ScipyMetric import ScipyMetric
 from .Factory import knownTypes
 from .Factory import returnInstance
 from .Factory import returnClass
 
-__all__ = ['DTW','SKL','PairwiseMetric','CDFAreaDifference','PDFCommonArea','ScipyMetric']
+__all__ = ['Metric']
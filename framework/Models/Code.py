@@ -359,7 +359,7 @@ class Code(Model):
         os.mkdir(subSubDirectory)
       ##########################################################################
       newInputSet[index].setPath(subSubDirectory)
-      shutil.copy(self.oriInputFiles[index].getAbsFile(),subSubDirectory)
+      self._stageInputFile(self.oriInputFiles[index],subSubDirectory)
 
     kwargs['subDirectory'] = subDirectory
 
@@ -373,6 +373,32 @@ class Code(Model):
 
     return (newInput,kwargs)
 
+  def _stageInputFile(self, inputFile, directory):
+    """
+      Places an original input file in the run directory of a realization: copied, or linked if requested by
+      its "staging" attribute (meant for large read-only files, e.g. tables). The files with one of the input
+      extensions of the code are always copied, since the code interfaces write the new inputs in them.
+      @ In, inputFile, Files.File, the original input file
+      @ In, directory, string, the run directory
+      @ Out, None
+    """
+    staging = inputFile.getStaging()
+    if staging == 'copy' or inputFile.getExt() in self.code.getInputExtension():
+      shutil.copy(inputFile.getAbsFile(),directory)
+      return
+    destination = os.path.join(directory,inputFile.getFilename())
+    if os.path.lexists(destination):
+      os.remove(destination)
+    try:
+      if staging == 'hardlink':
+        os.link(inputFile.getAbsFile(),destination)
+      else:
+        os.symlink(inputFile.getAbsFile(),destination)
+    except (OSError, AttributeError, NotImplementedError) as error:
+      # e.g. hard links across file systems, or symbolic links not available on Windows
+      self.raiseAWarning('Could not '+staging+' the file '+inputFile.getFilename()+' ('+str(error)+'), it is copied instead')
+      shutil.copy(inputFile.getAbsFile(),directory)
+
   def _expandCommand(self, origCommand):
     """
       Function to expand a command from string to list.
@@ -582,7 +608,7 @@ class Code(Model):
       finalCodeOutputFile = self.code.finalizeCodeOutput(command, codeLogFile, metaData['subDirectory'])
       ## Special case for RAVEN interface --ALFOA 09/17/17
       ravenCase = False
-      if type(finalCodeOutputFile).__name__ == 'dict':
+      if utils.isAMapping(finalCodeOutputFile):
         ravenCase = True
       if ravenCase and self.code.__class__.__name__ != 'RAVEN':
         self.raiseAnError(RuntimeError, 'The return argument from "finalizeCodeOutput" must be a str containing the new output file root!')
@@ -83,10 +83,10 @@ class Dummy(Model):
       @ Out, localInput, dict, the manipulated input
     """
     #self.raiseADebug('wondering if a dictionary compatibility should be kept','FIXME')
-    if  type(dataIN).__name__ !='dict':
+    if not utils.isAMapping(dataIN):
       if dataIN.type not in self.admittedData:
         self.raiseAnError(IOError,self,'type "'+dataIN.type+'" is not compatible with the model "' + self.type + '" named "' + self.name+'"!')
-    if type(dataIN)!=dict:
+    if not utils.isAMapping(dataIN):
       #localInput = dict.fromkeys(dataIN.getParaKeys('inputs' )+dataIN.getParaKeys('outputs' ),None)
       localInput = dict.fromkeys(dataIN.getVars('input')+dataIN.getVars('output')+dataIN.indexes,None)
       if not len(dataIN) == 0:
@@ -190,11 +190,22 @@ class Dummy(Model):
     # TODO consistency with old HDF5; fix this when HDF5 api is in place
     # TODO expensive deepcopy prevents modification when sent to multiple outputs
     result = finishedJob.getEvaluation()
-    # alias system
-    self._replaceVariablesNamesWithAliasSystem(result,'output',True)
     if isinstance(result,Runners.Error):
       self.raiseAnError(Runners.Error,'No available output to collect!')
-    output.addRealization(result)
+    # in the event a batch is run, the evaluations will be a dict as {'RAVEN_isBatch':True, 'realizations': [...]}
+    if result.get('RAVEN_isBatch',False):
+      # alias system, for each realization
+      for rlz in result['realizations']:
+        self._replaceVariablesNamesWithAliasSystem(rlz,'output',True)
+      if output.type in ['PointSet','HistorySet','DataSet']:
+        output.addRealizations(result['realizations'])
+      else:
+        for rlz in result['realizations']:
+          output.addRealization(rlz)
+    else:
+      # alias system
+      self._replaceVariablesNamesWithAliasSystem(result,'output',True)
+      output.addRealization(result)
     # END can be abstracted to base class
 
   def collectOutputFromDict(self,exportDict,output,options=None):
@@ -23,7 +23,6 @@ warnings.simplefilter('default',DeprecationWarning)
 #External Modules------------------------------------------------------------------------------------
 import copy
 import numpy as np
-import time
 import itertools
 from collections import OrderedDict
 #External Modules End--------------------------------------------------------------------------------
@@ -627,11 +626,10 @@ class EnsembleModel(Dummy):
               self.raiseADebug('Submitting model',modelIn)
               self.modelsDictionary[modelIn]['Instance'].submit(originalInput[modelIn], samplerType, jobHandler, **inputKwargs[modelIn])
               # wait until the model finishes, in order to get ready to run the subsequential one
-              while not jobHandler.isThisJobFinished(modelIn+utils.returnIdSeparator()+identifier):
-                time.sleep(1.e-3)
+              jobHandler.waitForFinished(jobIdentifier = modelIn+utils.returnIdSeparator()+identifier, uniqueHandler = self.name+identifier)
               nextModel = moveOn = True
             else:
-              time.sleep(1.e-3)
+              jobHandler.waitForAvailability()
           # store the results in the working dictionaries
             returnDict[modelIn]   = {}
           #if modelIn not in modelsOnHold:
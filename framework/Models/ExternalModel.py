@@ -21,6 +21,7 @@ warnings.simplefilter('default',DeprecationWarning)
 #End compatibility block for Python 3----------------------------------------------------------------
 
 #External Modules------------------------------------------------------------------------------------
+import os
 import copy
 import numpy as np
 import inspect
@@ -31,6 +32,7 @@ from .Dummy import Dummy
 import CustomCommandExecuter
 from utils import utils
 from utils import InputData
+from utils.sampleRecord import SampleRecord
 import Runners
 #Internal Modules End--------------------------------------------------------------------------------
 
@@ -85,6 +87,32 @@ class ExternalModel(Dummy):
     self.initExtSelf              = utils.Object()
     self.workingDir = runInfoDict['WorkingDir']
 
+  def __getstate__(self):
+    """
+      Get state for pickling (e.g. to evaluate the samples on a pool of processes).
+      The imported module cannot be pickled, so its file name is stored instead.
+      @ In, None
+      @ Out, state, dict, the state of this object
+    """
+    state = self.__dict__.copy()
+    if inspect.ismodule(self.sim):
+      state['sim'] = None
+      state['RAVEN_simFile'] = self.sim.__file__
+    return state
+
+  def __setstate__(self, state):
+    """
+      Set state after unpickling, importing again the external module if needed.
+      @ In, state, dict, the state of this object
+      @ Out, None
+    """
+    simFile = state.pop('RAVEN_simFile', None)
+    self.__dict__.update(state)
+    if simFile is not None:
+      if simFile.endswith(('.pyc','.pyo')):
+        simFile = simFile[:-1]
+      self.sim = utils.importFromPath(simFile, False)
+
   def initialize(self,runInfo,inputs,initDict=None):
     """
       this needs to be over written if a re initialization of the model is need it gets called at every beginning of a step
@@ -116,8 +144,11 @@ class ExternalModel(Dummy):
       extCreateNewInput = self.sim.createNewInput(self.initExtSelf,myInput,samplerType,**kwargs)
       if extCreateNewInput== None:
         self.raiseAnError(AttributeError,'in external Model '+self.ModuleToLoad+' the method createNewInput must return something. Got: None')
-      if type(extCreateNewInput).__name__ != "dict":
+      if not utils.isAMapping(extCreateNewInput):
         self.raiseAnError(AttributeError,'in external Model '+self.ModuleToLoad+ ' the method createNewInput must return a dictionary. Got type: ' +type(extCreateNewInput).__name__)
+      if isinstance(extCreateNewInput,SampleRecord):
+        # e.g. the SampledVars passed in kwargs
+        extCreateNewInput = dict(extCreateNewInput)
       if 'SampledVars' in kwargs.keys() and len(self.alias['input'].keys()) != 0:
         kwargs['SampledVars'] = sampledVars
       # add sampled vars
@@ -147,8 +178,9 @@ class ExternalModel(Dummy):
     if 'ModuleToLoad' in paramInput.parameterValues:
       self.ModuleToLoad = paramInput.parameterValues['ModuleToLoad']
       moduleToLoadString, self.ModuleToLoad = utils.identifyIfExternalModelExists(self, self.ModuleToLoad, self.workingDir)
-      # load the external module and point it to self.sim
-      self.sim = utils.importFromPath(moduleToLoadString,self.messageHandler.getDesiredVerbosity(self)>1)
+      # load the external module and point it to self.sim (with an absolute path, so
+      # that it can be imported again after unpickling, from any working directory)
+      self.sim = utils.importFromPath(os.path.abspath(moduleToLoadString),self.messageHandler.getDesiredVerbosity(self)>1)
     elif len(paramInput.parameterValues['subType'].strip()) > 0:
       # it is a plugin. Look for the type in the plugins class list
       if paramInput.parameterValues['subType'] not in ExternalModel.plugins.knownTypes():
@@ -190,7 +222,7 @@ class ExternalModel(Dummy):
     for key in self.modelVariableType.keys():
       modelVariableValues[key] = None
     for key,value in self.initExtSelf.__dict__.items():
-      CustomCommandExecuter.execCommand('self.'+ key +' = copy.copy(object)',self=externalSelf,object=value)  # exec('externalSelf.'+ key +' = copy.copy(value)')
+      CustomCommandExecuter.attributeSetter(key)(externalSelf,copy.copy(value))
       modelVariableValues[key] = copy.copy(value)
     for key in Input.keys():
       if key in modelVariableValues.keys():
@@ -206,7 +238,7 @@ class ExternalModel(Dummy):
     for key in self.modelVariableType.keys():
       # add the variable as a member of "self"
       try:
-        CustomCommandExecuter.execCommand('self.'+ key +' = copy.copy(object["'+key+'"])',self=externalSelf,object=modelVariableValues) #exec('externalSelf.'+ key +' = copy.copy(modelVariableValues[key])')  #self.__uploadSolution()
+        CustomCommandExecuter.attributeSetter(key)(externalSelf,copy.copy(modelVariableValues[key]))
       # if variable name is too strange to be a member of "self", then skip it
       except SyntaxError:
         self.raiseAWarning('Variable "{}" could not be added to "self" due to complex name.  Find it in "Inputs" dictionary instead.'.format(key))
@@ -221,11 +253,11 @@ class ExternalModel(Dummy):
 
     for key in self.modelVariableType.keys():
       try:
-        CustomCommandExecuter.execCommand('object["'+key+'"]  = copy.copy(self.'+key+')',self=externalSelf,object=modelVariableValues) #exec('modelVariableValues[key]  = copy.copy(externalSelf.'+key+')') #self.__pointSolution()
+        modelVariableValues[key] = copy.copy(CustomCommandExecuter.attributeGetter(key)(externalSelf))
       except (SyntaxError,AttributeError):
         self.raiseAWarning('Variable "{}" cannot be read from "self" due to complex name.  Retaining original value.'.format(key))
     for key in self.initExtSelf.__dict__.keys():
-      CustomCommandExecuter.execCommand('self.' +key+' = copy.copy(object.'+key+')',self=self.initExtSelf,object=externalSelf) #exec('self.initExtSelf.' +key+' = copy.copy(externalSelf.'+key+')')
+      CustomCommandExecuter.attributeSetter(key)(self.initExtSelf,copy.copy(CustomCommandExecuter.attributeGetter(key)(externalSelf)))
     if None in self.modelVariableType.values():
       errorFound = False
       for key in self.modelVariableType.keys():
@@ -260,6 +292,9 @@ class ExternalModel(Dummy):
           the second item will be the output of this model given the specified
           inputs
     """
+    if self.canEvaluateBatch() and self.__scalarSamples([kwargs]):
+      # a vectorized module always receives one entry per sample
+      return self.__evaluateVectorized(myInput, samplerType, [kwargs])[0]
     Input = self.createNewInput(myInput, samplerType, **kwargs)
     inRun = copy.copy(self._manipulateInput(Input[0][0]))
     # collect results from model run
@@ -276,6 +311,102 @@ class ExternalModel(Dummy):
     rlz.update(dict((var,np.atleast_1d(val)) for var,val in kwargs['SampledVars'].items()))
     return rlz
 
+  def canEvaluateBatch(self):
+    """
+      Determines if several samples can be evaluated at once with a single call to the "run" method of the
+      external module, which is the case if the module flags it as vectorized ("run.vectorized = True") and does
+      not create the inputs itself (createNewInput).
+      @ In, None
+      @ Out, canEvaluateBatch, bool, True if submitBatch can be used
+    """
+    return getattr(getattr(self.sim,'run',None),'vectorized',False) is True and 'createNewInput' not in dir(self.sim)
+
+  def submitBatch(self, myInput, samplerType, jobHandler, batch):
+    """
+        This will submit a batch of samples to be evaluated by this model as a single job to a
+        specified jobHandler. The job result is a {'RAVEN_isBatch':True,'realizations':[...]} dictionary.
+        @ In, myInput, list, the inputs (list) to start from to generate the new one
+        @ In, samplerType, string, is the type of sampler that is calling to generate a new input
+        @ In,  jobHandler, JobHandler instance, the global job handler instance
+        @ In, batch, list(dict), the information coming from the sampler for each sample (see submit)
+        @ Out, None
+    """
+    prefix = batch[0]['prefix'] if len(batch) == 1 else '{}-{}'.format(batch[0]['prefix'],batch[-1]['prefix'])
+    uniqueHandler = batch[0].get('uniqueHandler','any')
+    metadata = {'prefix':prefix, 'batchSize':len(batch)}
+    jobHandler.addJob((self, myInput, samplerType, batch), self.__class__.evaluateBatch, prefix, metadata=metadata, modulesToImport=self.mods, uniqueHandler=uniqueHandler)
+
+  def evaluateBatch(self, myInput, samplerType, batch):
+    """
+        This will evaluate a batch of samples on this model with a single call to the vectorized "run" method of
+        the external module (see __evaluateVectorized). Samples with non-scalar inputs are evaluated one at a time.
+        @ In, myInput, list, the inputs (list) to start from to generate the new one
+        @ In, samplerType, string, is the type of sampler that is calling to generate a new input
+        @ In, batch, list(dict), the information coming from the sampler for each sample (see evaluateSample)
+        @ Out, result, dict, {'RAVEN_isBatch':True,'realizations':[rlz]} with one realization (see evaluateSample) per sample
+    """
+    if not self.__scalarSamples(batch):
+      return {'RAVEN_isBatch':True, 'realizations':list(self.evaluateSample(myInput, samplerType, kwargs) for kwargs in batch)}
+    return {'RAVEN_isBatch':True, 'realizations':self.__evaluateVectorized(myInput, samplerType, batch)}
+
+  def __scalarSamples(self, batch):
+    """
+      Checks if the samples of a batch can be stacked: same sampled variables, each with a single value
+      @ In, batch, list(dict), the information coming from the sampler for each sample (see evaluateSample)
+      @ Out, scalar, bool, True if the samples can be stacked
+    """
+    sampledVars = set(batch[0]['SampledVars'].keys())
+    return all(set(kwargs['SampledVars'].keys()) == sampledVars and
+               all(np.asarray(value).size == 1 for value in kwargs['SampledVars'].values()) for kwargs in batch)
+
+  def __evaluateVectorized(self, myInput, samplerType, batch):
+    """
+        Evaluates samples with scalar inputs with a single call to the vectorized "run" method of the external
+        module: each variable of "self" holds the array of the values of all the samples, and the method must set
+        each output to an array with one entry (or one row, for a history) per sample, whatever the number of
+        samples (a single sample included), or to a single value common to all the samples. The outputs common to
+        all the samples that are not single values (e.g. the pivot parameter of the histories) must be listed in
+        the "sharedOutputs" attribute of the method, so that they are never split along the samples.
+        @ In, myInput, list, the inputs (list) to start from to generate the new one
+        @ In, samplerType, string, is the type of sampler that is calling to generate a new input
+        @ In, batch, list(dict), the information coming from the sampler for each sample (see evaluateSample)
+        @ Out, realizations, list(dict), one realization (see evaluateSample) per sample
+    """
+    numSamples = len(batch)
+    # stack the sampled values, so that the module runs once for all the samples
+    stacked = dict(batch[0])
+    stacked['SampledVars'] = dict((var,np.array(list(np.asarray(kwargs['SampledVars'][var]).ravel()[0] for kwargs in batch))) for var in batch[0]['SampledVars'].keys())
+    Input = self.createNewInput(myInput, samplerType, **stacked)
+    inRun = copy.copy(self._manipulateInput(Input[0][0]))
+    result,_ = self._externalRun(inRun,Input[1])
+    sharedOutputs = getattr(self.sim.run,'sharedOutputs',[])
+    # split the values along the samples (single values and the declared shared outputs are common to all the samples)
+    def perSample(var,values):
+      """
+        Returns the function giving the value of a variable for a sample
+        @ In, var, str, the variable name
+        @ In, values, object, the values of the variable for the batch
+        @ Out, perSample, function, the value of the i-th sample
+      """
+      values = np.atleast_1d(values)
+      if var in sharedOutputs or values.size == 1:
+        return lambda i: values
+      if values.shape[0] == numSamples:
+        return lambda i: np.atleast_1d(values[i])
+      self.raiseAnError(RuntimeError,'The vectorized run of the external model "{}" returned "{}" with shape {} for a batch of {} samples!'.format(self.name,var,values.shape,numSamples),
+                        'The values of each sample must be a row (a history must be a 2-D array samples x pivot), and the outputs common to all the samples must be listed in "run.sharedOutputs".')
+    inRun = dict((var,perSample(var,values)) for var,values in inRun.items())
+    result = dict((var,perSample(var,values)) for var,values in result.items())
+    # build realizations, as in evaluateSample
+    realizations = []
+    for i,kwargs in enumerate(batch):
+      rlz = dict((var,values(i)) for var,values in inRun.items())
+      rlz.update(dict((var,values(i)) for var,values in result.items()))
+      rlz.update(dict((var,np.atleast_1d(val)) for var,val in kwargs.items()))
+      rlz.update(dict((var,np.atleast_1d(val)) for var,val in kwargs['SampledVars'].items()))
+      realizations.append(rlz)
+    return realizations
+
   def collectOutput(self,finishedJob,output,options=None):
     """
       Method that collects the outputs from the previous run
@@ -294,12 +425,15 @@ class ExternalModel(Dummy):
 
     # TODO move this check to the data object instead.
     if output.type in ['HistorySet']:
-      outputSize = -1
-      for key in output.getVars('output'):
-        # OLD ? if key in instanciatedSelf.modelVariableType.keys(): #TODO why would it not be in this dict?
-        if outputSize == -1:
-          outputSize = len(np.atleast_1d(evaluation[key]))
-        if not utils.sizeMatch(evaluation[key],outputSize):
-          self.raiseAnError(Exception,"the time series size needs to be the same for the output space in a HistorySet! Variable:"+key+". Size in the HistorySet="+str(outputSize)+".Size outputed="+str(len(np.atleast_1d(outcomes[key]))))
+      # in the event a batch is run, each realization is checked
+      realizations = evaluation['realizations'] if evaluation.get('RAVEN_isBatch',False) else [evaluation]
+      for rlz in realizations:
+        outputSize = -1
+        for key in output.getVars('output'):
+          # OLD ? if key in instanciatedSelf.modelVariableType.keys(): #TODO why would it not be in this dict?
+          if outputSize == -1:
+            outputSize = len(np.atleast_1d(rlz[key]))
+          if not utils.sizeMatch(rlz[key],outputSize):
+            self.raiseAnError(Exception,"the time series size needs to be the same for the output space in a HistorySet! Variable:"+key+". Size in the HistorySet="+str(outputSize)+".Size outputed="+str(len(np.atleast_1d(rlz[key]))))
 
     Dummy.collectOutput(self, finishedJob, output, options)
@@ -24,9 +24,9 @@ warnings.simplefilter('default',DeprecationWarning)
 
 #External Modules------------------------------------------------------------------------------------
 import copy
+import math
 import numpy as np
-from numpy import linalg
-import time
+from scipy.spatial.distance import cdist, pdist, squareform
 import itertools
 from collections import OrderedDict
 #External Modules End--------------------------------------------------------------------------------
@@ -74,10 +74,12 @@ class HybridModel(Dummy):
     tolInput = InputData.parameterInputFactory("tolerance", contentType=InputData.FloatType)
     maxTrainStepInput = InputData.parameterInputFactory("maxTrainSize", contentType=InputData.IntegerType)
     initialTrainStepInput = InputData.parameterInputFactory("minInitialTrainSize", contentType=InputData.IntegerType)
+    retrainGrowthInput = InputData.parameterInputFactory("retrainGrowthFactor", contentType=InputData.FloatType)
     settingsInput = InputData.parameterInputFactory("settings", contentType=InputData.StringType)
     settingsInput.addSub(tolInput)
     settingsInput.addSub(maxTrainStepInput)
     settingsInput.addSub(initialTrainStepInput)
+    settingsInput.addSub(retrainGrowthInput)
     inputSpecification.addSub(settingsInput)
     # add validationMethod block
     threshold = InputData.parameterInputFactory("threshold", contentType=InputData.FloatType)
@@ -112,6 +114,7 @@ class HybridModel(Dummy):
     self.romTrainStartSize     = 10                  # the initial size of training set
     self.romTrainMaxSize       = 1.0e6               # the maximum size of training set
     self.romValidateSize       = 10                  # the size of rom validation set
+    self.romRetrainGrowth      = 1.0                 # the roms are retrained once the training set is grown by this factor
     self.romTrained            = False               # True if all roms are trained
     self.sleepTime             = 0.005               # waiting time before checking if a run is finished.
     self.romConverged          = False               # True if all roms are converged
@@ -125,7 +128,6 @@ class HybridModel(Dummy):
     self.oldTrainingSize       = 0                   # The size of training set that is previous used to train the rom
     self.modelIndicator        = {}                  # a dict i.e. {jobPrefix: 1 or 0} used to indicate the runs: model or rom. '1' indicates ROM run, and '0' indicates Code run
     self.metricCategories      = {'find_min':['explained_variance_score', 'r2_score'], 'find_max':['median_absolute_error', 'mean_squared_error', 'mean_absolute_error']}
-    self.crowdingDistance      = None
     # assembler objects to be requested
     self.addAssemblerObject('Model','1',True)
     self.addAssemblerObject('ROM','n')
@@ -153,7 +155,7 @@ class HybridModel(Dummy):
         self.targetEvaluationInstance = child.value.strip()
       if child.getName() == 'ROM':
         romName = child.value.strip()
-        self.romsDictionary[romName] = {'Instance': None, 'Converged': False, 'Valid': False}
+        self.romsDictionary[romName] = {'Instance': None, 'Converged': False, 'Valid': False, 'CrowdingDistance': None}
       if child.getName() == 'settings':
         for childChild in child.subparts:
           if childChild.getName() == 'maxTrainSize':
@@ -162,6 +164,10 @@ class HybridModel(Dummy):
             self.romTrainStartSize = utils.intConversion(childChild.value)
           if childChild.getName() == 'tolerance':
             self.romConvergence = utils.floatConversion(childChild.value)
+          if childChild.getName() == 'retrainGrowthFactor':
+            self.romRetrainGrowth = utils.floatConversion(childChild.value)
+            if self.romRetrainGrowth < 1.0:
+              self.raiseAnError(IOError, "The retrainGrowthFactor of HybridModel ", self.name, " must be greater than or equal to 1!")
       if child.getName() == 'validationMethod':
         name = child.parameterValues['name']
         self.validationMethod[name] = {}
@@ -229,6 +235,9 @@ class HybridModel(Dummy):
       if romIn.amITrained:
         # Only untrained roms are allowed
         self.raiseAnError(IOError,'HybridModel only accepts untrained ROM, but rom "', romIn.name, '" is already trained')
+      # untrained copy of the rom used for the cross validations, so that the roms that can be warm started are not reset
+      romInfo['Untrained'] = copy.deepcopy(romIn)
+      romInfo['CrowdingDistance'] = None
     # check: we require that the union of ROMs outputs is the same as the paired model in order to use the ROM
     # to replace the paired model.
     if len(set(totalRomOutputs)) != len(totalRomOutputs):
@@ -329,12 +338,15 @@ class HybridModel(Dummy):
       # and compared to the size of trainingSet in the ROM, the reason is that
       # we may end up using the same data to train the rom, the outputs may not be
       # collected yet!
-      # reset the rom
-      romInfo['Instance'].reset()
+      # reset the rom, unless it can be retrained starting from its current state
+      if not romInfo['Instance'].canWarmStart():
+        romInfo['Instance'].reset()
       useCV = self.checkCV(len(self.tempTargetEvaluation))
       if useCV:
         # always train the rom even if the rom is converged, we assume the cross validation and rom train are relative cheap
-        outputMetrics = self.cvInstance.evaluateSample([romInfo['Instance'], self.tempTargetEvaluation], samplerType, kwargs)[1]
+        # the cross validation trains its rom, so the copy is reset to start each cross validation from scratch
+        romInfo['Untrained'].reset()
+        outputMetrics = self.cvInstance.evaluateSample([romInfo['Untrained'], self.tempTargetEvaluation], samplerType, kwargs)[1]
         converged = self.isRomConverged(outputMetrics)
         romInfo['Converged'] = converged
         if converged:
@@ -388,8 +400,8 @@ class HybridModel(Dummy):
     """
     if type(metricResults) == list or isinstance(metricResults,np.ndarray):
       errorList = np.atleast_1d(metricResults)
-    elif type(metricResults) == dict:
-      errorList = np.atleast_1d(metricResults.values())
+    elif utils.isAMapping(metricResults):
+      errorList = np.atleast_1d(list(metricResults.values()))
     else:
       self.raiseAnError(IOError, "The outputs generated by the cross validation '", self.cvInstance.name, "' can not be processed by HybridModel '", self.name, "'!")
     converged = False
@@ -458,12 +470,13 @@ class HybridModel(Dummy):
       paramsList = romInfo['Instance'].getInitParams()['Features']
       trainInput = self._extractInputs(romInfo['Instance'].trainingSet, paramsList)
       currentInput = self._extractInputs(varDict, paramsList)
-      if self.crowdingDistance is None:
-        self.crowdingDistance = self.computeCrowdingDistance(trainInput)
-      sizeCD = len(self.crowdingDistance)
-      if sizeCD != trainInput.shape[1]:
-        self.crowdingDistance = self.updateCrowdingDistance(trainInput[:,0:sizeCD], trainInput[:,sizeCD:], self.crowdingDistance)
-      crowdingDistance = self.updateCrowdingDistance(trainInput, currentInput, self.crowdingDistance)
+      # the crowding distances of the training set are only updated with the points added since the last check
+      sizeCD = 0 if romInfo['CrowdingDistance'] is None else len(romInfo['CrowdingDistance'])
+      if sizeCD == 0 or sizeCD > trainInput.shape[1]:
+        romInfo['CrowdingDistance'] = self.computeCrowdingDistance(trainInput)
+      elif sizeCD != trainInput.shape[1]:
+        romInfo['CrowdingDistance'] = self.updateCrowdingDistance(trainInput[:,0:sizeCD], trainInput[:,sizeCD:], romInfo['CrowdingDistance'])
+      crowdingDistance = self.updateCrowdingDistance(trainInput, currentInput, romInfo['CrowdingDistance'])
       maxDist = np.amax(crowdingDistance)
       minDist = np.amin(crowdingDistance)
       if maxDist == minDist:
@@ -483,19 +496,19 @@ class HybridModel(Dummy):
   def _extractInputs(self,dataIn, paramsList):
     """
       Extract the the parameters in the paramsList from the given data object dataIn
-      @ dataIn, Instance or Dict, data object or dictionary contains the input and output parameters
+      @ dataIn, Instance or Dict, data object or dictionary (or SampleRecord) contains the input and output parameters
       @ paramsList, List, List of parameter names
       @ localInput, numpy.array, array contains the values of selected input and output parameters
     """
     localInput = []
-    if type(dataIn) == dict:
+    if utils.isAMapping(dataIn):
       for elem in paramsList:
         if elem in dataIn.keys():
           localInput.append(np.atleast_1d(dataIn[elem]))
         else:
           self.raiseAnError(IOError, "Parameter ", elem, " is not found!")
     else:
-      self.raiseAnError(IOError, "The input type '", inputType, "' can not be accepted!")
+      self.raiseAnError(IOError, "The input type '", type(dataIn).__name__, "' can not be accepted!")
     return np.asarray(localInput)
 
   def computeCrowdingDistance(self, trainSet):
@@ -504,12 +517,9 @@ class HybridModel(Dummy):
       @ In, trainSet, numpy.array, array contains values of input parameters
       @ Out, crowdingDist, numpy.array, crowding distances for given input parameters
     """
-    dim = trainSet.shape[1]
-    distMat = np.zeros((dim, dim))
-    for i in range(dim):
-      for j in range(i):
-        distMat[i,j] = linalg.norm(trainSet[:,i] - trainSet[:,j])
-        distMat[j,i] = distMat[i,j]
+    if trainSet.shape[1] < 2:
+      return np.zeros(trainSet.shape[1])
+    distMat = squareform(pdist(trainSet.T))
     crowdingDist = np.sum(distMat,axis=1)
     return crowdingDist
 
@@ -526,16 +536,10 @@ class HybridModel(Dummy):
     totSize = oldSize + newSize
     if oldSize != crowdingDistance.size:
       self.raiseAnError(IOError, "The old crowding distances is not match the old data set!")
-    newCrowdingDistance = np.zeros(totSize)
-    distMatAppend = np.zeros((oldSize,newSize))
-    for i in range(oldSize):
-      for j in range(newSize):
-        distMatAppend[i,j] = linalg.norm(oldSet[:,i] - newSet[:,j])
-    distMatNew = self.computeCrowdingDistance(newSet)
-    for i in range(oldSize):
-      newCrowdingDistance[i] = crowdingDistance[i] + np.sum(distMatAppend[i,:])
-    for i in range(newSize):
-      newCrowdingDistance[i+oldSize] = distMatNew[i] + np.sum(distMatAppend[:,i])
+    newCrowdingDistance = np.empty(totSize)
+    distMatAppend = cdist(oldSet.T, newSet.T)
+    newCrowdingDistance[:oldSize] = crowdingDistance + np.sum(distMatAppend,axis=1)
+    newCrowdingDistance[oldSize:] = self.computeCrowdingDistance(newSet) + np.sum(distMatAppend,axis=0)
     return newCrowdingDistance
 
   def amIReadyToTrainROM(self):
@@ -550,8 +554,9 @@ class HybridModel(Dummy):
     if newGeneratedTrainingSize > self.romTrainMaxSize:
       self.raiseAMessage("Maximum training size is reached, ROMs will not be trained anymore!")
       return ready
-    trainingStepSize = len(self.tempTargetEvaluation) - self.oldTrainingSize
-    if newGeneratedTrainingSize >= self.romTrainStartSize and trainingStepSize > 0:
+    # the roms are retrained once the training set is grown by the retrain growth factor (at least by one sample)
+    nextTrainingSize = max(self.oldTrainingSize + 1, int(math.ceil(self.oldTrainingSize*self.romRetrainGrowth)))
+    if newGeneratedTrainingSize >= self.romTrainStartSize and len(self.tempTargetEvaluation) >= nextTrainingSize:
       ready = True
     return ready
 
@@ -653,7 +658,7 @@ class HybridModel(Dummy):
             self.raiseADebug("Job ", romName, " with identifier ", identifier, " is submitted")
             nextRom = True
           else:
-            time.sleep(self.sleepTime)
+            jobHandler.waitForAvailability(pollingTime = self.sleepTime)
       # collect the outputs from the runs of ROMs
       while True:
         finishedJobs = jobHandler.getFinished(uniqueHandler=uniqueHandler)
@@ -668,7 +673,7 @@ class HybridModel(Dummy):
         if jobHandler.areTheseJobsFinished(uniqueHandler=uniqueHandler):
           self.raiseADebug("Jobs with uniqueHandler ", uniqueHandler, "are collected!")
           break
-        time.sleep(self.sleepTime)
+        jobHandler.waitForFinished(uniqueHandler = uniqueHandler, pollingTime = self.sleepTime)
       exportDict['prefix'] = identifier
     else:
       # run model
@@ -681,9 +686,8 @@ class HybridModel(Dummy):
           self.raiseADebug("Job submitted for model ", self.modelInstance.name, " with identifier ", identifier)
           moveOn = True
         else:
-          time.sleep(self.sleepTime)
-      while not jobHandler.isThisJobFinished(self.modelInstance.name+utils.returnIdSeparator()+identifier):
-        time.sleep(self.sleepTime)
+          jobHandler.waitForAvailability(pollingTime = self.sleepTime)
+      jobHandler.waitForFinished(jobIdentifier = inputKwargs['prefix'], uniqueHandler = uniqueHandler, pollingTime = self.sleepTime)
       self.raiseADebug("Job finished ", self.modelInstance.name, " with identifier ", identifier)
       finishedRun = jobHandler.getFinished(jobIdentifier = inputKwargs['prefix'], uniqueHandler = uniqueHandler)
       evaluation = finishedRun[0].getEvaluation()
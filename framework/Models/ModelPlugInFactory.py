@@ -50,18 +50,31 @@ __basePluginClasses  = {'ExternalModel':'ExternalModelPluginBase'}
 """
 __base                          = 'ModelPlugins'
 __interFaceDict                 = defaultdict(dict)
-for moduleIndex in range(len(__moduleInterfaceList)):
-  if 'class' in open(__moduleInterfaceList[moduleIndex]).read():
-    __moduleImportedList.append(utils.importFromPath(__moduleInterfaceList[moduleIndex],False))
-    for key,modClass in inspect.getmembers(__moduleImportedList[-1], inspect.isclass):
-      for base in modClass.__bases__:
-        for ravenEntityName, baseClassName in __basePluginClasses.items():
-          if base.__name__ == baseClassName:
-            __interFaceDict[ravenEntityName][key] = modClass
-            # check the validity of the plugin
-            if not modClass.isAvalidPlugin():
-              raise IOError("The plugin based on the class "+ravenEntityName.strip()+" is not valid. Please check with the Plugin developer!")
-__knownTypes = [item for sublist in __interFaceDict.values() for item in sublist]
+__knownTypes                    = None
+
+def __loadPlugins():
+  """
+    Imports the plugin modules and registers the classes that refer to a model. This is only done the first
+    time a plugin is requested, so that the plugins (and the libraries they need) are not imported by the
+    runs that do not use them.
+    @ In, None
+    @ Out, None
+  """
+  global __knownTypes
+  if __knownTypes is not None:
+    return
+  for moduleIndex in range(len(__moduleInterfaceList)):
+    if 'class' in open(__moduleInterfaceList[moduleIndex]).read():
+      __moduleImportedList.append(utils.importFromPath(__moduleInterfaceList[moduleIndex],False))
+      for key,modClass in inspect.getmembers(__moduleImportedList[-1], inspect.isclass):
+        for base in modClass.__bases__:
+          for ravenEntityName, baseClassName in __basePluginClasses.items():
+            if base.__name__ == baseClassName:
+              __interFaceDict[ravenEntityName][key] = modClass
+              # check the validity of the plugin
+              if not modClass.isAvalidPlugin():
+                raise IOError("The plugin based on the class "+ravenEntityName.strip()+" is not valid. Please check with the Plugin developer!")
+  __knownTypes = [item for sublist in __interFaceDict.values() for item in sublist]
 
 def knownTypes():
   """
@@ -69,6 +82,7 @@ def knownTypes():
     @ In, None
     @ Out, __knownTypes, list, the list of known types
   """
+  __loadPlugins()
   return __knownTypes
 
 def returnPlugin(Type,subType,caller):
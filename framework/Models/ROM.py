@@ -154,6 +154,7 @@ class ROM(Dummy):
     inputSpecification.addSub(InputData.parameterInputFactory("IndexPoints", InputData.StringType))
     inputSpecification.addSub(InputData.parameterInputFactory("IndexSet",IndexSetInputType))
     inputSpecification.addSub(InputData.parameterInputFactory('pivotParameter',contentType=InputData.StringType))
+    inputSpecification.addSub(InputData.parameterInputFactory('trainingProcesses',contentType=InputData.IntegerType))
     inputSpecification.addSub(InputData.parameterInputFactory("PolynomialOrder", InputData.IntegerType))
     inputSpecification.addSub(InputData.parameterInputFactory("SobolOrder", InputData.IntegerType))
     inputSpecification.addSub(InputData.parameterInputFactory("SparseGrid", InputData.StringType))
@@ -246,6 +247,7 @@ class ROM(Dummy):
     Dummy.__init__(self,runInfoDict)
     self.initializationOptionDict = {}          # ROM initialization options
     self.amITrained                = False      # boolean flag, is the ROM trained?
+    self.stateVersion              = 0          # incremented every time the ROM is trained or reset (see Runners.ProcessPool.share)
     self.supervisedEngine          = None       # dict of ROM instances (== number of targets => keys are the targets)
     self.printTag = 'ROM MODEL'
 
@@ -362,6 +364,16 @@ class ROM(Dummy):
     """
     self.supervisedEngine.reset()
     self.amITrained   = False
+    self.stateVersion += 1
+
+  def canWarmStart(self):
+    """
+      Determines if this ROM can be retrained (e.g. with an enlarged training set) starting from its current
+      trained state, so that it does not need to be reset first
+      @ In, None
+      @ Out, canWarmStart, bool, True if the ROM can be retrained without being reset
+    """
+    return self.supervisedEngine is not None and not self.supervisedEngine.pickled and self.supervisedEngine.canWarmStart()
 
   def getInitParams(self):
     """
@@ -388,7 +400,7 @@ class ROM(Dummy):
       self.supervisedEngine         = copy.deepcopy(trainingSet.supervisedEngine)
     else:
       # TODO: The following check may need to be moved to Dummy Class -- wangc 7/30/2018
-      if type(trainingSet).__name__ != 'dict' and trainingSet.type == 'HistorySet':
+      if not utils.isAMapping(trainingSet) and trainingSet.type == 'HistorySet':
         pivotParameterId = self.supervisedEngine.pivotParameterId
         if not trainingSet.checkIndexAlignment(indexesToCheck=pivotParameterId):
           self.raiseAnError(IOError, "The data provided by the data object", trainingSet.name, "is not synchonized!",
@@ -397,6 +409,7 @@ class ROM(Dummy):
       self._replaceVariablesNamesWithAliasSystem(self.trainingSet, 'inout', False)
       self.supervisedEngine.train(self.trainingSet)
       self.amITrained = self.supervisedEngine.amITrained
+    self.stateVersion += 1
 
   def confidence(self,request,target = None):
     """
@@ -459,6 +472,70 @@ class ROM(Dummy):
     rlz.update(dict((var,np.atleast_1d(inRun[var] if var in kwargs['SampledVars'] else result[var])) for var in set(itertools.chain(result.keys(),inRun.keys()))))
     return rlz
 
+  def canEvaluateBatch(self):
+    """
+      Determines if several samples can be evaluated at once with a single (vectorized) ROM evaluation,
+      which is the case for ROMs that return one value (or one history) per target for each realization.
+      @ In, None
+      @ Out, canEvaluateBatch, bool, True if submitBatch can be used
+    """
+    if not self.amITrained or self.supervisedEngine.pickled:
+      return False
+    containers = self.supervisedEngine.supervisedContainer
+    return len(containers) == 1 and containers[0].canEvaluateBatch()
+
+  def submitBatch(self, myInput, samplerType, jobHandler, batch):
+    """
+        This will submit a batch of samples to be evaluated by this model as a single job to a
+        specified jobHandler. The job result is a {'RAVEN_isBatch':True,'realizations':[...]} dictionary.
+        @ In, myInput, list, the inputs (list) to start from to generate the new one
+        @ In, samplerType, string, is the type of sampler that is calling to generate a new input
+        @ In,  jobHandler, JobHandler instance, the global job handler instance
+        @ In, batch, list(dict), the information coming from the sampler for each sample (see submit)
+        @ Out, None
+    """
+    prefix = batch[0]['prefix'] if len(batch) == 1 else '{}-{}'.format(batch[0]['prefix'],batch[-1]['prefix'])
+    uniqueHandler = batch[0].get('uniqueHandler','any')
+    metadata = {'prefix':prefix, 'batchSize':len(batch)}
+    jobHandler.addJob((self, myInput, samplerType, batch), self.__class__.evaluateBatch, prefix, metadata=metadata, modulesToImport=self.mods, uniqueHandler=uniqueHandler)
+
+  def evaluateBatch(self, myInput, samplerType, batch):
+    """
+        This will evaluate a batch of samples on this model with a single ROM evaluation.
+        Samples with non-scalar inputs are evaluated one at a time.
+        @ In, myInput, list, the inputs (list) to start from to generate the new one
+        @ In, samplerType, string, is the type of sampler that is calling to generate a new input
+        @ In, batch, list(dict), the information coming from the sampler for each sample (see evaluateSample)
+        @ Out, result, dict, {'RAVEN_isBatch':True,'realizations':[rlz]} with one realization (see evaluateSample) per sample
+    """
+    numSamples = len(batch)
+    sampledVars = list(batch[0]['SampledVars'].keys())
+    scalar = all(set(kwargs['SampledVars'].keys()) == set(sampledVars) and
+                 all(np.asarray(kwargs['SampledVars'][var]).size == 1 for var in sampledVars) for kwargs in batch)
+    if not scalar:
+      return {'RAVEN_isBatch':True, 'realizations':list(self.evaluateSample(myInput, samplerType, kwargs) for kwargs in batch)}
+    # stack the sampled values, so that the ROM is evaluated once for all the samples
+    stacked = dict(batch[0])
+    stacked['SampledVars'] = dict((var,np.array(list(np.asarray(kwargs['SampledVars'][var]).ravel()[0] for kwargs in batch))) for var in sampledVars)
+    Input = self.createNewInput(myInput, samplerType, **stacked)
+    inRun = self._manipulateInput(Input[0])
+    # features that are not sampled are shared by all the samples
+    for var,values in inRun.items():
+      if np.asarray(values).size == 1:
+        inRun[var] = np.repeat(np.atleast_1d(values),numSamples)
+    result = self._externalRun(inRun)
+    # the pivot parameter of dynamic ROMs (e.g. the time of ARMA histories) is shared by all the samples
+    shared = [self.supervisedEngine.pivotParameterId] if self.supervisedEngine.supervisedContainer[0].isDynamic() else []
+    if any(len(np.atleast_1d(values)) != numSamples for var,values in result.items() if var not in shared):
+      return {'RAVEN_isBatch':True, 'realizations':list(self.evaluateSample(myInput, samplerType, kwargs) for kwargs in batch)}
+    # build realizations, as in evaluateSample
+    realizations = []
+    for i,kwargs in enumerate(batch):
+      rlz = dict((var,np.atleast_1d(kwargs[var])) for var in kwargs.keys())
+      rlz.update(dict((var,np.atleast_1d(inRun[var][i] if var in sampledVars else (result[var] if var in shared else result[var][i]))) for var in set(itertools.chain(result.keys(),inRun.keys()))))
+      realizations.append(rlz)
+    return {'RAVEN_isBatch':True, 'realizations':realizations}
+
   def reseed(self,seed):
     """
       Used to reset the seed of the underlying ROM.
@@ -21,24 +21,19 @@ import warnings
 warnings.simplefilter('default',DeprecationWarning)
 #End compatibility block for Python 3-------------------------------------------
 
-################################################################################
-from .Optimizer import Optimizer
-from .GradientBasedOptimizer import GradientBasedOptimizer
-from .SPSA import SPSA
-from .FiniteDifferenceGradientOptimizer import FiniteDifferenceGradientOptimizer
-## [ Add new class here ]
-
+from utils import importerUtils
 
 """
  Interface Dictionary (factory) (private)
 """
-# This machinery will automatically populate the "knownTypes" given the
-# imports defined above.
+# The optimizers are registered by the path of their definition, so that their modules (and the
+# libraries they need) are only imported if an input uses them.
 __base = 'Optimizer'
-__interFaceDict = {}
-__interFaceDict['GradientBasedOptimizer'           ] = GradientBasedOptimizer
-__interFaceDict['SPSA'                             ] = SPSA
-__interFaceDict['FiniteDifferenceGradientOptimizer'] = FiniteDifferenceGradientOptimizer
+__interFaceDict = importerUtils.LazyClassRegistry()
+__interFaceDict['GradientBasedOptimizer'           ] = 'Optimizers.GradientBasedOptimizer.GradientBasedOptimizer'
+__interFaceDict['SPSA'                             ] = 'Optimizers.SPSA.SPSA'
+__interFaceDict['FiniteDifferenceGradientOptimizer'] = 'Optimizers.FiniteDifferenceGradientOptimizer.FiniteDifferenceGradientOptimizer'
+## [ Add new class here ]
 __knownTypes = list(__interFaceDict.keys())
 
 def knownTypes():
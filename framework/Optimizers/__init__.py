@@ -22,9 +22,9 @@ from __future__ import absolute_import
 
 # These lines ensure that we do not have to do something like:
 # 'from Optimizers.Optimizer import Sampler' outside of this submodule
+# Only the base class is imported here, the specific optimizers are imported
+# by the Factory when an input asks for them
 from .Optimizer import Optimizer
-from .GradientBasedOptimizer import GradientBasedOptimizer
-from .SPSA import SPSA
 
 
 from .Factory import knownTypes
@@ -87,6 +87,19 @@ class OrthogonalPolynomial(MessageHandler.MessageUser):
     inps=self.params+[self.pointMod(pt)]
     return self._evPoly(order,*inps) * self.norm(order)
 
+  def vandermonde(self,maxOrder,pts):
+    """
+      Returns the polynomials of all the orders up to 'maxOrder' evaluated at all the points 'pts'.
+      @ In, maxOrder, int, highest order at which polynomials should be evaluated
+      @ In, pts, np.array, shape = [n_points], values at which polynomials should be evaluated
+      @ Out, vandermonde, np.array, shape = [n_points,maxOrder+1], polynomial of order j evaluated at point i
+    """
+    orders = np.arange(maxOrder+1)
+    modPts = np.array(list(self.pointMod(pt) for pt in pts),dtype=float)
+    norms = np.array(list(self.norm(o) for o in orders),dtype=float)
+    inps = self.params+[modPts[:,np.newaxis]]
+    return self._evPoly(orders[np.newaxis,:],*inps) * norms[np.newaxis,:]
+
   def __getstate__(self):
     """
       Pickle dump method.
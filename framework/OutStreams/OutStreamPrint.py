@@ -41,7 +41,7 @@ class OutStreamPrint(OutStreamManager):
   ## the variables immutable (so long as no one touches the internally stored
   ## "_"-prefixed), so other objects don't accidentally modify them.
 
-  _availableOutStreamTypes = ['csv', 'xml']
+  _availableOutStreamTypes = ['csv', 'xml', 'packed']
 
   @ClassProperty
   def availableOutStreamTypes(cls):
@@ -118,7 +118,7 @@ class OutStreamPrint(OutStreamManager):
       self.raiseAnError(TypeError, 'Print type ' + self.options['type'] + ' not available yet. ')
     if 'what' in self.options.keys():
       self.what = self.options['what']
-      if self.options['type'] == 'csv':
+      if self.options['type'] in ['csv','packed']:
         for elm in self.what.lower().split(","):
           if not elm.startswith("input") and not elm.startswith("output") and not elm.startswith("metadata"):
             self.raiseAnError(IOError, 'Not recognized request in "what" node <'+elm.strip()+'>. The request must begin with one of "input", "output" or "metadata" or it could be "all" for ROMs!')
@@ -165,6 +165,12 @@ class OutStreamPrint(OutStreamManager):
             self.raiseAnError(NotImplementedError, 'No implementation for source type', self.sourceData[index].type, 'and output type "'+str(self.options['type'].strip())+'"!')
           finally:
             self.indexPrinted[filename] = rlzIndex
+        elif self.options['type'] == 'packed':
+          # the packed file is a single file, rewritten entirely
+          try:
+            self.sourceData[index].write(dictOptions['filenameroot'],style='packed',**dictOptions)
+          except AttributeError:
+            self.raiseAnError(NotImplementedError, 'No implementation for source type', self.sourceData[index].type, 'and output type "'+str(self.options['type'].strip())+'"!')
         elif self.options['type'] == 'xml':
           try:
             self.sourceData[index].printXML(dictOptions)
@@ -25,13 +25,13 @@ from __future__ import absolute_import
 ## These lines ensure that we do not have to do something like:
 ## 'from OutStreamManagers.OutStreamPlot import OutStreamPlot' outside
 ## of this submodule
+## Only the base class is imported here, the specific OutStreams are imported
+## by the Factory when an input asks for them (matplotlib is only needed by the Plot)
 from .OutStreamManager import OutStreamManager
-from .OutStreamPlot import OutStreamPlot
-from .OutStreamPrint import OutStreamPrint
 
 from .Factory import knownTypes
 from .Factory import returnInstance
 from .Factory import returnClass
 
 # We should not really need this as we do not use wildcard imports
-__all__ = ['OutStreamManager','OutStreamPlot','OutStreamPrint']
+__all__ = ['OutStreamManager']
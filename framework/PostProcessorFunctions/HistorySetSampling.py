@@ -28,6 +28,7 @@ import numpy as np
 from scipy import interpolate
 from scipy import integrate
 import copy
+from utils import historyUtils
 
 
 class HistorySetSampling(PostProcessorInterfaceBase):
@@ -36,6 +37,9 @@ class HistorySetSampling(PostProcessorInterfaceBase):
    The conversion is made so that each history H is re-sampled accordingly to a specific sampling strategy.
    It can be used to reduce the amount of space required by the HistorySet.
   """
+  # interpolations performed on all the histories at once, and the corresponding resampling methods
+  _resamplingMethods = {'linear':'linear', 'slinear':'linear', 'zero':'step'}
+
   def initialize(self):
     """
      Method to initialize the Interfaced Post-processor
@@ -108,26 +112,30 @@ class HistorySetSampling(PostProcessorInterfaceBase):
     for var in inputDic['inpVars']:
       outputDic['data'][var] = copy.deepcopy(inputDic['data'][var])
 
-    # loop over realizations and find the desired sample points
-    for hist in range(inputDic['numberRealizations']):
-      # set up the realization
-      rlz={}
-      for var in inputDic['outVars']:
-        rlz[var] = inputDic['data'][var][hist]
-      rlz[self.pivotParameter]=inputDic['data'][self.pivotParameter][hist]
-
-      # do the sampling based on what the user requested
-      if self.samplingType in ['uniform','firstDerivative','secondDerivative']:
-        outData = self.varsTimeInterp(rlz)
-      elif self.samplingType in ['filteredFirstDerivative','filteredSecondDerivative']:
-        outData = timeSeriesFilter(self.pivotParameter,rlz,self.samplingType,self.tolerance)
-      else:
-        self.raiseAnError(IOError, 'HistorySetSampling Interfaced Post-Processor ' + str(self.name) + ' : not recognized samplingType')
+    # uniform sampling with a piecewise-linear or constant interpolation is done on all the histories at once
+    if self.samplingType == 'uniform' and self.interpolation in self._resamplingMethods:
+      outputDic['data'].update(self.uniformTimeInterp(inputDic))
+    else:
+      # otherwise loop over realizations and find the desired sample points
+      for hist in range(inputDic['numberRealizations']):
+        # set up the realization
+        rlz={}
+        for var in inputDic['outVars']:
+          rlz[var] = inputDic['data'][var][hist]
+        rlz[self.pivotParameter]=inputDic['data'][self.pivotParameter][hist]
+
+        # do the sampling based on what the user requested
+        if self.samplingType in ['uniform','firstDerivative','secondDerivative']:
+          outData = self.varsTimeInterp(rlz)
+        elif self.samplingType in ['filteredFirstDerivative','filteredSecondDerivative']:
+          outData = timeSeriesFilter(self.pivotParameter,rlz,self.samplingType,self.tolerance)
+        else:
+          self.raiseAnError(IOError, 'HistorySetSampling Interfaced Post-Processor ' + str(self.name) + ' : not recognized samplingType')
 
-      for var in outData.keys():
-        if hist == 0:
-          outputDic['data'][var] = np.zeros(inputDic['numberRealizations'], dtype=object)
-        outputDic['data'][var][hist] = outData[var]
+        for var in outData.keys():
+          if hist == 0:
+            outputDic['data'][var] = np.zeros(inputDic['numberRealizations'], dtype=object)
+          outputDic['data'][var][hist] = outData[var]
 
     if 'ProbabilityWeight' in inputDic['data'].keys():
       outputDic['data']['ProbabilityWeight'] = inputDic['data']['ProbabilityWeight']
@@ -136,6 +144,23 @@ class HistorySetSampling(PostProcessorInterfaceBase):
     outputDic['dims'] = copy.deepcopy(inputDic['dims'])
     return outputDic
 
+  def uniformTimeInterp(self, inputDic):
+    """
+      This function samples all the histories at once, each one on numberOfSamples values uniformly
+      distributed over its own pivot range
+      @ In, inputDic, dict, the HistorySet to sample
+      @ Out, newVars, dict, {var:np.array(object)} the sampled histories
+    """
+    times, offsets = historyUtils.packHistories(inputDic['data'][self.pivotParameter])
+    newTimes = np.linspace(times[offsets[:-1]],times[offsets[1:]-1],self.numberOfSamples,axis=1)
+    outVars = [var for var in inputDic['outVars'] if var != self.pivotParameter]
+    resampled = historyUtils.resampleHistories(inputDic['data'][self.pivotParameter],
+                                               dict((var,inputDic['data'][var]) for var in outVars),
+                                               newTimes, method=self._resamplingMethods[self.interpolation])
+    newVars = dict((var,historyUtils.unpackHistories(values,offsets)) for var,values in resampled.items())
+    newVars[self.pivotParameter] = historyUtils.unpackHistories(newTimes,offsets)
+    return newVars
+
   def varsTimeInterp(self, vars):
     """
       This function samples a multi-variate temporal function
@@ -203,19 +228,19 @@ class HistorySetSampling(PostProcessorInterfaceBase):
       else:
         normalizedVar[keys]=var[keys]/np.float64(1.0)
 
+    pivotValues = normalizedVar[self.pivotParameter]
     if self.samplingType=='firstDerivative':
-      for t in range(1, normalizedVar[self.pivotParameter].shape[0]):
-        t_contrib=0.0
-        for keys in normalizedVar.keys():
-          t_contrib += abs(normalizedVar[keys][t] - normalizedVar[keys][t-1])/(normalizedVar[self.pivotParameter][t]-normalizedVar[self.pivotParameter][t-1])
-        cumDerivative[t] = cumDerivative[t-1] + t_contrib
+      tContrib = 0.0
+      for keys in normalizedVar.keys():
+        tContrib = tContrib + np.abs(np.diff(normalizedVar[keys]))/np.diff(pivotValues)
+      cumDerivative[1:] = np.cumsum(tContrib)
 
     elif self.samplingType=='secondDerivative':
-      for t in range(1, normalizedVar[self.pivotParameter].shape[0]-1):
-        t_contrib=0.0
-        for keys in normalizedVar.keys():
-          t_contrib += abs(normalizedVar[keys][t+1] - 2.0 * normalizedVar[keys][t] + normalizedVar[keys][t-1])/(normalizedVar[self.pivotParameter][t]-normalizedVar[self.pivotParameter][t-1])**2
-        cumDerivative[t] = cumDerivative[t-1] + t_contrib
+      tContrib = 0.0
+      for keys in normalizedVar.keys():
+        values = normalizedVar[keys]
+        tContrib = tContrib + np.abs(values[2:] - 2.0 * values[1:-1] + values[:-2])/(pivotValues[1:-1]-pivotValues[:-2])**2
+      cumDerivative[1:-1] = np.cumsum(tContrib)
       cumDerivative[-1] = cumDerivative[normalizedVar[self.pivotParameter].shape[0]-2]
 
     else:
@@ -238,32 +263,26 @@ def timeSeriesFilter(pivotParameter, vars, filterType, filterValue):
   filterValue : value associated to the filter
   """
   derivative = np.zeros(vars[pivotParameter].size)
+  deltaPivot = np.diff(vars[pivotParameter])
 
   if filterType=='filteredFirstDerivative':
-    for t in range(1, len(vars[pivotParameter])):
-      t_contrib=0.0
-      for keys in vars.keys():
-        if keys != pivotParameter:
-          t_contrib += abs((vars[keys][t] - vars[keys][t-1])/(vars[pivotParameter][t] - vars[pivotParameter][t-1]))
-      derivative[t] = t_contrib
+    tContrib = 0.0
+    for keys in vars.keys():
+      if keys != pivotParameter:
+        tContrib = tContrib + np.abs(np.diff(vars[keys])/deltaPivot)
+    derivative[1:] = tContrib
   elif filterType=='filteredSecondDerivative':
-    for t in range(1, vars[pivotParameter].size-1):
-      t_contrib=0.0
-      for keys in vars.keys():
-        t_contrib += abs((vars[keys][t+1] - 2.0 * vars[keys][t] + vars[keys][t-1])/(vars[pivotParameter][t] - vars[pivotParameter][t-1])**2)
-      derivative[t] = t_contrib
+    tContrib = 0.0
+    for keys in vars.keys():
+      values = np.asarray(vars[keys])
+      tContrib = tContrib + np.abs((values[2:] - 2.0 * values[1:-1] + values[:-2])/deltaPivot[:-1]**2)
+    derivative[1:-1] = tContrib
     derivative[-1] = derivative[len(vars[pivotParameter])-2]
 
+  # the first and last values are always kept
+  keep = derivative > filterValue
   newVars = {}
   for key in vars:
-    newVars[key]=np.array(vars[key][0])
-
-  for t in range(derivative.size):
-    if derivative[t] > filterValue:
-      for key in vars:
-        newVars[key]=np.append(newVars[key],vars[key][t])
-
-  for key in vars:
-    newVars[key]=np.append(newVars[key],vars[key][-1])
+    newVars[key] = np.concatenate(([vars[key][0]],np.asarray(vars[key])[keep],[vars[key][-1]]))
 
   return newVars
@@ -29,6 +29,7 @@ import copy
 import importlib
 
 import HistorySetSync as HSS
+from utils import historyUtils
 
 class HistorySetSnapShot(PostProcessorInterfaceBase):
   """
@@ -228,28 +229,33 @@ def historySnapShot(inputDic, pivotVar, snapShotType, pivotVal=None, tempID = No
     pass
   vars = [var for var in outVars if var not in inputDic['inpVars']]
 
+  # all the histories are processed at once; the location of the snapshot is the same for all the variables
+  if snapShotType in ['min','max','value']:
+    pivotValues, pivotOffsets = historyUtils.packHistories(inputDic['data'][pivotVar])
+    lengths = np.diff(pivotOffsets)
+    if snapShotType in ['min','max']:
+      idx = historyUtils.extremumIndices(pivotValues, pivotOffsets, snapShotType) - pivotOffsets[:-1]
+    else:
+      idx = historyUtils.firstPassageIndices(pivotValues, pivotOffsets, pivotVal)
+      # interpolate between the previous and the first passage value if it is beyond pivotVal,
+      #   otherwise between the first passage and the next value (indices as python, negative from the end)
+      beyond = pivotValues[pivotOffsets[:-1] + idx % lengths] > pivotVal
+      lower = np.where(beyond, idx-1, idx) % lengths
+      upper = np.where(beyond, idx, idx+1) % lengths
+      pivotLower = pivotValues[pivotOffsets[:-1] + lower]
+      intervalFraction = (pivotVal-pivotLower)/(pivotValues[pivotOffsets[:-1] + upper]-pivotLower)
+
   for var in vars:
     outputDic['data'][var] = np.zeros(inputDic['numberRealizations'], dtype=object)
-    for history in range(inputDic['numberRealizations']):
-      if snapShotType == 'min':
-        idx = np.argmin(inputDic['data'][pivotVar][history])
-        outputDic['data'][var][history] = inputDic['data'][var][history][idx]
-      if snapShotType == 'max':
-        idx = np.argmax(inputDic['data'][pivotVar][history])
-        outputDic['data'][var][history] = inputDic['data'][var][history][idx]
-      elif snapShotType == 'value':
-        idx = returnIndexFirstPassage(inputDic['data'][pivotVar][history],pivotVal)
-        if inputDic['data'][pivotVar][history][idx]>pivotVal:
-          intervalFraction = (pivotVal-inputDic['data'][pivotVar][history][idx-1])/(inputDic['data'][pivotVar][history][idx]-inputDic['data'][pivotVar][history][idx-1])
-          outputDic['data'][var][history] = inputDic['data'][var][history][idx-1] + (inputDic['data'][var][history][idx]-inputDic['data'][var][history][idx-1])*intervalFraction
-        else:
-          intervalFraction = (pivotVal-inputDic['data'][pivotVar][history][idx])/(inputDic['data'][pivotVar][history][idx+1]-inputDic['data'][pivotVar][history][idx])
-          outputDic['data'][var][history] = inputDic['data'][var][history][idx] + (inputDic['data'][var][history][idx+1]-inputDic['data'][var][history][idx])*intervalFraction
-      elif snapShotType == 'average':
-        cumulative=0.0
-        for t in range(1,len(inputDic['data'][tempID][history])):
-          cumulative += (inputDic['data'][var][history][t] + inputDic['data'][var][history][t-1]) / 2.0 * (inputDic['data'][tempID][history][t] - inputDic['data'][tempID][history][t-1])
-        outputDic['data'][var][history] = cumulative / (inputDic['data'][tempID][history][-1] - inputDic['data'][tempID][history][0])
+    if snapShotType == 'average':
+      outputDic['data'][var][:] = historyUtils.trapezoidalAverages(inputDic['data'][tempID], inputDic['data'][var])
+      continue
+    values, offsets = historyUtils.packHistories(inputDic['data'][var])
+    if snapShotType in ['min','max']:
+      outputDic['data'][var][:] = values[offsets[:-1] + idx]
+    elif snapShotType == 'value':
+      lowerValues = values[offsets[:-1] + lower]
+      outputDic['data'][var][:] = lowerValues + (values[offsets[:-1] + upper]-lowerValues)*intervalFraction
   return outputDic
 
 def historySetWindow(inputDic,timeStepID,inpVars,outVars,N,pivotParameter):
@@ -273,9 +279,13 @@ def historySetWindow(inputDic,timeStepID,inpVars,outVars,N,pivotParameter):
     outputDic['data'][var] = inputDic['data'][var]
 
   for var in outVars:
+    values, offsets = historyUtils.packHistories(inputDic['data'][var])
+    lengths = np.diff(offsets)
+    idx = timeStepID + lengths if timeStepID < 0 else np.full(N, timeStepID)
+    if np.any((idx < 0) | (idx >= lengths)):
+      raise IndexError('Time step {} is out of the range of the histories of "{}"!'.format(timeStepID,var))
     outputDic['data'][var] = np.zeros(N, dtype=object)
-    for rlz in range(N):
-      outputDic['data'][var][rlz] = inputDic['data'][var][rlz][timeStepID]
+    outputDic['data'][var][:] = values[offsets[:-1] + idx]
   return outputDic
 
 def returnIndexFirstPassage(array,value):
@@ -29,6 +29,7 @@ import numpy as np
 #External Modules End--------------------------------------------------------------------------------
 
 from PostProcessorInterfaceBaseClass import PostProcessorInterfaceBase
+from utils import historyUtils
 
 
 class HistorySetSync(PostProcessorInterfaceBase):
@@ -99,22 +100,14 @@ class HistorySetSync(PostProcessorInterfaceBase):
       outputDic={}
 
       newTime = []
+      if self.syncMethod in ['grid','all']:
+        times, offsets = historyUtils.packHistories(inputDic['data'][self.pivotParameter])
       if self.syncMethod == 'grid':
-        maxEndTime = []
-        minInitTime = []
-        for hist in inputDic['data'][self.pivotParameter]:
-          maxEndTime.append(hist[-1])
-          minInitTime.append(hist[0])
-        maxTime = max(maxEndTime)
-        minTime = min(minInitTime)
+        maxTime = times[offsets[1:]-1].max()
+        minTime = times[offsets[:-1]].min()
         newTime = np.linspace(minTime,maxTime,self.numberOfSamples)
       elif self.syncMethod == 'all':
-        times = []
-        for hist in inputDic['data'][self.pivotParameter]:
-            times.extend(hist)
-        times = list(set(times))
-        times.sort()
-        newTime = np.array(times)
+        newTime = np.unique(times)
       elif self.syncMethod in ['min','max']:
         notableHist   = None   #set on first iteration
         notableLength = None   #set on first iteration
@@ -127,18 +120,18 @@ class HistorySetSync(PostProcessorInterfaceBase):
         newTime = np.array(notableHist)
 
       outputDic['data']={}
-      for var in inputDic['outVars']:
-        outputDic['data'][var] = np.zeros(inputDic['numberRealizations'], dtype=object)
-      outputDic['data'][self.pivotParameter] = np.zeros(inputDic['numberRealizations'], dtype=object)
-
       for var in inputDic['inpVars']:
         outputDic['data'][var] = copy.deepcopy(inputDic['data'][var])
 
+      # all the histories and variables are re-sampled at once
+      oldTimes = inputDic['data'][self.pivotParameter]
+      outVars = [var for var in inputDic['outVars'] if var != self.pivotParameter]
+      resampled = historyUtils.resampleHistories(oldTimes, dict((var,inputDic['data'][var]) for var in outVars), newTime, extension=self.extension)
+      for var in outVars:
+        outputDic['data'][var] = historyUtils.unpackHistories(resampled[var], None)
+      outputDic['data'][self.pivotParameter] = np.zeros(inputDic['numberRealizations'], dtype=object)
       for rlz in range(inputDic['numberRealizations']):
         outputDic['data'][self.pivotParameter][rlz] = newTime
-        for var in inputDic['outVars']:
-          oldTime = inputDic['data'][self.pivotParameter][rlz]
-          outputDic['data'][var][rlz] = self.resampleHist(inputDic['data'][var][rlz], oldTime, newTime)
 
       outputDic['data']['ProbabilityWeight'] = inputDic['data']['ProbabilityWeight']
       outputDic['data']['prefix'] = inputDic['data']['prefix']
@@ -154,21 +147,4 @@ class HistorySetSync(PostProcessorInterfaceBase):
       @ In, newTime,  np.array, array containing the sampled values of the new temporal variable
       @ Out, variable, np.array, array containing the sampled values of the dependent variable re-sampled on oldTime
     '''
-    newVar=np.zeros(newTime.size)
-    pos=0
-    for newT in newTime:
-      if newT<oldTime[0]:
-        if self.extension == 'extended':
-          newVar[pos] = variable[0]
-        elif self.extension == 'zeroed':
-          newVar[pos] = 0.0
-      elif newT>oldTime[-1]:
-        if self.extension == 'extended':
-          newVar[pos] = variable[-1]
-        elif self.extension == 'zeroed':
-          newVar[pos] = 0.0
-      else:
-        index = np.searchsorted(oldTime,newT)
-        newVar[pos] = variable[index-1] + (variable[index]-variable[index-1])/(oldTime[index]-oldTime[index-1])*(newT-oldTime[index-1])
-      pos=pos+1
-    return newVar
+    return historyUtils.resampleHistories([oldTime], {'variable':[variable]}, newTime, extension=self.extension)['variable'][0]
@@ -24,7 +24,7 @@ import numpy as np
 import copy
 from collections import defaultdict
 from functools import partial
-from utils import mathUtils, utils
+from utils import mathUtils, utils, historyUtils
 
 class TypicalHistoryFromHistorySet(PostProcessorInterfaceBase):
   """
@@ -100,13 +100,17 @@ class TypicalHistoryFromHistorySet(PostProcessorInterfaceBase):
     if self.outputLen is None:
       self.outputLen = np.asarray(inputDict['output'][utils.first(inputDict['output'].keys())][self.pivotParameter])[-1]
 
-    ## Check if data is synchronized
+    ## Check if data is synchronized (all at once, against the first history)
     referenceHistory = 0
-    referenceTimeAxis = inputDict[self.pivotParameter][referenceHistory]
-    for hist in range(inputDic[0]['numberRealizations']):
-      if str(inputDict[self.pivotParameter][hist]) != str(referenceTimeAxis):
-        errorMessage = '{} Interfaced Post-Processor "{}": one or more histories in the historySet have different time scales (e.g., reference points: {} and {})'.format(self.__class__.__name__, self.name,referenceHistory, hist)
-        self.raiseAnError(IOError, errorMessage)
+    times, offsets = historyUtils.packHistories(inputDict[self.pivotParameter])
+    referenceLength = offsets[1]
+    unsynchronized = np.flatnonzero(np.diff(offsets) != referenceLength)
+    if len(unsynchronized) == 0:
+      times = times.reshape(-1,referenceLength)
+      unsynchronized = np.flatnonzero(np.any(~np.isclose(times,times[referenceHistory],rtol=1e-8,atol=0.0),axis=1))
+    if len(unsynchronized) > 0:
+      errorMessage = '{} Interfaced Post-Processor "{}": one or more histories in the historySet have different time scales (e.g., reference points: {} and {})'.format(self.__class__.__name__, self.name,referenceHistory, unsynchronized[0])
+      self.raiseAnError(IOError, errorMessage)
 
     # task: reshape the data into histories with the size of the output I'm looking for
     #data dictionaries have form {historyNumber:{VarName:[data], VarName:[data]}}
@@ -171,6 +175,12 @@ class TypicalHistoryFromHistorySet(PostProcessorInterfaceBase):
       n+= 1
     numParallelSubsequences = len(self.subsequence)
 
+    # stack the (reshaped) histories of each feature, one row per history
+    historyData = {}
+    for feature in self.features:
+      historyData[feature], _ = historyUtils.packHistories(list(inputDict['output'][h][feature] for h in inputDict['output'].keys()))
+      historyData[feature] = historyData[feature].reshape(self.numHistory,-1)
+
     #now that the subsequences are identified, collect the data
     # for the record, defaultdict is a dict that auto-populates using the constructer given if an element isn't present
     subseqData = defaultdict(dict)  # eventually {'all':{feature:[[parallel output data]], feature:[[parallel output data]]},
@@ -191,15 +201,12 @@ class TypicalHistoryFromHistorySet(PostProcessorInterfaceBase):
         subseqData[index][self.pivotParameter] = np.concatenate((subseqData[index][self.pivotParameter], np.asarray([self.pivotValues[-1]])))
       #get the subsequence data for each feature, for each history
       for feature in self.features:
-        subseqData[index][feature] = np.zeros(shape=(self.numHistory,len(subseqData[index][self.pivotParameter])))
-        for h, historyNumber in enumerate(inputDict['output'].keys()):
-          if self.pivotValues[-1] == self.subsequence[index][1]:
-            #TODO this is doing the right action, but it's strange that we need to add one extra element.
-            #  Maybe this should be fixed where we set the self.subsequence[index][1] for the last index, instead of patched here
-            subseqData[index][feature][h,0:-1] = np.extract(extractCondition, inputDict['output'][historyNumber][feature])
-            subseqData[index][feature][h,-1] = inputDict['output'][historyNumber][feature][-1]
-          else:
-            subseqData[index][feature][h,:] = np.extract(extractCondition, inputDict['output'][historyNumber][feature])
+        if self.pivotValues[-1] == self.subsequence[index][1]:
+          #TODO this is doing the right action, but it's strange that we need to add one extra element.
+          #  Maybe this should be fixed where we set the self.subsequence[index][1] for the last index, instead of patched here
+          subseqData[index][feature] = np.concatenate((historyData[feature][:,extractCondition],historyData[feature][:,-1:]),axis=1)
+        else:
+          subseqData[index][feature] = historyData[feature][:,extractCondition]
 
     # task: compare CDFs to find the nearest match to the collective time's standard CDF (see the paper ref'd in the manual)
     # start by building the CDFs in the same structure as subseqData
@@ -207,17 +214,14 @@ class TypicalHistoryFromHistorySet(PostProcessorInterfaceBase):
     cdfData = defaultdict(dict) # eventually {'all':{feature:[monotonically increasing floats], feature:[monotonically increasing floats]},
     #                                    subseqIndex:{pivotParam:pivotValues[-1]},
     #                                                 feature:[monotonically increasing floats]}
-    # TODO there surely is a faster way to do this than triple-for-loops
     for feature in self.features:
       #construct reasonable bins for feature
       numBins, binEdges = mathUtils.numBinsDraconis(subseqData['all'][feature])
       #get the empirical CDF by bin for entire history (e.g., full year or even multiple years)
       cdfData['all'][feature] = self.__computeECDF(subseqData['all'][feature], binEdges)
-      #get the empirical CDF by bin for subsequence (e.g., for a month)
+      #get the empirical CDF by bin for subsequence (e.g., for a month), for all the histories at once
       for index in range(numParallelSubsequences):
-        cdfData[index][feature] = np.zeros(shape=(self.numHistory,numBins))
-        for h in range(self.numHistory):
-          cdfData[index][feature][h,:] = self.__computeECDF(subseqData[index][feature][h,:], binEdges)
+        cdfData[index][feature] = self.__computeECDF(subseqData[index][feature], binEdges)
 
     # now determine which subsequences are the most typical, using the CDF
     # find the smallestDeltaCDF and its index so the typical data can be set
@@ -226,13 +230,8 @@ class TypicalHistoryFromHistorySet(PostProcessorInterfaceBase):
     for index in range(numParallelSubsequences):
       typicalDataHistories[index] = {}
       typicalDataHistories[index][self.pivotParameter] = subseqData[index][self.pivotParameter]
-      smallestDeltaCDF = np.inf
-      smallestDeltaIndex = numParallelSubsequences + 1 #initialized as bogus index to preserve errors
-      for h in range(self.numHistory):# for h, historyNumber in enumerate(inputDict['output'].keys()):
-        delta = sum(self.__computeDist(cdfData['all'][feature],cdfData[index][feature][h,:]) for feature in self.features)
-        if delta < smallestDeltaCDF:
-          smallestDeltaCDF = delta
-          smallestDeltaIndex = h
+      delta = sum(self.__computeDist(cdfData['all'][feature],cdfData[index][feature]) for feature in self.features)
+      smallestDeltaIndex = np.argmin(delta)
       for feature in self.features:
         typicalDataHistories[index][feature] = subseqData[index][feature][smallestDeltaIndex,:]
     # now collapse the data into the typical history
@@ -264,18 +263,27 @@ class TypicalHistoryFromHistorySet(PostProcessorInterfaceBase):
   def __computeECDF(self, data, binEdgesIn):
     """
       Method to generate empirical CDF of input data, with the bins given.
-      @ In, data, numpy array, data for which empirical CDF is computed
-      @ In, binEdgesIn, numpy array, bins over which CDF value is computed
-      @ Out, , numpy array, empirical CDF of the input data.
+      @ In, data, numpy array, data for which empirical CDF is computed (or 2-D array, one CDF per row)
+      @ In, binEdgesIn, numpy array, bins over which CDF value is computed (equally spaced)
+      @ Out, , numpy array, empirical CDF of the input data (one row per row of data for 2-D data)
     """
-    (counts, _) = np.histogram(data,bins=binEdgesIn,normed=True)
-    return np.cumsum(counts)/max(np.cumsum(counts))
+    rows = np.atleast_2d(data)
+    numBins = len(binEdgesIn)-1
+    # bin of each value, as in np.histogram (the last bin includes its upper edge, values outside are not counted)
+    bins = np.searchsorted(binEdgesIn, rows, side='right') - 1
+    bins[rows == binEdgesIn[-1]] = numBins - 1
+    inside = np.logical_and(bins >= 0, bins < numBins)
+    rowIndex = np.broadcast_to(np.arange(rows.shape[0])[:,None], rows.shape)
+    counts = np.bincount(rowIndex[inside]*numBins + bins[inside], minlength=rows.shape[0]*numBins).reshape(rows.shape[0],numBins)
+    cumulative = np.cumsum(counts, axis=1)
+    ecdf = cumulative/cumulative.max(axis=1, keepdims=True)
+    return ecdf if np.ndim(data) > 1 else ecdf[0]
 
   def __computeDist(self, x1, x2):
     """
       Method to compute absolute difference of two points.
       @ In, x1, numpy array, input 1
-      @ In, x2, numpy array, input 2
-      @ Out, , float, difference between x1 and x2
+      @ In, x2, numpy array, input 2 (or 2-D array, one point per row)
+      @ Out, , float, difference between x1 and x2 (one per row of x2)
     """
-    return np.average(np.absolute(x1-x2))
+    return np.average(np.absolute(x1-x2), axis=-1)
@@ -115,10 +115,10 @@ class PostProcessorInterfaceBase(utils.metaclass_insert(abc.ABCMeta,object),Mess
       @ Out, outcome, bool, outcome of the outputDic check (True/False)
     """
     outcome = True
-    if isinstance(outputDic,dict):
+    if utils.isAMapping(outputDic):
       if self.outputFormat == 'HistorySet':
         for key in outputDic:
-          if isinstance(outputDic[key],dict):
+          if utils.isAMapping(outputDic[key]):
             outcome = outcome and True
           else:
             self.raiseAWarning('Bad PP output type for key:',key,':',type(outputDic[key]),'; should be dict!')
@@ -148,7 +148,7 @@ class PostProcessorInterfaceBase(utils.metaclass_insert(abc.ABCMeta,object),Mess
       @ Out, outcome, bool, outcome of the outputDic check (True/False)
     """
     outcome = True
-    if isinstance(outputDic,dict):
+    if utils.isAMapping(outputDic):
         for key in outputDic:
           if isinstance(outputDic[key],(np.ndarray,c1darray)):
             outcome = outcome and True
@@ -35,6 +35,7 @@ from .PostProcessor import PostProcessor
 from utils import utils
 from utils import InputData
 from utils import mathUtils
+from utils import streamingStatistics
 import Files
 import Runners
 #Internal Modules End-----------------------------------------------------------
@@ -108,6 +109,11 @@ class BasicStatistics(PostProcessor):
     multipleFeaturesInput = InputData.parameterInputFactory("multipleFeatures", contentType=InputData.BoolType)
     inputSpecification.addSub(multipleFeaturesInput)
 
+    onlineInput = InputData.parameterInputFactory("online", contentType=InputData.BoolType)
+    onlineInput.addParam("chunkSize", InputData.IntegerType)
+    onlineInput.addParam("sketchSize", InputData.IntegerType)
+    inputSpecification.addSub(onlineInput)
+
     return inputSpecification
 
   def __init__(self, messageHandler):
@@ -133,6 +139,10 @@ class BasicStatistics(PostProcessor):
     self.realizationWeight = None # The joint probabilities
     self.outputDataset  = False # True if the user wants to dump the outputs to dataset
     self.multipleFeatures = True # True if multiple features are employed in linear regression as feature inputs
+    self.online         = False # True if the statistics are accumulated chunk by chunk
+    self.chunkSize      = 1000  # number of realizations processed at once in online mode
+    self.sketchSize     = 200   # number of centroids of the quantile sketches in online mode
+    self.onlineState    = None  # accumulators of the online mode, kept between runs (see __updateOnlineState)
 
   def inputToInternal(self, currentInp):
     """
@@ -152,7 +162,7 @@ class BasicStatistics(PostProcessor):
       return currentInput
     # TODO: convert dict to dataset, I think this will be removed when DataSet is used by other entities that
     # are currently using this Basic Statisitics PostProcessor.
-    if type(currentInput).__name__ == 'dict':
+    if utils.isAMapping(currentInput):
       if 'targets' not in currentInput.keys():
         self.raiseAnError(IOError, 'Did not find targets in the input dictionary')
       inputDataset = xr.Dataset()
@@ -219,6 +229,34 @@ class BasicStatistics(PostProcessor):
 
     return inputDataset, pbWeights
 
+  def __inspectOnlineInput(self, currentInput):
+    """
+      Method to read the structure of the input of the online mode (as inputToInternal does for the standard mode),
+      without casting the input as a dataset: the realizations are only read one chunk at a time (see __onlineChunk)
+      @ In, currentInput, DataObject, the input PointSet or HistorySet
+      @ Out, None
+    """
+    self.dynamic = False
+    if len(currentInput) == 0:
+      self.raiseAnError(IOError, "In post-processor " +self.name+" the input "+currentInput.name+" is empty.")
+    self.sampleTag = currentInput.sampleTag
+    if currentInput.type == 'HistorySet':
+      dims = set(dim for target in self.parameters['targets'] for dim in currentInput.getDimensions(target)[target])
+      if self.pivotParameter is None:
+        if len(dims) > 0:
+          self.raiseAnError(IOError, self, 'Time-dependent statistics is requested (HistorySet) but no pivotParameter \
+                got inputted!')
+      elif self.pivotParameter not in dims:
+        self.raiseAnError(IOError, self, 'Pivot parameter', self.pivotParameter, 'is not the associated index for \
+                requested variables', ','.join(self.parameters['targets']))
+      else:
+        self.dynamic = True
+        # the alignment of the other realizations is checked chunk by chunk
+        self.pivotValue = currentInput.getChunk(self.parameters['targets'], 0, 1)[self.pivotParameter].values
+    self.pbPresent = 'ProbabilityWeight' in currentInput.getVars('meta')
+    if not self.pbPresent:
+      self.raiseAWarning('BasicStatistics postprocessor did not detect ProbabilityWeights! Assuming unit weights instead...')
+
   def initialize(self, runInfo, inputs, initDict):
     """
       Method to initialize the BasicStatistic pp. In here the working dir is
@@ -318,6 +356,12 @@ class BasicStatistics(PostProcessor):
         self.outputDataset = child.value
       elif tag == "multipleFeatures":
         self.multipleFeatures = child.value
+      elif tag == "online":
+        self.online = child.value
+        self.chunkSize = child.parameterValues.get('chunkSize', self.chunkSize)
+        self.sketchSize = child.parameterValues.get('sketchSize', self.sketchSize)
+        if self.chunkSize < 1 or self.sketchSize < 1:
+          self.raiseAnError(IOError, 'The "chunkSize" and "sketchSize" of node <online> must be positive!')
       else:
         self.raiseAWarning('Unrecognized node in BasicStatistics "',tag,'" has been ignored!')
     assert (len(self.toDo)>0), self.raiseAnError(IOError, 'BasicStatistics needs parameters to work on! Please check input for PP: ' + self.name)
@@ -488,16 +532,13 @@ class BasicStatistics(PostProcessor):
     return result
 
 
-  def __runLocal(self, inputData):
+  def __neededMetrics(self):
     """
-      This method executes the postprocessor action. In this case, it computes all the requested statistical FOMs
-      @ In, inputData, tuple,  (inputDataset, pbWeights), tuple, the dataset of inputs and the corresponding
-        variable probability weight
-      @ Out, outputSet or outputDict, xarray.Dataset or dict, dataset or dictionary containing the results
+      Constructs the dictionary of the metrics (and of their parameters) that need to be computed,
+      including the ones required by the requested metrics
+      @ In, None
+      @ Out, needed, dict, {metric:{'targets':list, 'features':list or 'percent':set}}
     """
-    inputDataset, pbWeights = inputData[0], inputData[1]
-    #storage dictionary for skipped metrics
-    self.skipped = {}
     #construct a dict of required computations
     needed = dict((metric,{'targets':set(),'percent':set()}) for metric in self.scalarVals)
     needed.update(dict((metric,{'targets':set(),'features':set()}) for metric in self.vectorVals))
@@ -553,6 +594,42 @@ class BasicStatistics(PostProcessor):
         needed[metric]['features'] = list(params['features'])
       except KeyError:
         pass
+    return needed
+
+  def __startVector(self, metric, needed):
+    """
+      Common method among all metrics for establishing parameters
+      @ In, metric, string, the name of the statistics metric to calculate
+      @ In, needed, dict, the metrics that need to be computed (see __neededMetrics)
+      @ Out, targets, list(str), list of target parameter names (evaluate metrics for these)
+      @ Out, features, list(str), list of feature parameter names (evaluate with respect to these)
+      @ Out, skip, bool, if True it means either features or parameters were missing, so don't calculate anything
+    """
+    # default to skipping, change that if we find criteria
+    targets = []
+    features = []
+    skip = True
+    if len(needed[metric]['targets'])>0:
+      self.raiseADebug('Starting "'+metric+'"...')
+      targets = list(needed[metric]['targets'])
+      features = list(needed[metric]['features'])
+      skip = False #True only if we don't have targets and features
+    if skip:
+      if metric not in self.skipped.keys():
+        self.skipped[metric] = True
+    return targets,features,skip
+
+  def __runLocal(self, inputData):
+    """
+      This method executes the postprocessor action. In this case, it computes all the requested statistical FOMs
+      @ In, inputData, tuple,  (inputDataset, pbWeights), tuple, the dataset of inputs and the corresponding
+        variable probability weight
+      @ Out, outputSet or outputDict, xarray.Dataset or dict, dataset or dictionary containing the results
+    """
+    inputDataset, pbWeights = inputData[0], inputData[1]
+    #storage dictionary for skipped metrics
+    self.skipped = {}
+    needed = self.__neededMetrics()
 
     #
     # BEGIN actual calculations
@@ -730,28 +807,6 @@ class BasicStatistics(PostProcessor):
         percentileSet = percentileSet.rename({'quantile':'percent'})
       calculations[metric] = percentileSet
 
-    def startVector(metric):
-      """
-        Common method among all metrics for establishing parameters
-        @ In, metric, string, the name of the statistics metric to calculate
-        @ Out, targets, list(str), list of target parameter names (evaluate metrics for these)
-        @ Out, features, list(str), list of feature parameter names (evaluate with respect to these)
-        @ Out, skip, bool, if True it means either features or parameters were missing, so don't calculate anything
-      """
-      # default to skipping, change that if we find criteria
-      targets = []
-      features = []
-      skip = True
-      if len(needed[metric]['targets'])>0:
-        self.raiseADebug('Starting "'+metric+'"...')
-        targets = list(needed[metric]['targets'])
-        features = list(needed[metric]['features'])
-        skip = False #True only if we don't have targets and features
-      if skip:
-        if metric not in self.skipped.keys():
-          self.skipped[metric] = True
-      return targets,features,skip
-
     #################
     # VECTOR VALUES #
     #################
@@ -759,7 +814,7 @@ class BasicStatistics(PostProcessor):
     # sensitivity matrix
     #
     metric = 'sensitivity'
-    targets,features,skip = startVector(metric)
+    targets,features,skip = self.__startVector(metric, needed)
     #NOTE sklearn expects the transpose of what we usually do in RAVEN, so #samples by #features
     if not skip:
       #for sensitivity matrix, we don't use numpy/scipy methods to calculate matrix operations,
@@ -789,7 +844,7 @@ class BasicStatistics(PostProcessor):
     # covariance matrix
     #
     metric = 'covariance'
-    targets,features,skip = startVector(metric)
+    targets,features,skip = self.__startVector(metric, needed)
     if not skip:
       # because the C implementation is much faster than picking out individual values,
       #   we do the full covariance matrix with all the targets and features.
@@ -828,6 +883,18 @@ class BasicStatistics(PostProcessor):
         da = self.covarianceCalculation(paramSamples,fact,varianceDA,targVars)
         calculations[metric] = da
 
+    self.__computeCovarianceDerived(calculations, needed)
+
+    return self.__formatOutput(calculations)
+
+  def __computeCovarianceDerived(self, calculations, needed):
+    """
+      Computes the metrics derived from the covariance matrix (pearson, VarianceDependentSensitivity and
+      NormalizedSensitivity), and stores them in the calculations
+      @ In, calculations, dict, the metrics already computed, {metric:xarray.Dataset or xarray.DataArray}
+      @ In, needed, dict, the metrics that need to be computed (see __neededMetrics)
+      @ Out, None
+    """
     def getCovarianceSubset(desired):
       """
         @ In, desired, list(str), list of parameters to extract from covariance matrix
@@ -840,7 +907,7 @@ class BasicStatistics(PostProcessor):
     #
     # see comments in covariance for notes on C implementation
     metric = 'pearson'
-    targets,features,skip = startVector(metric)
+    targets,features,skip = self.__startVector(metric, needed)
     if not skip:
       params = list(set(targets).union(set(features)))
       reducedCovar = getCovarianceSubset(params)
@@ -866,7 +933,7 @@ class BasicStatistics(PostProcessor):
     # vc(X) is the covariance matrix of X with itself.
     # The variance dependent sensitivity matrix is defined as: cov(Y,X) * [vc(X)]^(-1)
     metric = 'VarianceDependentSensitivity'
-    targets,features,skip = startVector(metric)
+    targets,features,skip = self.__startVector(metric, needed)
     if not skip:
       params = list(set(targets).union(set(features)))
       reducedCovar = getCovarianceSubset(params)
@@ -888,7 +955,7 @@ class BasicStatistics(PostProcessor):
     # variance dependent sensitivity  normalized by the mean (% change of output)/(% change of input)
     #
     metric = 'NormalizedSensitivity'
-    targets,features,skip = startVector(metric)
+    targets,features,skip = self.__startVector(metric, needed)
     if not skip:
       params = list(set(targets).union(set(features)))
       reducedSen = calculations['VarianceDependentSensitivity'].sel(**{'targets':params,'features':params})
@@ -899,7 +966,12 @@ class BasicStatistics(PostProcessor):
       reducedSen *= meanDA
       calculations[metric] = reducedSen
 
-
+  def __formatOutput(self, calculations):
+    """
+      Converts the computed metrics into the output of this post-processor
+      @ In, calculations, dict, the computed metrics, {metric:xarray.Dataset or xarray.DataArray}
+      @ Out, outputSet or outputDict, xarray.Dataset or dict, dataset or dictionary containing the results
+    """
     for metric, ds in calculations.items():
       if metric in self.scalarVals and metric !='samples':
         calculations[metric] = ds.to_array().rename({'variable':'targets'})
@@ -939,6 +1011,256 @@ class BasicStatistics(PostProcessor):
 
       return outputDict
 
+  def __runOnline(self, currentInput):
+    """
+      This method executes the postprocessor action in online mode: the statistics are accumulated chunk by chunk
+      over the realizations of the input, so that only a chunk of samples is read and expanded at once (the input
+      is never cast as a whole dataset). The accumulators are kept between runs, thus only the realizations added
+      to the input after the previous run are processed.
+      @ In, currentInput, DataObject, the input PointSet or HistorySet
+      @ Out, outputSet or outputDict, xarray.Dataset or dict, dataset or dictionary containing the results
+    """
+    #storage dictionary for skipped metrics
+    self.skipped = {}
+    needed = self.__neededMetrics()
+    state = self.__updateOnlineState(currentInput, needed)
+    moments = state['moments']
+
+    def scalarSet(values, variables, targets, dims=(), coords=None):
+      """
+        Converts accumulated statistics into a dataset
+        @ In, values, np.ndarray, [...,#variables,#pivotValues] the statistics of the variables
+        @ In, variables, list(str), the variables of the accumulator
+        @ In, targets, list(str), the targets to include in the dataset
+        @ In, dims, tuple, optional, the leading dimensions of values
+        @ In, coords, dict, optional, the coordinates of the leading dimensions
+        @ Out, scalarDS, xarray.Dataset, the dataset of the statistics
+      """
+      scalarDS = xr.Dataset()
+      coords = dict(coords) if coords is not None else {}
+      for target in targets:
+        targValues = values[...,variables.index(target),:]
+        if self.dynamic:
+          targCoords = dict(coords, **{self.pivotParameter:self.pivotValue})
+          scalarDS[target] = xr.DataArray(targValues, dims=dims+(self.pivotParameter,), coords=targCoords)
+        else:
+          scalarDS[target] = xr.DataArray(targValues[...,0], dims=dims, coords=coords)
+      return scalarDS
+
+    calculations = {}
+    #################
+    # SCALAR VALUES #
+    #################
+    metric = 'samples'
+    if len(needed[metric]['targets'])>0:
+      self.raiseADebug('Starting "'+metric+'"...')
+      sampleMat = np.zeros((len(self.parameters['targets']),moments.mean.shape[-1]))
+      sampleMat.fill(moments.count)
+      calculations[metric] = scalarSet(sampleMat, self.parameters['targets'], self.parameters['targets']).to_array().rename({'variable':'targets'})
+    # moments and extrema, the statistics are only evaluated if requested
+    statistics = OrderedDict([('expectedValue',       lambda: moments.mean),
+                              ('variance',            lambda: moments.variance(self.biased)),
+                              ('sigma',               lambda: np.sqrt(moments.variance(self.biased))),
+                              ('variationCoefficient',lambda: np.sqrt(moments.variance(self.biased))/moments.mean),
+                              ('skewness',            lambda: moments.skewness(self.biased)),
+                              ('kurtosis',            lambda: moments.kurtosis(self.biased)),
+                              ('maximum',             lambda: moments.maximum),
+                              ('minimum',             lambda: moments.minimum)])
+    for metric, statistic in statistics.items():
+      if len(needed[metric]['targets'])>0:
+        self.raiseADebug('Starting "'+metric+'"...')
+        calculations[metric] = scalarSet(statistic(), state['variables']['moments'], needed[metric]['targets'])
+    # median and percentiles, from the quantile sketches
+    metric = 'median'
+    if len(needed[metric]['targets'])>0:
+      self.raiseADebug('Starting "'+metric+'"...')
+      quantile = state['sketch'].quantile([0.5], method='weighted' if self.pbPresent else 'midpoint')
+      calculations[metric] = scalarSet(quantile[0], state['variables']['sketch'], needed[metric]['targets'])
+    metric = 'percentile'
+    if len(needed[metric]['targets'])>0:
+      self.raiseADebug('Starting "'+metric+'"...')
+      percent = list(needed[metric]['percent'])
+      quantile = state['sketch'].quantile(percent, method='weighted' if self.pbPresent else 'lower')
+      calculations[metric] = scalarSet(quantile, state['variables']['sketch'], needed[metric]['targets'], ('percent',), {'percent':percent})
+
+    #################
+    # VECTOR VALUES #
+    #################
+    metric = 'sensitivity'
+    targets,features,skip = self.__startVector(metric, needed)
+    if not skip:
+      calculations[metric] = self.__onlineSensitivity(state, targets, features)
+    metric = 'covariance'
+    targets,features,skip = self.__startVector(metric, needed)
+    if not skip:
+      params = state['variables']['covariance']
+      index = [state['variables']['moments'].index(param) for param in params]
+      # the deviations are computed from the means of each target, as in the standard mode
+      covariance = state['covariance'].covariance(self.biased, means=moments.mean[index].T)
+      diagonal = np.arange(len(params))
+      covariance[:,diagonal,diagonal] = moments.variance(self.biased)[index].T
+      calculations[metric] = self.__onlineMatrix(covariance, params, params)
+
+    self.__computeCovarianceDerived(calculations, needed)
+
+    return self.__formatOutput(calculations)
+
+  def __updateOnlineState(self, currentInput, needed):
+    """
+      Updates the accumulators of the online mode with the realizations of the input that have not been
+      processed yet. The accumulators are rebuilt from scratch if the input is not the one they were built on
+      anymore (e.g. a different DataObject, or a DataObject that has been reset and refilled).
+      @ In, currentInput, DataObject, the input PointSet or HistorySet
+      @ In, needed, dict, the metrics that need to be computed (see __neededMetrics)
+      @ Out, state, dict, the accumulators and the information about the processed realizations
+    """
+    variables = {'moments':sorted(self.parameters['targets']),
+                 'sketch':sorted(set(needed['median']['targets']).union(needed['percentile']['targets'])),
+                 'covariance':sorted(set(needed['covariance']['targets']).union(needed['covariance']['features'])),
+                 'sensitivity':sorted(set(needed['sensitivity']['targets']).union(needed['sensitivity']['features']))}
+    state = self.onlineState
+    if state is not None and not self.__onlineStateMatches(state, currentInput, variables):
+      self.raiseADebug('The input', currentInput.name, 'changed, the online statistics are accumulated again')
+      state = None
+    if state is None:
+      state = {'input':currentInput.name,
+               'variables':variables,
+               'pbPresent':self.pbPresent,
+               'pivot':np.copy(self.pivotValue) if self.dynamic else None,
+               'consumed':0,
+               'signature':None,
+               'moments':streamingStatistics.WeightedMoments(),
+               'sketch':streamingStatistics.QuantileSketch(self.sketchSize) if len(variables['sketch'])>0 else None,
+               'covariance':streamingStatistics.WeightedCoMoments() if len(variables['covariance'])>0 else None,
+               'sensitivity':streamingStatistics.WeightedCoMoments() if len(variables['sensitivity'])>0 else None}
+    numRlz = len(currentInput)
+    if state['consumed'] < numRlz:
+      allVars = variables['moments']
+      subsets = dict((key,[allVars.index(var) for var in varList]) for key,varList in variables.items())
+      for start in range(state['consumed'], numRlz, self.chunkSize):
+        end = min(start+self.chunkSize, numRlz)
+        values, realizationWeight, weights = self.__onlineChunk(currentInput, allVars, start, end)
+        state['moments'].update(values, weights)
+        if state['sketch'] is not None:
+          state['sketch'].update(values[:,subsets['sketch']], weights[:,subsets['sketch']])
+        if state['covariance'] is not None:
+          state['covariance'].update(values[:,subsets['covariance']], realizationWeight)
+        if state['sensitivity'] is not None:
+          # the linear regression is not weighted, as in the standard mode
+          state['sensitivity'].update(values[:,subsets['sensitivity']], np.ones(end-start))
+      self.raiseADebug('Online statistics updated with realizations',state['consumed'],'to',numRlz-1)
+      state['consumed'] = numRlz
+      state['signature'] = self.__onlineChunk(currentInput, allVars, numRlz-1, numRlz)[0]
+    self.onlineState = state
+    return state
+
+  def __onlineStateMatches(self, state, currentInput, variables):
+    """
+      Checks if the online accumulators have been built on the first realizations of the input
+      @ In, state, dict, the accumulators and the information about the processed realizations
+      @ In, currentInput, DataObject, the input PointSet or HistorySet
+      @ In, variables, dict, the variables of each accumulator
+      @ Out, matches, bool, True if the accumulators can be updated with the following realizations
+    """
+    consumed = state['consumed']
+    if state['input'] != currentInput.name or state['variables'] != variables or state['pbPresent'] != self.pbPresent:
+      return False
+    if consumed > len(currentInput) or self.dynamic != (state['pivot'] is not None):
+      return False
+    if self.dynamic and (len(state['pivot']) != len(self.pivotValue) or np.any(state['pivot'] != self.pivotValue)):
+      return False
+    # the last processed realization must not have changed
+    last = self.__onlineChunk(currentInput, variables['moments'], consumed-1, consumed)[0]
+    return np.allclose(last, state['signature'], rtol=0.0, atol=0.0, equal_nan=True)
+
+  def __onlineChunk(self, currentInput, variables, start, end):
+    """
+      Reads the values and the probability weights of a chunk of realizations of the input
+      @ In, currentInput, DataObject, the input PointSet or HistorySet
+      @ In, variables, list(str), the variables to extract
+      @ In, start, int, the first realization of the chunk
+      @ In, end, int, the realization following the last one of the chunk
+      @ Out, values, np.ndarray, [#realizations,#variables,#pivotValues] the values (1 pivot value if not time-dependent)
+      @ Out, realizationWeight, np.ndarray, [#realizations] the weights of the realizations (unit weights if not available)
+      @ Out, weights, np.ndarray, [#realizations,#variables] the weights of each variable
+    """
+    pbNames = []
+    if self.pbPresent:
+      metaVars = currentInput.getVars('meta')
+      pbNames = ['ProbabilityWeight'] + list(name for name in ('ProbabilityWeight-' + var for var in variables) if name in metaVars)
+    chunk = currentInput.getChunk(list(variables) + pbNames, start, end)
+    array = chunk[variables].to_array()
+    if self.dynamic:
+      pivot = chunk[self.pivotParameter].values
+      values = array.transpose(self.sampleTag,'variable',self.pivotParameter).values.astype(float)
+      # the realizations must share the pivot values of the first one (see __inspectOnlineInput)
+      if len(pivot) != len(self.pivotValue) or np.any(pivot != self.pivotValue) or np.isnan(values).any():
+        self.raiseAnError(IOError, "The data provided by the data objects", currentInput.name, "is not synchronized!")
+    else:
+      values = array.transpose(self.sampleTag,'variable').values.astype(float)[:,:,np.newaxis]
+    if not self.pbPresent:
+      return values, np.ones(end-start), np.ones((end-start,len(variables)))
+    realizationWeight = chunk['ProbabilityWeight'].values.astype(float)
+    weights = np.empty((end-start,len(variables)))
+    for i, var in enumerate(variables):
+      pbName = 'ProbabilityWeight-' + var
+      weights[:,i] = chunk[pbName].values if pbName in pbNames else realizationWeight
+    return values, realizationWeight, weights
+
+  def __onlineSensitivity(self, state, targets, features):
+    """
+      Computes the sensitivity coefficients (linear regression coefficients) from the accumulated co-moments,
+      solving the normal equations of the regressions performed by sensitivityCalculation
+      @ In, state, dict, the accumulators of the online mode
+      @ In, targets, list(str), list of target variables
+      @ In, features, list(str), list of feature variables
+      @ Out, da, xarray.DataArray, contains the calculations of sensitivity coefficients
+    """
+    params = state['variables']['sensitivity']
+    comoment = state['sensitivity'].comoment
+    targIndex = [params.index(targ) for targ in targets]
+    featIndex = [params.index(feat) for feat in features]
+    senMatrix = np.zeros((comoment.shape[0],len(targets),len(features)))
+
+    def pinv(matrices):
+      """
+        Pseudo-inverses of a stack of matrices (np.linalg.pinv only accepts stacks from numpy 1.14)
+        @ In, matrices, np.ndarray, [#pivotValues,n,n] the matrices
+        @ Out, pinv, np.ndarray, [#pivotValues,n,n] the pseudo-inverses
+      """
+      return np.asarray([np.linalg.pinv(matrix) for matrix in matrices])
+
+    if self.multipleFeatures:
+      if not set(targets) & set(features):
+        senMatrix = np.matmul(comoment[:,targIndex][:,:,featIndex], pinv(comoment[:,featIndex][:,:,featIndex]))
+      else:
+        # the target is not regressed on itself, its coefficient is 1 (see sensitivityCalculation)
+        for p, targ in enumerate(targets):
+          others = [i for i, feat in enumerate(features) if feat != targ]
+          otherIndex = [featIndex[i] for i in others]
+          regCoeff = np.matmul(comoment[:,targIndex[p],otherIndex][:,np.newaxis,:], pinv(comoment[:,otherIndex][:,:,otherIndex]))
+          senMatrix[:,p,others] = regCoeff[:,0,:]
+          if targ in features:
+            senMatrix[:,p,features.index(targ)] = 1.0
+    else:
+      for p, feat in enumerate(features):
+        senMatrix[:,:,p] = comoment[:,targIndex,featIndex[p]]/comoment[:,featIndex[p],featIndex[p]][:,np.newaxis]
+    return self.__onlineMatrix(senMatrix, targets, features)
+
+  def __onlineMatrix(self, values, targets, features):
+    """
+      Converts an accumulated matrix statistic into a DataArray
+      @ In, values, np.ndarray, [#pivotValues,#targets,#features] the statistic
+      @ In, targets, list(str), list of target variables
+      @ In, features, list(str), list of feature variables
+      @ Out, da, xarray.DataArray, the statistic
+    """
+    coords = {'targets':targets,'features':features}
+    if self.dynamic:
+      coords[self.pivotParameter] = self.pivotValue
+      return xr.DataArray(values, dims=(self.pivotParameter,'targets','features'), coords=coords)
+    return xr.DataArray(values[0], dims=('targets','features'), coords=coords)
+
   def corrCoeff(self, covM):
     """
       This method calculates the correlation coefficient Matrix (pearson) for the given data.
@@ -1052,8 +1374,12 @@ class BasicStatistics(PostProcessor):
       @ In,  inputIn, object, object contained the data to process. (inputToInternal output)
       @ Out, outputSet, xarray.Dataset or dictionary, dataset or dictionary containing the results
     """
-    inputData = self.inputToInternal(inputIn)
-    outputSet = self.__runLocal(inputData)
+    currentInput = inputIn[-1] if type(inputIn) == list else inputIn
+    if self.online and getattr(currentInput, 'type', None) in ['PointSet','HistorySet']:
+      self.__inspectOnlineInput(currentInput)
+      outputSet = self.__runOnline(currentInput)
+    else:
+      outputSet = self.__runLocal(self.inputToInternal(inputIn))
 
     return outputSet
 
@@ -506,7 +506,7 @@ class ComparisonStatistics(PostProcessor):
           else:
             return str(l)
         newFileName = output.getBase() + "_" + delist(dataPulls) + "_" + str(i) + ".csv"
-        if type(dataStat).__name__ != 'dict':
+        if not utils.isAMapping(dataStat):
           assert(False)
           continue
         dataPairs = []
@@ -216,7 +216,7 @@ class CrossValidation(PostProcessor):
     if inputType == 'HDF5':
       self.raiseAnError(IOError, "Input type '", inputType, "' can not be accepted")
 
-    if type(currentInput) != dict:
+    if not utils.isAMapping(currentInput):
       dictKeys = list(cvEstimator.initializationOptionDict['Features'].split(',')) + list(cvEstimator.initializationOptionDict['Target'].split(','))
       newInput = dict.fromkeys(dictKeys, None)
       if not len(currentInput) == 0:
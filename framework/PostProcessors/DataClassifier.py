@@ -155,7 +155,7 @@ class DataClassifier(PostProcessor):
     haveClassifier = False
     haveTarget = False
     for inputObject in currentInput:
-      if isinstance(inputObject, dict):
+      if utils.isAMapping(inputObject):
         newInput.append(inputObject)
       else:
         if inputObject.type not in ['PointSet', 'HistorySet']:
@@ -234,22 +234,23 @@ class DataClassifier(PostProcessor):
 
     numRlz = utils.first(targetDict['input'].values()).size
     outputDict[self.label] = np.empty(numRlz)
+    targetValues = {}
+    targetValues.update(targetDict['input'])
+    targetValues.update(targetDict['output'])
+    # the functions are evaluated for all the realizations in one batch
+    calcVals = {}
+    for key in classifierDict['input'].keys():
+      calcVals[key] = self.funcDict[key].evaluateBatch("evaluate", targetValues)
     for i in range(numRlz):
-      tempTargDict = {}
-      for param, vals in targetDict['input'].items():
-        tempTargDict[param] = vals[i]
-      for param, vals in targetDict['output'].items():
-        tempTargDict[param] = vals[i]
-      tempClfList = []
       labelIndex = None
       for key, values in classifierDict['input'].items():
-        calcVal = self.funcDict[key].evaluate("evaluate", tempTargDict)
-        inds, = np.where(np.asarray(values) == calcVal)
+        inds, = np.where(np.asarray(values) == calcVals[key][i])
         if labelIndex is None:
           labelIndex = set(inds)
         else:
           labelIndex = labelIndex & set(inds)
       if len(labelIndex) != 1:
+        tempTargDict = dict((param, vals[i]) for param, vals in targetValues.items())
         self.raiseAnError(IOError, "The parameters", ",".join(tempTargDict.keys()), "with values", ",".join([str(el) for el in tempTargDict.values()]), "could not be put in any class!")
       outputDict[self.label][i] = classifierDict['output'][self.label][list(labelIndex)[0]]
 
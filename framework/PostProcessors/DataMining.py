@@ -190,6 +190,7 @@ class DataMining(PostProcessor):
     self.PreProcessor = None    ## Instance of PreProcessor, default is None
     self.metric = None          ## Instance of Metric, default is None
     self.pivotParameter = None  ## default pivotParameter for HistorySet
+    self.jobHandler = None      ## the job handler, providing the pool of processes (if any)
 
   def _localWhatDoINeed(self):
     """
@@ -366,7 +367,7 @@ class DataMining(PostProcessor):
     elif currentInput.type == 'PointSet':
       return self.inputToInternalForPointSet(currentInput)
 
-    elif type(currentInp) == dict:
+    elif utils.isAMapping(currentInp):
       if 'Features' in currentInput.keys():
         return
 
@@ -578,7 +579,9 @@ class DataMining(PostProcessor):
       metric = None
       if self.metric is not None:
         metric = MetricDistributor.returnInstance('MetricDistributor', self.metric, self)
-      self.unSupervisedEngine.train(Input['Features'], metric)
+      # the pairwise distances of the histories can be shared among the processes of the handler (if any)
+      pool = self.jobHandler.getProcessPool() if self.jobHandler is not None else None
+      self.unSupervisedEngine.train(Input['Features'], metric, pool)
     self.unSupervisedEngine.confidence()
     self.userInteraction()
     outputDict = self.unSupervisedEngine.outputDict
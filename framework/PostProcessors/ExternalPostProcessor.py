@@ -88,7 +88,7 @@ class ExternalPostProcessor(PostProcessor):
       @ Out, inputDict, dict, An input dictionary this object can process
     """
 
-    if type(currentInput) == dict and 'targets' in currentInput.keys():
+    if utils.isAMapping(currentInput) and 'targets' in currentInput.keys():
       return
 
     if type(currentInput) == list:
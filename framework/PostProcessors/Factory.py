@@ -23,64 +23,41 @@ import warnings
 warnings.simplefilter('default',DeprecationWarning)
 #End compatibility block for Python 3-------------------------------------------
 
-################################################################################
-from utils import utils
-from .PostProcessor import PostProcessor
-
-from .Metric import Metric
-from .DataMining import DataMining
-from .ETImporter import ETImporter
-from .SafestPoint import SafestPoint
-from .LimitSurface import LimitSurface
-from .ValueDuration import ValueDuration
-from .SampleSelector import SampleSelector
-from .ImportanceRank import ImportanceRank
-from .BasicStatistics import BasicStatistics
-from .CrossValidation import CrossValidation
-from .LimitSurfaceIntegral import LimitSurfaceIntegral
-from .ExternalPostProcessor import ExternalPostProcessor
-from .InterfacedPostProcessor import InterfacedPostProcessor
-from .TopologicalDecomposition import TopologicalDecomposition
-from .ComparisonStatisticsModule import ComparisonStatistics
-# from .RavenOutput import RavenOutput # deprecated for now
-
-## These utilize the optional prequisite library PySide, so don't error if they
-## do not import appropriately.
-try:
-  from .TopologicalDecomposition import QTopologicalDecomposition
-  from .DataMining import QDataMining
-except ImportError:
-  pass
-
-## [ Add new class here ]
-
-################################################################################
-## Alternatively, to fully automate this file:
-# from PostProcessors import *
-################################################################################
-
+from utils import importerUtils
 
 """
  Interface Dictionary (factory) (private)
 """
-
-# This machinery will automatically populate the "knownTypes" given the
-# imports defined above.
+# The post-processors are registered by the path of their definition, so that their modules (and the
+# libraries they need, e.g. scikit-learn) are only imported if an input uses them.
 __base = 'PostProcessor'
-__interFaceDict = {}
-
-for classObj in utils.getAllSubclasses(eval(__base)):
-  key = classObj.__name__
-  __interFaceDict[key] = classObj
-
+__interFaceDict = importerUtils.LazyClassRegistry()
+__interFaceDict['Metric'                  ] = 'PostProcessors.Metric.Metric'
+__interFaceDict['ETImporter'              ] = 'PostProcessors.ETImporter.ETImporter'
+__interFaceDict['FTImporter'              ] = 'PostProcessors.FTImporter.FTImporter'
+__interFaceDict['SafestPoint'             ] = 'PostProcessors.SafestPoint.SafestPoint'
+__interFaceDict['LimitSurface'            ] = 'PostProcessors.LimitSurface.LimitSurface'
+__interFaceDict['ValueDuration'           ] = 'PostProcessors.ValueDuration.ValueDuration'
+__interFaceDict['SampleSelector'          ] = 'PostProcessors.SampleSelector.SampleSelector'
+__interFaceDict['ImportanceRank'          ] = 'PostProcessors.ImportanceRank.ImportanceRank'
+__interFaceDict['BasicStatistics'         ] = 'PostProcessors.BasicStatistics.BasicStatistics'
+__interFaceDict['CrossValidation'         ] = 'PostProcessors.CrossValidation.CrossValidation'
+__interFaceDict['DataClassifier'          ] = 'PostProcessors.DataClassifier.DataClassifier'
+__interFaceDict['LimitSurfaceIntegral'    ] = 'PostProcessors.LimitSurfaceIntegral.LimitSurfaceIntegral'
+__interFaceDict['ExternalPostProcessor'   ] = 'PostProcessors.ExternalPostProcessor.ExternalPostProcessor'
+__interFaceDict['InterfacedPostProcessor' ] = 'PostProcessors.InterfacedPostProcessor.InterfacedPostProcessor'
+__interFaceDict['ComparisonStatistics'    ] = 'PostProcessors.ComparisonStatisticsModule.ComparisonStatistics'
 ## Adding aliases for certain classes that are exposed to the user.
-__interFaceDict['External'] = ExternalPostProcessor
-try:
-  __interFaceDict['TopologicalDecomposition' ] = QTopologicalDecomposition
-  __interFaceDict['DataMining'               ] = QDataMining
-except NameError:
-  ## The correct names should already be used for these classes otherwise
-  pass
+__interFaceDict['External'                ] = 'PostProcessors.ExternalPostProcessor.ExternalPostProcessor'
+## The Q versions of these classes utilize the optional prequisite library PySide, they are only
+## defined (and then used in place of the plain ones) if it imports appropriately.
+__interFaceDict['TopologicalDecomposition'] = ('PostProcessors.TopologicalDecomposition.QTopologicalDecomposition',
+                                               'PostProcessors.TopologicalDecomposition.TopologicalDecomposition')
+__interFaceDict['DataMining'              ] = ('PostProcessors.DataMining.QDataMining',
+                                               'PostProcessors.DataMining.DataMining')
+__interFaceDict['QTopologicalDecomposition'] = 'PostProcessors.TopologicalDecomposition.QTopologicalDecomposition'
+__interFaceDict['QDataMining'             ] = 'PostProcessors.DataMining.QDataMining'
+## [ Add new class here ]
 
 def knownTypes():
   """
@@ -31,6 +31,7 @@ import copy
 #Internal Modules------------------------------------------------------------------------------------
 from .PostProcessor import PostProcessor
 from utils import InputData
+from utils import utils
 import Files
 from PostProcessorInterfaceBaseClass import PostProcessorInterfaceBase
 import Runners
@@ -253,7 +254,7 @@ class ImportanceRank(PostProcessor):
       currentInput = currentInp[-1]
     else:
       currentInput = currentInp
-    if type(currentInput) == dict:
+    if utils.isAMapping(currentInput):
       if 'targets' not in currentInput.keys() and 'timeDepData' not in currentInput.keys():
         self.raiseAnError(IOError, 'Did not find targets or timeDepData in input dictionary')
       return currentInput
@@ -157,7 +157,7 @@ class InterfacedPostProcessor(PostProcessor):
     """
     inputDict = []
     for inp in inputs:
-      if type(inp) == dict:
+      if utils.isAMapping(inp):
         return [inp]
       else:
         inputDictTemp = {}
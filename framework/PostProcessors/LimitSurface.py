@@ -177,7 +177,7 @@ class LimitSurface(PostProcessor):
       @ Out, None
     """
     self.raiseADebug('Initiate training')
-    if type(inp) == dict:
+    if utils.isAMapping(inp):
       self.functionValue.update(inp)
     else:
       dataSet = inp.asDataset("dict")
@@ -196,15 +196,19 @@ class LimitSurface(PostProcessor):
     else:
       self.functionValue[self.externalFunction.name] = np.zeros(indexEnd + 1)
 
-    for myIndex in range(indexLast + 1, indexEnd + 1):
-      for key, value in self.functionValue.items():
-        tempDict[key] = value[myIndex]
-      self.functionValue[self.externalFunction.name][myIndex] = self.externalFunction.evaluate('residuumSign', tempDict)
-      if abs(self.functionValue[self.externalFunction.name][myIndex]) != 1.0:
+    if indexEnd > indexLast:
+      # all the new points are evaluated in one batch
+      newPoints = slice(indexLast + 1, indexEnd + 1)
+      for key in self.externalFunction.parameterNames():
+        if key in self.functionValue:
+          tempDict[key] = np.asarray(self.functionValue[key])[newPoints]
+      signs = self.externalFunction.evaluateBatch('residuumSign', tempDict)
+      if np.any(np.abs(signs) != 1.0):
         self.raiseAnError(IOError, 'LimitSurface: the function evaluation of the residuumSign method needs to return a 1 or -1!')
-      if type(inp).__name__ in ['dict','OrderedDict']:
+      self.functionValue[self.externalFunction.name][newPoints] = signs
+      if utils.isAMapping(inp):
         if self.externalFunction.name in inp:
-          inp[self.externalFunction.name] = np.concatenate((inp[self.externalFunction.name],np.asarray(self.functionValue[self.externalFunction.name][myIndex])))
+          inp[self.externalFunction.name] = np.concatenate((inp[self.externalFunction.name],self.functionValue[self.externalFunction.name][newPoints]))
     # check if the Limit Surface has been crossed
     self.crossedLimitSurf = not (np.sum(self.functionValue[self.externalFunction.name]) ==
                                  float(len(self.functionValue[self.externalFunction.name])) or
@@ -330,9 +330,10 @@ class Metric(PostProcessor):
     assert(len(self.features) == len(measureList))
     for metricInstance in self.metricsDict.values():
       metricEngine = MetricDistributor.returnInstance('MetricDistributor',metricInstance,self)
+      # all the (feature, target) pairs are given to the metric at once
+      outputs = metricEngine.evaluateAll(measureList, weights=self.weight, multiOutput=self.multiOutput)
       for cnt in range(len(self.targets)):
         nodeName = (str(self.targets[cnt]) + '_' + str(self.features[cnt])).replace("|","_")
         varName = metricInstance.name + '|' + nodeName
-        output = metricEngine.evaluate(measureList[cnt], weights=self.weight, multiOutput=self.multiOutput)
-        outputDict[varName] = np.atleast_1d(output)
+        outputDict[varName] = np.atleast_1d(outputs[cnt])
     return outputDict
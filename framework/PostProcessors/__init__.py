@@ -24,64 +24,13 @@ from __future__ import absolute_import
 ## These lines ensure that we do not have to do something like:
 ## 'from PostProcessors.PostProcessor import PostProcessor' outside
 ## of this submodule
+## Only the base class is imported here, the specific post-processors are imported
+## by the Factory when an input asks for them
 from .PostProcessor import PostProcessor
 
-from .Metric import Metric
-from .ETImporter import ETImporter
-from .DataMining import DataMining
-from .SafestPoint import SafestPoint
-from .LimitSurface import LimitSurface
-from .ValueDuration import ValueDuration
-from .SampleSelector import SampleSelector
-from .ImportanceRank import ImportanceRank
-from .CrossValidation import CrossValidation
-from .BasicStatistics import BasicStatistics
-from .LimitSurfaceIntegral import LimitSurfaceIntegral
-from .ExternalPostProcessor import ExternalPostProcessor
-from .InterfacedPostProcessor import InterfacedPostProcessor
-from .TopologicalDecomposition import TopologicalDecomposition
-from .DataMining import DataMining
-from .Metric import Metric
-from .CrossValidation import CrossValidation
-from .ETImporter import ETImporter
-from .FTImporter import FTImporter
-from .DataClassifier import DataClassifier
-from .ComparisonStatisticsModule import ComparisonStatistics
-# from .RavenOutput import RavenOutput # deprecated for now
-
-additionalModules = []
-## These utilize the optional prequisite library PySide, so don't error if they
-## do not import appropriately.
-try:
-  from .TopologicalDecomposition import QTopologicalDecomposition
-  from .DataMining import QDataMining
-  additionalModules.append(QTopologicalDecomposition)
-  additionalModules.append(QDataMining)
-except ImportError:
-  ## User most likely does not have PySide installed and working
-  pass
-
 from .Factory import knownTypes
 from .Factory import returnInstance
 from .Factory import returnClass
 
 # We should not really need this as we do not use wildcard imports
-__all__ = ['PostProcessor',
-           'BasicStatistics',
-           'ComparisonStatistics',
-           'ExternalPostProcessor',
-           'ImportanceRank',
-           'InterfacedPostProcessor',
-           'LimitSurface',
-           'LimitSurfaceIntegral',
-           'SafestPoint',
-           'TopologicalDecomposition',
-           'DataMining',
-           'Metric',
-           'CrossValidation',
-           'ValueDuration',
-           'FTImporter',
-           'DataClassifier',
-           'SampleSelector',
-           'ETImporter'] + additionalModules
-#           'RavenOutput', # deprecated for now
+__all__ = ['PostProcessor']
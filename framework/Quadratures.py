@@ -31,6 +31,7 @@ import itertools
 import collections #.OrderedDict as collections.OrderedDict
 import operator #.operator.itemgetter as operator.itemgetter
 import inspect
+import functools
 #External Modules End-----------------------------------------------------------------
 
 #Internal Modules
@@ -40,11 +41,129 @@ import MessageHandler
 from utils import utils
 #Internal Modules End-----------------------------------------------------------------
 
+def smolyakCoefficients(indexSet, entries=None):
+  """
+    Computes the Smolyak combination coefficient of each entry i of an index set,
+    c_i = sum of (-1)^|z| over the z in {0,1}^d such that i+z is in the index set.
+    For a downward closed index set, i+z is only in the set if i+z' is in it for every z' <= z, so the offsets z
+    are built one dimension at a time (in increasing order of the dimensions), only extending the ones found in
+    the set: the work is proportional to the number of neighbors actually found, not to 2^d.
+    The entries are looked up all at once, sorting the rows of the index set as byte strings.
+    @ In, indexSet, np.array, shape = [n_entries,n_dims], the index set
+    @ In, entries, tuple(int), optional, (first,last) range of the entries whose coefficients are computed, default all of them
+    @ Out, coeffs, np.array, shape = [last-first], the combination coefficients of the requested entries
+  """
+  indexSet = np.ascontiguousarray(indexSet,dtype=np.int64)
+  first,last = (0,len(indexSet)) if entries is None else entries
+  if last <= first:
+    return np.zeros(0)
+  numEntries,numDims = indexSet.shape
+  rowType = np.dtype((np.void,indexSet.itemsize*numDims))
+  sortedRows = np.sort(indexSet.view(rowType).ravel())
+  def lookup(rows):
+    """
+      Finds which rows are entries of the index set
+      @ In, rows, np.array, shape = [n_rows,n_dims], the rows to look for
+      @ Out, found, np.array(bool), shape = [n_rows], True if the row is in the index set
+    """
+    keys = np.ascontiguousarray(rows,dtype=np.int64).view(rowType).ravel()
+    return sortedRows[np.minimum(np.searchsorted(sortedRows,keys),numEntries-1)] == keys
+  # the set must be downward closed: each entry minus a unit vector (if nonnegative) is in the set too
+  for dim in range(numDims):
+    below = indexSet[indexSet[:,dim] > 0]
+    below[:,dim] -= 1
+    if not np.all(lookup(below)):
+      return _pairwiseSmolyakCoefficients(indexSet,first,last)
+  coeffs = np.ones(last-first)
+  # frontier of the offsets found so far: the entry they belong to, the row i+z and the last dimension in z
+  owner = np.arange(last-first)
+  rows = indexSet[first:last]
+  lastDim = np.full(last-first,-1)
+  sign = 1.
+  blockSize = max(1,2**22//(numDims*numDims))
+  while len(owner) > 0:
+    # extend each offset with the dimensions after its last one, a block of the frontier at a time
+    extended = []
+    for start in range(0,len(owner),blockSize):
+      frontier,dims = np.nonzero(np.arange(numDims)[np.newaxis,:] > lastDim[start:start+blockSize,np.newaxis])
+      frontier += start
+      candidates = rows[frontier]
+      candidates[np.arange(len(dims)),dims] += 1
+      found = lookup(candidates)
+      extended.append((owner[frontier[found]],candidates[found],dims[found]))
+    owner,rows,lastDim = (np.concatenate(parts) for parts in zip(*extended))
+    sign = -sign
+    coeffs += sign*np.bincount(owner,minlength=len(coeffs))
+  return coeffs
+
+def _pairwiseSmolyakCoefficients(indexSet, first, last):
+  """
+    Computes the Smolyak combination coefficients (see smolyakCoefficients) comparing each entry with all the
+    others, for the index sets that are not downward closed.
+    @ In, indexSet, np.array, shape = [n_entries,n_dims], the index set
+    @ In, first, int, the first entry whose coefficient is computed
+    @ In, last, int, the entry following the last one whose coefficient is computed
+    @ Out, coeffs, np.array, shape = [last-first], the combination coefficients of the requested entries
+  """
+  numEntries,numDims = indexSet.shape
+  coeffs = np.zeros(last-first)
+  blockSize = max(1,2**22//(numEntries*numDims))
+  for start in range(first,last,blockSize):
+    end = min(start+blockSize,last)
+    offsets = indexSet[np.newaxis,:,:] - indexSet[start:end,np.newaxis,:]
+    isOffset = np.all((offsets == 0) | (offsets == 1),axis=2)
+    signs = np.where(offsets.sum(axis=2) % 2,-1.,1.)
+    coeffs[start-first:end-first] = np.sum(np.where(isOffset,signs,0.),axis=1)
+  return coeffs
+
+def tensorProductGrids(rules, orders, coeffs):
+  """
+    Builds tensor grids from 1-D quadrature rules, and scales their weights.
+    @ In, rules, dict, {(dim,number of points):(points,weights)}, 1-D rules (see SparseGrid._oneDimensionalRules)
+    @ In, orders, np.array, shape = [n_grids,n_dims], number of points of each tensor grid in each dimension
+    @ In, coeffs, np.array, shape = [n_grids], the factor applied to the weights of each grid
+    @ Out, points, np.array, shape = [n_points,n_dims], the points of all the grids, one grid after the other
+    @ Out, weights, np.array, shape = [n_points], the weights of all the grids
+  """
+  pointSets = []
+  weightSets = []
+  for m,coeff in zip(orders,coeffs):
+    pts,wts = zip(*(rules[(n,int(mn))] for n,mn in enumerate(m)))
+    grid = np.meshgrid(*pts,indexing='ij')
+    pointSets.append(np.stack(list(g.ravel() for g in grid),axis=-1))
+    weightSets.append(functools.reduce(np.multiply.outer,wts).ravel()*coeff)
+  return np.concatenate(pointSets),np.concatenate(weightSets)
+
+def mergeGridPoints(points, weights):
+  """
+    Merges the points with the same coordinates, summing their weights.
+    @ In, points, np.array, shape = [n_points,n_dims], the points
+    @ In, weights, np.array, shape = [n_points], the weights
+    @ Out, points, np.array, shape = [n_unique,n_dims], the distinct points, in order of first appearance
+    @ Out, weights, np.array, shape = [n_unique], the summed weights (in order of appearance)
+  """
+  # rows sorted lexicographically (np.unique only accepts an axis from numpy 1.13); the sort is stable, thus the
+  #   first row of each group of equal rows is the first appearance of the point
+  sort = np.lexsort(points.T[::-1])
+  sortedPoints = points[sort]
+  new = np.ones(len(sort),dtype=bool)
+  new[1:] = np.any(sortedPoints[1:] != sortedPoints[:-1],axis=1)
+  inverse = np.empty(len(sort),dtype=int)
+  inverse[sort] = np.cumsum(new)-1
+  first = sort[new]
+  merged = np.bincount(inverse,weights=weights,minlength=len(first))
+  order = np.argsort(first)
+  return points[first[order]],merged[order]
+
+
 
 class SparseGrid(MessageHandler.MessageUser):
   """
     Base class to produce sparse-grid multiple-dimension quadrature.
   """
+  pooledGridPoints      = 2**20 # number of tensor grid points above which the grids are built on a pool of processes (if any)
+  pooledCoefficientWork = 2**20 # size of the index set (entries times dimensions) above which the coefficients are computed on a pool of processes (if any)
+
   def __init__(self):
     """
       Constructor.
@@ -341,23 +460,55 @@ class SparseGrid(MessageHandler.MessageUser):
       @ In, m, list(int), number points
       @ Out, (points,weights), tuple(tuple(float),float), requisite points and weights
     """
-    pointLists=[]
-    weightLists=[]
+    orders = np.atleast_2d(np.asarray(m,dtype=int))
+    points,weights = tensorProductGrids(self._oneDimensionalRules(orders),orders,[1.0])
+    return list(map(tuple,points.tolist())),weights.tolist()
+
+  def _oneDimensionalRules(self, orders):
+    """
+      Collects the 1-D quadrature points (in the distribution domain) and weights needed by a set of tensor grids.
+      @ In, orders, np.array, shape = [n_grids,n_dims], number of points of each tensor grid in each dimension
+      @ Out, rules, dict, {(dim,number of points):(points,weights)}, the 1-D rules
+    """
+    rules = {}
     for n,var in enumerate(self.varNames):
       distr = self.distDict[var]
       quad = self.quadDict[var]
-      mn = m[n]
-      pts,wts=quad(mn)
-      pts=pts.real
-      wts=wts.real
-      pts = distr.convertToDistr(quad.type,pts)
-      pointLists.append(pts)
-      weightLists.append(wts)
-    points = list(itertools.product(*pointLists))
-    weights= list(itertools.product(*weightLists))
-    for k,wtset in enumerate(weights):
-      weights[k]=np.product(wtset)
-    return points,weights
+      for mn in np.unique(orders[:,n]):
+        pts,wts = quad(int(mn))
+        rules[(n,int(mn))] = (np.asarray(distr.convertToDistr(quad.type,pts.real)),wts.real)
+    return rules
+
+  def _assembleGrids(self, orders, coeffs, pool=None):
+    """
+      Builds the grid as a combination of tensor grids, merging their common points.
+      @ In, orders, np.array, shape = [n_grids,n_dims], number of points of each tensor grid in each dimension
+      @ In, coeffs, np.array, shape = [n_grids], the combination coefficient of each tensor grid
+      @ In, pool, Runners.ProcessPool, optional, pool of processes building chunks of tensor grids
+      @ Out, None
+    """
+    if len(coeffs) == 0:
+      #no tensor grid (e.g. empty index set), the grid is empty
+      self.SG = collections.OrderedDict()
+      return
+    rules = self._oneDimensionalRules(orders)
+    gridSizes = np.prod(orders,axis=1)
+    points = None
+    if pool is not None and gridSizes.sum() > self.pooledGridPoints:
+      #contiguous chunks of grids with about the same number of points, so that the points keep their order
+      bounds = np.searchsorted(np.cumsum(gridSizes),np.linspace(0,gridSizes.sum(),pool.numWorkers+1)[1:-1])
+      chunks = list(zip(np.split(orders,bounds),np.split(np.asarray(coeffs),bounds)))
+      responses = pool.map(tensorProductGrids,rules,list(chunk for chunk in chunks if len(chunk[0])))
+      if all(succeeded for succeeded,_ in responses):
+        points = np.concatenate(list(response[0] for _,response in responses))
+        weights = np.concatenate(list(response[1] for _,response in responses))
+      else:
+        self.raiseAWarning('Tensor grids could not be built on the pool of processes, they are built in process.')
+    if points is None:
+      points,weights = tensorProductGrids(rules,orders,coeffs)
+    points,weights = mergeGridPoints(points,weights)
+    self.SG = collections.OrderedDict(zip(map(tuple,points.tolist()),weights.tolist()))
+
 #
 #
 #
@@ -397,9 +548,7 @@ class TensorGrid(SparseGrid):
         largest[i] = max(idx[i],largest[i])
     #construct tensor grid using largest in each dimension
     quadSizes = self.quadRule(largest)+1 #TODO give user access to this +1 rule
-    points,weights = self.tensorGrid(quadSizes)
-    for i,pt in enumerate(points):
-      self.SG[pt] = weights[i]
+    self._assembleGrids(np.atleast_2d(quadSizes),[1.0])
 
 #
 #
@@ -431,140 +580,36 @@ class SmolyakSparseGrid(SparseGrid):
       @ Out, None
     """
     SparseGrid.initialize(self, varNames, indexSet, distDict, quadDict, handler, msgHandler)
+    #the jobs are small and vectorized, they only use the pool of processes of the handler (if any)
+    pool = handler.getProcessPool() if handler is not None else None
     #we know how this ends if it's tensor product index set
     if indexSet.type=='Tensor Product':
-      self.c=[1]
-      self.indexSet=[self.indexSet[-1]]
+      self.c=np.ones(1)
+      self.indexSet=self.indexSet[-1:]
     else:
-      if handler !=None:
-        self.parallelMakeCoeffs(handler)
-      else:
-        self.smarterMakeCoeffs()
+      self.smarterMakeCoeffs(pool)
       survive = np.nonzero(self.c!=0)
       self.c=self.c[survive]
       self.indexSet=self.indexSet[survive]
-    if handler!=None:
-      self.parallelSparseQuadGen(handler)
-    else:
-      for j,cof in enumerate(self.c):
-        idx = self.indexSet[j]
-        m = self.quadRule(idx)+1
-        new = self.tensorGrid(m)
-        for i in range(len(new[0])):
-          newpt=tuple(new[0][i])
-          newwt=new[1][i]*cof
-          if newpt in self.SG.keys():
-            self.SG[newpt]+=newwt
-          else:
-            self.SG[newpt] = newwt
-
-  def parallelSparseQuadGen(self,handler):
-    """
-      Generates sparse quadrature points in parallel.
-      @ In, handler, JobHandler, parallel processing tool
-      @ Out, None
-    """
-    numRunsNeeded=len(self.c)
-    j=-1
-    prefix = 'sparseTensor_'
-    while True:
-      finishedJobs = handler.getFinished(jobIdentifier=prefix) #FIXME this is by far the most expensive line in this method
-      #finishedJobs = handler.getFinished(prefix=prefix) #FIXME this is by far the most expensive line in this method
-      for job in finishedJobs:
-        if job.getReturnCode() == 0:
-          new = job.getEvaluation()
-          for i in range(len(new[0])):
-            newpt = tuple(new[0][i])
-            newwt = new[1][i]*float(str(job.identifier).replace(prefix, ""))
-            if newpt in self.SG.keys():
-              self.SG[newpt]+= newwt
-            else:
-              self.SG[newpt] = newwt
-        else:
-          self.raiseAMessage('Sparse quad generation (tensor) '+job.identifier+' failed...')
-      if j<numRunsNeeded-1:
-        for _ in range(min(numRunsNeeded-1-j,handler.availability())):
-          j+=1
-          cof=self.c[j]
-          idx = self.indexSet[j]
-          m=self.quadRule(idx)+1
-          handler.addJob((m,),self.tensorGrid,prefix+str(cof),modulesToImport = self.mods)
-      else:
-        if handler.isFinished() and len(handler.getFinishedNoPop())==0:
-          break #FIXME this is significantly the second-most expensive line in this method
-      import time
-      time.sleep(0.005)
+    orders = np.array(list(self.quadRule(idx)+1 for idx in self.indexSet))
+    self._assembleGrids(orders,self.c,pool)
 
-  def smarterMakeCoeffs(self):
+  def smarterMakeCoeffs(self,pool=None):
     """
-      Somewhat optimized method to create coefficients for each index set in the sparse grid approximation.
-      This particular implementation is faster for any more than 2 dimensions in comparison with the
-      serialMakeCoeffs method.
-      @ In, None
+      Creates the combination coefficient of each entry of the index set (see smolyakCoefficients),
+      only looking up the neighbors of each entry that can be in the index set.
+      @ In, pool, Runners.ProcessPool, optional, pool of processes sharing the entries
       @ Out, None
     """
-    N=len(self.indexSet)
-    iSet = self.indexSet[:]
-    self.c=np.ones(N)
-    for i in range(N):
-      #could be parallelized from here
-      idx = iSet[i]
-      for j in range(i+1,N):
-        jdx = iSet[j]
-        d = jdx-idx
-        if all(np.logical_and(d>=0,d<=1)):
-          #TODO PROFILE ME -> it appears this is slightly faster than (-1)**sum(d)
-          if sum(d) % 2 == 0:
-            self.c[i] += 1
-          else:
-            self.c[i] -= 1
-          #self.c[i]+=(-1)**sum(d)
-
-  def parallelMakeCoeffs(self,handler):
-    """
-      Same thing as smarterMakeCoeffs, but in parallel.
-      @ In, None
-      @ Out, None
-    """
-    N=len(self.indexSet)
-    self.c=np.zeros(N)
-    i=-1
-    prefix = 'sparseGrid_'
-    while True:
-      #finishedJobs = handler.getFinished(prefix=prefix)
-      finishedJobs = handler.getFinished(jobIdentifier=prefix)
-      for job in finishedJobs:
-        if job.getReturnCode() == 0:
-          self.c[int(str(job.identifier).replace(prefix, ""))]=job.getEvaluation()
-        else:
-          self.raiseAMessage('Sparse grid index '+job.identifier+' failed...')
-      if i<N-1:
-        #load new inputs, up to 100 at a time
-        for k in range(min(handler.availability(),N-1-i)):
-          i+=1
-          handler.addJob((N,i,self.indexSet[i],self.indexSet[:]),makeSingleCoeff,prefix+str(i),modulesToImport = self.mods)
-      else:
-        if handler.isFinished() and len(handler.getFinishedNoPop())==0:
-          break
-      #TODO optimize this with a sleep time
-
-  def makeSingleCoeff(self,N,i,idx,iSet):
-    """
-      Batch-style algorithm to calculate a single coefficient
-      @ In, N, int, required arguments
-      @ In, i, int, required arguments
-      @ In, idx, tuple(int), required arguments
-      @ In, iSet, int, required arguments
-      @ Out, float, coefficient for subtensor i
-    """
-    #N,i,idx,iSet = arglist
-    c=1
-    for j in range(i+1,N):
-      jdx = iSet[j]
-      d = jdx-idx
-      if all(np.logical_and(d>=0,d<=1)):
-        c += (-1)**sum(d)
-    return c
+    numEntries = len(self.indexSet)
+    if pool is not None and numEntries*self.N > self.pooledCoefficientWork:
+      bounds = np.linspace(0,numEntries,min(pool.numWorkers,numEntries)+1).astype(np.int64)
+      responses = pool.map(smolyakCoefficients,self.indexSet,list(((int(bounds[i]),int(bounds[i+1])),) for i in range(len(bounds)-1)))
+      if all(succeeded for succeeded,_ in responses):
+        self.c = np.concatenate(list(response for _,response in responses))
+        return
+      self.raiseAWarning('Sparse grid coefficients could not be computed on the pool of processes, they are computed in process.')
+    self.c = smolyakCoefficients(self.indexSet)
 #
 #
 #
@@ -783,25 +828,6 @@ def GaussQuadRule(i):
   return i
 
 
-#Debug module-level method
-def makeSingleCoeff(N,i,idx,iSet):
-  """
-    Batch-style algorithm to calculate a single coefficient
-    @ In, N, int, required arguments
-    @ In, i, int, required arguments
-    @ In, idx, tuple(int), required arguments
-    @ In, iSet, int, required arguments
-    @ Out, c, float, coefficient for subtensor i
-  """
-  #N,i,idx,iSet = arglist
-  c=1
-  for j in range(i+1,N):
-    jdx = iSet[j]
-    d = jdx-idx
-    if all(np.logical_and(d>=0,d<=1)):
-      c += (-1)**sum(d)
-  return c
-
 """
  Interface Dictionary (factory) (private)
 """
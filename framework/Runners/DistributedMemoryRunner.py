@@ -28,6 +28,7 @@ import signal
 import copy
 import sys
 import abc
+import threading
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
@@ -42,6 +43,8 @@ class DistributedMemoryRunner(InternalRunner):
     Class for running internal objects in distributed memory fashion using
     ppserver
   """
+  notifiesCompletion = True
+
   def __init__(self, messageHandler, ppserver, args, functionToRun,
                      frameworkModules = [], identifier=None, metadata=None,
                      functionToSkip = None, uniqueHandler = "any",
@@ -88,6 +91,10 @@ class DistributedMemoryRunner(InternalRunner):
     ## Other parameters passed at initialization
     self.__ppserver = ppserver
 
+    ## Set by the waiter thread when the ppserver task completes, since the
+    ## task releases its lock before setting its own finished flag
+    self.finished = False
+
   def isDone(self):
     """
       Method to check if the calculation associated with this Runner is finished
@@ -101,7 +108,7 @@ class DistributedMemoryRunner(InternalRunner):
     if self.thread is None:
       return True
     else:
-      return self.thread.finished
+      return self.finished or self.thread.finished
 
   def _collectRunnerResponse(self):
     """
@@ -124,13 +131,32 @@ class DistributedMemoryRunner(InternalRunner):
       @ Out, None
     """
     try:
+      self.finished = False
       self.thread = self.__ppserver.submit(self.functionToRun, args=self.args, depfuncs=(), modules = tuple(list(set(self.frameworkMods))),functionToSkip=self.functionToSkip)
+      ## the ppserver task can only be waited on, so a waiter thread blocks on
+      ## it and signals the completion of the job
+      waiter = threading.Thread(target = self._waitAndNotify, name = self.identifier+'-waiter')
+      waiter.daemon = True
+      waiter.start()
       self.trackTime('runner_started')
       self.started = True
     except Exception as ae:
       self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
       self.returnCode = -1
 
+  def _waitAndNotify(self):
+    """
+      Method executed by the waiter thread. Blocks until the ppserver task
+      completes and signals the completion of the job.
+      @ In, None
+      @ Out, None
+    """
+    try:
+      self.thread.wait()
+    finally:
+      self.finished = True
+      self._notifyCompletion()
+
   def kill(self):
     """
       Method to kill the job associated to this Runner
@@ -79,7 +79,7 @@ class InternalRunner(Runner):
     self.returnCode     = 0
 
     ## These things cannot be deep copied
-    self.skipOnCopy = ['functionToRun','thread','__queueLock']
+    self.skipOnCopy = ['functionToRun','thread','__queueLock','completionCallback']
 
   def __deepcopy__(self,memo):
     """
@@ -0,0 +1,275 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Runner executing internal objects on a persistent pool of local processes,
+  so that Python-heavy models (ExternalModel, ROM) are not serialized by the GIL.
+"""
+#for future compatibility with Python 3--------------------------------------------------------------
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+#End compatibility block for Python 3----------------------------------------------------------------
+
+#External Modules------------------------------------------------------------------------------------
+import sys
+import uuid
+import pickle
+import traceback
+import threading
+import multiprocessing
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
+from .InternalRunner import InternalRunner
+#Internal Modules End--------------------------------------------------------------------------------
+
+## Objects shared by the jobs, kept alive in each worker process across jobs
+## {key:(token,object)}, see ProcessPool.submit
+_warmObjects = {}
+
+def _initializeWorker(parentPath):
+  """
+    Initializes a worker process of the pool, so that it can import the same
+    modules as the RAVEN driver (independently of the start method of the pool).
+    @ In, parentPath, list, the sys.path of the RAVEN driver
+    @ Out, None
+  """
+  for path in parentPath:
+    if path not in sys.path:
+      sys.path.append(path)
+
+def _runPooledJob(functionToRun, args, sharedArgs):
+  """
+    Runs a job in a worker process. The shared arguments are only unpickled the
+    first time the worker sees them, and are reused by the following jobs; the ones
+    without a key (see ProcessPool.map) are unpickled for the job only.
+    @ In, functionToRun, function, the function to run
+    @ In, args, list, the arguments of the function (None in place of the shared ones)
+    @ In, sharedArgs, dict, {position:(key,token,payload)}, the pickled shared arguments
+    @ Out, response, tuple, (True,returnValue) if the function succeeded,
+      (False,traceback) otherwise
+  """
+  try:
+    args = list(args)
+    for position,(key,token,payload) in sharedArgs.items():
+      if key is None:
+        args[position] = pickle.loads(payload)
+        continue
+      if key not in _warmObjects or _warmObjects[key][0] != token:
+        _warmObjects[key] = (token,pickle.loads(payload))
+      args[position] = _warmObjects[key][1]
+    return True, functionToRun(*args)
+  except Exception:
+    return False, traceback.format_exc()
+
+class ProcessPool(object):
+  """
+    Persistent pool of worker processes used by the ProcessPoolRunner. The
+    first argument of the jobs (the model evaluating the sample) is pickled once
+    and kept warm in the workers, only the sample itself is pickled for each job.
+  """
+  def __init__(self, numWorkers):
+    """
+      Constructor
+      @ In, numWorkers, int, the number of worker processes
+      @ Out, None
+    """
+    self.numWorkers = numWorkers
+    self.__pool = multiprocessing.Pool(numWorkers, initializer=_initializeWorker, initargs=(list(sys.path),))
+    ## {id(object):(object,version,key,token,payload)}, the object is kept to make sure its id is not reused
+    self.__shared = {}
+    self.__sharedLock = threading.Lock()
+
+  def share(self, obj):
+    """
+      Pickles an object to be shared by the jobs, unless it is already shared.
+      Objects that change during a step (e.g. the ROMs retrained by a HybridModel)
+      are pickled again when their "stateVersion" attribute changes, so that the
+      workers do not keep using a stale copy.
+      @ In, obj, object, the object to share
+      @ Out, shared, tuple, (key,token,payload), the identification of the object and its pickle
+    """
+    version = getattr(obj, 'stateVersion', None)
+    with self.__sharedLock:
+      if id(obj) not in self.__shared or self.__shared[id(obj)][1] != version:
+        payload = pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+        self.__shared[id(obj)] = (obj, version, id(obj), uuid.uuid4().hex, payload)
+      return self.__shared[id(obj)][2:]
+
+  def reset(self):
+    """
+      Forgets the shared objects, so that they are pickled again the next time
+      they are used (e.g. at the beginning of a step, once the models are reinitialized).
+      @ In, None
+      @ Out, None
+    """
+    with self.__sharedLock:
+      self.__shared = {}
+
+  def submit(self, functionToRun, args, callback):
+    """
+      Submits a job to the pool.
+      @ In, functionToRun, function, the function to run (it must be picklable,
+        i.e. defined at the top level of a module or a class)
+      @ In, args, tuple, the arguments of the function, the first one is shared (see share)
+      @ In, callback, function, the function called (in a thread of the pool) with
+        the response of the job (see _runPooledJob)
+      @ Out, None
+    """
+    args = list(args)
+    sharedArgs = {0:self.share(args[0])}
+    args[0] = None
+    kwargs = {'callback':callback}
+    if sys.version_info.major > 2:
+      ## failures of the pool itself, e.g. if the arguments cannot be pickled
+      kwargs['error_callback'] = lambda error: callback((False, repr(error)))
+    self.__pool.apply_async(_runPooledJob, (functionToRun, args, sharedArgs), **kwargs)
+
+  def map(self, functionToRun, sharedArg, argsList):
+    """
+      Runs a function once for each list of arguments and waits for all the calls to end.
+      The first argument is pickled once for all the calls, but it is not kept by the pool
+      nor by the workers once the calls end (unlike the shared objects of submit).
+      @ In, functionToRun, function, the function to run (it must be picklable, see submit)
+      @ In, sharedArg, object, the first argument of all the calls
+      @ In, argsList, list(tuple), the other arguments of each call
+      @ Out, responses, list(tuple), the response of each call (see _runPooledJob), in the order of argsList
+    """
+    sharedArgs = {0:(None, None, pickle.dumps(sharedArg, pickle.HIGHEST_PROTOCOL))}
+    asyncResults = list(self.__pool.apply_async(_runPooledJob, (functionToRun, [None]+list(args), sharedArgs)) for args in argsList)
+    return list(result.get() for result in asyncResults)
+
+  def terminate(self):
+    """
+      Stops the worker processes, discarding the running jobs.
+      @ In, None
+      @ Out, None
+    """
+    self.reset()
+    self.__pool.terminate()
+
+class ProcessPoolRunner(InternalRunner):
+  """
+    Class for running internal objects on a persistent pool of local processes
+  """
+  notifiesCompletion = True
+
+  def __init__(self, messageHandler, pool, args, functionToRun, identifier=None, metadata=None, uniqueHandler = "any", profile = False):
+    """
+      Init method
+      @ In, messageHandler, MessageHandler object, the global RAVEN message
+        handler object
+      @ In, pool, ProcessPool, the pool of processes running the job
+      @ In, args, dict, this is a list of arguments that will be passed as
+        function parameters into whatever method is stored in functionToRun.
+        e.g., functionToRun(*args)
+      @ In, functionToRun, method or function, function that needs to be run
+      @ In, identifier, string, optional, id of this job
+      @ In, metadata, dict, optional, dictionary of metadata associated with
+        this run
+      @ In, uniqueHandler, string, optional, it is a special keyword attached to
+        this runner. For example, if present, to retrieve this runner using the
+        method jobHandler.getFinished, the uniqueHandler needs to be provided.
+        If uniqueHandler == 'any', every "client" can get this runner
+      @ In, profile, bool, optional, if True then at deconstruction timing statements will be printed
+      @ Out, None
+    """
+    super(ProcessPoolRunner, self).__init__(messageHandler, args, functionToRun, identifier, metadata, uniqueHandler, profile)
+    self.pool = pool
+    ## Response of the worker, (succeeded,returnValue or traceback)
+    self.response = None
+    self.finished = False
+    self.skipOnCopy.append('pool')
+
+  def isDone(self):
+    """
+      Method to check if the calculation associated with this Runner is finished
+      @ In, None
+      @ Out, finished, bool, is it finished?
+    """
+    return self.started and self.finished
+
+  def getReturnCode(self):
+    """
+      Returns the return code from running the code.  If return code not yet
+      set, then set it.
+      @ In, None
+      @ Out, returnCode, int,  the return code of this evaluation
+    """
+    if not self.hasBeenAdded:
+      self._collectRunnerResponse()
+    if self.runReturn is None:
+      self.returnCode = -1
+    return self.returnCode
+
+  def _collectRunnerResponse(self):
+    """
+      Method to add the process response in the internal variable (pointer)
+      self.runReturn
+      @ In, None
+      @ Out, None
+    """
+    if not self.hasBeenAdded:
+      if self.response is None:
+        self.runReturn = None
+      else:
+        succeeded, value = self.response
+        if succeeded:
+          self.runReturn = value
+        else:
+          self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:\n"+str(value))
+          self.runReturn = None
+      self.hasBeenAdded = True
+
+  def start(self):
+    """
+      Method to start the job associated to this Runner
+      @ In, None
+      @ Out, None
+    """
+    try:
+      self.finished = False
+      self.pool.submit(self.functionToRun, self.args, self._jobDone)
+      self.trackTime('runner_started')
+      self.started = True
+    except Exception as ae:
+      self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
+      self.returnCode = -1
+      ## nothing is going to run, so the job is over
+      self.started = True
+      self._jobDone(None)
+
+  def _jobDone(self, response):
+    """
+      Completion callback of the pool, called from a thread of the pool.
+      @ In, response, tuple, the response of the worker (see _runPooledJob), or None
+      @ Out, None
+    """
+    if self.finished:
+      return
+    self.response = response
+    self.finished = True
+    self._notifyCompletion()
+
+  def kill(self):
+    """
+      Method to kill the job associated to this Runner. A job cannot be removed
+      from a worker process, so the job is only marked as failed (the whole pool
+      is terminated by the JobHandler).
+      @ In, None
+      @ Out, None
+    """
+    self.raiseAWarning("Terminating Identifier " + self.identifier)
+    self._jobDone(None)
+    self.trackTime('runner_killed')
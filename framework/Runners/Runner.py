@@ -40,6 +40,10 @@ class Runner(MessageHandler.MessageUser):
     Generic base class for running codes and models in parallel environments
     both internally (shared data) and externally.
   """
+  ## True if the runner calls its completion callback when it finishes, so the
+  ## JobHandler can wait for it instead of polling (see setCompletionCallback)
+  notifiesCompletion = False
+
   def __init__(self, messageHandler, identifier = None, metadata = None, uniqueHandler = "any", profile = False):
     """
       Initialize command variable
@@ -59,6 +63,7 @@ class Runner(MessageHandler.MessageUser):
     self.metadata       = copy.copy(metadata)
     self.uniqueHandler  = uniqueHandler
     self.started        = False
+    self.completionCallback = None ## called (with no arguments) when the job finishes
 
     ## First attempt to use a user-specified identifier name
     if identifier is not None:
@@ -141,6 +146,25 @@ class Runner(MessageHandler.MessageUser):
     """
     self.started = True
 
+  def setCompletionCallback(self, callback):
+    """
+      Sets the function to call when the job finishes (e.g. to wake up the
+      JobHandler). The function is called from the thread running the job, so
+      it should be short and thread safe.
+      @ In, callback, function, the function to call (without arguments), or None
+      @ Out, None
+    """
+    self.completionCallback = callback
+
+  def _notifyCompletion(self):
+    """
+      Calls the completion callback, if any.
+      @ In, None
+      @ Out, None
+    """
+    if self.completionCallback is not None:
+      self.completionCallback()
+
   def kill(self):
     """
       Function to kill the subprocess of the driven code
@@ -46,6 +46,8 @@ class SharedMemoryRunner(InternalRunner):
     Class for running internal objects in a threaded fashion using the built-in
     threading library
   """
+  notifiesCompletion = True
+
   def __init__(self, messageHandler, args, functionToRun, identifier=None, metadata=None, uniqueHandler = "any", profile = False):
     """
       Init method
@@ -74,6 +76,10 @@ class SharedMemoryRunner(InternalRunner):
     self.subque = collections.deque()
     #self.subque = queue.Queue()
 
+    ## Set by the job thread right before notifying its completion, since the
+    ## thread is still alive while the completion callback runs
+    self.finished = False
+
     self.skipOnCopy.append('subque')
 
   def isDone(self):
@@ -89,7 +95,7 @@ class SharedMemoryRunner(InternalRunner):
     if self.thread is None:
       return True
     else:
-      return not self.thread.is_alive()
+      return self.finished or not self.thread.is_alive()
 
   def getReturnCode(self):
     """
@@ -130,7 +136,8 @@ class SharedMemoryRunner(InternalRunner):
       @ Out, None
     """
     try:
-      self.thread = threading.Thread(target = lambda q, *arg : q.append(self.functionToRun(*arg)), name = self.identifier, args=(self.subque,)+tuple(self.args))
+      self.finished = False
+      self.thread = threading.Thread(target = self._runAndNotify, name = self.identifier, args=(self.subque,)+tuple(self.args))
 
       self.thread.daemon = True
       self.thread.start()
@@ -140,6 +147,20 @@ class SharedMemoryRunner(InternalRunner):
       self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
       self.returnCode = -1
 
+  def _runAndNotify(self, subque, *args):
+    """
+      Method executed by the job thread. Runs the function and signals the
+      completion of the job, whether or not the function succeeded.
+      @ In, subque, collections.deque, the container for the function return
+      @ In, args, list, the arguments of the function
+      @ Out, None
+    """
+    try:
+      subque.append(self.functionToRun(*args))
+    finally:
+      self.finished = True
+      self._notifyCompletion()
+
   def kill(self):
     """
       Method to kill the job associated to this Runner
@@ -28,6 +28,7 @@ from .Runner import Runner
 from .InternalRunner import InternalRunner
 from .SharedMemoryRunner import SharedMemoryRunner
 from .DistributedMemoryRunner import DistributedMemoryRunner
+from .ProcessPoolRunner import ProcessPoolRunner, ProcessPool
 from .Error import Error
 
 # from .Factory import knownTypes
@@ -35,4 +36,4 @@ from .Error import Error
 # from .Factory import returnClass
 
 # We should not really need this as we do not use wildcard imports
-__all__ = ['Runner', 'InternalRunner', 'SharedMemoryRunner', 'DistributedMemoryRunner', 'Error']
+__all__ = ['Runner', 'InternalRunner', 'SharedMemoryRunner', 'DistributedMemoryRunner', 'ProcessPoolRunner', 'ProcessPool', 'Error']
@@ -192,10 +192,8 @@ class DynamicEventTree(Grid):
       @ In, idj, string, the identifier of a job object
       @ Out, parentNode, TreeStructure.Node, the parent node of the job linked to idj
     """
-    if(idj == self.TreeInfo[self.rootToJob[idj]].getrootnode().name):
-      parentNode = self.TreeInfo[self.rootToJob[idj]].getrootnode()
-    else:
-      parentNode = list(self.TreeInfo[self.rootToJob[idj]].getrootnode().iter(idj))[0]
+    # the nodes are indexed by name (i.e. job identifier) in the tree
+    parentNode = self.TreeInfo[self.rootToJob[idj]].getNode(idj)
     return parentNode
 
   def localFinalizeActualSampling(self,jobObject,model,myInput,genRunQueue=True):
@@ -679,18 +677,12 @@ class DynamicEventTree(Grid):
     jobInput  = self.RunQueue['queue'      ].pop(0)
     jobId     = self.RunQueue['identifiers'].pop(0)
     #set running flags in self.TreeInfo
-    root = self.TreeInfo[self.rootToJob[jobId]].getrootnode()
+    subElm = self.TreeInfo[self.rootToJob[jobId]].getNode(jobId)
     # Update the run information flags
-    if (root.name == jobId):
-      root.add('runEnded',False)
-      root.add('running',True)
-      root.add('queue',False)
-    else:
-      subElm = list(root.iter(jobId))[0]
-      if(subElm):
-        subElm.add('runEnded',False)
-        subElm.add('running',True)
-        subElm.add('queue',False)
+    if subElm is not None:
+      subElm.add('runEnded',False)
+      subElm.add('running',True)
+      subElm.add('queue',False)
 
     return jobInput
 
@@ -33,6 +33,7 @@ from functools import reduce
 
 #Internal Modules------------------------------------------------------------------------------------
 from utils import InputData
+from utils import utils
 from .ForwardSampler        import ForwardSampler
 from .MonteCarlo            import MonteCarlo
 from .Grid                  import Grid
@@ -219,7 +220,7 @@ class EnsembleForward(ForwardSampler):
           self.inputInfo[key] = combination[key]
 
         else:
-          if type(self.inputInfo[key]).__name__ == 'dict':
+          if utils.isAMapping(self.inputInfo[key]):
             self.inputInfo[key].update(combination[key])
     self.inputInfo['PointProbability'] = reduce(mul, self.inputInfo['SampledVarsPb'].values())
     self.inputInfo['ProbabilityWeight' ] = 1.0
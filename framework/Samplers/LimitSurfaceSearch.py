@@ -36,10 +36,11 @@ import sys
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
-from PostProcessors import LimitSurface
+from PostProcessors.LimitSurface import LimitSurface
 from .AdaptiveSampler import AdaptiveSampler
 import Distributions
 from AMSC_Object import AMSC_Object
+from utils import utils
 from utils import randomUtils
 from utils import InputData
 #Internal Modules End--------------------------------------------------------------------------------
@@ -416,7 +417,7 @@ class LimitSurfaceSearch(AdaptiveSampler):
     #test on what to do
     if not ready:
       return ready #if we exceeded the limit just return that we are done
-    if type(self.lastOutput) == dict:
+    if utils.isAMapping(self.lastOutput):
       if self.lastOutput == None and not self.limitSurfacePP.ROM.amITrained:
         return ready
     else:
@@ -424,7 +425,7 @@ class LimitSurfaceSearch(AdaptiveSampler):
       if len(self.lastOutput) == 0 and not self.limitSurfacePP.ROM.amITrained:
         return ready
     #first evaluate the goal function on the newly sampled points and store them in mapping description self.functionValue RecontructEnding
-    if type(self.lastOutput) == dict:
+    if utils.isAMapping(self.lastOutput):
       self.limitSurfacePP._initializeLSppROM(self.lastOutput,False)
     else:
       if len(self.lastOutput) > 0:
@@ -68,7 +68,10 @@ class MonteCarlo(ForwardSampler):
     samplerInitInput.addSub(samplingTypeInput)
     reseedEachIterationInput = InputData.parameterInputFactory("reseedEachIteration", contentType=InputData.StringType)
     samplerInitInput.addSub(reseedEachIterationInput)
-
+    blockSizeInput = InputData.parameterInputFactory("blockSize", contentType=InputData.IntegerType)
+    samplerInitInput.addSub(blockSizeInput)
+    randomEngineInput = InputData.parameterInputFactory("randomEngine", contentType=InputData.StringType)
+    samplerInitInput.addSub(randomEngineInput)
 
     inputSpecification.addSub(samplerInitInput)
 
@@ -85,6 +88,10 @@ class MonteCarlo(ForwardSampler):
     self.printTag = 'SAMPLER MONTECARLO'
     self.samplingType = None
     self.limit = None
+    self.blockSize = 1      # number of samples drawn at once with vectorized calls to the distributions
+    self._block = None      # samples drawn ahead of time, see localGenerateInputBatch
+    self._blockIndex = 0    # next sample to be used from self._block
+    self.randomEngine = 'global' # 'global' (shared random sequence) or 'counter' (random numbers addressed by seed, sample and variable)
 
   def localInputAndChecks(self,xmlNode, paramInput):
     """
@@ -104,9 +111,116 @@ class MonteCarlo(ForwardSampler):
           self.raiseAnError(IOError,self,'Monte Carlo sampler '+self.name+': specified type of samplingType is not recognized. Allowed type is: uniform')
       else:
         self.samplingType = None
+      if paramInput.findFirst('samplerInit').findFirst('blockSize') is not None:
+        self.blockSize = paramInput.findFirst('samplerInit').findFirst('blockSize').value
+        if self.blockSize < 1:
+          self.raiseAnError(IOError,self,'Monte Carlo sampler '+self.name+': blockSize must be a positive integer, got '+str(self.blockSize))
+      if paramInput.findFirst('samplerInit').findFirst('randomEngine') is not None:
+        self.randomEngine = paramInput.findFirst('samplerInit').findFirst('randomEngine').value.strip().lower()
+        if self.randomEngine not in ['global','counter']:
+          self.raiseAnError(IOError,self,'Monte Carlo sampler '+self.name+': randomEngine must be "global" or "counter", got '+self.randomEngine)
     else:
       self.raiseAnError(IOError,self,'Monte Carlo sampler '+self.name+' needs the samplerInit block')
 
+  def localInitialize(self):
+    """
+      Will perform all initialization specific to this Sampler.
+      @ In, None
+      @ Out, None
+    """
+    # samples drawn before a reseeding are not valid anymore
+    self._block = None
+    self._blockIndex = 0
+    if self.blockSize > 1 and not self._canGenerateBlock():
+      self.raiseAWarning('Monte Carlo sampler '+self.name+': blockSize is only available for univariate distributions without '+
+                         'reseedEachIteration. Samples will be drawn one at a time.')
+
+  def _canGenerateBlock(self):
+    """
+      Determines if the samples can be drawn a block at a time, using the same random numbers as the
+      one-at-a-time sampling.
+      @ In, None
+      @ Out, canGenerateBlock, bool, True if localGenerateInputBatch can be used
+    """
+    if len(self.distDict) == 0 or (self.reseedAtEachIteration and self.randomEngine != 'counter'):
+      return False
+    return all(self.variables2distributionsMapping[key]['totDim'] == 1 for key in self.distDict)
+
+  def _counterUniforms(self,key,dim=1):
+    """
+      Gets the uniform random numbers of a variable for the current sample with the counter randomEngine: they
+      only depend on the seed, the index of the sample and the variable (see localGenerateInputBatch)
+      @ In, key, str, the sampled variable (the stream of the random numbers)
+      @ In, dim, int, optional, the number of random numbers
+      @ Out, uniforms, np.array, the random numbers on [0,1)
+    """
+    return randomUtils.counterRandom(self.currentSeed,self.auxcnt - self.currentSeed - 1,key,dim)[0]
+
+  def localGenerateInputBatch(self,size):
+    """
+      Draws a block of samples with vectorized calls to the distributions.
+      Random numbers are consumed in the same order as "size" calls to localGenerateInput (sample by sample,
+      variables in sorted order), so the sampled points do not depend on the block size.
+      With the counter randomEngine, the random number of each variable of each sample only depends on the seed,
+      the index of the sample and the variable, so that any block of samples can be drawn independently.
+      @ In, size, int, number of samples to draw
+      @ Out, block, dict, sampled data as arrays with one entry per sample:
+                          {'values':{var:np.array}, 'SampledVarsPb':{key:np.array}, 'ProbabilityWeight':np.array}
+    """
+    keys = sorted(self.distDict)
+    if self.randomEngine == 'counter':
+      # the first sample of the block is the current one
+      samples = np.arange(size) + (self.auxcnt - self.currentSeed - 1)
+      uniforms = np.empty((size,len(keys)))
+      for k,key in enumerate(keys):
+        uniforms[:,k] = randomUtils.counterRandom(self.currentSeed,samples,key)[:,0]
+    else:
+      uniforms = randomUtils.random(len(keys),size,keepMatrix=True)
+    block = {'values':{}, 'SampledVarsPb':{}, 'ProbabilityWeight':np.ones(size)}
+    for k,key in enumerate(keys):
+      if self.samplingType == 'uniform':
+        distData = self.distDict[key].getCrowDistDict()
+        if ('xMin' not in distData.keys()) or ('xMax' not in distData.keys()):
+          self.raiseAnError(IOError,"In the Monte-Carlo sampler a uniform sampling type has been chosen;"
+                 + " however, one or more distributions have not specified either the lowerBound or the upperBound")
+        lower = distData['xMin']
+        upper = distData['xMax']
+        rvsnum = lower + (upper - lower) * uniforms[:,k]
+        epsilon = (upper-lower)/self.limit
+        # as in localGenerateInput, the weight of the point is the one of the last variable
+        block['ProbabilityWeight'] = self.distDict[key].cdf(rvsnum + epsilon) - self.distDict[key].cdf(rvsnum - epsilon)
+      else:
+        rvsnum = np.atleast_1d(self.distDict[key].ppf(uniforms[:,k]))
+      for kkey in key.split(','):
+        block['values'][kkey] = rvsnum
+      block['SampledVarsPb'][key] = np.atleast_1d(self.distDict[key].pdf(rvsnum))
+    return block
+
+  def _useNextInBlock(self):
+    """
+      Fills the sampler values and inputInfo from the next sample of the current block, drawing a new block if needed.
+      @ In, None
+      @ Out, None
+    """
+    if self._block is None or self._blockIndex >= len(self._block['ProbabilityWeight']):
+      # do not draw past the limit, so that the random sequence is left where the one-at-a-time sampling leaves it
+      size = max(1,min(self.blockSize,self.limit - self.counter + 1))
+      self._block = self.localGenerateInputBatch(size)
+      self._blockIndex = 0
+    i = self._blockIndex
+    for var,values in self._block['values'].items():
+      self.values[var] = values[i]
+    for key,values in self._block['SampledVarsPb'].items():
+      self.inputInfo['SampledVarsPb'][key] = values[i]
+      self.inputInfo['ProbabilityWeight-' + key] = 1.
+    self._blockIndex += 1
+    self.inputInfo['PointProbability'] = reduce(mul, self.inputInfo['SampledVarsPb'].values())
+    if self.samplingType == 'uniform':
+      self.inputInfo['ProbabilityWeight'  ] = self._block['ProbabilityWeight'][i]
+    else:
+      self.inputInfo['ProbabilityWeight' ] = 1.0 #MC weight is 1/N => weight is one
+    self.inputInfo['SamplerType'] = 'MonteCarlo'
+
   def localGenerateInput(self,model,myInput):
     """
       Function to select the next most informative point for refining the limit
@@ -119,6 +233,9 @@ class MonteCarlo(ForwardSampler):
     """
     # create values dictionary
     weight = 1.0
+    if (self.blockSize > 1 or self.randomEngine == 'counter') and self._canGenerateBlock():
+      self._useNextInBlock()
+      return
     for key in sorted(self.distDict):
       # check if the key is a comma separated list of strings
       # in this case, the user wants to sample the comma separated variables with the same sampled value => link the value to all comma separated variables
@@ -136,11 +253,14 @@ class MonteCarlo(ForwardSampler):
                    + " however, one or more distributions have not specified either the lowerBound or the upperBound")
           lower = distData['xMin']
           upper = distData['xMax']
-          rvsnum = lower + (upper - lower) * randomUtils.random()
+          uniform = self._counterUniforms(key)[0] if self.randomEngine == 'counter' else randomUtils.random()
+          rvsnum = lower + (upper - lower) * uniform
           epsilon = (upper-lower)/self.limit
           midPlusCDF  = self.distDict[key].cdf(rvsnum + epsilon)
           midMinusCDF = self.distDict[key].cdf(rvsnum - epsilon)
           weight *= midPlusCDF - midMinusCDF
+        elif self.randomEngine == 'counter':
+          rvsnum = self.distDict[key].ppf(self._counterUniforms(key)[0])
         else:
           rvsnum = self.distDict[key].rvs()
         for kkey in key.split(','):
@@ -150,14 +270,18 @@ class MonteCarlo(ForwardSampler):
       elif totDim > 1:
         if reducedDim == 1:
           if self.samplingType is None:
-            rvsnum = self.distDict[key].rvs()
+            if self.randomEngine == 'counter':
+              rvsnum = self.distDict[key].rvsFromUniforms(self._counterUniforms(key,self.distDict[key].numberOfUniforms()))
+            else:
+              rvsnum = self.distDict[key].rvs()
             coordinate = np.atleast_1d(rvsnum).tolist()
           else:
             coordinate = np.zeros(totDim)
+            uniforms = self._counterUniforms(key,totDim) if self.randomEngine == 'counter' else None
             for i in range(totDim):
               lower = self.distDict[key].returnLowerBound(i)
               upper = self.distDict[key].returnUpperBound(i)
-              coordinate[i] = lower + (upper - lower) * randomUtils.random()
+              coordinate[i] = lower + (upper - lower) * (uniforms[i] if uniforms is not None else randomUtils.random())
           if reducedDim > len(coordinate):
             self.raiseAnError(IOError,"The dimension defined for variables drew from the multivariate normal distribution is exceeded by the dimension used in Distribution (MultivariateNormal) ")
           probabilityValue = self.distDict[key].pdf(coordinate)
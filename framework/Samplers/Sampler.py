@@ -24,7 +24,6 @@ warnings.simplefilter('default',DeprecationWarning)
 
 #External Modules------------------------------------------------------------------------------------
 import sys
-import copy
 import abc
 import json
 import itertools
@@ -33,6 +32,7 @@ import numpy as np
 
 #Internal Modules------------------------------------------------------------------------------------
 from utils import utils,randomUtils,InputData
+from utils.sampleRecord import SampleRecord
 from BaseClasses import BaseType
 from Assembler import Assembler
 #Internal Modules End--------------------------------------------------------------------------------
@@ -124,6 +124,7 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta,BaseType),Assembler):
     self.variableShapes                = {}                        # stores the dimensionality of each variable by name, as tuple e.g. (2,3) for [[#,#,#],[#,#,#]]
     self.inputInfo                     = {}                        # depending on the sampler several different type of keywarded information could be present only one is mandatory, see below
     self.initSeed                      = None                      # if not provided the seed is randomly generated at the istanciation of the sampler, the step can override the seed by sending in another seed
+    self.currentSeed                   = None                      # seed of the current random sequence (initial or external seeding), self.auxcnt-self.currentSeed is the number of samples drawn in it
     self.inputInfo['SampledVars'     ] = self.values               # this is the location where to get the values of the sampled variables
     self.inputInfo['SampledVarsPb'   ] = {}                        # this is the location where to get the probability of the sampled variables
     #self.inputInfo['PointProbability'] = None                      # this is the location where the point wise probability is stored (probability associated to a sampled point)
@@ -437,11 +438,13 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta,BaseType),Assembler):
     if not externalSeeding:
       randomUtils.randomSeed(self.initSeed)       #use the sampler initialization seed
       self.auxcnt = self.initSeed
+      self.currentSeed = self.initSeed
     elif externalSeeding=='continue':
       pass        #in this case the random sequence needs to be preserved
     else                              :
       randomUtils.randomSeed(externalSeeding)     #the external seeding is used
       self.auxcnt = externalSeeding
+      self.currentSeed = externalSeeding
     #grab restart dataobject if it's available, then in localInitialize the sampler can deal with it.
     if 'Restart' in self.assemblerDict.keys():
       self.raiseADebug('Restart object: '+str(self.assemblerDict['Restart']))
@@ -807,7 +810,8 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta,BaseType),Assembler):
       # DO format the data as atleast_1d so it's consistent in the ExternalModel for users (right?)
       rlz['inputs'] = dict((var,np.atleast_1d(inExisting[var])) for var in self.restartData.getVars('input'))
       rlz['outputs'] = dict((var,np.atleast_1d(inExisting[var])) for var in self.restartData.getVars('output')+self.restartData.getVars('indexes'))
-      rlz['metadata'] = copy.deepcopy(self.inputInfo) # TODO need deepcopy only because inputInfo is on self
+      # snapshot, since inputInfo is on self (copy-on-write, the values are only copied if the metadata is modified)
+      rlz['metadata'] = SampleRecord.fromDict(self.inputInfo)
       return 1,rlz
 
   def generateInputBatch(self,myInput,model,batchSize,projector=None):
@@ -818,14 +822,18 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta,BaseType),Assembler):
       @ In, model, model instance, it is the instance of a RAVEN model
       @ In, batchSize, int, the number of input sets required
       @ In, projector, object, optional, used for adaptive sampling to provide the projection of the solution on the success metric
-      @ Out, newInputs, list of list, list of the list of input sets
+      @ Out, newInputs, list of tuple, (found, newInput, inputInfo) for each input set (see generateInput), where inputInfo
+                                       is a snapshot (SampleRecord) of self.inputInfo for that input set (to be used as keyword arguments for Model.submit)
+                                       or None for the points found in the restart (their realization already holds it as metadata)
     """
     newInputs = []
-    while self.amIreadyToProvideAnInput() and (self.counter < batchSize):
-      if projector==None:
-        newInputs.append(self.generateInput(model,myInput))
+    while self.amIreadyToProvideAnInput() and (len(newInputs) < batchSize):
+      if projector is None:
+        found,newInput = self.generateInput(model,myInput)
       else:
-        newInputs.append(self.generateInput(model,myInput,projector))
+        found,newInput = self.generateInput(model,myInput,projector)
+      # the snapshot shares the values with the other samples until they are modified, nothing is deep copied here
+      newInputs.append((found,newInput,SampleRecord.fromDict(self.inputInfo) if found == 0 else None))
     return newInputs
 
   @abc.abstractmethod
@@ -23,33 +23,15 @@ from __future__ import absolute_import
 
 # These lines ensure that we do not have to do something like:
 # 'from Samplers.Sampler import Sampler' outside of this submodule
+# Only the base classes are imported here, the specific samplers are imported
+# by the Factory when an input asks for them (e.g. 'from Samplers.Grid import Grid')
 from .Sampler import Sampler
-# Forward Samplers
-from .ForwardSampler        import ForwardSampler
-from .MonteCarlo            import MonteCarlo
-from .Grid                  import Grid
-from .Stratified            import Stratified
-from .FactorialDesign       import FactorialDesign
-from .ResponseSurfaceDesign import ResponseSurfaceDesign
-from .Sobol                 import Sobol
-from .SparseGridCollocation import SparseGridCollocation
-from .EnsembleForward       import EnsembleForward
-from .CustomSampler         import CustomSampler
-
-# Adaptive Samplers
-from .AdaptiveSampler      import AdaptiveSampler
-from .LimitSurfaceSearch   import LimitSurfaceSearch
-from .AdaptiveSobol        import AdaptiveSobol
-from .AdaptiveSparseGrid   import AdaptiveSparseGrid
-# Dynamic Event Tree-based Samplers
-from .DynamicEventTree         import DynamicEventTree
-from .AdaptiveDynamicEventTree import AdaptiveDynamicEventTree
+from .ForwardSampler  import ForwardSampler
+from .AdaptiveSampler import AdaptiveSampler
 # Factory methods
 from .Factory import knownTypes
 from .Factory import returnInstance
 from .Factory import returnClass
 
 # We should not really need this as we do not use wildcard imports
-__all__ = ['Sampler','AdaptiveSampler','ForwardSampler','MonteCarlo','Grid','CustomSampler','Stratified',
-           'FactorialDesign','ResponseSurfaceDesign','Sobol','EnsembleForward','SparseGridCollocation',
-           'DynamicEventTree','LimitSurfaceSearch','AdaptiveDynamicEventTree','AdaptiveSparseGrid','AdaptiveSobol']
+__all__ = ['Sampler','AdaptiveSampler','ForwardSampler']
@@ -33,21 +33,23 @@ import threading
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
-import Steps
-import DataObjects
-import Files
-import Samplers
-import Optimizers
-import Models
-import Metrics
-import Distributions
-import Databases
-import Functions
-import OutStreams
 from JobHandler import JobHandler
 import MessageHandler
 import VariableGroups
-from utils import utils,TreeStructure,xmlUtils
+from utils import utils,TreeStructure,xmlUtils,importerUtils
+## The entities are only imported when an input uses them (the first time the factory of an entity is
+## asked for an instance), so that a run does not import the libraries needed by entities it does not use.
+Steps         = importerUtils.importModuleLazy('Steps')
+DataObjects   = importerUtils.importModuleLazy('DataObjects')
+Files         = importerUtils.importModuleLazy('Files')
+Samplers      = importerUtils.importModuleLazy('Samplers')
+Optimizers    = importerUtils.importModuleLazy('Optimizers')
+Models        = importerUtils.importModuleLazy('Models')
+Metrics       = importerUtils.importModuleLazy('Metrics')
+Distributions = importerUtils.importModuleLazy('Distributions')
+Databases     = importerUtils.importModuleLazy('Databases')
+Functions     = importerUtils.importModuleLazy('Functions')
+OutStreams    = importerUtils.importModuleLazy('OutStreams')
 from Application import __QtAvailable
 from Interaction import Interaction
 if __QtAvailable:
@@ -168,11 +170,12 @@ class Simulation(MessageHandler.MessageUser):
      myInstance.myClassmyCurrentSetting()               !see BaseType class-
 
     --how to add a new entity <myClass> to the simulation--
-    Add an import for the module where it is defined. Convention is that the module is named with the plural
-     of the base class of the module: <MyModule>=<myClass>+'s'.
+    Add a (lazy) import for the module where it is defined, <MyModule> = importerUtils.importModuleLazy('<MyModule>').
+     Convention is that the module is named with the plural of the base class of the module: <MyModule>=<myClass>+'s'.
      The base class of the module is by convention named as the new type of simulation component <myClass>.
      The module should contain a set of classes named <myType> that are child of the base class <myClass>.
-     The module should possess a function <MyModule>.returnInstance('<myType>',caller) that returns a pointer to the class <myType>.
+     The module should possess a function <MyModule>.returnInstance('<myType>',caller) that returns a pointer to the class <myType>
+     (the classes can be registered in an importerUtils.LazyClassRegistry so that they are only imported when requested).
     Add in Simulation.__init__ the following
      self.<myClass>Dict = {}
      self.addWhatDict['<myClass>'] = <MyModule>
@@ -236,6 +239,7 @@ class Simulation(MessageHandler.MessageUser):
     self.runInfoDict['numProcByRun'      ] = 1            # Total number of core used by one run (number of threads by number of mpi)
     self.runInfoDict['batchSize'         ] = 1            # number of contemporaneous runs
     self.runInfoDict['internalParallel'  ] = False        # activate internal parallel (parallel python). If True parallel python is used, otherwise multi-threading is used
+    self.runInfoDict['internalRunner'    ] = 'threads'    # how the internal jobs are run locally if internalParallel is False: 'threads' or 'processes' (pool of processes for the ExternalModel and ROM jobs)
     self.runInfoDict['ParallelCommand'   ] = ''           # the command that should be used to submit jobs in parallel (mpi)
     self.runInfoDict['ThreadingCommand'  ] = ''           # the command should be used to submit multi-threaded
     self.runInfoDict['totalNumCoresUsed' ] = 1            # total number of cores used by driver
@@ -251,6 +255,8 @@ class Simulation(MessageHandler.MessageUser):
     self.runInfoDict['logfileBuffer'     ] = int(io.DEFAULT_BUFFER_SIZE)*50 # logfile buffer size in bytes
     self.runInfoDict['clusterParameters' ] = []           # Extra parameters to use with the qsub command.
     self.runInfoDict['maxQueueSize'      ] = None
+    self.runInfoDict['messageFlushInterval'] = 0.5      # time in seconds between two writes of the queued messages (0 writes each message when raised)
+    self.runInfoDict['messageLog'        ] = None         # file of the structured (JSON lines) log of the messages
 
     #Following a set of dictionaries that, in a manner consistent with their names, collect the instance of all objects needed in the simulation
     #Theirs keywords in the dictionaries are the the user given names of data, sampler, etc.
@@ -429,7 +435,7 @@ class Simulation(MessageHandler.MessageUser):
         else:
           globalAttributes = child.attrib
           #if 'verbosity' in globalAttributes.keys(): self.verbosity = globalAttributes['verbosity']
-        if Class not in ['RunInfo','OutStreams'] and "returnInputParameter" in self.addWhatDict[Class].__dict__:
+        if Class not in ['RunInfo','OutStreams'] and hasattr(self.addWhatDict[Class],"returnInputParameter"):
           paramInput = self.addWhatDict[Class].returnInputParameter()
           paramInput.parseNode(child)
           for childChild in paramInput.subparts:
@@ -437,7 +443,7 @@ class Simulation(MessageHandler.MessageUser):
             if "name" not in childChild.parameterValues:
               self.raiseAnError(IOError,'not found name attribute for '+childName +' in '+Class)
             name = childChild.parameterValues["name"]
-            if "needsRunInfo" in self.addWhatDict[Class].__dict__:
+            if hasattr(self.addWhatDict[Class],"needsRunInfo"):
               self.whichDict[Class][name] = self.addWhatDict[Class].returnInstance(childName,self.runInfoDict,self)
             else:
               self.whichDict[Class][name] = self.addWhatDict[Class].returnInstance(childName,self)
@@ -453,7 +459,7 @@ class Simulation(MessageHandler.MessageUser):
               #if name not in self.whichDict[Class].keys():  self.whichDict[Class][name] = self.addWhatDict[Class].returnInstance(childChild.tag,self)
               if Class != 'OutStreams':
                 if name not in self.whichDict[Class].keys():
-                  if "needsRunInfo" in self.addWhatDict[Class].__dict__:
+                  if hasattr(self.addWhatDict[Class],"needsRunInfo"):
                     self.whichDict[Class][name] = self.addWhatDict[Class].returnInstance(childChild.tag,self.runInfoDict,self)
                   else:
                     self.whichDict[Class][name] = self.addWhatDict[Class].returnInstance(childChild.tag,self)
@@ -500,6 +506,10 @@ class Simulation(MessageHandler.MessageUser):
     os.chdir(self.runInfoDict['WorkingDir'])
     #add also the new working dir to the path
     sys.path.append(os.getcwd())
+    #set up the output of the messages (the log file is relative to the working dir)
+    self.messageHandler.setFlushInterval(self.runInfoDict['messageFlushInterval'])
+    if self.runInfoDict['messageLog'] is not None:
+      self.messageHandler.setMessageLog(self.runInfoDict['messageLog'])
     #check consistency and fill the missing info for the // runs (threading, mpi, batches)
     self.runInfoDict['numProcByRun'] = self.runInfoDict['NumMPI']*self.runInfoDict['NumThreads']
     oldTotalNumCoresUsed = self.runInfoDict['totalNumCoresUsed']
@@ -642,6 +652,11 @@ class Simulation(MessageHandler.MessageUser):
         self.runInfoDict['NumMPI'            ] = int(element.text)
       elif element.tag == 'internalParallel':
         self.runInfoDict['internalParallel'  ] = utils.interpretBoolean(element.text)
+      elif element.tag == 'internalRunner':
+        internalRunner = element.text.strip().lower()
+        if internalRunner not in ['threads','processes']:
+          self.raiseAnError(IOError,'Unknown internalRunner "'+element.text.strip()+'"! Available are "threads" and "processes".')
+        self.runInfoDict['internalRunner'    ] = internalRunner
       elif element.tag == 'batchSize':
         self.runInfoDict['batchSize'         ] = int(element.text)
       elif element.tag.lower() == 'maxqueuesize':
@@ -659,6 +674,13 @@ class Simulation(MessageHandler.MessageUser):
           self.runInfoDict['delSucLogFiles'    ] = True
         else:
           self.runInfoDict['delSucLogFiles'    ] = False
+      elif element.tag == 'messageFlushInterval':
+        try:
+          self.runInfoDict['messageFlushInterval'] = float(element.text)
+        except ValueError:
+          self.raiseAnError(IOError,'Value given for RunInfo.messageFlushInterval could not be converted to float: {}'.format(element.text))
+      elif element.tag == 'messageLog':
+        self.runInfoDict['messageLog'        ] = element.text.strip()
       elif element.tag == 'logfileBuffer':
         self.runInfoDict['logfileBuffer'] = utils.convertMultipleToBytes(element.text.lower())
       elif element.tag == 'clusterParameters':
@@ -786,6 +808,7 @@ class Simulation(MessageHandler.MessageUser):
     self.jobHandler.shutdown()
     self.messageHandler.printWarnings()
     self.raiseAMessage('Run complete!',forcePrint=True)
+    self.messageHandler.flush()
 
   def generateAllAssemblers(self, objectInstance):
     """
@@ -43,7 +43,9 @@ from BaseClasses import BaseType
 import Files
 from utils import utils
 from utils import InputData
+from utils.sampleRecord import SampleRecord
 import Models
+import Samplers
 from OutStreams import OutStreamManager
 from DataObjects import DataObject
 #Internal Modules End--------------------------------------------------------------------------------
@@ -290,6 +292,10 @@ class Step(utils.metaclass_insert(abc.ABCMeta,BaseType)):
       @ In, inDictionary, dict, contains the list of instances (see Simulation)
       @ Out, None
     """
+    # write the realizations buffered by the databases
+    for output in inDictionary['Output']:
+      if output.type == 'HDF5':
+        output.flush()
     if self.pauseEndStep:
       for i in range(len(inDictionary['Output'])):
         #if type(inDictionary['Output'][i]).__name__ not in ['str','bytes','unicode']:
@@ -487,7 +493,7 @@ class SingleRun(Step):
                                  str(self.failureHandling['repetitions'])+' times, failing all the times!!!')
       if jobHandler.isFinished() and len(jobHandler.getFinishedNoPop()) == 0:
         break
-      time.sleep(self.sleepTime)
+      jobHandler.waitForEvent(self.sleepTime)
     if sampler is not None:
       sampler.handleFailedRuns(self.failedRuns)
     else:
@@ -520,8 +526,24 @@ class MultiRun(SingleRun):
     SingleRun.__init__(self)
     self._samplerInitDict = {} #this is a dictionary that gets sent as key-worded list to the initialization of the sampler
     self.counter          = 0  #just an handy counter of the runs already performed
+    self.batchEvaluation  = 1  #number of samples evaluated by each job, when the model can evaluate them at once (e.g. ROMs)
+    self._useBatches      = False # True if the samples are submitted in batches during this step
+    self._knownAttribute += ['batchEvaluation']
     self.printTag = 'STEP MULTIRUN'
 
+  @classmethod
+  def getInputSpecification(cls):
+    """
+      Method to get a reference to a class that specifies the input data for
+      class cls.
+      @ In, cls, the class for which we are retrieving the specification
+      @ Out, inputSpecification, InputData.ParameterInput, class to use for
+        specifying input of cls.
+    """
+    inputSpecification = super(MultiRun, cls).getInputSpecification()
+    inputSpecification.addParam("batchEvaluation", InputData.IntegerType)
+    return inputSpecification
+
   def _localInputAndCheckParam(self,paramInput):
     """
       Place here specialized reading, input consistency check and
@@ -532,6 +554,10 @@ class MultiRun(SingleRun):
     SingleRun._localInputAndCheckParam(self,paramInput)
     if self.samplerType not in [item[0] for item in self.parList]:
       self.raiseAnError(IOError,'It is not possible a multi-run without a sampler or optimizer!')
+    if 'batchEvaluation' in paramInput.parameterValues:
+      self.batchEvaluation = paramInput.parameterValues['batchEvaluation']
+      if self.batchEvaluation < 1:
+        self.raiseAnError(IOError,'In Step named '+self.name+' the attribute "batchEvaluation" must be a positive integer!')
 
   def _initializeSampler(self,inDictionary):
     """
@@ -595,11 +621,20 @@ class MultiRun(SingleRun):
       if not model.amITrained:
         model.raiseAnError(RuntimeError,'ROM model "%s" has not been trained yet, so it cannot be sampled!' %model.name+\
                                         ' Use a RomTrainer step to train it.')
+    # batches are only possible for samplers that do not need to look at each run (forward samplers)
+    self._useBatches = self.batchEvaluation > 1 and isinstance(inDictionary[self.samplerType],Samplers.ForwardSampler) \
+                       and isinstance(model,(Models.ROM,Models.ExternalModel)) and model.canEvaluateBatch()
+    if self.batchEvaluation > 1 and not self._useBatches:
+      self.raiseAWarning('In Step named '+self.name+' the samples cannot be evaluated in batches with the sampler "'+inDictionary[self.samplerType].name+
+                         '" and the model "'+model.name+'". They will be evaluated one at a time.')
     for inputIndex in range(inDictionary['jobHandler'].runInfoDict['batchSize']):
       if inDictionary[self.samplerType].amIreadyToProvideAnInput():
         try:
-          newInput = self._findANewInputToRun(inDictionary[self.samplerType], inDictionary['Model'], inDictionary['Input'], inDictionary['Output'])
-          inDictionary["Model"].submit(newInput, inDictionary[self.samplerType].type, inDictionary['jobHandler'], **copy.deepcopy(inDictionary[self.samplerType].inputInfo))
+          if self._useBatches:
+            self._submitBatch(inDictionary[self.samplerType], model, inDictionary['Input'], inDictionary['Output'], inDictionary['jobHandler'])
+          else:
+            newInput = self._findANewInputToRun(inDictionary[self.samplerType], inDictionary['Model'], inDictionary['Input'], inDictionary['Output'])
+            inDictionary["Model"].submit(newInput, inDictionary[self.samplerType].type, inDictionary['jobHandler'], **SampleRecord.fromDict(inDictionary[self.samplerType].inputInfo))
           self.raiseADebug('Submitted input '+str(inputIndex+1))
         except utils.NoMoreSamplesNeeded:
           self.raiseAMessage('Sampler returned "NoMoreSamplesNeeded".  Continuing...')
@@ -674,8 +709,11 @@ class MultiRun(SingleRun):
 
           if sampler.amIreadyToProvideAnInput():
             try:
-              newInput = self._findANewInputToRun(sampler, model, inputs, outputs)
-              model.submit(newInput, inDictionary[self.samplerType].type, jobHandler, **copy.deepcopy(sampler.inputInfo))
+              if self._useBatches:
+                self._submitBatch(sampler, model, inputs, outputs, jobHandler)
+              else:
+                newInput = self._findANewInputToRun(sampler, model, inputs, outputs)
+                model.submit(newInput, inDictionary[self.samplerType].type, jobHandler, **SampleRecord.fromDict(sampler.inputInfo))
             except utils.NoMoreSamplesNeeded:
               self.raiseAMessage('Sampler returned "NoMoreSamplesNeeded".  Continuing...')
               break
@@ -686,7 +724,7 @@ class MultiRun(SingleRun):
       if jobHandler.isFinished() and not sampler.amIreadyToProvideAnInput():
         self.raiseADebug('Finished with %d runs submitted, %d jobs running, and %d completed jobs waiting to be processed.' % (jobHandler.numSubmitted(),jobHandler.numRunning(),len(jobHandler.getFinishedNoPop())) )
         break
-      time.sleep(self.sleepTime)
+      jobHandler.waitForEvent(self.sleepTime)
     # END while loop that runs the step iterations
     # if any collected runs failed, let the sampler treat them appropriately, and any other closing-out actions
     sampler.finalizeSampler(self.failedRuns)
@@ -717,6 +755,28 @@ class MultiRun(SingleRun):
         for collector, outIndex in self._outputDictCollectionLambda:
           collector([newInp,outputs[outIndex]])
     return newInp
+
+  def _submitBatch(self, sampler, model, inputs, outputs, jobHandler):
+    """
+      Generates up to "batchEvaluation" new samples and submits them to the model as a single job.
+      Samples found in the restart are collected right away, as in _findANewInputToRun.
+      @ In, sampler, Sampler, the sampler in charge of generating the samples
+      @ In, model, Model, the model in charge of evaluating the samples (able to evaluate batches, see ROM.submitBatch
+        and ExternalModel.submitBatch)
+      @ In, inputs, list, the raven objects used as the input in this step
+      @ In, outputs, list, the raven objects used as the output in this step
+      @ In, jobHandler, JobHandler, the job handler
+      @ Out, None
+    """
+    batch = []
+    for found,newInp,inputInfo in sampler.generateInputBatch(inputs,model,self.batchEvaluation):
+      if found == 1:
+        for collector, outIndex in self._outputDictCollectionLambda:
+          collector([newInp,outputs[outIndex]])
+      else:
+        batch.append(inputInfo)
+    if len(batch) > 0:
+      model.submitBatch(inputs, sampler.type, jobHandler, batch)
 #
 #
 #
@@ -848,8 +908,10 @@ class IOStep(Step):
       elif  isinstance(inDictionary['Input'][i],DataObject.DataObject):
         if outputs[i].type == 'HDF5':
           self.actionType.append('dataObjects-HDF5')
+        elif isinstance(outputs[i],Files.File) and outputs[i].getExt() == 'packed':
+          self.actionType.append('dataObjects-FILES')
         else:
-          self.raiseAnError(IOError,'In Step named ' + self.name + '. This step accepts ' + 'HDF5' + ' as Output only, when the Input is a DataObjects. Got ' + inDictionary['Output'][i].type)
+          self.raiseAnError(IOError,'In Step named ' + self.name + '. This step accepts ' + 'HDF5' + ' or packed Files as Output only, when the Input is a DataObjects. Got ' + inDictionary['Output'][i].type)
       elif isinstance(inDictionary['Input'][i],Models.ROM):
         if isinstance(outputs[i],Files.File):
           self.actionType.append('ROM-FILES')
@@ -903,15 +965,19 @@ class IOStep(Step):
         #inDictionary['Input'][i] is HDF5, outputs[i] is a DataObjects
         allRealizations = inDictionary['Input'][i].allRealizations()
         ## TODO convert to load function when it can handle unstructured multiple realizations
-        for rlz in allRealizations:
-          outputs[i].addRealization(rlz)
+        outputs[i].addRealizations(allRealizations)
       elif self.actionType[i] == 'dataObjects-HDF5':
         #inDictionary['Input'][i] is a dataObjects, outputs[i] is HDF5
         ## TODO convert to load function when it can handle unstructured multiple realizations
+        allRealizations = []
         for rlzNo in range(len(inDictionary['Input'][i])):
           rlz = inDictionary['Input'][i].realization(rlzNo, unpackXArray=True)
-          rlz = dict((var,np.atleast_1d(val)) for var, val in rlz.items())
-          outputs[i].addRealization(rlz)
+          allRealizations.append(dict((var,np.atleast_1d(val)) for var, val in rlz.items()))
+        outputs[i].addRealizations(allRealizations)
+        outputs[i].flush()
+      elif self.actionType[i] == 'dataObjects-FILES':
+        #inDictionary['Input'][i] is a dataObjects, outputs[i] is a packed Files
+        inDictionary['Input'][i].write(outputs[i].getAbsFile(),style='packed')
 
       elif self.actionType[i] == 'ROM-FILES':
         #inDictionary['Input'][i] is a ROM, outputs[i] is Files
@@ -943,7 +1009,8 @@ class IOStep(Step):
         #inDictionary['Input'][i] is a Files, outputs[i] is PointSet
         infile = inDictionary['Input'][i]
         options = {'fileToLoad':infile}
-        outputs[i].load(inDictionary['Input'][i].getPath(),'csv',**options)
+        style = 'packed' if infile.getExt() == 'packed' else 'csv'
+        outputs[i].load(inDictionary['Input'][i].getPath(),style,**options)
       else:
         self.raiseAnError(IOError,"Unknown action type "+self.actionType[i])
     for output in inDictionary['Output']:
@@ -32,6 +32,7 @@ import statsmodels.api as sm # VARMAX is in sm.tsa
 from statsmodels.tsa.arima_model import ARMA as smARMA
 import numpy as np
 from scipy import optimize
+from scipy.signal import lfilter
 from scipy.linalg import solve_discrete_lyapunov
 from sklearn import linear_model, neighbors
 #External Modules End--------------------------------------------------------------------------------
@@ -360,24 +361,37 @@ class ARMA(supervisedLearning):
 
   def __evaluateLocal__(self,featureVals):
     """
-      @ In, featureVals, float, a scalar feature value is passed as scaling factor
-      @ Out, returnEvaluation , dict, dictionary of values for each target (and pivot parameter)
+      @ In, featureVals, np.array, shape = [n_histories,1], the scaling factor of each synthetic history
+      @ Out, returnEvaluation , dict, dictionary of values for each target (and pivot parameter), a single history
+        (np.array(n_pivot)) for a single scaling factor, np.array shape = [n_histories,n_pivot] otherwise
     """
-    if featureVals.size > 1:
-      self.raiseAnError(ValueError, 'The input feature for ARMA for evaluation cannot have size greater than 1. ')
-
-    # Instantiate a normal distribution for time series synthesis (noise part)
-    # TODO USE THIS, but first retrofix rvs on norm to take "size=") for number of results
-
+    # one independent history for each scaling factor
+    scaling = np.asarray(featureVals,dtype=float).reshape(-1)
+    histories = self.generateHistories(scaling.size)
     # make sure pivot value is in return object
     returnEvaluation = {self.pivotParameterID:self.pivotParameterValues}
+    for target,signal in histories.items():
+      ## FIXME this is ASSUMING the input to ARMA is only ever a single scaling factor.
+      signal *= scaling[:,np.newaxis]
+      # sanity check on the signal
+      assert(signal.shape[1] == returnEvaluation[self.pivotParameterID].size)
+      returnEvaluation[target] = signal[0] if scaling.size == 1 else signal
+    return returnEvaluation
 
+  def generateHistories(self,numHistories):
+    """
+      Generates independent synthetic histories of the targets at once. The random shocks of all the histories
+      are drawn in bulk (see _drawHistoryNoise), the histories are propagated together, and the trained Fourier
+      signals and empirical CDFs are applied to all of them together.
+      @ In, numHistories, int, number of histories to generate
+      @ Out, histories, dict, {target:np.array, shape = [numHistories,n_pivot]}, the (unscaled) synthetic histories
+    """
+    numPivot = len(self.pivotParameterValues)
+    histories = {}
+    normals, coordinates = self._drawHistoryNoise(numHistories)
     # TODO when we have output printing for ROMs, the distinct signals here could be outputs!
-    # leaving "debuggFile" as examples of this, in comments
-    #debuggFile = open('signal_bases.csv','w')
-    #debuggFile.writelines('Time,'+','.join(str(x) for x in self.pivotParameterValues)+'\n')
     correlatedSample = None
-    for tIdx,target in enumerate(self.target):
+    for target in self.target:
       # start with the random gaussian signal
       if target in self.correlations:
         # where is target in correlated data
@@ -391,44 +405,47 @@ class ARMA(supervisedLearning):
           if correlatedSample is None:
             # if not, take the samples now
             unzeroedSample = self._generateVARMASignal(self.varmaResult[0],
-                                                 numSamples = self.zeroFilterMask.sum(),
-                                                 randEngine = self.normEngine.rvs,
-                                                 rvsIndex = 0)
+                                                       numSamples = self.zeroFilterMask.sum(),
+                                                       rvsIndex = 0,
+                                                       numHistories = numHistories,
+                                                       coordinates = coordinates[0])
             ## zero sampling is dependent on whether the trained model is a VARMA or ARMA
             if self.varmaNoise[1] is not None:
               zeroedSample = self._generateVARMASignal(self.varmaResult[1],
-                                                   numSamples = self.notZeroFilterMask.sum(),
-                                                   randEngine = self.normEngine.rvs,
-                                                   rvsIndex = 1)
+                                                     numSamples = self.notZeroFilterMask.sum(),
+                                                     rvsIndex = 1,
+                                                     numHistories = numHistories,
+                                                     coordinates = coordinates[1])
             else:
               result = self.varmaResult[1]
               sample = self._generateARMASignal(result,
                                                 numSamples = self.notZeroFilterMask.sum(),
-                                                randEngine = self.normEngine.rvs)
-              zeroedSample = np.zeros((self.notZeroFilterMask.sum(),1))
-              zeroedSample[:,0] = sample
+                                                numHistories = numHistories,
+                                                noise = normals[None])
+              zeroedSample = sample[:,:,np.newaxis]
             correlatedSample = True # placeholder, signifies we've sampled the correlated distribution
           # reconstruct base signal from samples
           ## initialize
-          signal = np.zeros(len(self.pivotParameterValues))
+          signal = np.zeros((numHistories,numPivot))
           ## first the data from the non-zero portions of the original signal
-          signal[self.zeroFilterMask] = unzeroedSample[:,corrIndex]
+          signal[:,self.zeroFilterMask] = unzeroedSample[:,:,corrIndex]
           ## then the data from the zero portions (if the filter target, don't bother because they're zero anyway)
           if target != self.zeroFilterTarget:
             # fix offset since we didn't include zero-filter target in zeroed correlated arma
             indexOffset = 0 if corrIndex < filterTargetIndex else -1
-            signal[self.notZeroFilterMask] = zeroedSample[:,corrIndex+indexOffset]
+            signal[:,self.notZeroFilterMask] = zeroedSample[:,:,corrIndex+indexOffset]
         # if no zero-filtering (but still correlated):
         else:
           ## check if sample taken yet
           if correlatedSample is None:
             ## if not, do so now
             correlatedSample = self._generateVARMASignal(self.varmaResult[0],
-                                                         numSamples = len(self.pivotParameterValues),
-                                                         randEngine = self.normEngine.rvs,
-                                                         rvsIndex = 0)
+                                                         numSamples = numPivot,
+                                                         rvsIndex = 0,
+                                                         numHistories = numHistories,
+                                                         coordinates = coordinates[0])
           # take base signal from sample
-          signal = correlatedSample[:,self.correlations.index(target)]
+          signal = correlatedSample[:,:,corrIndex]
       # if NOT correlated
       else:
         result = self.armaResult[target] # ARMAResults object
@@ -437,38 +454,26 @@ class ARMA(supervisedLearning):
         if target == self.zeroFilterTarget:
           sample = self._generateARMASignal(result,
                                             numSamples = self.zeroFilterMask.sum(),
-                                            randEngine = self.normEngine.rvs)
+                                            numHistories = numHistories,
+                                            noise = normals[target])
           ## if so, then expand result into signal space (functionally, put back in all the zeros)
-          signal = np.zeros(len(self.pivotParameterValues))
-          signal[self.zeroFilterMask] = sample
+          signal = np.zeros((numHistories,numPivot))
+          signal[:,self.zeroFilterMask] = sample
         else:
           ## if not, no extra work to be done here!
-          sample = self._generateARMASignal(result,
-                                            numSamples = len(self.pivotParameterValues),
-                                            randEngine = self.normEngine.rvs)
-          signal = sample
+          signal = self._generateARMASignal(result,
+                                            numSamples = numPivot,
+                                            numHistories = numHistories,
+                                            noise = normals[target])
       # END creating base signal
-      # DEBUGG adding arbitrary variables for debugging, TODO find a more elegant way, leaving these here as markers
-      #returnEvaluation[target+'_0base'] = copy.copy(signal)
       # denoise
       signal = self._denormalizeThroughCDF(signal,self.cdfParams[target])
-      # DEBUGG adding arbitrary variables
-      #returnEvaluation[target+'_1denorm'] = copy.copy(signal)
-      #debuggFile.writelines('signal_arma,'+','.join(str(x) for x in signal)+'\n')
-
       # Add fourier trends
       if target in self.fourierParams:
         signal += self.fourierResults[target]['predict']
-        # DEBUGG adding arbitrary variables
-        #returnEvaluation[target+'_2fourier'] = copy.copy(signal)
-        #debuggFile.writelines('signal_fourier,'+','.join(str(x) for x in self.fourierResults[target]['predict'])+'\n')
-
       # Re-zero out zero filter target's zero regions
       if target == self.zeroFilterTarget:
-        # DEBUGG adding arbitrary variables
-        #returnEvaluation[target+'_3zerofilter'] = copy.copy(signal)
-        signal[self.notZeroFilterMask] = 0.0
-
+        signal[:,self.notZeroFilterMask] = 0.0
       # Domain limitations
       for domain,requests in self.outTruncation.items():
         if target in requests:
@@ -476,20 +481,17 @@ class ARMA(supervisedLearning):
             signal = np.absolute(signal)
           elif domain == 'negative':
             signal = -np.absolute(signal)
-        # DEBUGG adding arbitrary variables
-        #returnEvaluation[target+'_4truncated'] = copy.copy(signal)
-
-      # store results
-      ## FIXME this is ASSUMING the input to ARMA is only ever a single scaling factor.
-      signal *= featureVals[0]
-      # DEBUGG adding arbitrary variables
-      #returnEvaluation[target+'_5scaled'] = copy.copy(signal)
-      # sanity check on the signal
-      assert(signal.size == returnEvaluation[self.pivotParameterID].size)
-      #debuggFile.writelines('final,'+','.join(str(x) for x in signal)+'\n')
-      returnEvaluation[target] = signal
+      histories[target] = signal
     # END for target in targets
-    return returnEvaluation
+    return histories
+
+  def canEvaluateBatch(self):
+    """
+      Determines if several points can be evaluated at once, the ARMA generates one history for each scaling factor.
+      @ In, None
+      @ Out, canEvaluateBatch, bool, True
+    """
+    return True
 
   def reseed(self,seed):
     """
@@ -525,30 +527,92 @@ class ARMA(supervisedLearning):
   def _denormalizeThroughCDF(self, data, params):
     """
       Normalizes "data" using a Gaussian normal plus CDF of data
-      @ In, data, np.array, data to normalize with
+      @ In, data, np.array, data to normalize with (any shape, e.g. several histories)
       @ In, params, dict, CDF parameters (as obtained by "generateCDF")
       @ Out, normed, np.array, normalized data
     """
-    denormed = self.normEngine.cdf(data)
+    data = np.asarray(data)
+    denormed = self.normEngine.cdf(data.ravel())
     denormed = self._sampleICDF(denormed, params)
-    return denormed
-
-  def _generateARMASignal(self, model, numSamples=None, randEngine=None):
-    """
-      Generates a synthetic history from fitted parameters.
+    return denormed.reshape(data.shape)
+
+  def _drawHistoryNoise(self, numHistories):
+    """
+      Draws the random numbers of several histories at once, with one call for each random stream (the standard
+      normal shocks of the ARMAs from the normal engine, the coordinates of the VARMA distributions from the random
+      stream of the distributions). The numbers are laid out history by history, in the order the generation of a
+      single history takes them, so that generating several histories at once gives the same histories as
+      generating them one at a time.
+      @ In, numHistories, int, number of histories to generate
+      @ Out, normals, dict, {target:np.array, shape = [numHistories,n_shocks]}, the standard normal shocks of the
+        ARMA of each uncorrelated target (with key None for the ARMA of the zero-filtered correlated targets)
+      @ Out, coordinates, list(np.array), shape = [numHistories,n_coordinates], the coordinates in the transformed
+        space of the noise and initial state distributions of each VARMA (see _generateVARMASignal)
+    """
+    numPivot = len(self.pivotParameterValues)
+    burnin = 2*max(self.Pmax,self.Qmax) # @epinas, 2018
+    normalSizes = [] # (target, number of shocks) in the order of the targets
+    coordinateSizes = [] # number of coordinates, for each VARMA
+    def varmaCoordinates(index, numSamples):
+      """
+        Number of coordinates of a VARMA history, the state shocks and then the initial state
+        @ In, index, int, index of the VARMA
+        @ In, numSamples, int, number of samples of the history
+        @ Out, size, int, the number of coordinates
+      """
+      return numSamples*self.varmaNoise[index].rank + self.varmaInit[index].rank
+    correlatedSample = None
+    for target in self.target:
+      if target in self.correlations:
+        # the correlated sample is taken once, for all the correlated targets
+        if correlatedSample is not None:
+          continue
+        correlatedSample = True
+        if len(self.varmaResult) > 1:
+          coordinateSizes.append(varmaCoordinates(0, self.zeroFilterMask.sum()))
+          if self.varmaNoise[1] is not None:
+            coordinateSizes.append(varmaCoordinates(1, self.notZeroFilterMask.sum()))
+          else:
+            normalSizes.append((None, self.notZeroFilterMask.sum() + burnin))
+        else:
+          coordinateSizes.append(varmaCoordinates(0, numPivot))
+      else:
+        numSamples = self.zeroFilterMask.sum() if target == self.zeroFilterTarget else numPivot
+        normalSizes.append((target, numSamples + burnin))
+    normals = {}
+    totalSize = sum(size for _,size in normalSizes)
+    if totalSize > 0:
+      values = np.asarray(self.normEngine.rvs(numHistories*totalSize)).reshape(numHistories,totalSize)
+      splits = np.cumsum([size for _,size in normalSizes])[:-1]
+      normals = dict(zip((key for key,_ in normalSizes), np.split(values, splits, axis=1)))
+    coordinates = []
+    totalSize = sum(coordinateSizes)
+    if totalSize > 0:
+      values = Distributions.transformedSpaceCoordinates(numHistories*totalSize).reshape(numHistories,totalSize)
+      coordinates = np.split(values, np.cumsum(coordinateSizes)[:-1], axis=1)
+    return normals, coordinates
+
+  def _generateARMASignal(self, model, numSamples=None, randEngine=None, numHistories=1, noise=None):
+    """
+      Generates synthetic histories from fitted parameters.
       @ In, model, statsmodels.tsa.arima_model.ARMAResults, fitted ARMA such as otained from _trainARMA
       @ In, numSamples, int, optional, number of samples to take (default to pivotParameters length)
       @ In, randEngine, instance, optional, method to call to get random samples (for example "randEngine(size=6)")
-      @ Out, hist, np.array(float), synthetic ARMA signal
+      @ In, numHistories, int, optional, number of independent histories to generate
+      @ In, noise, np.array, optional, shape = [numHistories,numSamples+burnin], the standard normal shocks (drawn
+        from randEngine if not given, see _drawHistoryNoise)
+      @ Out, hist, np.array(float), shape = [numHistories,numSamples], synthetic ARMA signals
     """
     if numSamples is None:
       numSamples =  len(self.pivotParameterValues)
-    hist = sm.tsa.arma_generate_sample(ar = np.append(1., -model.arparams),
-                                       ma = np.append(1., model.maparams),
-                                       nsample = numSamples,
-                                       distrvs = randEngine,
-                                       sigma = np.sqrt(model.sigma2),
-                                       burnin = 2*max(self.Pmax,self.Qmax)) # @epinas, 2018
+    if randEngine is None:
+      randEngine = self.normEngine.rvs
+    burnin = 2*max(self.Pmax,self.Qmax) # @epinas, 2018
+    if noise is None:
+      noise = np.asarray(randEngine(numHistories*(numSamples+burnin))).reshape(numHistories,numSamples+burnin)
+    # same as statsmodels' arma_generate_sample for each history, with the shocks of all the histories drawn at once
+    shocks = np.sqrt(model.sigma2) * noise
+    hist = lfilter(np.append(1., model.maparams), np.append(1., -model.arparams), shocks, axis=1)[:,burnin:]
     return hist
 
   def _generateFourierSignal(self, pivots, basePeriod, fourierOrder):
@@ -567,34 +631,47 @@ class ARMA(supervisedLearning):
         fourier[base][:, 2*orderBp+1] = np.cos(2*np.pi*(orderBp+1)/base*pivots)
     return fourier
 
-  def _generateVARMASignal(self, model, numSamples=None, randEngine=None, rvsIndex=None):
+  def _generateVARMASignal(self, model, numSamples=None, rvsIndex=None, numHistories=1, coordinates=None):
     """
-      Generates a set of correlated synthetic histories from fitted parameters.
+      Generates sets of correlated synthetic histories from fitted parameters, all the histories at once.
       @ In, model, statsmodels.tsa.statespace.VARMAX, fitted VARMA such as otained from _trainVARMA
       @ In, numSamples, int, optional, number of samples to take (default to pivotParameters length)
-      @ In, randEngine, instance, optional, method to call to get random samples (for example "randEngine(size=6)")
       @ In, rvsIndex, int, optional, if provided then will take from list of varmaNoise and varmaInit distributions
-      @ Out, hist, np.array(float), synthetic ARMA signal
+      @ In, numHistories, int, optional, number of independent sets of histories to generate
+      @ In, coordinates, np.array, optional, shape = [numHistories,n_coordinates], the coordinates in the transformed
+        space of the state shocks and then of the initial state of each history (drawn from the random stream of the
+        distributions if not given, see _drawHistoryNoise)
+      @ Out, hist, np.array(float), shape = [numHistories,numSamples,n_correlated], synthetic VARMA signals
     """
     if numSamples is None:
       numSamples =  len(self.pivotParameterValues)
-    # sample measure, state shocks
-    ## TODO it appears that measure shock always has a 0 variance multivariate normal, so just create it
-    measureShocks = np.zeros([numSamples,len(self.correlations)])
     ## state shocks come from sampling multivariate
+    ## TODO it appears that measure shock always has a 0 variance multivariate normal, so it is not sampled
     noiseDist = self.varmaNoise
     initDist = self.varmaInit
     if rvsIndex is not None:
       noiseDist = noiseDist[rvsIndex]
       initDist = initDist[rvsIndex]
-    stateShocks = np.array([noiseDist.rvs() for _ in range(numSamples)])
+    numShockCoordinates = numSamples*noiseDist.rank
+    if coordinates is None:
+      coordinates = Distributions.transformedSpaceCoordinates(numHistories*(numShockCoordinates+initDist.rank))
+      coordinates = coordinates.reshape(numHistories,-1)
+    stateShocks = self._transformMultivariateNormal(noiseDist, coordinates[:,:numShockCoordinates]).reshape(numHistories,numSamples,-1)
     # pick an intial by sampling multinormal distribution
-    init = np.array(initDist.rvs())
-    obs, states = model.ssm.simulate(numSamples,
-                                     initial_state = init,
-                                     measurement_shocks = measureShocks,
-                                     state_shocks = stateShocks)
-    return obs
+    inits = self._transformMultivariateNormal(initDist, coordinates[:,numShockCoordinates:])
+    # same as model.ssm.simulate for each history (the VARMA is time invariant), for all the histories together
+    ssm = model.ssm
+    design = ssm['design',:,:,0]
+    transition = ssm['transition',:,:,0]
+    selection = ssm['selection',:,:,0]
+    stateShocks = stateShocks.dot(selection.T) + ssm['state_intercept',:,0]
+    states = inits
+    hist = np.empty((numHistories,numSamples,design.shape[0]))
+    for t in range(numSamples):
+      hist[:,t,:] = states.dot(design.T)
+      states = states.dot(transition.T) + stateShocks[:,t,:]
+    hist += ssm['obs_intercept',:,0]
+    return hist
 
   def _interpolateDist(self,x,y,Xlow,Xhigh,Ylow,Yhigh,inMask):
     """
@@ -696,6 +773,19 @@ class ARMA(supervisedLearning):
     y = self._interpolateDist(x,y,Xlow,Xhigh,Ylow,Yhigh,inMask)
     return y
 
+  def _transformMultivariateNormal(self, dist, coordinates):
+    """
+      Transforms coordinates drawn in the transformed space of a multivariate normal distribution (as trained by
+      _trainMultivariateNormal) into samples of the distribution, all at once, as the distribution does for each
+      of its samples.
+      @ In, dist, Distributions.MultivariateNormal, the distribution
+      @ In, coordinates, list(list(float)), the coordinates (see Distributions.MultivariateNormal.coordinateInTransformedSpace)
+      @ Out, samples, np.array, shape = [len(coordinates),dimension], the samples
+    """
+    transformation = dist.transformationMatrix()
+    coordinates = np.asarray(coordinates,dtype=float).reshape(-1,transformation.shape[1])
+    return coordinates.dot(transformation.T) + np.asarray(dist.mu)
+
   def _trainARMA(self,data):
     """
       Fit ARMA model: x_t = \sum_{i=1}^P \phi_i*x_{t-i} + \alpha_t + \sum_{j=1}^Q \theta_j*\alpha_{t-j}
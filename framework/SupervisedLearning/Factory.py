@@ -22,44 +22,27 @@ import warnings
 warnings.simplefilter('default',DeprecationWarning)
 #End compatibility block for Python 3-------------------------------------------
 
-################################################################################
-
-from SupervisedLearning.SupervisedLearning import supervisedLearning
-# Forward Samplers
-from SupervisedLearning.ARMA               import ARMA
-from SupervisedLearning.GaussPolynomialRom import GaussPolynomialRom
-from SupervisedLearning.HDMRRom            import HDMRRom
-from SupervisedLearning.MSR                import MSR
-from SupervisedLearning.NDinterpolatorRom  import NDinterpolatorRom
-from SupervisedLearning.NDinvDistWeight    import NDinvDistWeight
-from SupervisedLearning.NDsplineRom        import NDsplineRom
-from SupervisedLearning.SciKitLearn        import SciKitLearn
-from SupervisedLearning.pickledROM         import pickledROM
-from SupervisedLearning.PolyExponential    import PolyExponential
-from SupervisedLearning.DynamicModeDecomposition import DynamicModeDecomposition
-
-## [ Add new class here ]
-################################################################################
-
+from utils import importerUtils
 
 """
  Interface Dictionary (factory) (private)
 """
-# This machinery will automatically populate the "knownTypes" given the
-# imports defined above.
+# The ROMs are registered by the path of their definition, so that their modules (and the libraries
+# they need, e.g. scikit-learn or statsmodels) are only imported if an input uses them.
 __base = 'supervisedLearning'
-__interfaceDict                         = {}
-__interfaceDict['NDspline'            ] = NDsplineRom
-__interfaceDict['NDinvDistWeight'     ] = NDinvDistWeight
-__interfaceDict['NDsplineRom'         ] = NDsplineRom
-__interfaceDict['SciKitLearn'         ] = SciKitLearn
-__interfaceDict['GaussPolynomialRom'  ] = GaussPolynomialRom
-__interfaceDict['HDMRRom'             ] = HDMRRom
-__interfaceDict['MSR'                 ] = MSR
-__interfaceDict['ARMA'                ] = ARMA
-__interfaceDict['pickledROM'          ] = pickledROM
-__interfaceDict['PolyExponential'     ] = PolyExponential
-__interfaceDict['DMD'                 ] = DynamicModeDecomposition
+__interfaceDict                         = importerUtils.LazyClassRegistry()
+__interfaceDict['NDspline'            ] = 'SupervisedLearning.NDsplineRom.NDsplineRom'
+__interfaceDict['NDinvDistWeight'     ] = 'SupervisedLearning.NDinvDistWeight.NDinvDistWeight'
+__interfaceDict['NDsplineRom'         ] = 'SupervisedLearning.NDsplineRom.NDsplineRom'
+__interfaceDict['SciKitLearn'         ] = 'SupervisedLearning.SciKitLearn.SciKitLearn'
+__interfaceDict['GaussPolynomialRom'  ] = 'SupervisedLearning.GaussPolynomialRom.GaussPolynomialRom'
+__interfaceDict['HDMRRom'             ] = 'SupervisedLearning.HDMRRom.HDMRRom'
+__interfaceDict['MSR'                 ] = 'SupervisedLearning.MSR.MSR'
+__interfaceDict['ARMA'                ] = 'SupervisedLearning.ARMA.ARMA'
+__interfaceDict['pickledROM'          ] = 'SupervisedLearning.pickledROM.pickledROM'
+__interfaceDict['PolyExponential'     ] = 'SupervisedLearning.PolyExponential.PolyExponential'
+__interfaceDict['DMD'                 ] = 'SupervisedLearning.DynamicModeDecomposition.DynamicModeDecomposition'
+## [ Add new class here ]
 
 def knownTypes():
   """
@@ -43,6 +43,10 @@ class GaussPolynomialRom(supervisedLearning):
   """
     Gauss Polynomial Rom Class
   """
+  maxBasisEntries = 2**22 # maximum size of the matrices of polynomials evaluated at once, see _iterBasis
+  _polyIndices    = None  # np.array of the polynomial orders of the coefficients, see _coefficientMatrix
+  _polyCoeffs     = None  # np.array of the polynomial coefficients for each target, see _coefficientMatrix
+
   def __confidenceLocal__(self,featureVals):
     """
       This should return an estimation of the quality of the prediction.
@@ -300,6 +304,53 @@ class GaussPolynomialRom(supervisedLearning):
       tot*=self.polys[varName](o,p)
     return tot
 
+  def _standardizePoints(self,featureVals):
+    """
+      Converts points to the standard quadrature space of each variable.
+      @ In, featureVals, np.array, shape = [n_points,n_features], points in the variables space
+      @ Out, stdPts, np.array, shape = [n_points,n_features], points in the quadrature space
+    """
+    featureVals = np.atleast_2d(np.asarray(featureVals,dtype=float))
+    stdPts = np.zeros(featureVals.shape)
+    for i,varName in enumerate(self.sparseGrid.varNames):
+      dist,quadType = self.distDict[varName],self.quads[varName].type
+      stdPts[:,i] = list(dist.convertToQuad(quadType,p) for p in featureVals[:,i])
+    return stdPts
+
+  def _iterBasis(self,stdPts,polyIndices):
+    """
+      Evaluates the multidimensional polynomials of an index set at the given points, in chunks of points
+      so that the size of the basis matrix is bounded. The 1-D polynomials of each variable are evaluated
+      once for each distinct coordinate (Vandermonde tables), then combined by products.
+      @ In, stdPts, np.array, shape = [n_points,n_features], points in the quadrature space
+      @ In, polyIndices, np.array, shape = [n_polynomials,n_features], polynomial orders of the index set
+      @ Out, chunks, generator, yields (slice of the points, np.array shape = [n_chunk_points,n_polynomials])
+    """
+    tables = []
+    for i,varName in enumerate(self.sparseGrid.varNames):
+      unique,inverse = np.unique(stdPts[:,i],return_inverse=True)
+      tables.append((self.polys[varName].vandermonde(polyIndices[:,i].max(),unique),inverse.ravel()))
+    chunkSize = max(1,self.maxBasisEntries//max(1,len(polyIndices)))
+    for start in range(0,len(stdPts),chunkSize):
+      rows = slice(start,start+chunkSize)
+      basis = np.ones((len(stdPts[rows]),len(polyIndices)))
+      for i,(table,inverse) in enumerate(tables):
+        basis *= table[inverse[rows]][:,polyIndices[:,i]]
+      yield rows,basis
+
+  def _coefficientMatrix(self):
+    """
+      Returns the polynomial coefficients as arrays, built from self.polyCoeffDict if not already available.
+      @ In, None
+      @ Out, polyIndices, np.array, shape = [n_polynomials,n_features], polynomial orders
+      @ Out, polyCoeffs, np.array, shape = [n_polynomials,n_targets], polynomial coefficients for each target
+    """
+    if self._polyIndices is None:
+      keys = list(self.polyCoeffDict[self.target[0]].keys())
+      self._polyIndices = np.array(keys,dtype=int).reshape(len(keys),len(self.features))
+      self._polyCoeffs = np.array(list(list(self.polyCoeffDict[target][key] for target in self.target) for key in keys),dtype=float).reshape(len(keys),len(self.target))
+    return self._polyIndices,self._polyCoeffs
+
   def __trainLocal__(self,featureVals,targetVals):
     """
       Trains ROM.
@@ -311,66 +362,36 @@ class GaussPolynomialRom(supervisedLearning):
       self.raiseAnError(RuntimeError,'ROM has not yet been initialized!  Has the Sampler associated with this ROM been used?')
     self.raiseADebug('training',self.features,'->',self.target)
     self.featv, self.targv = featureVals,targetVals
-    self.polyCoeffDict = {key: dict({}) for key in self.target}
     #check equality of point space
     self.raiseADebug('...checking required points are available...')
-    fvs = []
-    tvs = {key: list({}) for key in self.target}
-    sgs = list(self.sparseGrid.points())
-    missing=[]
+    sgs = self.sparseGrid.points()
     kdTree = spatial.KDTree(featureVals)
-    #TODO this is slowest loop in this algorithm, by quite a bit.
-    for pt in sgs:
-      #KDtree way
-      distances,idx = kdTree.query(pt,k=1,distance_upper_bound=1e-9) #FIXME how to set the tolerance generically?
-      #KDTree repots a "not found" as at infinite distance with index len(data)
-      if idx >= len(featureVals):
-        found = False
-      else:
-        found = True
-        point = tuple(featureVals[idx])
-      #end KDTree way
-      if found:
-        fvs.append(point)
-        for cnt, target in enumerate(self.target):
-          tvs[target].append(targetVals[idx,cnt])
-      else:
-        missing.append(pt)
-    if len(missing)>0:
+    #KDTree reports a "not found" as at infinite distance with index len(data)
+    _,found = kdTree.query(np.asarray(sgs,dtype=float).reshape(len(sgs),-1),k=1,distance_upper_bound=1e-9) #FIXME how to set the tolerance generically?
+    missing = found >= len(featureVals)
+    if missing.any():
       msg='\n'
       msg+='DEBUG missing feature vals:\n'
-      for i in missing:
-        msg+='  '+str(i)+'\n'
+      for i in np.where(missing)[0]:
+        msg+='  '+str(sgs[i])+'\n'
       self.raiseADebug(msg)
       self.raiseADebug('sparse:',sgs)
-      self.raiseADebug('solns :',fvs)
+      self.raiseADebug('solns :',list(tuple(featureVals[idx]) for idx in found[~missing]))
       self.raiseAnError(IOError,'input values do not match required values!')
-    #make translation matrix between lists, also actual-to-standardized point map
-    self.raiseADebug('...constructing translation matrices...')
-    translate={}
-    for i in range(len(fvs)):
-      translate[tuple(fvs[i])]=sgs[i]
-    standardPoints = {}
-    for pt in fvs:
-      stdPt = []
-      for i,p in enumerate(pt):
-        varName = self.sparseGrid.varNames[i]
-        stdPt.append( self.distDict[varName].convertToQuad(self.quads[varName].type,p) )
-      standardPoints[tuple(pt)] = stdPt[:]
+    #solutions and quadrature weights, in the order of the sparse grid points
+    weightedSolns = targetVals[found]*np.asarray(self.sparseGrid.weights(),dtype=float)[:,np.newaxis]
+    standardPoints = self._standardizePoints(featureVals[found])
     #make polynomials
     self.raiseADebug('...constructing polynomials...')
     self.norm = np.prod(list(self.distDict[v].measureNorm(self.quads[v].type) for v in self.distDict.keys()))
-    for i,idx in enumerate(self.indexSet):
-      idx=tuple(idx)
-      for target in self.target:
-        self.polyCoeffDict[target][idx]=0
-        wtsum=0
-        for pt,soln in zip(fvs,tvs[target]):
-          tupPt = tuple(pt)
-          stdPt = standardPoints[tupPt]
-          wt = self.sparseGrid.weights(translate[tupPt])
-          self.polyCoeffDict[target][idx]+=soln*self._multiDPolyBasisEval(idx,stdPt)*wt
-        self.polyCoeffDict[target][idx]*=self.norm
+    self._polyIndices = np.array(list(tuple(idx) for idx in self.indexSet),dtype=int).reshape(-1,len(self.features))
+    #projection of all the targets at once, coeff[k,t] = norm * sum_p Psi_k(x_p) * wt_p * soln_p[t]
+    self._polyCoeffs = np.zeros((len(self._polyIndices),len(self.target)))
+    for rows,basis in self._iterBasis(standardPoints,self._polyIndices):
+      self._polyCoeffs += np.dot(basis.T,weightedSolns[rows])
+    self._polyCoeffs *= self.norm
+    keys = list(tuple(idx) for idx in self._polyIndices.tolist())
+    self.polyCoeffDict = dict((target,dict(zip(keys,self._polyCoeffs[:,t]))) for t,target in enumerate(self.target))
     self.amITrained=True
     self.raiseADebug('...training complete!')
 
@@ -430,34 +451,27 @@ class GaussPolynomialRom(supervisedLearning):
       @ Out, tot, float, evaluation of moment
     """
     target = self.target[0] if targ is None else targ
-    #TODO is there a faster way still to do this?
     if r==1:
       return self.polyCoeffDict[target][tuple([0]*len(self.features))]
     elif r==2:
       return sum(s**2 for s in self.polyCoeffDict[target].values())
-    tot=0
-    for pt,wt in self.sparseGrid:
-      tot+=self.__evaluateLocal__([pt])[target]**r*wt
+    values = self.__evaluateLocal__(self.sparseGrid.points())[target]
+    tot = np.dot(values**r,np.asarray(self.sparseGrid.weights(),dtype=float))
     tot*=self.norm
     return tot
 
   def __evaluateLocal__(self,featureVals):
     """
-      Evaluates a point.
-      @ In, featureVals, list, of values at which to evaluate the ROM
-      @ Out, returnDict, dict, the evaluated point for each target
+      Evaluates a set of points.
+      @ In, featureVals, np.array, shape = [n_points,n_features], values at which to evaluate the ROM
+      @ Out, returnDict, dict, the evaluated points for each target ({target:np.array(n_points)})
     """
-    featureVals=featureVals[0]
-    returnDict={}
-    stdPt = np.zeros(len(featureVals))
-    for p,pt in enumerate(featureVals):
-      varName = self.sparseGrid.varNames[p]
-      stdPt[p] = self.distDict[varName].convertToQuad(self.quads[varName].type,pt)
-    for target in self.target:
-      tot=0
-      for idx,coeff in self.polyCoeffDict[target].items():
-        tot+=coeff*self._multiDPolyBasisEval(idx,stdPt)
-      returnDict[target] = tot
+    polyIndices,polyCoeffs = self._coefficientMatrix()
+    stdPts = self._standardizePoints(featureVals)
+    values = np.zeros((len(stdPts),len(self.target)))
+    for rows,basis in self._iterBasis(stdPts,polyIndices):
+      values[rows] = np.dot(basis,polyCoeffs)
+    returnDict = dict((target,values[:,t]) for t,target in enumerate(self.target))
     return returnDict
 
   def _printPolynomial(self):
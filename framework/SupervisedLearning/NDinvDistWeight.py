@@ -25,14 +25,175 @@ warnings.simplefilter('default',DeprecationWarning)
 #End compatibility block for Python 3----------------------------------------------------------------
 
 #External Modules------------------------------------------------------------------------------------
+import numpy as np
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import cdist
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
-from utils import utils
-interpolationND = utils.findCrowModule("interpolationND")
 from .NDinterpolatorRom import NDinterpolatorRom
 #Internal Modules End--------------------------------------------------------------------------------
 
+class InverseDistanceWeighting(object):
+  """
+    Inverse distance weighting of scattered data (all the targets at once), with the same weights as the
+    crow InverseDistanceWeighting: the distance is the Minkowski distance of order p and the weights are
+    distance^-(dimensions+1); a query point that coincides with a training point gets its value.
+    The weighting is restricted to the k nearest training points and/or the training points within a
+    radius (found with a KD-tree) if requested, otherwise all the training points are used.
+    Training points can be added incrementally: they are kept in a buffer (searched exhaustively) until
+    the buffer is large enough to rebuild the tree.
+  """
+  ## size of the blocks of distances computed at once, [queries x training points]
+  maxChunkCells = 2**22
+  ## the tree is rebuilt when the buffer is larger than this fraction of the points in the tree (or minRebuild)
+  rebuildFraction = 0.1
+  minRebuild = 64
+
+  def __init__(self, p, neighbors=None, radius=None):
+    """
+      Constructor
+      @ In, p, float, the order of the Minkowski distance (>= 1)
+      @ In, neighbors, int, optional, the number of nearest training points used (all if None)
+      @ In, radius, float, optional, the maximum distance of the training points used (no limit if None)
+      @ Out, None
+    """
+    self.p = float(p)
+    self.neighbors = neighbors
+    self.radius = radius
+    self.points = None        # training points, [n_points,n_dimensions] (the tree ones first, then the buffer)
+    self.values = None        # training values, [n_points,n_targets]
+    self.tree = None          # KD-tree of the first self.treeSize points
+    self.treeSize = 0
+
+  def fit(self, points, values):
+    """
+      Sets the training points
+      @ In, points, np.array, the coordinates, [n_points,n_dimensions]
+      @ In, values, np.array, the values, [n_points,n_targets]
+      @ Out, None
+    """
+    self.points = np.array(points, dtype=float, ndmin=2)
+    self.values = np.array(values, dtype=float).reshape(len(self.points),-1)
+    self.__buildTree()
+
+  def add(self, points, values):
+    """
+      Adds training points
+      @ In, points, np.array, the coordinates, [n_new_points,n_dimensions]
+      @ In, values, np.array, the values, [n_new_points,n_targets]
+      @ Out, None
+    """
+    points = np.array(points, dtype=float, ndmin=2)
+    self.points = np.concatenate((self.points,points))
+    self.values = np.concatenate((self.values,np.array(values, dtype=float).reshape(len(points),-1)))
+    if len(self.points) - self.treeSize > max(self.minRebuild,self.rebuildFraction*self.treeSize):
+      self.__buildTree()
+
+  def __buildTree(self):
+    """
+      Builds the KD-tree on all the training points (only needed for restricted weightings)
+      @ In, None
+      @ Out, None
+    """
+    if self.neighbors is not None or self.radius is not None:
+      self.tree = cKDTree(self.points)
+      self.treeSize = len(self.points)
+
+  def interpolateAt(self, queries):
+    """
+      Interpolates at the query points
+      @ In, queries, np.array, the coordinates, [n_queries,n_dimensions]
+      @ Out, result, np.array, the interpolated values, [n_queries,n_targets]
+    """
+    queries = np.array(queries, dtype=float, ndmin=2)
+    if self.neighbors is None and self.radius is None:
+      # all the training points, by blocks of queries
+      chunk = max(1,self.maxChunkCells//max(1,len(self.points)))
+      result = np.empty((len(queries),self.values.shape[1]))
+      for start in range(0,len(queries),chunk):
+        distances = cdist(queries[start:start+chunk],self.points,'minkowski',p=self.p)
+        exact = distances == 0.0
+        with np.errstate(divide='ignore'):
+          weights = distances**(-(self.points.shape[1]+1.0))
+        weights[exact] = 0.0
+        with np.errstate(invalid='ignore',divide='ignore'):
+          block = np.dot(weights,self.values)/np.sum(weights,axis=1)[:,np.newaxis]
+        # coinciding points: the value of the (first) training point
+        matched = np.any(exact,axis=1)
+        block[matched] = self.values[np.argmax(exact[matched],axis=1)]
+        result[start:start+chunk] = block
+      return result
+    rows, cols, distances = self.__neighborPairs(queries)
+    return self.__average(len(queries),rows,cols,distances,queries)
+
+  def __neighborPairs(self, queries):
+    """
+      Finds the training points used for each query (in the tree and in the buffer)
+      @ In, queries, np.array, the coordinates, [n_queries,n_dimensions]
+      @ Out, rows, np.array(int), the query of each (query,training point) pair
+      @ Out, cols, np.array(int), the training point of each pair
+      @ Out, distances, np.array, the distance of each pair
+    """
+    radius = np.inf if self.radius is None else self.radius
+    buffered = self.points[self.treeSize:]
+    bufferDistances = cdist(queries,buffered,'minkowski',p=self.p) if len(buffered) > 0 else np.zeros((len(queries),0))
+    bufferDistances[bufferDistances > radius] = np.inf
+    if self.neighbors is not None:
+      k = min(self.neighbors,self.treeSize)
+      distances, cols = self.tree.query(queries,k=k,p=self.p,distance_upper_bound=radius)
+      distances = np.concatenate((distances.reshape(len(queries),k),bufferDistances),axis=1)
+      cols = np.concatenate((cols.reshape(len(queries),k),np.broadcast_to(np.arange(self.treeSize,len(self.points)),bufferDistances.shape)),axis=1)
+      if distances.shape[1] > self.neighbors:
+        nearest = np.argpartition(distances,self.neighbors-1,axis=1)[:,:self.neighbors]
+        queryIndex = np.arange(len(queries))[:,np.newaxis]
+        distances = distances[queryIndex,nearest]
+        cols = cols[queryIndex,nearest]
+      rows = np.broadcast_to(np.arange(len(queries))[:,np.newaxis],distances.shape)
+      found = np.isfinite(distances)
+      return rows[found], cols[found], distances[found]
+    # all the points within the radius
+    neighbors = self.tree.query_ball_point(queries,radius,p=self.p)
+    counts = np.fromiter((len(n) for n in neighbors),dtype=int,count=len(queries))
+    rows = np.repeat(np.arange(len(queries)),counts)
+    cols = np.fromiter((c for n in neighbors for c in n),dtype=int,count=counts.sum())
+    distances = np.sum(np.abs(queries[rows]-self.points[cols])**self.p,axis=1)**(1.0/self.p)
+    bufferRows, bufferCols = np.nonzero(np.isfinite(bufferDistances))
+    return (np.concatenate((rows,bufferRows)), np.concatenate((cols,bufferCols+self.treeSize)),
+            np.concatenate((distances,bufferDistances[bufferRows,bufferCols])))
+
+  def __average(self, numQueries, rows, cols, distances, queries=None):
+    """
+      Weighted average of the values of the (query,training point) pairs
+      @ In, numQueries, int, the number of queries
+      @ In, rows, np.array(int), the query of each pair
+      @ In, cols, np.array(int), the training point of each pair
+      @ In, distances, np.array, the distance of each pair
+      @ In, queries, np.array, optional, the query coordinates (for the queries without training points, that
+                                         get the value of the nearest training point)
+      @ Out, result, np.array, the interpolated values, [n_queries,n_targets]
+    """
+    exact = distances == 0.0
+    weights = np.zeros(len(distances))
+    weights[~exact] = distances[~exact]**(-(self.points.shape[1]+1.0))
+    sumWeights = np.bincount(rows,weights=weights,minlength=numQueries)
+    result = np.empty((numQueries,self.values.shape[1]))
+    for t in range(self.values.shape[1]):
+      result[:,t] = np.bincount(rows,weights=weights*self.values[cols,t],minlength=numQueries)
+    with np.errstate(invalid='ignore',divide='ignore'):
+      result /= sumWeights[:,np.newaxis]
+    # coinciding points: the value of the (first) training point
+    first = np.full(numQueries,len(self.points))
+    np.minimum.at(first,rows[exact],cols[exact])
+    matched = first < len(self.points)
+    result[matched] = self.values[first[matched]]
+    # no training point in the radius: the value of the nearest one
+    empty = (sumWeights == 0.0) & ~matched
+    if np.any(empty):
+      nearest = np.argmin(cdist(queries[empty],self.points,'minkowski',p=self.p),axis=1)
+      result[empty] = self.values[nearest]
+    return result
+
 class NDinvDistWeight(NDinterpolatorRom):
   """
     An N-dimensional model that interpolates data based on a inverse weighting of
@@ -50,6 +211,12 @@ class NDinvDistWeight(NDinterpolatorRom):
     self.printTag = 'ND-INVERSEWEIGHT ROM'
     if not 'p' in self.initOptionDict.keys():
       self.raiseAnError(IOError,'the <p> parameter must be provided in order to use NDinvDistWeigth as ROM!!!!')
+    self.neighbors = self.initOptionDict.get('knn',None)
+    if self.neighbors is not None and int(self.neighbors) < 1:
+      self.raiseAnError(IOError,'the <knn> parameter of NDinvDistWeigth must be a positive integer!')
+    self.radius = self.initOptionDict.get('radius',None)
+    if self.radius is not None and float(self.radius) <= 0.0:
+      self.raiseAnError(IOError,'the <radius> parameter of NDinvDistWeigth must be positive!')
     self.__initLocal__()
 
   def __initLocal__(self):
@@ -58,9 +225,9 @@ class NDinvDistWeight(NDinterpolatorRom):
       @ In, None
       @ Out, None
     """
-    self.interpolator = []
-    for _ in range(len(self.target)):
-      self.interpolator.append(interpolationND.InverseDistanceWeighting(float(self.initOptionDict['p'])))
+    self.interpolator = InverseDistanceWeighting(float(self.initOptionDict['p']),
+                                                 None if self.neighbors is None else int(self.neighbors),
+                                                 None if self.radius is None else float(self.radius))
 
   def __resetLocal__(self):
     """
@@ -69,3 +236,33 @@ class NDinvDistWeight(NDinterpolatorRom):
       @ Out, None
     """
     self.__initLocal__()
+
+  def __trainLocal__(self,featureVals,targetVals):
+    """
+      Perform training on samples in featureVals with responses y.
+      If the previous training points are the first ones of the new training set (and their normalization
+      did not change), only the new points are added to the interpolator.
+      @ In, featureVals, {array-like, sparse matrix}, shape=[n_samples, n_features],
+        an array of input feature values
+      @ Out, targetVals, array, shape = [n_samples], an array of output target
+        associated with the corresponding points in featureVals
+    """
+    numOld = 0 if self.interpolator.points is None or self.featv is None else len(self.featv)
+    if 0 < numOld < len(featureVals) and np.array_equal(featureVals[:numOld],self.featv) and np.array_equal(targetVals[:numOld],self.targv):
+      self.interpolator.add(featureVals[numOld:],targetVals[numOld:])
+    else:
+      self.interpolator.fit(featureVals,targetVals)
+    self.featv, self.targv = featureVals,targetVals
+
+  def __evaluateLocal__(self,featureVals):
+    """
+      Perform regression on samples in featureVals (all the samples and targets at once).
+      @ In, featureVals, numpy.array 2-D, features
+      @ Out, prediction, dict, {target:numpy.array 1-D} predicted values
+    """
+    values = self.interpolator.interpolateAt(featureVals)
+    prediction = {}
+    for index, target in enumerate(self.target):
+      prediction[target] = values[:,index]
+      self.raiseAMessage('NDinterpRom   : Prediction by ' + self.__class__.ROMtype + ' for target '+target+'. Predicted value is ' + str(prediction[target][-1]))
+    return prediction
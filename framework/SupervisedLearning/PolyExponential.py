@@ -34,7 +34,7 @@ import numpy as np
 
 #Internal Modules------------------------------------------------------------------------------------
 from SupervisedLearning import supervisedLearning
-from SupervisedLearning import NDsplineRom
+from SupervisedLearning.NDsplineRom import NDsplineRom
 #Internal Modules End--------------------------------------------------------------------------------
 
 
@@ -169,6 +169,10 @@ class SciKitLearn(supervisedLearning):
       else:
         qualityEstTypeDict[key1][key2] = False
 
+  # estimators whose fit with multiple outputs is equivalent to independent fits of each output,
+  # computing only once what depends on the features (e.g. factorization, neighbors search)
+  sharedFeatureTypes = ['linear_model|LinearRegression','linear_model|Ridge','neighbors|KNeighborsRegressor','neighbors|RadiusNeighborsRegressor']
+
   def __init__(self,messageHandler,**kwargs):
     """
       A constructor that will appropriately initialize a supervised learning object
@@ -189,6 +193,7 @@ class SciKitLearn(supervisedLearning):
     SKLtype, SKLsubType = self.initOptionDict['SKLtype'].split('|')
     self.subType = SKLsubType
     self.intrinsicMultiTarget     = 'MultiTask' in self.initOptionDict['SKLtype']
+    self.sharedFeatureFit         = self.initOptionDict['SKLtype'] in self.__class__.sharedFeatureTypes and 'estimator' not in self.initOptionDict
     self.initOptionDict.pop('SKLtype')
     if not SKLtype in self.__class__.availImpl.keys():
       self.raiseAnError(IOError,'not known SKLtype "' + SKLtype +'" (from ROM "'+name+'")')
@@ -270,6 +275,49 @@ class SciKitLearn(supervisedLearning):
           self.ROM[index].fit(featureVals,targetVals[:,index])
         self.evaluate = self._readdressEvaluateRomResponse
 
+  def canWarmStart(self):
+    """
+      This method tells if this ROM can be retrained starting from its current trained state, i.e. if the
+      estimators are set to reuse the solution of the previous fit as initialization (warm_start)
+      @ In, None
+      @ Out, canWarmStart, bool, True if the ROM does not need to be reset before being retrained
+    """
+    return all(rom.get_params().get('warm_start',False) is True for rom in self.ROM)
+
+  def canTrainSlicesTogether(self):
+    """
+      This method tells if a chain of copies of this ROM, one for each value of the pivot parameter,
+      can be trained and evaluated at once (see __trainSlicesLocal__)
+      @ In, None
+      @ Out, canTrainSlicesTogether, bool, True if trainSlices and evaluateSlices can be used
+    """
+    return self.sharedFeatureFit
+
+  def __trainSlicesLocal__(self,featureVals,targetVals):
+    """
+      Perform the training of all the slices of a chain of ROMs at once: for each target, the estimator
+      is fitted once with the values of all the slices as outputs.
+      @ In, featureVals, np.array, shape=[n_samples, n_features], an array of input feature values
+      @ In, targetVals, np.array, shape = [n_samples,n_slices,n_targets], an array of output target
+        associated with the corresponding points in featureVals, for each slice
+      @ Out, None
+    """
+    for index in range(len(self.ROM)):
+      self.ROM[index].fit(featureVals,targetVals[:,:,index])
+    # the slices are evaluated through the shared estimators, never with the constant response shortcut
+    self.__dict__.pop('evaluate',None)
+
+  def __evaluateSlicesLocal__(self,featureVals):
+    """
+      Evaluates all the slices of a chain of ROMs at once.
+      @ In, featureVals, np.array, list of values at which to evaluate the ROM
+      @ Out, returnDict, dict, {target:np.array, shape = [n_samples,n_slices]}, the evaluated points
+    """
+    returnDict = {}
+    for index, target in enumerate(self.target):
+      returnDict[target] = self.ROM[index].predict(featureVals).reshape(featureVals.shape[0],-1)
+    return returnDict
+
   def __confidenceLocal__(self,featureVals):
     """
       This should return an estimation of the quality of the prediction.
@@ -291,7 +339,11 @@ class SciKitLearn(supervisedLearning):
       @ Out, returnDict, dict, dict of all the target results
     """
     returnDict = {}
-    if not self.intrinsicMultiTarget:
+    if self.sliceIndex is not None:
+      # slice of a chain of ROMs trained at once
+      for index, target in enumerate(self.target):
+        returnDict[target] = self.ROM[index].predict(featureVals).reshape(featureVals.shape[0],-1)[:,self.sliceIndex]
+    elif not self.intrinsicMultiTarget:
       for index, target in enumerate(self.target):
         returnDict[target] = self.ROM[index].predict(featureVals)
     else:
@@ -59,6 +59,7 @@ class supervisedLearning(utils.metaclass_insert(abc.ABCMeta),MessageHandler.Mess
   ROMtype          = ''    # the broad class of the interpolator
   ROMmultiTarget   = False #
   ROMtimeDependent = False # is this ROM able to treat time-like (any monotonic variable) explicitly in its formulation?
+  sliceIndex       = None  # index of the pivot slice handled by this ROM, if it belongs to a chain of ROMs trained at once (see trainSlices)
 
   @staticmethod
   def checkArrayConsistency(arrayIn,isDynamic=False):
@@ -133,8 +134,40 @@ class supervisedLearning(utils.metaclass_insert(abc.ABCMeta),MessageHandler.Mess
       @ In, tdict, dict, training dictionary
       @ Out, None
     """
-    if type(tdict) != dict:
-      self.raiseAnError(TypeError,'In method "train", the training set needs to be provided through a dictionary. Type of the in-object is ' + str(type(tdict)))
+    featureValues, targetValues = self._trainingMatrices(tdict)
+    # a ROM trained on its own is not a slice of a chain of ROMs (see trainSlices)
+    self.sliceIndex = None
+    self.__trainLocal__(featureValues,targetValues)
+    self.amITrained = True
+
+  def trainSlices(self,tdicts):
+    """
+      Method to train at once a chain of copies of this ROM, one for each slice of the pivot parameter,
+      when all the slices share the same feature values (see canTrainSlicesTogether)
+      @ In, tdicts, list(dict), the training dictionary of each slice
+      @ Out, roms, list, the trained ROMs, one for each slice, sharing the trained model
+    """
+    trained = copy.deepcopy(self)
+    featureValues, targetValues = trained._trainingMatrices(tdicts[0])
+    sliceTargets = np.empty((targetValues.shape[0],len(tdicts),targetValues.shape[1]))
+    sliceTargets[:,0,:] = targetValues
+    for ts in range(1,len(tdicts)):
+      sliceTargets[:,ts,:] = trained._targetMatrix(tdicts[ts])
+    trained.__trainSlicesLocal__(featureValues,sliceTargets)
+    trained.amITrained = True
+    roms = []
+    for ts in range(len(tdicts)):
+      rom = copy.copy(trained)
+      rom.sliceIndex = ts
+      roms.append(rom)
+    return roms
+
+  def _targetMatrix(self,tdict):
+    """
+      Method to collect the target values of a training dictionary
+      @ In, tdict, dict, training dictionary
+      @ Out, targetValues, np.array, shape = [n_samples,n_targets], the target values
+    """
     names, values  = list(tdict.keys()), list(tdict.values())
     ## This is for handling the special case needed by SKLtype=*MultiTask* that
     ## requires multiple targets.
@@ -152,6 +185,19 @@ class supervisedLearning(utils.metaclass_insert(abc.ABCMeta),MessageHandler.Mess
     else:
       sl = (slice(None),) * np.asarray(targetValues[0]).ndim + (np.newaxis,)
       targetValues = np.concatenate([np.asarray(arr)[sl] for arr in targetValues], axis=np.asarray(targetValues[0]).ndim)
+    return targetValues
+
+  def _trainingMatrices(self,tdict):
+    """
+      Method to translate a training dictionary into the (normalized) feature matrix and the target matrix
+      @ In, tdict, dict, training dictionary
+      @ Out, featureValues, np.array, shape = [n_samples,n_features], the normalized feature values
+      @ Out, targetValues, np.array, shape = [n_samples,n_targets], the target values
+    """
+    if not utils.isAMapping(tdict):
+      self.raiseAnError(TypeError,'In method "train", the training set needs to be provided through a dictionary. Type of the in-object is ' + str(type(tdict)))
+    names, values  = list(tdict.keys()), list(tdict.values())
+    targetValues = self._targetMatrix(tdict)
 
     # construct the evaluation matrixes
     featureValues = np.zeros(shape=(len(targetValues),len(self.features)))
@@ -171,8 +217,7 @@ class supervisedLearning(utils.metaclass_insert(abc.ABCMeta),MessageHandler.Mess
         self._localNormalizeData(values,names,feat)
         # valueToUse can be either a matrix (for who can handle time-dep data) or a vector (for who can not)
         featureValues[:,cnt] = ( (valueToUse[:,0] if len(valueToUse.shape) > 1 else valueToUse[:]) - self.muAndSigmaFeatures[feat][0])/self.muAndSigmaFeatures[feat][1]
-    self.__trainLocal__(featureValues,targetValues)
-    self.amITrained = True
+    return featureValues, targetValues
 
   def _localNormalizeData(self,values,names,feat):
     """
@@ -192,7 +237,7 @@ class supervisedLearning(utils.metaclass_insert(abc.ABCMeta),MessageHandler.Mess
       @ In, edict, dict, evaluation dictionary
       @ Out, confidence, float, the confidence
     """
-    if type(edict) != dict:
+    if not utils.isAMapping(edict):
       self.raiseAnError(IOError,'method "confidence". The inquiring set needs to be provided through a dictionary. Type of the in-object is ' + str(type(edict)))
     names, values   = list(edict.keys()), list(edict.values())
     for index in range(len(values)):
@@ -218,7 +263,23 @@ class supervisedLearning(utils.metaclass_insert(abc.ABCMeta),MessageHandler.Mess
       @ In, edict, dict, evaluation dictionary
       @ Out, evaluate, numpy.array, evaluated points
     """
-    if type(edict) != dict:
+    return self.__evaluateLocal__(self._evaluationMatrix(edict))
+
+  def evaluateSlices(self,edict):
+    """
+      Method to evaluate at once all the slices of a chain of ROMs trained with trainSlices
+      @ In, edict, dict, evaluation dictionary
+      @ Out, evaluate, dict, {target:np.array, shape = [n_samples,n_slices]}, the evaluated points
+    """
+    return self.__evaluateSlicesLocal__(self._evaluationMatrix(edict))
+
+  def _evaluationMatrix(self,edict):
+    """
+      Method to translate an evaluation dictionary into the (normalized) feature matrix
+      @ In, edict, dict, evaluation dictionary
+      @ Out, featureValues, np.array, shape = [n_samples,n_features], the normalized feature values
+    """
+    if not utils.isAMapping(edict):
       self.raiseAnError(IOError,'method "evaluate". The evaluate request/s need/s to be provided through a dictionary. Type of the in-object is ' + str(type(edict)))
     names, values  = list(edict.keys()), list(edict.values())
     for index in range(len(values)):
@@ -235,7 +296,7 @@ class supervisedLearning(utils.metaclass_insert(abc.ABCMeta),MessageHandler.Mess
         if not resp[0]:
           self.raiseAnError(IOError,'In training set for feature '+feat+':'+resp[1])
         featureValues[:,cnt] = ((values[names.index(feat)] - self.muAndSigmaFeatures[feat][0]))/self.muAndSigmaFeatures[feat][1]
-    return self.__evaluateLocal__(featureValues)
+    return featureValues
 
   def reset(self):
     """
@@ -311,6 +372,35 @@ class supervisedLearning(utils.metaclass_insert(abc.ABCMeta),MessageHandler.Mess
     """
     return self._dynamicHandling
 
+  def canWarmStart(self):
+    """
+      This method tells if this ROM can be retrained (e.g. with an enlarged training set) starting from its
+      current trained state, instead of being reset first. Overwrite in the inheriting classes as needed.
+      @ In, None
+      @ Out, canWarmStart, bool, True if the ROM does not need to be reset before being retrained
+    """
+    return False
+
+  def canTrainSlicesTogether(self):
+    """
+      This method tells if a chain of copies of this ROM, one for each value of the pivot parameter (see LearningGate),
+      can be trained and evaluated at once when the slices share the same feature values (e.g. factoring the
+      feature matrix only once). Overwrite in the inheriting classes implementing __trainSlicesLocal__ and __evaluateSlicesLocal__.
+      @ In, None
+      @ Out, canTrainSlicesTogether, bool, True if trainSlices and evaluateSlices can be used
+    """
+    return False
+
+  def canEvaluateBatch(self):
+    """
+      This method tells if several samples can be evaluated at once with a single call to evaluate, i.e. if
+      the ROM returns one value (or one history, for dynamic ROMs) per target for each of the requested points.
+      Overwrite in the inheriting classes as needed.
+      @ In, None
+      @ Out, canEvaluateBatch, bool, True if a batch of samples can be evaluated at once
+    """
+    return not self.isDynamic()
+
   def reseed(self,seed):
     """
       Used to reset the seed of the ROM.  By default does nothing; overwrite in the inheriting classes as needed.
@@ -330,6 +420,24 @@ class supervisedLearning(utils.metaclass_insert(abc.ABCMeta),MessageHandler.Mess
         associated with the corresponding points in featureVals
     """
 
+  def __trainSlicesLocal__(self,featureVals,targetVals):
+    """
+      Perform the training of all the slices of a chain of ROMs at once (see canTrainSlicesTogether).
+      @ In, featureVals, np.array, shape=[n_samples, n_features], an array of input feature values
+      @ In, targetVals, np.array, shape = [n_samples,n_slices,n_targets], an array of output target
+        associated with the corresponding points in featureVals, for each slice
+      @ Out, None
+    """
+    self.raiseAnError(NotImplementedError,'The ROM of type '+str(self.printTag)+' can not train the slices of a chain of ROMs at once!')
+
+  def __evaluateSlicesLocal__(self,featureVals):
+    """
+      Evaluates all the slices of a chain of ROMs at once (see canTrainSlicesTogether).
+      @ In, featureVals, np.array, 2-D numpy array [n_samples,n_features]
+      @ Out, returnDict, dict, {target:np.array, shape = [n_samples,n_slices]}, the evaluated points
+    """
+    self.raiseAnError(NotImplementedError,'The ROM of type '+str(self.printTag)+' can not evaluate the slices of a chain of ROMs at once!')
+
   @abc.abstractmethod
   def __confidenceLocal__(self,featureVals):
     """
@@ -26,17 +26,8 @@ from __future__ import absolute_import
 # 'from Samplers.Sampler import Sampler' outside of this submodule
 from .SupervisedLearning import supervisedLearning
 
-from .ARMA               import ARMA
-from .GaussPolynomialRom import GaussPolynomialRom
-from .HDMRRom            import HDMRRom
-from .MSR                import MSR
-from .NDinterpolatorRom  import NDinterpolatorRom
-from .NDinvDistWeight    import NDinvDistWeight
-from .NDsplineRom        import NDsplineRom
-from .SciKitLearn        import SciKitLearn
-from .pickledROM         import pickledROM
-from .PolyExponential    import PolyExponential
-from .DynamicModeDecomposition import DynamicModeDecomposition
+# Only the base class is imported here, the specific ROMs are imported by the
+# Factory when an input asks for them (e.g. 'from SupervisedLearning.ARMA import ARMA')
 
 # Factory methods
 from .Factory import knownTypes
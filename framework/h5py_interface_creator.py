@@ -62,6 +62,264 @@ def _loads(val):
   else:
     return pk.loads(val)
 
+#
+#  ***************************
+#  *  COLUMNAR STORAGE CLASS  *
+#  ***************************
+#
+
+class ColumnarStore(object):
+  """
+    Append-only storage of non-hierarchical (MC-type) realizations in a HDF5 group.
+    Each variable is stored in a chunked, resizable dataset (the values of all the realizations,
+    flattened and concatenated), along with a compact index: the names of the realizations and,
+    only for the variables that are not scalars, the shape of each value.
+    The variables are stored as:
+    - 'float': the numbers (as in the per-group layout, ints are stored as floats)
+    - 'str': the strings
+    - 'pickle': anything else (e.g. booleans), the bytes of one pickled array per realization
+    Next to the shapes, the offset of the first value of each realization is stored, so that reading
+    a single realization does not depend on the number of realizations stored before it.
+  """
+  ## attribute identifying the groups containing a ColumnarStore
+  marker = 'RAVEN_columnar'
+  ## number of values per chunk of the datasets
+  chunkSize = 4096
+
+  def __init__(self, group, create=False):
+    """
+      Constructor
+      @ In, group, h5py.Group, the group containing the storage
+      @ In, create, bool, optional, True to set up a new (empty) storage in the group
+      @ Out, None
+    """
+    self.group = group
+    if create:
+      group.attrs[self.marker] = True
+      group.create_dataset('names', shape=(0,), maxshape=(None,), chunks=(self.chunkSize,), dtype=h5.special_dtype(vlen=str))
+      self.columns = []
+      self.__saveColumns()
+    else:
+      self.columns = _loads(group.attrs['columns'])
+    ## {variable name: column index}
+    self.columnIndex = dict((column['name'],c) for c,column in enumerate(self.columns))
+
+  def __len__(self):
+    """
+      Number of realizations in the storage
+      @ In, None
+      @ Out, len, int, the number of realizations
+    """
+    return self.group['names'].shape[0]
+
+  def __saveColumns(self):
+    """
+      Stores the description of the columns (only needed when columns are added or changed)
+      @ In, None
+      @ Out, None
+    """
+    self.group.attrs['columns'] = _dumps(self.columns)
+
+  @staticmethod
+  def _columnKind(value):
+    """
+      Determines how a value is stored
+      @ In, value, np.ndarray, the value
+      @ Out, kind, str, 'float', 'str' or 'pickle'
+    """
+    if value.dtype.kind in 'iuf':
+      return 'float'
+    if value.dtype.kind in 'US' or (value.dtype.kind == 'O' and all(utils.isString(v) for v in value.ravel())):
+      return 'str'
+    return 'pickle'
+
+  @staticmethod
+  def _readStrings(dataset, selection=slice(None)):
+    """
+      Reads the strings stored in a dataset (h5py may return them as bytes)
+      @ In, dataset, h5py.Dataset, the dataset
+      @ In, selection, slice, optional, the part to read
+      @ Out, strings, np.ndarray, the strings
+    """
+    if hasattr(dataset, 'asstr'):
+      return np.asarray(dataset.asstr()[selection], dtype=object).astype(str)
+    return np.asarray(dataset[selection], dtype=object).astype(str)
+
+  def names(self):
+    """
+      Returns the names of the realizations, in insertion order
+      @ In, None
+      @ Out, names, list, the names
+    """
+    return list(self._readStrings(self.group['names']))
+
+  def __addColumn(self, name, value, numRows):
+    """
+      Adds a column for a new variable
+      @ In, name, str, the variable name
+      @ In, value, np.ndarray, a value of the variable (to determine its kind)
+      @ In, numRows, int, the number of realizations (without this variable) already stored
+      @ Out, None
+    """
+    c = len(self.columns)
+    kind = self._columnKind(value)
+    if kind == 'pickle':
+      # the shape of a pickled value is the number of bytes
+      column = {'name':name, 'kind':kind, 'ndim':1, 'scalar':False}
+      dtype = np.uint8
+    else:
+      column = {'name':name, 'kind':kind, 'ndim':value.ndim, 'scalar':numRows == 0 and value.shape == (1,)}
+      dtype = float if kind == 'float' else h5.special_dtype(vlen=str)
+    self.group.create_dataset('values{}'.format(c), shape=(0,), maxshape=(None,), chunks=(self.chunkSize,), dtype=dtype)
+    if not column['scalar']:
+      # the rows stored so far do not have this variable
+      self.__createIndex(c, np.zeros((numRows,column['ndim']),dtype=int), np.zeros(numRows,dtype=int))
+    self.columns.append(column)
+    self.columnIndex[name] = c
+
+  def __unscalarize(self, c, numRows):
+    """
+      Adds the shapes to a column of scalars (every row so far has a single value)
+      @ In, c, int, the column index
+      @ In, numRows, int, the number of rows already stored
+      @ Out, None
+    """
+    column = self.columns[c]
+    self.__createIndex(c, np.ones((numRows,column['ndim']),dtype=int), np.arange(numRows))
+    column['scalar'] = False
+
+  def __createIndex(self, c, shapes, offsets):
+    """
+      Creates the datasets of the shapes and offsets of the values of a column
+      @ In, c, int, the column index
+      @ In, shapes, np.ndarray, shape = [numRows,ndim], the shapes of the values of the rows already stored
+      @ In, offsets, np.ndarray, shape = [numRows], the offsets of the values of the rows already stored
+      @ Out, None
+    """
+    ndim = shapes.shape[1]
+    self.group.create_dataset('shapes{}'.format(c), data=shapes, maxshape=(None,ndim), chunks=(self.chunkSize,ndim))
+    self.group.create_dataset('offsets{}'.format(c), data=offsets, maxshape=(None,), chunks=(self.chunkSize,))
+
+  def append(self, names, rlzs):
+    """
+      Appends realizations to the storage
+      @ In, names, list(str), the names of the realizations
+      @ In, rlzs, list(dict), the realizations, as {var:np.ndarray}
+      @ Out, None
+    """
+    numRows = len(self)
+    numNew = len(rlzs)
+    columnsChanged = False
+    for rlz in rlzs:
+      for var,value in rlz.items():
+        if var not in self.columnIndex:
+          self.__addColumn(var, value, numRows)
+          columnsChanged = True
+    # index
+    namesDataset = self.group['names']
+    namesDataset.resize((numRows+numNew,))
+    namesDataset[numRows:] = np.asarray(names, dtype=object)
+    # columns
+    for c,column in enumerate(self.columns):
+      values = [rlz.get(column['name']) for rlz in rlzs]
+      valuesDataset = self.group['values{}'.format(c)]
+      if column['kind'] == 'pickle':
+        values = [None if value is None else np.frombuffer(pk.dumps(value), dtype=np.uint8) for value in values]
+      if column['scalar'] and any(value is None or value.shape != (1,) for value in values):
+        self.__unscalarize(c, numRows)
+        columnsChanged = True
+      start = valuesDataset.shape[0]
+      if not column['scalar']:
+        shapes = np.zeros((numNew,column['ndim']),dtype=int)
+        for r,value in enumerate(values):
+          if value is not None:
+            if value.ndim != column['ndim']:
+              raise IOError('Variable "{}" has {} dimensions, but was stored with {} dimensions!'.format(column['name'],value.ndim,column['ndim']))
+            shapes[r] = value.shape
+        shapesDataset = self.group['shapes{}'.format(c)]
+        shapesDataset.resize((numRows+numNew,column['ndim']))
+        shapesDataset[numRows:] = shapes
+        ends = start + np.cumsum(np.prod(shapes,axis=1))
+        offsetsDataset = self.group['offsets{}'.format(c)]
+        offsetsDataset.resize((numRows+numNew,))
+        offsetsDataset[numRows:] = ends - np.prod(shapes,axis=1)
+      present = [value.ravel() for value in values if value is not None]
+      flat = np.concatenate(present) if len(present) > 0 else np.zeros(0)
+      if column['kind'] == 'float':
+        try:
+          flat = flat.astype(float)
+        except (TypeError, ValueError):
+          raise IOError('Variable "{}" was stored as a number, but got values {}!'.format(column['name'],flat))
+      elif column['kind'] == 'pickle':
+        flat = flat.astype(np.uint8)
+      else:
+        flat = flat.astype(str).astype(object)
+      valuesDataset.resize((start+len(flat),))
+      valuesDataset[start:] = flat
+    if columnsChanged:
+      self.__saveColumns()
+
+  def __readColumn(self, c):
+    """
+      Reads a whole column
+      @ In, c, int, the column index
+      @ Out, rows, list, the value (np.ndarray) of each realization (None where the variable is missing)
+    """
+    column = self.columns[c]
+    valuesDataset = self.group['values{}'.format(c)]
+    numRows = len(self)
+    if column['kind'] == 'str':
+      values = self._readStrings(valuesDataset)
+    else:
+      values = valuesDataset[:]
+    if column['scalar']:
+      # one view per row
+      return list(values.reshape(numRows,1))
+    shapes = self.group['shapes{}'.format(c)][:]
+    sizes = np.prod(shapes, axis=1)
+    rows = np.split(values, np.cumsum(sizes)[:-1]) if numRows > 0 else []
+    if column['kind'] == 'pickle':
+      return [pk.loads(row.tobytes()) if sizes[r] > 0 else None for r,row in enumerate(rows)]
+    return [row.reshape(shapes[r]) if sizes[r] > 0 else None for r,row in enumerate(rows)]
+
+  def readAll(self):
+    """
+      Reads all the realizations, one dataset read per variable
+      @ In, None
+      @ Out, rlzs, list(dict), the realizations, in insertion order
+    """
+    rlzs = [{} for _ in range(len(self))]
+    for c,column in enumerate(self.columns):
+      for rlz,value in zip(rlzs,self.__readColumn(c)):
+        if value is not None:
+          rlz[column['name']] = value
+    return rlzs
+
+  def readRow(self, row):
+    """
+      Reads a single realization
+      @ In, row, int, the index of the realization
+      @ Out, rlz, dict, the realization
+    """
+    rlz = {}
+    for c,column in enumerate(self.columns):
+      valuesDataset = self.group['values{}'.format(c)]
+      if column['scalar']:
+        shape, begin = (1,), row
+      else:
+        shape = self.group['shapes{}'.format(c)][row]
+        begin = int(self.group['offsets{}'.format(c)][row])
+      size = int(np.prod(shape))
+      if size == 0:
+        continue
+      if column['kind'] == 'str':
+        rlz[column['name']] = np.reshape(self._readStrings(valuesDataset, slice(begin,begin+size)), shape)
+      elif column['kind'] == 'pickle':
+        rlz[column['name']] = pk.loads(valuesDataset[begin:begin+size].tobytes())
+      else:
+        rlz[column['name']] = np.reshape(valuesDataset[begin:begin+size], shape)
+    return rlz
+
 #
 #  *************************
 #  *  HDF5 DATABASE CLASS  *
@@ -113,6 +371,16 @@ class hdf5Database(MessageHandler.MessageUser):
     # Dictonary of boolean variables, true if the corresponding group in self.allGroupPaths
     # is an ending group (no sub-groups appended), false otherwise
     self.allGroupEnds = {}
+    # The non-hierarchical (MC) realizations are stored in columns (see ColumnarStore), one storage per root group
+    # {path of the storage: ColumnarStore}
+    self.columnarStores = {}
+    # Names of the realizations stored in columns (in insertion order) and {name: (path of the storage, row)}
+    self.columnarNames = []
+    self.columnarIndex = {}
+    # Realizations waiting to be appended (all at once) to the storage of the current root group, [(name,rlz)]
+    self.pendingRealizations = []
+    # Number of realizations appended at once
+    self.appendBatchSize = 256
     # We can create a base empty database or we open an existing one
     if self.fileExist:
       # self.h5FileW is the HDF5 object. Open the database in "update" mode
@@ -157,6 +425,19 @@ class hdf5Database(MessageHandler.MessageUser):
     else:
       self.h5FileW.visititems(self.__isGroup)
     self.raiseAMessage('TOTAL NUMBER OF GROUPS = ' + str(len(self.allGroupPaths)))
+    # load the index of the realizations stored in columns
+    self.columnarStores = {}
+    self.columnarNames = []
+    self.columnarIndex = {}
+    if 'columnarStores' in self.h5FileW.attrs:
+      for path in _loads(self.h5FileW.attrs['columnarStores']):
+        store = ColumnarStore(self.h5FileW[path])
+        self.columnarStores[path] = store
+        names = store.names()
+        self.columnarNames.extend(names)
+        self.columnarIndex.update((name,(path,row)) for row,name in enumerate(names))
+    if len(self.columnarNames) > 0:
+      self.raiseAMessage('TOTAL NUMBER OF REALIZATIONS STORED IN COLUMNS = ' + str(len(self.columnarNames)))
 
   def __isGroup(self,name,obj):
     """
@@ -166,7 +447,7 @@ class hdf5Database(MessageHandler.MessageUser):
       @ In, obj, object, the object itself
       @ Out, None
     """
-    if isinstance(obj,h5.Group):
+    if isinstance(obj,h5.Group) and ColumnarStore.marker not in obj.attrs:
       self.allGroupPaths.append(name)
       try:
         self.allGroupEnds[name]  = obj.attrs["endGroup"]
@@ -206,12 +487,7 @@ class hdf5Database(MessageHandler.MessageUser):
       @ Out, None
     """
     parentID  = rlz.get("RAVEN_parentID",[None])[0]
-    prefix    = rlz.get("prefix")
-    if prefix is not None:
-      groupName = str(prefix[0] if not utils.isString(prefix) else prefix)
-    else:
-      # this can happen when we want to add sampler generated data (e.g. LimitSurface) in the database
-      groupName = str(len(self.allGroupPaths))
+    groupName = self.__groupName(rlz)
     if parentID:
       #If Hierarchical structure, firstly add the root group
       if not self.firstRootGroup or parentID == "None":
@@ -222,14 +498,104 @@ class hdf5Database(MessageHandler.MessageUser):
         # Add sub group in the Hierarchical structure
         self.__addSubGroup(groupName,rlz)
     else:
-      # Parallel structure (always root level)
-      self.__addGroupRootLevel(groupName,rlz)
+      # Parallel structure (always root level), stored in columns
+      self.__addColumnarRealization(groupName,rlz)
       self.firstRootGroup = True
       self.type = 'MC'
+      return
     self.h5FileW.attrs['allGroupPaths'] = _dumps(self.allGroupPaths)
     self.h5FileW.attrs['allGroupEnds'] = _dumps(self.allGroupEnds)
     self.h5FileW.flush()
 
+  def addGroups(self,rlzs):
+    """
+      Function to add several groups into the database (e.g. a bulk load). The non-hierarchical realizations
+      are appended to the columns with a single write, whatever their number
+      @ In, rlzs, list(dict), the realizations (see addGroup)
+      @ Out, None
+    """
+    for rlz in rlzs:
+      if rlz.get("RAVEN_parentID",[None])[0]:
+        self.addGroup(rlz)
+      else:
+        self.__addColumnarRealization(self.__groupName(rlz),rlz,autoFlush=False)
+        self.firstRootGroup = True
+        self.type = 'MC'
+    self.flush()
+
+  def __groupName(self,rlz):
+    """
+      Function to get the name of the group of a realization
+      @ In, rlz, dict, dictionary with the data and metadata to add
+      @ Out, groupName, string, the group name
+    """
+    prefix = rlz.get("prefix")
+    if prefix is not None:
+      groupName = str(prefix[0] if not utils.isString(prefix) else prefix)
+    else:
+      # this can happen when we want to add sampler generated data (e.g. LimitSurface) in the database
+      groupName = str(len(self.allGroupPaths))
+    return groupName
+
+  def __addColumnarRealization(self,name,rlz,autoFlush=True):
+    """
+      Function to add a non-hierarchical realization into the database. The realizations
+      are buffered and appended to the columns of the current root group all at once (see flush)
+      @ In, name, string, realization name
+      @ In, rlz, dict, dictionary with the data and metadata to add
+      @ In, autoFlush, bool, optional, True to write the buffer when it holds appendBatchSize realizations
+      @ Out, None
+    """
+    if name in self.columnarIndex or self.__returnGroupPath(name) != '-$':
+      # the realization already exists
+      name = name + "_" + name
+    if self.variables is not None:
+      # check if all variables are contained in the rlz dictionary
+      if not set(self.variables).issubset(rlz.keys()):
+        self.raiseAnError(IOError, "Not all the requested variables have been passed in the realization. Missing are: "+
+                          ",".join(list(set(self.variables).symmetric_difference(set(rlz.keys())))))
+    # as in the per-group layout, only the requested numeric variables are filtered
+    data = {}
+    for key,value in rlz.items():
+      value = np.atleast_1d(value)
+      if self.variables is None or key in self.variables or value.dtype.kind not in 'iuf':
+        data[key] = value
+    path, store = self.__currentColumnarStore()
+    self.columnarNames.append(name)
+    self.columnarIndex[name] = (path, len(store)+len(self.pendingRealizations))
+    self.pendingRealizations.append((name,data))
+    if autoFlush and len(self.pendingRealizations) >= self.appendBatchSize:
+      self.flush()
+
+  def __currentColumnarStore(self):
+    """
+      Function to get the storage of the non-hierarchical realizations of the current root group,
+      creating it if needed
+      @ In, None
+      @ Out, (path, store), tuple, the path of the storage and the storage (ColumnarStore)
+    """
+    parentName = self.parentGroupName
+    if isinstance(parentName,bytes):
+      parentName = parentName.decode()
+    path = parentName.rstrip('/') + '/RAVEN_realizations'
+    if path not in self.columnarStores:
+      group = self.h5FileW.require_group(parentName).create_group('RAVEN_realizations')
+      self.columnarStores[path] = ColumnarStore(group, create=True)
+      self.h5FileW.attrs['columnarStores'] = _dumps(list(self.columnarStores.keys()))
+    return path, self.columnarStores[path]
+
+  def flush(self):
+    """
+      Function to write the buffered realizations to the database file
+      @ In, None
+      @ Out, None
+    """
+    if len(self.pendingRealizations) > 0:
+      _, store = self.__currentColumnarStore()
+      names, rlzs = zip(*self.pendingRealizations)
+      store.append(list(names), list(rlzs))
+      self.pendingRealizations = []
+    self.h5FileW.flush()
 
   def addGroupInit(self,groupName,attributes=None):
     """
@@ -241,6 +607,8 @@ class hdf5Database(MessageHandler.MessageUser):
       @ Out, None
     """
     attribs = {} if attributes is None else attributes
+    # the buffered realizations belong to the previous root group
+    self.flush()
     groupNameInit = groupName+"_"+datetime.now().strftime("%m-%d-%Y-%H-%S")
     for index in range(len(self.allGroupPaths)):
       comparisonName = self.allGroupPaths[index]
@@ -464,6 +832,8 @@ class hdf5Database(MessageHandler.MessageUser):
         allHistoryPaths = [k for k, v in self.allGroupPaths.items() if v ]
       else:
         allHistoryPaths = [k for k, v in self.allGroupPaths.items() if v and k.endswith(rname)]
+    # the realizations stored in columns are identified by the storage path and their name
+    allHistoryPaths = list(allHistoryPaths) + [self.columnarIndex[name][0]+'/'+name for name in self.columnarNames if not rootName or name.endswith(rname)]
     return allHistoryPaths
 
   def retrieveAllHistoryNames(self,rootName=None):
@@ -480,9 +850,28 @@ class hdf5Database(MessageHandler.MessageUser):
       workingList = [k.split('/')[-1] for k, v in self.allGroupEnds.items() if v ]
     else:
       workingList = [k.split('/')[-1] for k, v in self.allGroupEnds.items() if v and k.endswith(rname)]
+    workingList.extend(name for name in self.columnarNames if not rootName or name.endswith(rname))
 
     return workingList
 
+  def retrieveAllRealizations(self):
+    """
+      Function to retrieve all the realizations present in the database. The realizations stored
+      in columns are read with one read per variable.
+      @ In, None
+      @ Out, realizations, list, list of (name, realization dict) tuples
+    """
+    if not self.fileOpen:
+      self.__createObjFromFile()
+    else:
+      self.flush()
+    realizations = []
+    for store in self.columnarStores.values():
+      realizations.extend(zip(store.names(), store.readAll()))
+    for name in [k.split('/')[-1] for k, v in self.allGroupEnds.items() if v]:
+      realizations.append((name, self._getRealizationByName(name)[0]))
+    return realizations
+
   def __getListOfParentGroups(self, grp, backGroups = []):
     """
       Method to get the list of groups from the deepest to the root, given a certain group
@@ -543,6 +932,13 @@ class hdf5Database(MessageHandler.MessageUser):
     # and create the "self.allGroupPaths" list from the existing database
     if not self.fileOpen:
       self.__createObjFromFile()
+    # the realizations stored in columns are never hierarchical
+    if name in self.columnarIndex:
+      self.flush()
+      storePath, row = self.columnarIndex[name]
+      newData = self.columnarStores[storePath].readRow(row)
+      attrs = {'nVars':len(newData.keys()),'varKeys':newData.keys()}
+      return(newData,attrs)
     # Find the endGroup that coresponds to the given name
     path = self.__returnGroupPath(name)
     found = path != '-$'
@@ -577,6 +973,8 @@ class hdf5Database(MessageHandler.MessageUser):
       @ In,  None
       @ Out, None
     """
+    if self.fileOpen:
+      self.flush()
     self.h5FileW.close()
     self.fileOpen       = False
     return
@@ -129,22 +129,24 @@ class unSupervisedLearning(utils.metaclass_insert(abc.ABCMeta), MessageHandler.M
     ## The normalized training data
     self.normValues = None
 
-  def train(self, tdict, metric = None):
+  def train(self, tdict, metric = None, pool = None):
     """
       Method to perform the training of the unSuperVisedLearning algorithm
       NB. The unSuperVisedLearning object is committed to convert the dictionary
       that is passed (in), into the local format the interface with the kernels
       requires. So far the base class will do the translation into numpy.
       @ In, tdict, dict, training dictionary
+      @ In, metric, MetricDistributor, optional, the metric between the realizations (or histories)
+      @ In, pool, Runners.ProcessPool, optional, pool of processes the metric can use for the pairs of histories
       @ Out, None
     """
 
     self.metric = metric
-    if type(tdict) != dict:
+    if not utils.isAMapping(tdict):
       self.raiseAnError(IOError, ' method "train". The training set needs to be provided through a dictionary. Type of the in-object is ' + str(type(tdict)))
 
     featureCount = len(self.features)
-    if not isinstance(tdict[utils.first(tdict.keys())],dict):
+    if not utils.isAMapping(tdict[utils.first(tdict.keys())]):
       realizationCount = utils.first(tdict.values()).size
 
     ############################################################################
@@ -216,29 +218,14 @@ class unSupervisedLearning(utils.metaclass_insert(abc.ABCMeta), MessageHandler.M
             (mu,sigma) = mathUtils.normalizationFactors(tdict[key][var])
             tdictNorm[key][var] = (tdict[key][var]-mu)/sigma
 
-        cardinality = len(tdictNorm.keys())
-        self.normValues = np.zeros((cardinality,cardinality))
+        # process the input data for the metric, a numpy.array (numParams, numSteps) per history is required
         keys = list(tdictNorm.keys())
-        for i in range(cardinality):
-          for j in range(i,cardinality):
-            # process the input data for the metric, numpy.array is required
-            assert(list(tdictNorm[keys[i]].keys()) == list(tdictNorm[keys[j]].keys()))
-            numParamsI = len(tdictNorm[keys[i]].keys())
-            numStepsI = len(utils.first(tdictNorm[keys[i]].values()))
-            numStepsJ = len(utils.first(tdictNorm[keys[j]].values()))
-
-            inputI = np.empty((numParamsI, numStepsI))
-            inputJ = np.empty((numParamsI, numStepsJ))
-            for ind, params in enumerate(tdictNorm[keys[i]].keys()):
-              valueI = tdictNorm[keys[i]][params]
-              valueJ = tdictNorm[keys[j]][params]
-              inputI[ind] = valueI
-              inputJ[ind] = valueJ
-            pairedData = ((inputI,None), (inputJ,None))
-            # FIXME: Using loops can be very slow for large number of realizations
-            self.normValues[i][j] = metric.evaluate(pairedData)
-            if i != j:
-              self.normValues[j][i] = self.normValues[i][j]
+        params = list(tdictNorm[keys[0]].keys()) if len(keys) > 0 else []
+        histories = []
+        for key in keys:
+          assert(list(tdictNorm[key].keys()) == params)
+          histories.append(np.asarray([tdictNorm[key][param] for param in params]))
+        self.normValues = metric.evaluatePairwiseHistories(histories, pool)
       else:
         ## PointSet
         normValues = np.zeros(shape = (realizationCount, featureCount))
@@ -265,7 +252,7 @@ class unSupervisedLearning(utils.metaclass_insert(abc.ABCMeta), MessageHandler.M
       @ In, edict, dict, evaluation dictionary
       @ Out, evaluation, numpy.array, array of evaluated points
     """
-    if type(edict) != dict:
+    if not utils.isAMapping(edict):
       self.raiseAnError(IOError, ' Method "evaluate". The evaluate request/s need/s to be provided through a dictionary. Type of the in-object is ' + str(type(edict)))
 
     names = edict.keys()
@@ -795,7 +782,7 @@ class temporalSciKitLearn(unSupervisedLearning):
     """
     ## need to overwrite train method because time dependent data mining
     ## requires different treatment of input
-    if type(tdict) != dict:
+    if not utils.isAMapping(tdict):
       self.raiseAnError(IOError, ' method "train". The training set needs to be provided through a dictionary. Type of the in-object is ' + str(type(tdict)))
 
     names = list(tdict.keys())
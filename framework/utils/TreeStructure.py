@@ -611,6 +611,7 @@ class HierarchicalNode(MessageHandler.MessageUser):
     self.depth     = 0
     self.messageHandler = messageHandler
     self.iterCounter = 0
+    self._nodeIndex = None # the name->nodes index of the tree this node belongs to (see HierarchicalTree.getNode)
 
   def __eq__(self,other):
     """
@@ -713,6 +714,7 @@ class HierarchicalNode(MessageHandler.MessageUser):
     else:
       node.depth      = self.depth + 1
     self._branches.append(node)
+    node._registerInIndex(self._nodeIndex)
 
   def updateDepth(self):
     """
@@ -737,6 +739,8 @@ class HierarchicalNode(MessageHandler.MessageUser):
       nod.parentname = self.name
       nod.parent     = self
     self._branches.extend(nodes)
+    for nod in nodes:
+      nod._registerInIndex(self._nodeIndex)
 
   def insertBranch(self, pos, node):
     """
@@ -748,6 +752,7 @@ class HierarchicalNode(MessageHandler.MessageUser):
     node.parentname = self.name
     node.parent     = self
     self._branches.insert(pos, node)
+    node._registerInIndex(self._nodeIndex)
 
   def removeBranch(self, node):
     """
@@ -756,6 +761,43 @@ class HierarchicalNode(MessageHandler.MessageUser):
       @ Out, None
     """
     self._branches.remove(node)
+    node._unregisterFromIndex()
+
+  def _registerInIndex(self, nodeIndex):
+    """
+      Method used to register this node and all its subnodes in the name->nodes index of a tree
+      @ In, nodeIndex, dict, the index {name:[nodes]}, if None, nothing is done
+      @ Out, None
+    """
+    if nodeIndex is None:
+      return
+    for nod in self.iter():
+      nod._nodeIndex = nodeIndex
+      nodeIndex.setdefault(nod.name,[]).append(nod)
+
+  def _unregisterFromIndex(self):
+    """
+      Method used to remove this node and all its subnodes from the name->nodes index they are registered in
+      @ In, None
+      @ Out, None
+    """
+    for nod in self.iter():
+      nod._dropIndexEntry()
+      nod._nodeIndex = None
+
+  def _dropIndexEntry(self):
+    """
+      Method used to remove this node (only) from the name->nodes index it is registered in
+      @ In, None
+      @ Out, None
+    """
+    if self._nodeIndex is None:
+      return
+    sameName = [other for other in self._nodeIndex.get(self.name,[]) if other is not self]
+    if sameName:
+      self._nodeIndex[self.name] = sameName
+    else:
+      self._nodeIndex.pop(self.name,None)
 
   def findBranch(self, path):
     """
@@ -796,6 +838,8 @@ class HierarchicalNode(MessageHandler.MessageUser):
       @ Out, None
     """
     self.values.clear()
+    for nod in self._branches:
+      nod._unregisterFromIndex()
     self._branches = []
 
   def get(self, key, default=None):
@@ -1009,8 +1053,11 @@ class HierarchicalTree(MessageHandler.MessageUser):
       raise(IOError,'Tried to initialize NodeTree without a message handler!  Was given: '+str(messageHandler))
     self.messageHandler = messageHandler
     self._rootnode = node
+    # index of the nodes by name {name:[nodes]}, kept up to date when branches are appended to/removed from the nodes
+    self._nodeIndex = {}
     if node:
       node.parentname='root'
+      node._registerInIndex(self._nodeIndex)
 
   def getrootnode(self):
     """
@@ -1026,7 +1073,11 @@ class HierarchicalTree(MessageHandler.MessageUser):
       @ In, node, Node, the newer node
       @ Out, None
     """
+    if self._rootnode:
+      self._rootnode._unregisterFromIndex()
     self._rootnode = node
+    if node:
+      node._registerInIndex(self._nodeIndex)
 
   def updateNodeName(self,path, newName):
     """
@@ -1040,7 +1091,11 @@ class HierarchicalTree(MessageHandler.MessageUser):
     else:
       node = self.find(path)
     if node != None:
+      # the node is re-indexed under its new name
+      node._dropIndexEntry()
       node.name = newName
+      if node._nodeIndex is not None:
+        node._nodeIndex.setdefault(newName,[]).append(node)
 
   def iter(self, name=None):
     """
@@ -1053,6 +1108,17 @@ class HierarchicalTree(MessageHandler.MessageUser):
     else:
       return self._rootnode.iter(name)
 
+  def getNode(self, name):
+    """
+      Method to get a node of the tree given its name, in constant time (the nodes are indexed by name
+      when they are appended to the tree). If several nodes share the same name, the first one
+      that has been appended is returned.
+      @ In, name, string, the node name
+      @ Out, node, Node, the node (None if not found)
+    """
+    nodes = self._nodeIndex.get(name)
+    return nodes[0] if nodes else None
+
   def iterEnding(self):
     """
       Method for creating a tree iterator for the root node (ending branches)
@@ -23,6 +23,7 @@ warnings.simplefilter('default',DeprecationWarning)
 #----- end python 2 - 3 compatibility
 #External Modules------------------------------------------------------------------------------------
 import sys
+import copy
 import threading
 from numpy import ndarray
 import numpy as np
@@ -388,3 +389,431 @@ class cNDarray(object):
     assert(abs(index) < self.width)
     self.values = np.delete(self.values,index,axis=1)
     self.width -= 1
+
+#
+#
+#
+#
+class cColumn(object):
+  """
+    Cached column of single-valued entries (one per sample), stored in a typed np.ndarray.
+    The type is set by the first entry (float, int, bool, or object for strings and anything else), and the
+    column falls back to object type if an incompatible entry is added later on.
+  """
+  ## types of entries that can be stored in each kind of typed column without changing their value
+  _accepted = {'f':(float,int,np.floating,np.integer),
+               'i':(int,np.integer),
+               'u':(int,np.integer),
+               'b':(bool,np.bool_)}
+  ## types of entries that can be stored in object columns without copying them, since they cannot be changed
+  _immutable = (str,bytes,bool,int,float,complex,np.generic,type(None))
+
+  def __init__(self,values=None,capacity=100,first=None):
+    """
+      Constructor.
+      @ In, values, np.ndarray, optional, 1D array of initial values (used as storage, not copied)
+      @ In, capacity, int, optional, if not using "values" then this is the initial capacity
+      @ In, first, object, optional, if not using "values", example entry used to choose the type of the column
+      @ Out, None
+    """
+    if values is not None:
+      # fixed-size strings would be truncated by longer entries
+      self.values = values if values.dtype.kind in 'biufO' else values.astype(object)
+      self.size = len(values)
+    else:
+      if isinstance(first,(bool,np.bool_)):
+        dtype = bool
+      elif isinstance(first,(int,np.integer)):
+        dtype = int
+      elif isinstance(first,(float,np.floating)):
+        dtype = float
+      else:
+        dtype = object
+      self.values = np.ndarray(capacity,dtype=dtype)
+      self.size = 0
+    self.accepted = self._accepted.get(self.values.dtype.kind,None) # None for object (accepts all)
+
+  def append(self,entry):
+    """
+      Appends an entry to the column.
+      @ In, entry, object, the entry
+      @ Out, None
+    """
+    if self.accepted is not None and not isinstance(entry,self.accepted):
+      self.toObject()
+    if self.size == len(self.values):
+      self._grow()
+    self.values[self.size] = self._store(entry)
+    self.size += 1
+
+  def get(self,index):
+    """
+      Returns an entry of the column.
+      @ In, index, int, the index of the entry (nonnegative)
+      @ Out, get, object, the entry
+    """
+    return self.values[index]
+
+  def set(self,index,entry):
+    """
+      Changes an entry of the column.
+      @ In, index, int, the index of the entry (nonnegative)
+      @ In, entry, object, the new entry
+      @ Out, None
+    """
+    if self.accepted is not None and not isinstance(entry,self.accepted):
+      self.toObject()
+    self.values[index] = self._store(entry)
+
+  def getData(self,start=0,end=None):
+    """
+      Returns the entries of the column, as a view (not a copy) of the storage.
+      @ In, start, int, optional, the first entry
+      @ In, end, int, optional, the entry following the last one (the used size if None)
+      @ Out, getData, np.ndarray, the entries up to the used size
+    """
+    end = self.size if end is None else min(end,self.size)
+    return self.values[start:end]
+
+  def _store(self,entry):
+    """
+      Returns the entry as it is stored in the column: the mutable entries of object columns (lists, dicts, arrays,
+      ...) are copied, so that the caller can reuse them without changing the stored data.
+      @ In, entry, object, the entry
+      @ Out, _store, object, the entry to store
+    """
+    if self.accepted is not None or isinstance(entry,self._immutable):
+      return entry
+    if isinstance(entry,np.ndarray):
+      return entry.copy()
+    return copy.deepcopy(entry)
+
+  def toObject(self):
+    """
+      Converts the column to object type, so that it accepts any kind of entry.
+      @ In, None
+      @ Out, None
+    """
+    self.values = self.values.astype(object)
+    self.accepted = None
+
+  def _grow(self):
+    """
+      Doubles the capacity of the column.
+      @ In, None
+      @ Out, None
+    """
+    newValues = np.ndarray(max(2*len(self.values),1),dtype=self.values.dtype)
+    newValues[:self.size] = self.values[:self.size]
+    self.values = newValues
+
+class cRaggedColumn(object):
+  """
+    Cached column of np.ndarray entries (one per sample, e.g. histories), whose values are stored contiguously in a
+    single flat buffer, together with the offset and shape of each entry.
+    If all the entries have the same shape, the whole column can be retrieved as a view (see getStacked).
+  """
+  def __init__(self,capacity=100,first=None,values=None):
+    """
+      Constructor.
+      @ In, capacity, int, optional, the initial capacity (number of samples)
+      @ In, first, np.ndarray, optional, example entry used to choose the type and size of the buffer
+      @ In, values, np.ndarray, optional, array with shape (#samples, ...) of initial entries all with the same
+        shape (used as storage if contiguous, not copied)
+      @ Out, None
+    """
+    if values is not None:
+      self.size = values.shape[0]
+      self.shapes = [values.shape[1:]]*self.size
+      entrySize = int(np.prod(values.shape[1:]))
+      if values.dtype != self._bufferType(values.dtype):
+        values = values.astype(object)
+      self.buffer = np.ascontiguousarray(values).reshape(-1)
+      self.offsets = np.arange(self.size+1)*entrySize
+    else:
+      self.size = 0
+      self.shapes = []
+      self.buffer = np.ndarray(capacity*max(first.size,1),dtype=self._bufferType(first.dtype))
+      self.offsets = np.zeros(capacity+1,dtype=int)
+
+  @staticmethod
+  def _bufferType(dtype):
+    """
+      Type of the buffer to store entries of the given type: numbers are stored as such, everything else as objects,
+      to prevent string sizing in numpy.
+      @ In, dtype, np.dtype, type of the entries
+      @ Out, _bufferType, np.dtype, type of the buffer
+    """
+    return dtype if dtype.kind in 'biuf' else np.dtype(object)
+
+  def append(self,entry):
+    """
+      Appends an entry to the column, copying its values in the buffer.
+      @ In, entry, np.ndarray, the entry
+      @ Out, None
+    """
+    start = self.offsets[self.size]
+    end = start + entry.size
+    if self.buffer.dtype != object and not np.can_cast(entry.dtype,self.buffer.dtype):
+      dtype = np.promote_types(self.buffer.dtype,entry.dtype) if entry.dtype.kind in 'biuf' else object
+      self.buffer = self.buffer.astype(dtype)
+    if end > len(self.buffer):
+      newBuffer = np.ndarray(max(2*len(self.buffer),end),dtype=self.buffer.dtype)
+      newBuffer[:start] = self.buffer[:start]
+      self.buffer = newBuffer
+    if self.size + 1 == len(self.offsets):
+      self.offsets = np.concatenate((self.offsets,np.zeros(len(self.offsets),dtype=int)))
+    self.buffer[start:end] = entry.ravel()
+    self.offsets[self.size+1] = end
+    self.shapes.append(entry.shape)
+    self.size += 1
+
+  def get(self,index):
+    """
+      Returns an entry of the column, as a view of the buffer.
+      @ In, index, int, the index of the entry (nonnegative)
+      @ Out, get, np.ndarray, the entry
+    """
+    return self.buffer[self.offsets[index]:self.offsets[index+1]].reshape(self.shapes[index])
+
+  def getData(self,start=0,end=None):
+    """
+      Returns the entries of the column, as an object array of views of the buffer.
+      @ In, start, int, optional, the first entry
+      @ In, end, int, optional, the entry following the last one (the used size if None)
+      @ Out, getData, np.ndarray, the entries up to the used size
+    """
+    end = self.size if end is None else min(end,self.size)
+    data = np.ndarray(max(end-start,0),dtype=object)
+    for index in range(start,end):
+      data[index-start] = self.get(index)
+    return data
+
+  def getStacked(self,start=0,end=None):
+    """
+      Returns the entries of the column as a single array with shape (#samples, ...), which is a view of the buffer,
+      if all the entries have the same shape.
+      @ In, start, int, optional, the first entry
+      @ In, end, int, optional, the entry following the last one (the used size if None)
+      @ Out, getStacked, np.ndarray or None, the entries (None if they do not have the same shape)
+    """
+    end = self.size if end is None else min(end,self.size)
+    if end <= start or any(shape != self.shapes[start] for shape in self.shapes[start:end]):
+      return None
+    return self.buffer[self.offsets[start]:self.offsets[end]].reshape((end-start,)+tuple(self.shapes[start]))
+
+class cColumnarArray(object):
+  """
+    Collector of samples made of several entities (variables), each one stored in its own cached column:
+    single-valued entities in typed columns (cColumn) and np.ndarray entities in contiguous ragged columns
+    (cRaggedColumn). Compared to cNDarray, no object array is built for each sample, and the values of each entity
+    can be retrieved without looping over the samples.
+  """
+  def __init__(self,width=0,length=100):
+    """
+      Constructor.
+      @ In, width, int, optional, number of entities aka columns
+      @ In, length, int, optional, initial capacity (number of samples) to allocate
+      @ Out, None
+    """
+    self.width    = width  # number of entities aka columns
+    self.size     = 0      # number of rows (samples) with actual data
+    self.capacity = length # initial capacity of the columns
+    self.columns  = [None]*width # cColumn or cRaggedColumn for each entity, set up with the first sample
+
+  @classmethod
+  def fromColumns(cls,columns):
+    """
+      Creates a collector from the values of each entity.
+      @ In, columns, list(np.ndarray), the values of each entity, either as a 1D array of single values or of
+        np.ndarray entries, or as an array with shape (#samples, ...) of entries with the same shape
+      @ Out, collector, cColumnarArray, the new collector
+    """
+    collector = cls(width=len(columns))
+    collector.size = len(columns[0]) if len(columns) > 0 else 0
+    for c,values in enumerate(columns):
+      if len(values.shape) > 1:
+        collector.columns[c] = cRaggedColumn(values=values)
+      elif collector.size > 0 and isinstance(values[0],np.ndarray):
+        column = cRaggedColumn(capacity=collector.size,first=values[0])
+        for entry in values:
+          column.append(entry)
+        collector.columns[c] = column
+      else:
+        collector.columns[c] = cColumn(values=values)
+    return collector
+
+  @property
+  def shape(self):
+    """
+      Shape property, as used in np.ndarray structures.
+      @ In, None
+      @ Out, (int,int), the (#rows, #columns) of useful data in this collector
+    """
+    return (self.size,self.width)
+
+  def __len__(self):
+    """
+      Return size, which is the number of samples, independent of entities, containing useful data.
+      @ In, None
+      @ Out, __len__, integer, size
+    """
+    return self.size
+
+  def __getitem__(self,val):
+    """
+      Get item method, with the same indexing as cNDarray (e.g. [-1,2] or [:,2]). Selecting an entity avoids
+      building the entries of the others; any other selection builds the object array of all the entries.
+      @ In, val, slice object, the slicing object (e.g. 1, :, :2, 1:3, (-1,2), etc.)
+      @ Out, __getitem__, object or np.ndarray, the element(s)
+    """
+    if isinstance(val,tuple) and len(val) == 2 and isinstance(val[1],(int,np.integer)):
+      rows, entity = val
+      if isinstance(rows,(int,np.integer)):
+        return self.getValue(rows,entity)
+      return self.getColumn(entity)[rows]
+    data = np.ndarray((self.size,self.width),dtype=object)
+    for c in range(self.width):
+      data[:,c] = self.getColumn(c)
+    return data[val]
+
+  def append(self,entry):
+    """
+      Appends a sample to the collector.
+      @ In, entry, list, the entries of each entity (np.ndarray for ND entities, single values otherwise)
+      @ Out, None
+    """
+    if len(entry) != self.width:
+      raise IOError('Tried to add new data to cColumnarArray.  Need {} entries, but got {}'.format(self.width,len(entry)))
+    for c,value in enumerate(entry):
+      column = self.columns[c]
+      if column is None:
+        column = self._newColumn(c,value)
+      elif isinstance(column,cRaggedColumn) and not isinstance(value,np.ndarray):
+        # mixing single values and arrays, fall back to an object column
+        column = self._toObjectColumn(c)
+      column.append(value)
+    self.size += 1
+
+  def addEntity(self,vals):
+    """
+      Adds a column to the collector.
+      @ In, vals, list, as list(#,#,#) where # is either single-valued or numpy array, one for each sample
+      @ Out, None
+    """
+    self.columns.append(None)
+    self.width += 1
+    if self.size > 0:
+      self.columns[-1] = cColumnarArray.fromColumns([self._objectArray(vals)]).columns[0]
+
+  def removeEntity(self,index):
+    """
+      Removes a column from this collector.
+      @ In, index, int, index of entry to remove
+      @ Out, None
+    """
+    assert(abs(index) < self.width)
+    self.columns.pop(index)
+    self.width -= 1
+
+  def getColumn(self,index,start=0,end=None):
+    """
+      Returns the values of an entity for all the samples (or a range of samples).
+      @ In, index, int, index of the entity
+      @ In, start, int, optional, the first sample
+      @ In, end, int, optional, the sample following the last one (all the samples if None)
+      @ Out, getColumn, np.ndarray, the values (a view of the storage for single-valued entities,
+        an object array of views for ND entities)
+    """
+    column = self.columns[index]
+    if column is None:
+      return np.ndarray(0,dtype=object)
+    return column.getData(start,end)
+
+  def getStacked(self,index,start=0,end=None):
+    """
+      Returns the values of an ND entity as a single array (see cRaggedColumn.getStacked).
+      @ In, index, int, index of the entity
+      @ In, start, int, optional, the first sample
+      @ In, end, int, optional, the sample following the last one (all the samples if None)
+      @ Out, getStacked, np.ndarray or None, the values, or None if not available as a single array
+    """
+    column = self.columns[index]
+    if not isinstance(column,cRaggedColumn):
+      return None
+    return column.getStacked(start,end)
+
+  def getRow(self,index):
+    """
+      Returns the entries of a sample.
+      @ In, index, int, the index of the sample (negative counts from the end)
+      @ Out, getRow, list, the entries of each entity
+    """
+    if index < 0:
+      index += self.size
+    return list(column.get(index) for column in self.columns)
+
+  def getValue(self,index,entity):
+    """
+      Returns the entry of an entity for a sample.
+      @ In, index, int, the index of the sample (negative counts from the end)
+      @ In, entity, int, the index of the entity
+      @ Out, getValue, object, the entry
+    """
+    if index < 0:
+      index += self.size
+    return self.columns[entity].get(index)
+
+  def setValue(self,index,entity,value):
+    """
+      Changes the (single-valued) entry of an entity for a sample.
+      @ In, index, int, the index of the sample (negative counts from the end)
+      @ In, entity, int, the index of the entity
+      @ In, value, object, the new entry
+      @ Out, None
+    """
+    if index < 0:
+      index += self.size
+    if isinstance(self.columns[entity],cRaggedColumn):
+      self._toObjectColumn(entity)
+    self.columns[entity].set(index,value)
+
+  def _newColumn(self,index,first):
+    """
+      Sets up the column of an entity, according to its first entry.
+      @ In, index, int, the index of the entity
+      @ In, first, object, the first entry of the entity
+      @ Out, column, cColumn or cRaggedColumn, the new column
+    """
+    if isinstance(first,np.ndarray):
+      column = cRaggedColumn(capacity=self.capacity,first=first)
+    else:
+      column = cColumn(capacity=self.capacity,first=first)
+    self.columns[index] = column
+    return column
+
+  def _toObjectColumn(self,index):
+    """
+      Converts the column of an entity to an object column, that accepts any entry.
+      @ In, index, int, the index of the entity
+      @ Out, column, cColumn, the converted column
+    """
+    column = self.columns[index]
+    if isinstance(column,cRaggedColumn):
+      column = cColumn(values=self._objectArray(list(column.getData())))
+    else:
+      column.toObject()
+    self.columns[index] = column
+    return column
+
+  @staticmethod
+  def _objectArray(vals):
+    """
+      Builds a 1D object array from a list of entries, without unfolding np.ndarray entries.
+      @ In, vals, list, the entries
+      @ Out, array, np.ndarray, the object array
+    """
+    array = np.ndarray(len(vals),dtype=object)
+    for i,val in enumerate(vals):
+      array[i] = val
+    return array
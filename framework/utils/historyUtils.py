@@ -0,0 +1,299 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Vectorized operations on all the histories of a HistorySet at once.
+  The histories (one array of values per realization, with different lengths) are packed in a single
+  array together with the offsets of each history, so that the operations are performed in one pass
+  over all the histories instead of one history (and one variable) at a time.
+  The packed histories can also be stored in a single file, memory-mapped when read, so that a single
+  history is read without reading the others.
+"""
+#for future compatibility with Python 3--------------------------------------------------------------
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+#End compatibility block for Python 3----------------------------------------------------------------
+
+#External Modules------------------------------------------------------------------------------------
+import json
+import struct
+import numpy as np
+#External Modules End--------------------------------------------------------------------------------
+
+def packHistories(histories):
+  """
+    Packs ragged histories in a single array
+    @ In, histories, list or np.array(object), the 1-D arrays of values of each history
+    @ Out, packed, np.array, the concatenated values of all the histories
+    @ Out, offsets, np.array(int), the index in packed of the start of each history, plus the total size
+                                   (history h is packed[offsets[h]:offsets[h+1]])
+  """
+  histories = [np.asarray(history,dtype=float).ravel() for history in histories]
+  lengths = np.fromiter((len(history) for history in histories),dtype=int,count=len(histories))
+  offsets = np.zeros(len(histories)+1,dtype=int)
+  np.cumsum(lengths,out=offsets[1:])
+  packed = np.concatenate(histories) if len(histories) > 0 else np.zeros(0)
+  return packed, offsets
+
+def unpackHistories(packed, offsets):
+  """
+    Splits packed histories (see packHistories) in the object array of the histories used by the HistorySets
+    @ In, packed, np.array, the concatenated values of all the histories (or a 2-D array with a row per history)
+    @ In, offsets, np.array(int), the offsets of the histories (unused for 2-D arrays)
+    @ Out, histories, np.array(object), the array of each history
+  """
+  if packed.ndim == 2:
+    rows = list(packed)
+  else:
+    rows = np.split(packed,offsets[1:-1])
+  histories = np.empty(len(rows),dtype=object)
+  for h,row in enumerate(rows):
+    histories[h] = row
+  return histories
+
+def historyIndex(offsets):
+  """
+    Returns the history each packed value belongs to
+    @ In, offsets, np.array(int), the offsets of the histories (see packHistories)
+    @ Out, index, np.array(int), the history of each packed value
+  """
+  return np.repeat(np.arange(len(offsets)-1),np.diff(offsets))
+
+def resampleHistories(pivots, variables, newPivot, method='linear', extension='extended'):
+  """
+    Re-samples all the variables of all the histories on a new pivot grid, in one pass.
+    Outside the range of the pivot of a history, the values are either the first and last values of the
+    history (extension "extended") or zero (extension "zeroed").
+    @ In, pivots, list or np.array(object), the (increasing) pivot values of each history
+    @ In, variables, dict, {name:list or np.array(object)} the values of each variable for each history
+    @ In, newPivot, np.array, the new pivot values, either common to all the histories (1-D array) or one
+                              row per history (2-D array)
+    @ In, method, string, optional, the interpolation: "linear" or "step" (value of the previous pivot)
+    @ In, extension, string, optional, the values outside the pivot range: "extended" or "zeroed"
+    @ Out, resampled, dict, {name:np.array} the re-sampled values, one row per history
+  """
+  if method not in ['linear','step']:
+    raise IOError('Unknown resampling method "{}"! Available are "linear" and "step".'.format(method))
+  if extension not in ['extended','zeroed']:
+    raise IOError('Unknown extension "{}"! Available are "extended" and "zeroed".'.format(extension))
+  pivot, offsets = packHistories(pivots)
+  numHistories = len(offsets)-1
+  if np.any(offsets[1:] == offsets[:-1]):
+    raise IOError('Histories with no values can not be re-sampled!')
+  newPivot = np.asarray(newPivot,dtype=float)
+  # exact ranks of the old and new pivot values in their union: shifted by history, they are increasing
+  #   over all the packed histories, so that a single search finds for every history and every new pivot
+  #   value the number of old pivot values that are smaller or equal
+  union = np.unique(np.concatenate((pivot,newPivot.ravel())))
+  pivotKeys = historyIndex(offsets)*len(union) + np.searchsorted(union,pivot)
+  if np.any(np.diff(pivotKeys) < 0):
+    raise IOError('The pivot values of the histories must be increasing!')
+  newKeys = np.arange(numHistories)[:,None]*len(union) + np.searchsorted(union,newPivot)
+  first = offsets[:-1,None]
+  last = offsets[1:,None]-1
+  found = np.searchsorted(pivotKeys,newKeys,side='right')
+  below = found == first
+  above = newPivot > pivot[last]
+  # packed index of the previous old pivot value (clipped to the history)
+  lower = np.clip(found-1,first,last)
+  if method == 'linear':
+    upper = np.minimum(lower+1,last)
+    delta = pivot[upper]-pivot[lower]
+    delta[delta <= 0] = np.inf
+    distance = newPivot - pivot[lower]
+  resampled = {}
+  for var,histories in variables.items():
+    values, valueOffsets = packHistories(histories)
+    if not np.array_equal(valueOffsets,offsets):
+      raise IOError('The variable "{}" and the pivot parameter have different lengths!'.format(var))
+    if method == 'linear':
+      newValues = values[lower] + (values[upper]-values[lower])/delta*distance
+    else:
+      newValues = values[lower]
+    if extension == 'zeroed':
+      newValues[below | above] = 0.0
+    else:
+      newValues = np.where(below,values[first],newValues)
+      newValues = np.where(above,values[last],newValues)
+    resampled[var] = newValues
+  return resampled
+
+def extremumIndices(packed, offsets, kind):
+  """
+    Returns the packed index of the (first) minimum or maximum of each history
+    @ In, packed, np.array, the packed values (see packHistories)
+    @ In, offsets, np.array(int), the offsets of the histories
+    @ In, kind, string, "min" or "max"
+    @ Out, indices, np.array(int), the packed index of the extremum of each history
+  """
+  # stable sort by history, then by value: the first entry of each history is its (first) extremum
+  order = np.lexsort((packed if kind == 'min' else -packed, historyIndex(offsets)))
+  return order[offsets[:-1]]
+
+def firstPassageIndices(packed, offsets, value):
+  """
+    Returns the index (in each history) of the first value that, together with the previous one, brackets value
+    @ In, packed, np.array, the packed values (see packHistories)
+    @ In, offsets, np.array(int), the offsets of the histories
+    @ In, value, float, the value to cross
+    @ Out, indices, np.array(int), the index of the first passage in each history (-1 if never crossed)
+  """
+  current = packed[1:]
+  previous = packed[:-1]
+  crossing = ((current >= value) & (previous <= value)) | ((current <= value) & (previous >= value))
+  # pairs across two histories do not count
+  crossing[offsets[1:-1]-1] = False
+  crossed = np.flatnonzero(crossing)+1
+  histories, firstCrossing = np.unique(np.searchsorted(offsets,crossed,side='right')-1,return_index=True)
+  indices = np.full(len(offsets)-1,-1,dtype=int)
+  indices[histories] = crossed[firstCrossing]-offsets[histories]
+  return indices
+
+def trapezoidalAverages(pivots, histories):
+  """
+    Returns the average of each history over its pivot range, integrated with the trapezoidal rule
+    @ In, pivots, list or np.array(object), the pivot values of each history
+    @ In, histories, list or np.array(object), the values of each history
+    @ Out, averages, np.array, the average of each history
+  """
+  pivot, offsets = packHistories(pivots)
+  values, _ = packHistories(histories)
+  areas = (values[1:]+values[:-1])/2.0*(pivot[1:]-pivot[:-1])
+  # the segment across two histories does not count
+  areas[offsets[1:-1]-1] = 0.0
+  integrals = np.bincount(historyIndex(offsets)[1:],weights=areas,minlength=len(offsets)-1)
+  return integrals/(pivot[offsets[1:]-1]-pivot[offsets[:-1]])
+
+## the packed files: the magic string, the size of the (JSON) header, the header, then the raw values of each
+##   array, aligned so that they can be viewed in place in the memory-mapped file
+_packedMagic = b'RAVENPKD'
+_packedVersion = 1
+_packedAlignment = 64
+
+def _aligned(size):
+  """
+    Rounds a size up to the alignment of the arrays in the packed files
+    @ In, size, int, the size in bytes
+    @ Out, aligned, int, the aligned size in bytes
+  """
+  return -(-size//_packedAlignment)*_packedAlignment
+
+def _storable(values):
+  """
+    Converts values to an array that can be stored in a packed file (object arrays, e.g. of strings, are
+    converted to the natural type of their entries)
+    @ In, values, np.array, the values
+    @ Out, values, np.array, the contiguous values
+  """
+  values = np.asarray(values)
+  if values.dtype.hasobject:
+    values = np.array(values.tolist())
+    if values.dtype.hasobject:
+      raise TypeError('Values of type "{}" can not be packed!'.format(type(values.flat[0]).__name__))
+  return np.ascontiguousarray(values)
+
+def writePackedHistories(fileName, scalars, histories, offsets, extra=None, info=None):
+  """
+    Writes packed histories in a single file, with the offsets of the histories and the contiguous values
+    of each variable (see PackedHistories to read it)
+    @ In, fileName, str, path of the file
+    @ In, scalars, dict, {name:np.array} the scalar variables, one value per history
+    @ In, histories, dict, {name:np.array} the packed values of the history variables (see packHistories)
+    @ In, offsets, np.array(int), the offsets of the histories
+    @ In, extra, dict, optional, {name:np.array} additional arrays to store
+    @ In, info, dict, optional, additional (JSON-serializable) information to store
+    @ Out, None
+  """
+  arrays = [('offsets',np.ascontiguousarray(offsets,dtype=np.int64))]
+  for kind,variables in (('scalar',scalars),('history',histories),('extra',extra or {})):
+    for name,values in variables.items():
+      arrays.append((kind+'|'+name,_storable(values)))
+  layout = {}
+  position = 0
+  for name,values in arrays:
+    layout[name] = {'dtype':values.dtype.str,'shape':list(values.shape),'offset':position}
+    position += _aligned(values.nbytes)
+  header = json.dumps({'version':_packedVersion,'arrays':layout,'info':info or {}}).encode('utf-8')
+  start = _aligned(len(_packedMagic)+8+len(header))
+  with open(fileName,'wb') as packedFile:
+    packedFile.write(_packedMagic)
+    packedFile.write(struct.pack('<Q',len(header)))
+    packedFile.write(header)
+    for name,values in arrays:
+      packedFile.seek(start+layout[name]['offset'])
+      packedFile.write(memoryview(values.reshape(-1).view(np.uint8)))
+    # the file ends after the padding of the last array, so that every array can be viewed in place
+    packedFile.truncate(start+position)
+
+class PackedHistories(object):
+  """
+    Packed histories read from a file (see writePackedHistories). The file is memory-mapped: the arrays are
+    views of the file, and only the parts that are used are read.
+  """
+  def __init__(self, fileName):
+    """
+      Constructor
+      @ In, fileName, str, path of the file
+      @ Out, None
+    """
+    with open(fileName,'rb') as packedFile:
+      if packedFile.read(len(_packedMagic)) != _packedMagic:
+        raise IOError('"{}" is not a packed histories file!'.format(fileName))
+      headerSize = struct.unpack('<Q',packedFile.read(8))[0]
+      header = json.loads(packedFile.read(headerSize).decode('utf-8'))
+    if header['version'] > _packedVersion:
+      raise IOError('Packed histories file "{}" has an unknown version {}!'.format(fileName,header['version']))
+    start = _aligned(len(_packedMagic)+8+headerSize)
+    buffer = np.memmap(fileName,dtype=np.uint8,mode='r')
+    self.info = header['info']      # additional information
+    self.scalars = {}               # {name:np.array} the scalar variables, one value per history
+    self.histories = {}             # {name:np.array} the packed values of the history variables
+    self.extra = {}                 # {name:np.array} the additional arrays
+    self.offsets = None             # the offsets of the histories
+    stores = {'scalar':self.scalars,'history':self.histories,'extra':self.extra}
+    for name,layout in header['arrays'].items():
+      dtype = np.dtype(layout['dtype'])
+      shape = tuple(layout['shape'])
+      first = start+layout['offset']
+      size = dtype.itemsize*int(np.prod(shape))
+      values = buffer[first:first+size].view(dtype).reshape(shape) if size > 0 else np.zeros(shape,dtype=dtype)
+      if name == 'offsets':
+        self.offsets = values
+      else:
+        kind,name = name.split('|',1)
+        stores[kind][name] = values
+
+  def __len__(self):
+    """
+      Number of histories
+      @ In, None
+      @ Out, len, int, the number of histories
+    """
+    return len(self.offsets)-1
+
+  def history(self, index):
+    """
+      Returns a single history, without reading the others
+      @ In, index, int, the index of the history
+      @ Out, history, dict, {name:value or np.array} the scalar values and the values of the history variables
+    """
+    if index < 0:
+      index += len(self)
+    if not 0 <= index < len(self):
+      raise IndexError('History index {} out of range for {} histories!'.format(index,len(self)))
+    history = dict((name,values[index]) for name,values in self.scalars.items())
+    first,last = self.offsets[index],self.offsets[index+1]
+    for name,values in self.histories.items():
+      history[name] = values[first:last]
+    return history
@@ -0,0 +1,265 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Utilities to import the RAVEN entities on demand: modules that are imported the first time they are
+  used, registries of the classes of a factory that import the module of a class only when the class is
+  requested, and a profile of the time spent importing modules.
+"""
+#for future compatibility with Python 3--------------------------------------------------------------
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+#End compatibility block for Python 3----------------------------------------------------------------
+
+#External Modules------------------------------------------------------------------------------------
+import sys
+import time
+import types
+import threading
+try:
+  import builtins
+except ImportError:
+  import __builtin__ as builtins
+#External Modules End--------------------------------------------------------------------------------
+
+def importModule(name):
+  """
+    Imports a module through the builtin import (so that the import can be profiled, see startImportProfiling)
+    @ In, name, string, the full name of the module (e.g. "Samplers.MonteCarlo")
+    @ Out, module, module, the module
+  """
+  builtins.__import__(name)
+  return sys.modules[name]
+
+class LazyModule(types.ModuleType):
+  """
+    Placeholder of a module that is imported the first time one of its attributes is requested.
+  """
+  def __init__(self, name):
+    """
+      Constructor
+      @ In, name, string, the full name of the module (e.g. "Samplers")
+      @ Out, None
+    """
+    types.ModuleType.__init__(self, str(name))
+
+  def __getattr__(self, attr):
+    """
+      Imports the module (only called for the attributes this placeholder does not have yet)
+      @ In, attr, string, the requested attribute
+      @ Out, value, object, the attribute of the module
+    """
+    module = importModule(self.__name__)
+    self.__dict__.update(module.__dict__)
+    return getattr(module, attr)
+
+def importModuleLazy(name):
+  """
+    Returns the module named name if it is already imported, otherwise a placeholder that imports it when used.
+    @ In, name, string, the full name of the module (e.g. "Samplers")
+    @ Out, module, module or LazyModule, the module
+  """
+  if name in sys.modules:
+    return sys.modules[name]
+  return LazyModule(name)
+
+class LazyClassRegistry(object):
+  """
+    Interface dictionary of a factory, {type:class}, where the classes are registered by the dotted path
+    of their definition (e.g. "Samplers.MonteCarlo.MonteCarlo") and their modules are only imported when
+    the class is requested. Several paths can be registered for a type, the first one that can be
+    resolved is used (e.g. classes that are only defined if an optional library is available).
+    Classes can also be registered directly.
+  """
+  def __init__(self):
+    """
+      Constructor
+      @ In, None
+      @ Out, None
+    """
+    self.__paths = {}   # {type:tuple(path)}, the registered definitions
+    self.__classes = {} # {type:class}, the resolved classes
+
+  def __setitem__(self, key, value):
+    """
+      Registers a class
+      @ In, key, string, the type
+      @ In, value, string or tuple(string) or class, the dotted path(s) of the class, or the class itself
+      @ Out, None
+    """
+    self.__classes.pop(key, None)
+    if isinstance(value, (tuple, list)):
+      self.__paths[key] = tuple(value)
+    elif isinstance(value, type(u'')) or isinstance(value, str):
+      self.__paths[key] = (value,)
+    else:
+      self.__paths[key] = ()
+      self.__classes[key] = value
+
+  def __getitem__(self, key):
+    """
+      Returns the class registered for a type, importing its module if needed
+      @ In, key, string, the type
+      @ Out, classObj, class, the class (KeyError if the type is unknown or none of its paths is defined)
+    """
+    if key not in self.__classes:
+      for path in self.__paths[key]:
+        moduleName, _, className = path.rpartition('.')
+        classObj = getattr(importModule(moduleName), className, None)
+        if classObj is not None:
+          self.__classes[key] = classObj
+          break
+      else:
+        raise KeyError(key)
+    return self.__classes[key]
+
+  def __contains__(self, key):
+    """
+      Checks if a type is registered (without importing its class)
+      @ In, key, string, the type
+      @ Out, contains, bool, True if registered
+    """
+    return key in self.__paths
+
+  def __iter__(self):
+    """
+      Iterates over the registered types
+      @ In, None
+      @ Out, iterator, iterator, the types
+    """
+    return iter(self.__paths)
+
+  def __len__(self):
+    """
+      Number of registered types
+      @ In, None
+      @ Out, len, int, the number of types
+    """
+    return len(self.__paths)
+
+  def keys(self):
+    """
+      Returns the registered types (without importing their classes)
+      @ In, None
+      @ Out, keys, list, the types
+    """
+    return list(self.__paths.keys())
+
+  def get(self, key, default=None):
+    """
+      Returns the class registered for a type, or default if it is not available
+      @ In, key, string, the type
+      @ In, default, object, optional, the value returned for unknown types
+      @ Out, classObj, class, the class
+    """
+    try:
+      return self[key]
+    except KeyError:
+      return default
+
+  def items(self):
+    """
+      Returns all the types and classes, importing all of them (the types not defined are skipped)
+      @ In, None
+      @ Out, items, list(tuple), the (type,class) pairs
+    """
+    items = []
+    for key in self.keys():
+      classObj = self.get(key)
+      if classObj is not None:
+        items.append((key,classObj))
+    return items
+
+  def values(self):
+    """
+      Returns all the classes, importing all of them (see items)
+      @ In, None
+      @ Out, values, list, the classes
+    """
+    return list(classObj for _,classObj in self.items())
+
+## Import profiling
+__importProfile = {} # {module:[inclusive time, time of the imports nested in it]}
+__importStack = threading.local()
+__originalImport = None
+
+def __profiledImport(name, *args, **kwargs):
+  """
+    Replacement of the builtin __import__, timing the first import of each module
+    @ In, name, string, the module name
+    @ In, args, list, the other arguments of __import__
+    @ In, kwargs, dict, the other keyword arguments of __import__
+    @ Out, module, module, the imported module
+  """
+  level = args[3] if len(args) > 3 else kwargs.get('level', 0)
+  fullName = name
+  if level > 0 and name:
+    # relative import, e.g. "from .MonteCarlo import MonteCarlo" in the Samplers package
+    importer = args[0] if len(args) > 0 and args[0] else kwargs.get('globals') or {}
+    package = importer.get('__package__') or importer.get('__name__','').rpartition('.')[0]
+    fullName = '.'.join(package.split('.')[:len(package.split('.'))-level+1] + [name])
+  if not name or fullName in sys.modules:
+    return __originalImport(name, *args, **kwargs)
+  stack = getattr(__importStack, 'stack', None)
+  if stack is None:
+    stack = __importStack.stack = []
+  stack.append(0.0)
+  start = time.time()
+  try:
+    return __originalImport(name, *args, **kwargs)
+  finally:
+    elapsed = time.time() - start
+    nested = stack.pop()
+    if stack:
+      stack[-1] += elapsed
+    entry = __importProfile.setdefault(fullName, [0.0, 0.0])
+    entry[0] += elapsed
+    entry[1] += nested
+
+def startImportProfiling():
+  """
+    Starts timing the imports of new modules (see importProfilingReport)
+    @ In, None
+    @ Out, None
+  """
+  global __originalImport
+  if __originalImport is None:
+    __originalImport = builtins.__import__
+    builtins.__import__ = __profiledImport
+
+def stopImportProfiling():
+  """
+    Stops timing the imports
+    @ In, None
+    @ Out, None
+  """
+  global __originalImport
+  if __originalImport is not None:
+    builtins.__import__ = __originalImport
+    __originalImport = None
+
+def importProfilingReport(maxEntries=30):
+  """
+    Returns a report of the time spent importing modules since startImportProfiling was called,
+    sorted by the time spent in each module itself (excluding the modules it imports).
+    @ In, maxEntries, int, optional, the number of modules listed
+    @ Out, report, string, the report
+  """
+  entries = sorted(((inclusive-nested,inclusive,name) for name,(inclusive,nested) in __importProfile.items()), reverse=True)
+  total = sum(entry[0] for entry in entries)
+  lines = ['Import profile: {} modules imported in {:.3f} s'.format(len(entries),total),
+           '{:>10s} {:>10s}  {}'.format('self [s]','cumul. [s]','module')]
+  for selfTime,inclusive,name in entries[:maxEntries]:
+    lines.append('{:10.4f} {:10.4f}  {}'.format(selfTime,inclusive,name))
+  return '\n'.join(lines)
@@ -30,7 +30,7 @@ import scipy
 from scipy import interpolate, stats, integrate
 import numpy as np
 import six
-from utils.utils import UreturnPrintTag,UreturnPrintPostTag
+from utils.utils import UreturnPrintTag,UreturnPrintPostTag,isAMapping
 
 def normal(x,mu=0.0,sigma=1.0):
   """
@@ -337,11 +337,11 @@ def convertNumpyToLists(inputDict):
     @ Out, response, dict or list, same object with its content converted
   """
   returnDict = inputDict
-  if type(inputDict) == dict:
+  if isAMapping(inputDict):
     for key, value in inputDict.items():
       if   type(value) == np.ndarray:
         returnDict[key] = value.tolist()
-      elif type(value) == dict:
+      elif isAMapping(value):
         returnDict[key] = (convertNumpyToLists(value))
       else:
         returnDict[key] = value
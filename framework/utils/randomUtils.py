@@ -21,6 +21,7 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 import warnings
 warnings.simplefilter('default',DeprecationWarning)
 
+import zlib
 import numpy as np
 from collections import deque
 
@@ -53,6 +54,32 @@ class BoxMullerGenerator:
       self.queue.extend(self.createSamples())
     return self.queue.pop() #no need to pop left, as they're independent and all get used
 
+  def generateArray(self,size):
+    """
+      Yields normally-distributed pseudorandom values, the same as "size" calls to generate
+      @ In, size, int, the number of values
+      @ Out, vals, np.array, the random values
+    """
+    vals = np.empty(size)
+    numQueued = min(size,len(self.queue))
+    for i in range(numQueued):
+      vals[i] = self.queue.pop()
+    remaining = size - numQueued
+    if remaining > 0:
+      numPairs = (remaining+1)//2
+      uniforms = random(2*numPairs,keepMatrix=True)[0]
+      u1,u2 = uniforms[0::2],uniforms[1::2]
+      z1 = np.sqrt(-2.*np.log(u1))*np.cos(2.*np.pi*u2)
+      z2 = np.sqrt(-2.*np.log(u1))*np.sin(2.*np.pi*u2)
+      # generate returns the second value of each pair first
+      pairs = np.empty(2*numPairs)
+      pairs[0::2] = z2
+      pairs[1::2] = z1
+      vals[numQueued:] = pairs[:remaining]
+      if remaining % 2 == 1:
+        self.queue.append(z1[-1])
+    return vals
+
   def createSamples(self):
     """
       Sample calculator.  Because Box Muller does batches of 2, add them to a queue.
@@ -117,10 +144,9 @@ def random(dim=1,samples=1,keepMatrix=False):
   if stochasticEnv == 'numpy':
     vals = npStochEnv.rand(samples,dim)
   else: #crow
-    vals = np.zeros([samples,dim])
-    for i in range(len(vals)):
-      for j in range(len(vals[0])):
-        vals[i][j] = crowStochEnv.random()
+    # filled in place with a single call, in the same order as element by element
+    vals = np.empty([samples,dim])
+    crowStochEnv.fillRandom(vals)
   # regardless of stoch env
   if keepMatrix:
     return vals
@@ -140,10 +166,7 @@ def randomNormal(dim=1,samples=1,keepMatrix=False):
   if stochasticEnv == 'numpy':
     vals = npStochEnv.randn(samples,dim)
   else:
-    vals = np.zeros([samples,dim])
-    for i in range(len(vals)):
-      for j in range(len(vals[0])):
-        vals[i,j] = boxMullerGen.generate()
+    vals = boxMullerGen.generateArray(samples*dim).reshape(samples,dim)
   if keepMatrix:
     return vals
   else:
@@ -243,6 +266,103 @@ def newRNG(env=None):
     raise TypeError('Unrecognized environment requested:',env)
   return engine
 
+### counter-based random numbers ###
+# Philox4x32-10 (Salmon et al., "Parallel random numbers: as easy as 1, 2, 3", SC11): the random numbers are a
+#   function of a key (the seed) and of a counter (sample index, stream, component), so that any of them can
+#   be generated independently of the others, in any order, on any process, in bulk.
+_philoxMultipliers = (np.uint64(0xD2511F53), np.uint64(0xCD9E8D57))
+_philoxWeyl = (0x9E3779B9, 0xBB67AE85)
+_philoxRounds = 10
+_mask32 = np.uint64(0xFFFFFFFF)
+_shift32 = np.uint64(32)
+
+def _philox4x32(counters, key):
+  """
+    Philox4x32-10 bijection of the counters
+    @ In, counters, list(np.array), the four 32-bit words of each counter (arrays of the same shape)
+    @ In, key, tuple(int), the two 32-bit words of the key
+    @ Out, words, list(np.array(np.uint64)), the four 32-bit random words of each counter
+  """
+  c0, c1, c2, c3 = [np.asarray(word, dtype=np.uint64) & _mask32 for word in counters]
+  k0, k1 = key
+  for r in range(_philoxRounds):
+    product0 = _philoxMultipliers[0] * c0
+    product1 = _philoxMultipliers[1] * c2
+    c0, c1, c2, c3 = ((product1 >> _shift32) ^ c1 ^ np.uint64(k0), product1 & _mask32,
+                      (product0 >> _shift32) ^ c3 ^ np.uint64(k1), product0 & _mask32)
+    k0 = (k0 + _philoxWeyl[0]) & 0xFFFFFFFF
+    k1 = (k1 + _philoxWeyl[1]) & 0xFFFFFFFF
+  return [c0, c1, c2, c3]
+
+def streamKey(name):
+  """
+    Returns the stream number of a name (e.g. a variable), the same in every process and run
+    @ In, name, string, the name
+    @ Out, stream, int, the 32-bit stream number
+  """
+  return zlib.crc32(name.encode('utf-8')) & 0xFFFFFFFF
+
+def _counterWords(seed, samples, stream, dim):
+  """
+    Generates the random words of the components of the requested samples
+    @ In, seed, int, the seed (key)
+    @ In, samples, int or list or np.array(int), the indices of the samples
+    @ In, stream, int or string, the stream (e.g. one per variable, see streamKey)
+    @ In, dim, int, the number of components of each sample
+    @ Out, words, list(np.array(np.uint64)), the four words of each pair of components, shape [samples,(dim+1)//2]
+  """
+  if not isinstance(stream, (int, np.integer)):
+    stream = streamKey(stream)
+  samples = np.atleast_1d(np.asarray(samples, dtype=np.int64)).astype(np.uint64)[:,np.newaxis]
+  blocks = np.arange((int(dim)+1)//2, dtype=np.uint64)[np.newaxis,:]
+  counters = [samples & _mask32, samples >> _shift32, np.full(blocks.shape, int(stream) & 0xFFFFFFFF, dtype=np.uint64), blocks]
+  counters = np.broadcast_arrays(*counters)
+  seed = int(seed) & 0xFFFFFFFFFFFFFFFF
+  return _philox4x32(counters, (seed & 0xFFFFFFFF, seed >> 32))
+
+def _wordsToUniform(high, low):
+  """
+    Converts pairs of 32-bit words in doubles on [0,1) with 53 random bits
+    @ In, high, np.array(np.uint64), the words for the high bits
+    @ In, low, np.array(np.uint64), the words for the low bits
+    @ Out, uniform, np.array(float), the values
+  """
+  return ((high >> np.uint64(5)).astype(float)*67108864.0 + (low >> np.uint64(6)).astype(float))/9007199254740992.0
+
+def counterRandom(seed, samples, stream=0, dim=1):
+  """
+    Function to get the random values on [0,1) of given samples of a stream, independently of any other
+    random number requested before (the same value is returned for the same seed, sample, stream and component).
+    @ In, seed, int, the seed
+    @ In, samples, int or list or np.array(int), the (non-negative) indices of the samples
+    @ In, stream, int or string, optional, the stream (e.g. the name of the sampled variable)
+    @ In, dim, int, optional, the number of components of each sample
+    @ Out, vals, np.array, the random values, shape [len(samples),dim]
+  """
+  x0, x1, x2, x3 = _counterWords(seed, samples, stream, dim)
+  vals = np.empty((x0.shape[0], 2*x0.shape[1]))
+  vals[:,0::2] = _wordsToUniform(x0, x1)
+  vals[:,1::2] = _wordsToUniform(x2, x3)
+  return vals[:,:int(dim)]
+
+def counterRandomNormal(seed, samples, stream=0, dim=1):
+  """
+    Function to get the standard normal random values of given samples of a stream (see counterRandom)
+    @ In, seed, int, the seed
+    @ In, samples, int or list or np.array(int), the (non-negative) indices of the samples
+    @ In, stream, int or string, optional, the stream (e.g. the name of the sampled variable)
+    @ In, dim, int, optional, the number of components of each sample
+    @ Out, vals, np.array, the random values, shape [len(samples),dim]
+  """
+  x0, x1, x2, x3 = _counterWords(seed, samples, stream, dim)
+  # Box-Muller transform of the two uniforms of each counter (1-u is in (0,1])
+  radius = np.sqrt(-2.0*np.log(1.0 - _wordsToUniform(x0, x1)))
+  angle = 2.0*np.pi*_wordsToUniform(x2, x3)
+  vals = np.empty((x0.shape[0], 2*x0.shape[1]))
+  vals[:,0::2] = radius*np.cos(angle)
+  vals[:,1::2] = radius*np.sin(angle)
+  return vals[:,:int(dim)]
+
 ### internal utilities ###
 
 def _reduceRedundantListing(data,dim,samples):
@@ -0,0 +1,280 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Search structure used by the DataObjects to find realizations by value.
+  Exact (hash) lookups are used for strings, integers and booleans (e.g. "prefix"),
+  while floating point variables are searched through a scaled KD tree that is
+  maintained incrementally as realizations are added.
+"""
+#for future compatibility with Python 3--------------------------------------------------------------
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+#End compatibility block for Python 3----------------------------------------------------------------
+
+#External Modules------------------------------------------------------------------------------------
+import numpy as np
+from scipy import spatial
+#External Modules End--------------------------------------------------------------------------------
+
+class RealizationIndex(object):
+  """
+    Maintains the lookup structures for the values of scalar variables, indexed by realization number.
+    The index is not tied to any storage: the owner is responsible for registering the variables it wants
+    searched (with all existing values) and for appending each new realization in order.
+    Float variables are searched with a KD tree built on the (standardized) requested variables; realizations
+    added after the tree was built are kept in a pending region that is scanned with numpy until it becomes
+    large enough to justify rebuilding the tree. Searches return candidate realizations only; the owner
+    decides which candidate actually matches according to its own tolerance semantics.
+  """
+  # rebuild the KD tree once the pending region is larger than this fraction of the tree (or the minimum)
+  rebuildFraction = 0.125
+  minPending = 128
+
+  def __init__(self,size=0):
+    """
+      Constructor.
+      @ In, size, int, optional, number of realizations already stored by the owner
+      @ Out, None
+    """
+    self.size     = size # number of realizations indexed
+    self._floats  = {}   # {var:np.ndarray} float values by realization, with spare capacity
+    self._hashes  = {}   # {var:{value:[realization indices]}} exact lookup for non-float values
+    self._trees   = {}   # {tuple(vars):dict} KD trees for groups of float variables, see _buildTree
+
+  def __contains__(self,var):
+    """
+      Overload of "in" operator.
+      @ In, var, str, variable name
+      @ Out, __contains__, bool, True if "var" is indexed
+    """
+    return var in self._floats or var in self._hashes
+
+  def register(self,var,values):
+    """
+      Starts indexing a variable.
+      @ In, var, str, variable name
+      @ In, values, np.ndarray or list, value for each of the "size" realizations already stored
+      @ Out, registered, bool, True if the variable could be indexed (it has hashable scalar values)
+    """
+    assert(len(values) == self.size)
+    if all(isinstance(val,(float,np.floating)) for val in values):
+      column = np.empty(max(2*self.size,100),dtype=float)
+      column[:self.size] = values
+      self._floats[var] = column
+      return True
+    lookup = {}
+    try:
+      for r,val in enumerate(values):
+        lookup.setdefault(val,[]).append(r)
+    except TypeError:
+      # unhashable entries (for example arrays) can't be indexed
+      return False
+    self._hashes[var] = lookup
+    return True
+
+  def forget(self,var):
+    """
+      Stops indexing a variable.
+      @ In, var, str, variable name
+      @ Out, None
+    """
+    self._floats.pop(var,None)
+    self._hashes.pop(var,None)
+    for key in list(self._trees.keys()):
+      if var in key:
+        del self._trees[key]
+
+  def append(self,rlz):
+    """
+      Adds the next realization to the index.
+      @ In, rlz, dict, {var:value} containing at least every indexed variable
+      @ Out, None
+    """
+    row = self.size
+    for var,column in list(self._floats.items()):
+      value = rlz[var]
+      if not isinstance(value,(float,np.floating)):
+        # this variable no longer has a consistent type, so it can't be searched with the tree
+        self.forget(var)
+        continue
+      if row >= len(column):
+        column = np.concatenate((column,np.empty(len(column),dtype=float)))
+        self._floats[var] = column
+      column[row] = value
+    for var,lookup in list(self._hashes.items()):
+      try:
+        lookup.setdefault(rlz[var],[]).append(row)
+      except TypeError:
+        self.forget(var)
+    self.size += 1
+
+  def setValue(self,row,var,value):
+    """
+      Changes the value of an indexed variable for an existing realization.
+      @ In, row, int, realization index
+      @ In, var, str, variable name
+      @ In, value, object, new value
+      @ Out, None
+    """
+    if var in self._floats:
+      # trees store standardized copies of the values, so they need to be rebuilt
+      self.forget(var)
+    elif var in self._hashes:
+      lookup = self._hashes[var]
+      for key,rows in lookup.items():
+        if row in rows:
+          rows.remove(row)
+          if not rows:
+            del lookup[key]
+          break
+      try:
+        rows = lookup.setdefault(value,[])
+      except TypeError:
+        self.forget(var)
+        return
+      rows.append(row)
+      rows.sort()
+
+  def isFloat(self,var):
+    """
+      Determines if a variable is indexed with the float (tolerance) search.
+      @ In, var, str, variable name
+      @ Out, isFloat, bool, True if float-indexed
+    """
+    return var in self._floats
+
+  def floatValues(self,var,rows):
+    """
+      Returns the stored values of a float variable.
+      @ In, var, str, variable name
+      @ In, rows, np.ndarray(int), realization indices
+      @ Out, floatValues, np.ndarray, values
+    """
+    return self._floats[var][rows]
+
+  def candidates(self,exact,near):
+    """
+      Finds the realizations that could match the requested values.
+      @ In, exact, dict, {var:value} for variables that must match exactly (hash-indexed variables)
+      @ In, near, dict, {var:(value,radius)} for float variables, where "radius" is the largest absolute
+                        difference that could be accepted as a match by the owner
+      @ Out, candidates, np.ndarray(int), sorted realization indices that can match, as a superset of the matches
+    """
+    found = None
+    # exact entries first, since they are usually the most restrictive
+    exactRows = []
+    for var,value in exact.items():
+      try:
+        exactRows.append(self._hashes[var].get(value,[]))
+      except TypeError:
+        # unhashable requests can't match hashable entries
+        return np.zeros(0,dtype=int)
+    for rows in sorted(exactRows,key=len):
+      found = set(rows) if found is None else found.intersection(rows)
+      if not found:
+        return np.zeros(0,dtype=int)
+    if near:
+      varNames = tuple(sorted(near.keys()))
+      # if the exact matches already narrowed things down, check the few rows directly
+      if found is not None and len(found) < self.minPending:
+        rows = np.array(sorted(found),dtype=int)
+        return rows[self._withinRadius(varNames,near,rows)]
+      nearRows = self._nearRows(varNames,near)
+      found = set(nearRows) if found is None else found.intersection(nearRows)
+    return np.array(sorted(found),dtype=int)
+
+  def _withinRadius(self,varNames,near,rows):
+    """
+      Checks the given rows against the (absolute) radius for each float variable.
+      @ In, varNames, tuple(str), float variables to check
+      @ In, near, dict, {var:(value,radius)} (see candidates)
+      @ In, rows, np.ndarray(int), realization indices to check
+      @ Out, mask, np.ndarray(bool), True where all variables are within the radius
+    """
+    mask = np.ones(len(rows),dtype=bool)
+    for var in varNames:
+      value,radius = near[var]
+      values = self._floats[var][rows]
+      # non-finite values are not comparable through differences, so keep them for the owner to check
+      mask &= (np.abs(values - value) <= radius) | ~np.isfinite(values)
+    return mask
+
+  def _nearRows(self,varNames,near):
+    """
+      Finds the realizations within the radius for all the float variables, using the KD tree.
+      @ In, varNames, tuple(str), float variables to search
+      @ In, near, dict, {var:(value,radius)} (see candidates)
+      @ Out, rows, list(int), realization indices within the radius (unsorted)
+    """
+    tree = self._trees.get(varNames,None)
+    pending = self.size - tree['size'] if tree is not None else self.size
+    if tree is None or pending > max(self.minPending,int(self.rebuildFraction*tree['size'])):
+      tree = self._buildTree(varNames)
+    point = np.array(list(near[var][0] for var in varNames),dtype=float)
+    radii = np.array(list(near[var][1] for var in varNames),dtype=float)
+    rows = []
+    if tree['tree'] is not None:
+      scaled = (point - tree['loc'])/tree['scale']
+      # a single radius is used for all the dimensions, so take the widest; rounding from the
+      # standardization is covered by a small pad, since the owner checks the candidates exactly anyway
+      radius = np.max(radii/tree['scale'])*(1.0+1e-9) + 4.0*np.finfo(float).eps*(np.max(np.abs(scaled))+1.0)
+      if np.isfinite(radius) and np.all(np.isfinite(scaled)):
+        rows.extend(tree['rows'][i] for i in tree['tree'].query_ball_point(scaled,radius,p=np.inf))
+      else:
+        rows.extend(tree['rows'])
+    # realizations not in the tree: non-finite values, and the ones added since it was built
+    unsorted = np.concatenate((tree['extra'],np.arange(tree['size'],self.size,dtype=int)))
+    rows.extend(unsorted[self._withinRadius(varNames,near,unsorted)])
+    return rows
+
+  def _buildTree(self,varNames):
+    """
+      Builds the KD tree for a group of float variables, using the values standardized by mean and standard deviation.
+      @ In, varNames, tuple(str), float variables to include
+      @ Out, tree, dict, tree information
+    """
+    data = np.vstack(list(self._floats[var][:self.size] for var in varNames)).T
+    finite = np.all(np.isfinite(data),axis=1)
+    rows = np.arange(self.size,dtype=int)[finite]
+    data = data[finite]
+    if len(data):
+      loc = data.mean(axis=0)
+      scale = data.std(axis=0)
+      scale[scale == 0] = 1.0
+      kdTree = spatial.cKDTree((data - loc)/scale)
+    else:
+      loc = np.zeros(len(varNames))
+      scale = np.ones(len(varNames))
+      kdTree = None
+    tree = {'tree'  : kdTree,                                          # the KD tree itself
+            'rows'  : rows,                                            # realization index for each tree point
+            'extra' : np.arange(self.size,dtype=int)[np.logical_not(finite)], # realizations with non-finite values
+            'loc'   : loc,                                             # standardization shift
+            'scale' : scale,                                           # standardization scaling
+            'size'  : self.size}                                       # number of realizations when built
+    self._trees[varNames] = tree
+    return tree
+
+def relativeRadius(value,tol):
+  """
+    Provides the largest absolute difference from "value" that can satisfy mathUtils.compareFloats(value,x,tol).
+    @ In, value, float, value being searched for
+    @ In, tol, float, relative tolerance
+    @ Out, radius, float, absolute radius (inf if any value could match)
+  """
+  if tol >= 1.0 or not np.isfinite(value):
+    return np.inf
+  # |x-v| < tol*|x| <= tol*(|v|+|x-v|)
+  return tol*abs(value)/(1.0-tol)
@@ -0,0 +1,304 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Compact, copy-on-write snapshot of the information a sampler provides for a sample (its inputInfo), passed
+  to the models instead of deep copies of the inputInfo dictionary.
+  The values are stored aligned with a schema of the names, which is immutable and shared by all the records
+  with the same names (e.g. all the samples of a sampler): in a read-only float array if they are all floats
+  (e.g. the SampledVars and SampledVarsPb of most samplers), in a tuple otherwise. Copying a record (even deep
+  copying it, as the models do with their keyword arguments) does not copy its values; a record is only
+  copied into a private dictionary when it is modified.
+"""
+#for future compatibility with Python 3--------------------------------------------------------------
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+#End compatibility block for Python 3----------------------------------------------------------------
+
+#External Modules------------------------------------------------------------------------------------
+import copy
+import numpy as np
+try:
+  from collections.abc import MutableMapping
+except ImportError:
+  from collections import MutableMapping
+#External Modules End--------------------------------------------------------------------------------
+
+## the immutable types, shared by the copies of a record
+_immutableTypes = (type(None), bool, int, float, complex, str, bytes, type(u''), np.generic)
+
+## the schemas in use, {names:SampleSchema}
+_schemas = {}
+_maxSchemas = 1024
+
+class SampleSchema(object):
+  """
+    Immutable, shared, ordered names of the entries of the records
+  """
+  __slots__ = ('names','index')
+
+  def __init__(self, names):
+    """
+      Constructor (use getSchema to share the schemas)
+      @ In, names, tuple(string), the names
+      @ Out, None
+    """
+    self.names = names
+    self.index = dict((name,i) for i,name in enumerate(names))
+
+  def __reduce__(self):
+    """
+      Pickles the schema by its names, so that the unpickled schemas are shared again
+      @ In, None
+      @ Out, reduce, tuple, the function and arguments rebuilding the schema
+    """
+    return getSchema, (self.names,)
+
+def getSchema(names):
+  """
+    Returns the shared schema of the names
+    @ In, names, tuple(string), the names
+    @ Out, schema, SampleSchema, the schema
+  """
+  schema = _schemas.get(names)
+  if schema is None:
+    if len(_schemas) >= _maxSchemas:
+      _schemas.clear()
+    schema = _schemas[names] = SampleSchema(names)
+  return schema
+
+class SampleRecord(MutableMapping):
+  """
+    Copy-on-write mapping of the information of a sample, {name:value}
+  """
+  __slots__ = ('_schema','_values','_mutable','_dict','_pyFloats')
+
+  @classmethod
+  def fromDict(cls, info, nested=True):
+    """
+      Takes a snapshot of a dictionary (e.g. a sampler inputInfo). The dictionaries it contains become records
+      as well (if nested), the other mutable values (e.g. arrays) are deep copied.
+      @ In, info, dict, the information
+      @ In, nested, bool, optional, if True the dictionaries in info become records
+      @ Out, record, SampleRecord, the record
+    """
+    names = tuple(info.keys())
+    vector = cls._floatVector(info.values())
+    if vector is not None:
+      return cls(getSchema(names), *vector)
+    values = []
+    mutable = []
+    for i,value in enumerate(info.values()):
+      if not isinstance(value, _immutableTypes):
+        if isinstance(value, SampleRecord):
+          value = value.copy()
+        elif nested and type(value) == dict:
+          value = cls.fromDict(value, nested=False)
+        else:
+          value = copy.deepcopy(value)
+        mutable.append(i)
+      values.append(value)
+    return cls(getSchema(names), tuple(values), tuple(mutable))
+
+  @staticmethod
+  def _floatVector(values):
+    """
+      Stores values in a read-only float array, if they are all floats of the same type
+      @ In, values, iterable, the values
+      @ Out, vector, tuple, (array, mutable, pyFloats) arguments of the constructor, None if not all floats
+    """
+    values = list(values)
+    if len(values) == 0:
+      return None
+    kind = type(values[0])
+    if kind not in (float, np.float64) or any(type(value) is not kind for value in values):
+      return None
+    array = np.asarray(values, dtype=np.float64)
+    array.flags.writeable = False
+    return array, (), kind is float
+
+  @classmethod
+  def _fromPrivateDict(cls, privateDict):
+    """
+      Returns a modified record, storing its entries in a private dictionary
+      @ In, privateDict, dict, the dictionary (owned by the record)
+      @ Out, record, SampleRecord, the record
+    """
+    record = cls(None, None)
+    record._dict = privateDict
+    return record
+
+  def __init__(self, schema, values, mutable=(), pyFloats=False):
+    """
+      Constructor
+      @ In, schema, SampleSchema, the names of the entries
+      @ In, values, tuple or np.ndarray, the values of the entries (aligned with the schema), a read-only
+        float array if they are all floats
+      @ In, mutable, tuple(int), optional, the entries with mutable values (copied when the record is deep copied)
+      @ In, pyFloats, bool, optional, if True the values of the array are returned as Python floats (as they
+        were given), otherwise as numpy floats
+      @ Out, None
+    """
+    self._schema = schema
+    self._values = values
+    self._mutable = mutable
+    self._pyFloats = pyFloats
+    self._dict = None # the private dictionary, once the record is modified
+
+  def __getitem__(self, key):
+    """
+      Returns a value
+      @ In, key, string, the name
+      @ Out, value, object, the value
+    """
+    if self._dict is not None:
+      return self._dict[key]
+    value = self._values[self._schema.index[key]]
+    return value.item() if self._pyFloats else value
+
+  def vector(self):
+    """
+      Returns the values aligned with the names, without copying them if they are stored in an array
+      @ In, None
+      @ Out, (names, values), tuple, the names and the values (read-only array, or tuple)
+    """
+    if self._dict is not None:
+      return tuple(self._dict.keys()), tuple(self._dict.values())
+    return self._schema.names, self._values
+
+  def __contains__(self, key):
+    """
+      Checks if there is an entry
+      @ In, key, string, the name
+      @ Out, contains, bool, True if the entry is present
+    """
+    if self._dict is not None:
+      return key in self._dict
+    return key in self._schema.index
+
+  def __iter__(self):
+    """
+      Iterates over the names
+      @ In, None
+      @ Out, iterator, iterator, the names
+    """
+    return iter(self._dict if self._dict is not None else self._schema.names)
+
+  def __len__(self):
+    """
+      Number of entries
+      @ In, None
+      @ Out, len, int, the number of entries
+    """
+    return len(self._dict if self._dict is not None else self._values)
+
+  def __array__(self, dtype=None, copy=None):
+    """
+      Converts the record into a numpy array holding it, as numpy does for a dictionary (without this, numpy
+      would read it as a sequence of its names, e.g. in np.atleast_1d(record))
+      @ In, dtype, np.dtype, optional, the requested type (ignored, the array holds an object)
+      @ In, copy, bool, optional, the copy request of numpy (ignored, the record is never copied)
+      @ Out, array, np.ndarray, 0-d object array holding the record
+    """
+    array = np.empty((), dtype=object)
+    array[()] = self
+    return array
+
+  def __setitem__(self, key, value):
+    """
+      Sets a value (the record is copied in a private dictionary first)
+      @ In, key, string, the name
+      @ In, value, object, the value
+      @ Out, None
+    """
+    self.__materialize()[key] = value
+
+  def __delitem__(self, key):
+    """
+      Removes an entry (the record is copied in a private dictionary first)
+      @ In, key, string, the name
+      @ Out, None
+    """
+    del self.__materialize()[key]
+
+  def __materialize(self):
+    """
+      Copies the record in its private dictionary
+      @ In, None
+      @ Out, dict, dict, the private dictionary
+    """
+    if self._dict is None:
+      self._dict = dict((name,self[name]) for name in self._schema.names)
+      self._schema = self._values = None
+    return self._dict
+
+  def copy(self):
+    """
+      Returns a shallow copy (sharing the values until one of the two records is modified)
+      @ In, None
+      @ Out, copy, SampleRecord, the copy
+    """
+    if self._dict is not None:
+      return SampleRecord._fromPrivateDict(dict(self._dict))
+    return SampleRecord(self._schema, self._values, self._mutable, self._pyFloats)
+
+  def __copy__(self):
+    """
+      Shallow copy, see copy
+      @ In, None
+      @ Out, copy, SampleRecord, the copy
+    """
+    return self.copy()
+
+  def __deepcopy__(self, memo):
+    """
+      Deep copy: only the mutable values are copied, the immutable ones are shared
+      @ In, memo, dict, the objects already copied
+      @ Out, copy, SampleRecord, the copy
+    """
+    if self._dict is not None:
+      return SampleRecord._fromPrivateDict(copy.deepcopy(self._dict, memo))
+    values = self._values
+    if self._mutable:
+      values = list(values)
+      for i in self._mutable:
+        values[i] = copy.deepcopy(values[i], memo)
+      values = tuple(values)
+    return SampleRecord(self._schema, values, self._mutable, self._pyFloats)
+
+  def __getstate__(self):
+    """
+      Returns the state for pickling
+      @ In, None
+      @ Out, state, tuple, the state
+    """
+    return (self._schema, self._values, self._mutable, self._dict, self._pyFloats)
+
+  def __setstate__(self, state):
+    """
+      Restores the state after unpickling
+      @ In, state, tuple, the state
+      @ Out, None
+    """
+    self._schema, self._values, self._mutable, self._dict, self._pyFloats = state
+    if isinstance(self._values, np.ndarray):
+      self._values.flags.writeable = False
+
+  def __repr__(self):
+    """
+      Representation, as the one of a dictionary
+      @ In, None
+      @ Out, repr, string, the representation
+    """
+    return repr(dict(self.items()))
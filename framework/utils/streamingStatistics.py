@@ -0,0 +1,393 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Mergeable accumulators used to compute weighted statistics chunk by chunk
+  (e.g. by the BasicStatistics post-processor in online mode).
+  All the accumulators work on blocks of samples shaped as (#samples, #variables, #pivotValues);
+  static variables are simply handled with a single pivot value.
+  Two accumulators built on different sets of samples can be merged, obtaining the same state that
+  would have been built on the union of the samples.
+  Reference for the update formulas:
+  Philippe Pebay, "Formulas for robust, one-pass parallel computation of covariances and arbitrary-order
+  statistical moments", SAND2008-6212, 2008.
+"""
+#for future compatibility with Python 3--------------------------------------------------------------
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+#End compatibility block for Python 3----------------------------------------------------------------
+
+#External Modules------------------------------------------------------------------------------------
+import numpy as np
+#External Modules End--------------------------------------------------------------------------------
+
+class WeightedMoments(object):
+  """
+    Accumulator of the weighted central moments (up to the fourth order), minimum and maximum of a set
+    of variables. The sums of the powers of the weights are kept as well, so that the statistics can be
+    corrected for the sample size as in Rimoldini, "Weighted skewness and kurtosis unbiased by sample size"
+    (http://arxiv.org/pdf/1304.6564.pdf). With unit weights the usual unweighted estimators are obtained.
+  """
+  def __init__(self):
+    """
+      Constructor, the accumulator is empty
+      @ In, None
+      @ Out, None
+    """
+    self.count      = 0    # number of samples
+    self.weightSums = None # [4,#variables], sums of the first four powers of the weights
+    self.mean       = None # [#variables,#pivotValues], weighted mean
+    self.m2         = None # [#variables,#pivotValues], sums of the weighted central powers of order 2, 3, 4
+    self.m3         = None
+    self.m4         = None
+    self.minimum    = None # [#variables,#pivotValues]
+    self.maximum    = None
+
+  @classmethod
+  def fromSamples(cls, values, weights):
+    """
+      Builds the accumulator of a block of samples
+      @ In, values, np.ndarray, [#samples,#variables,#pivotValues] the samples
+      @ In, weights, np.ndarray, [#samples,#variables] the weights of the samples (for each variable)
+      @ Out, state, WeightedMoments, the accumulator
+    """
+    values = np.asarray(values, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    state = cls()
+    state.count = values.shape[0]
+    if state.count == 0:
+      return state
+    state.weightSums = np.asarray([np.sum(weights**p, axis=0) for p in range(1,5)])
+    weights = weights[:,:,np.newaxis]
+    state.minimum = np.min(values, axis=0)
+    state.maximum = np.max(values, axis=0)
+    state.mean = np.sum(weights*values, axis=0)/state.weightSums[0][:,np.newaxis]
+    # the rounding of the sum must not give a spread to constant variables
+    state.mean = np.where(state.minimum == state.maximum, state.minimum, state.mean)
+    deviation = values - state.mean
+    power = weights*deviation**2
+    state.m2 = np.sum(power, axis=0)
+    power *= deviation
+    state.m3 = np.sum(power, axis=0)
+    power *= deviation
+    state.m4 = np.sum(power, axis=0)
+    return state
+
+  def update(self, values, weights):
+    """
+      Adds a block of samples to the accumulator
+      @ In, values, np.ndarray, [#samples,#variables,#pivotValues] the samples
+      @ In, weights, np.ndarray, [#samples,#variables] the weights of the samples (for each variable)
+      @ Out, None
+    """
+    self.merge(self.fromSamples(values, weights))
+
+  def merge(self, other):
+    """
+      Merges the state of another accumulator (built on different samples of the same variables) into this one
+      @ In, other, WeightedMoments, the accumulator to merge
+      @ Out, None
+    """
+    if other.count == 0:
+      return
+    if self.count == 0:
+      self.__dict__.update(dict((key,np.copy(value) if isinstance(value,np.ndarray) else value) for key,value in other.__dict__.items()))
+      return
+    wa = self.weightSums[0][:,np.newaxis]
+    wb = other.weightSums[0][:,np.newaxis]
+    w = wa + wb
+    delta = other.mean - self.mean
+    m2 = self.m2 + other.m2 + delta**2*wa*wb/w
+    m3 = self.m3 + other.m3 + delta**3*wa*wb*(wa-wb)/w**2 + 3.0*delta*(wa*other.m2-wb*self.m2)/w
+    m4 = self.m4 + other.m4 + delta**4*wa*wb*(wa**2-wa*wb+wb**2)/w**3 \
+           + 6.0*delta**2*(wa**2*other.m2+wb**2*self.m2)/w**2 + 4.0*delta*(wa*other.m3-wb*self.m3)/w
+    self.mean = self.mean + delta*wb/w
+    self.m2, self.m3, self.m4 = m2, m3, m4
+    self.minimum = np.minimum(self.minimum, other.minimum)
+    self.maximum = np.maximum(self.maximum, other.maximum)
+    self.weightSums = self.weightSums + other.weightSums
+    self.count += other.count
+
+  def _normalizedWeightSums(self):
+    """
+      Sums of the powers of the weights, once the weights are normalized to sum to one
+      @ In, None
+      @ Out, (v2,v3,v4), tuple(np.ndarray), [#variables,1] each
+    """
+    w1 = self.weightSums[0][:,np.newaxis]
+    return tuple(self.weightSums[p-1][:,np.newaxis]/w1**p for p in range(2,5))
+
+  def variance(self, biased=False):
+    """
+      Weighted variance
+      @ In, biased, bool, optional, if True the biased estimator is returned
+      @ Out, variance, np.ndarray, [#variables,#pivotValues] the variance
+    """
+    variance = self.m2/self.weightSums[0][:,np.newaxis]
+    if not biased:
+      v2 = self._normalizedWeightSums()[0]
+      variance = variance/(1.0-v2)
+    return variance
+
+  def skewness(self, biased=False):
+    """
+      Weighted skewness
+      @ In, biased, bool, optional, if True the biased estimator is returned
+      @ Out, skewness, np.ndarray, [#variables,#pivotValues] the skewness
+    """
+    skewness = self.m3/self.weightSums[0][:,np.newaxis]
+    if not biased:
+      v2, v3, _ = self._normalizedWeightSums()
+      skewness = skewness/(1.0-3.0*v2+2.0*v3)
+    return skewness/self.variance(biased)**1.5
+
+  def kurtosis(self, biased=False):
+    """
+      Weighted (Fisher) kurtosis
+      @ In, biased, bool, optional, if True the biased estimator is returned
+      @ Out, kurtosis, np.ndarray, [#variables,#pivotValues] the kurtosis
+    """
+    w1 = self.weightSums[0][:,np.newaxis]
+    variance = self.variance(biased)
+    if biased:
+      return -3.0 + self.m4/w1/variance**2
+    v2, v3, v4 = self._normalizedWeightSums()
+    numer1 = 1.0-3.0*v2+2.0*v3+3.0*v2**2-3.0*v4
+    numer2 = 3.0*(2.0*v2-2.0*v3-3.0*v2**2+3.0*v4)
+    denom = (1.0-v2)*(1.0-6.0*v2+8.0*v3+3.0*v2**2-6.0*v4)
+    return -3.0 + (self.m4/w1*numer1/denom - (self.m2/w1)**2*numer2/denom)/variance**2
+
+class WeightedCoMoments(object):
+  """
+    Accumulator of the weighted co-moments (sums of the weighted products of the deviations) of a set
+    of variables, sharing the same weight for each sample, from which the covariance matrix and the
+    linear regression coefficients are obtained.
+  """
+  def __init__(self):
+    """
+      Constructor, the accumulator is empty
+      @ In, None
+      @ Out, None
+    """
+    self.count      = 0    # number of samples
+    self.weightSums = None # [2], sums of the weights and of their squares
+    self.mean       = None # [#pivotValues,#variables], weighted mean
+    self.comoment   = None # [#pivotValues,#variables,#variables], weighted co-moments
+
+  @classmethod
+  def fromSamples(cls, values, weights):
+    """
+      Builds the accumulator of a block of samples
+      @ In, values, np.ndarray, [#samples,#variables,#pivotValues] the samples
+      @ In, weights, np.ndarray, [#samples] the weights of the samples
+      @ Out, state, WeightedCoMoments, the accumulator
+    """
+    weights = np.asarray(weights, dtype=float)
+    state = cls()
+    state.count = len(weights)
+    if state.count == 0:
+      return state
+    # pivot values first, to use the stacked matrix products
+    values = np.asarray(values, dtype=float).transpose(2,1,0)
+    state.weightSums = np.asarray([np.sum(weights), np.sum(weights**2)])
+    state.mean = np.dot(values, weights)/state.weightSums[0]
+    # the rounding of the sum must not give a spread to constant variables
+    state.mean = np.where(values.min(axis=2) == values.max(axis=2), values[:,:,0], state.mean)
+    deviation = values - state.mean[:,:,np.newaxis]
+    state.comoment = np.matmul(deviation*weights, deviation.transpose(0,2,1))
+    return state
+
+  def update(self, values, weights):
+    """
+      Adds a block of samples to the accumulator
+      @ In, values, np.ndarray, [#samples,#variables,#pivotValues] the samples
+      @ In, weights, np.ndarray, [#samples] the weights of the samples
+      @ Out, None
+    """
+    self.merge(self.fromSamples(values, weights))
+
+  def merge(self, other):
+    """
+      Merges the state of another accumulator (built on different samples of the same variables) into this one
+      @ In, other, WeightedCoMoments, the accumulator to merge
+      @ Out, None
+    """
+    if other.count == 0:
+      return
+    if self.count == 0:
+      self.__dict__.update(dict((key,np.copy(value) if isinstance(value,np.ndarray) else value) for key,value in other.__dict__.items()))
+      return
+    wa, wb = self.weightSums[0], other.weightSums[0]
+    w = wa + wb
+    delta = other.mean - self.mean
+    self.comoment = self.comoment + other.comoment + delta[:,:,np.newaxis]*delta[:,np.newaxis,:]*wa*wb/w
+    self.mean = self.mean + delta*wb/w
+    self.weightSums = self.weightSums + other.weightSums
+    self.count += other.count
+
+  def covariance(self, biased=False, means=None):
+    """
+      Weighted covariance matrix
+      @ In, biased, bool, optional, if True the biased estimator is returned
+      @ In, means, np.ndarray, optional, [#pivotValues,#variables] the means the deviations are computed from,
+        if different from the weighted mean of the accumulator (e.g. if each variable has its own weights)
+      @ Out, covariance, np.ndarray, [#pivotValues,#variables,#variables] the covariance matrix
+    """
+    w1, w2 = self.weightSums
+    comoment = self.comoment
+    if means is not None:
+      shift = self.mean - means
+      comoment = comoment + w1*shift[:,:,np.newaxis]*shift[:,np.newaxis,:]
+    covariance = comoment/w1
+    if not biased:
+      covariance = covariance/(1.0-w2/w1**2)
+    return covariance
+
+class QuantileSketch(object):
+  """
+    Mergeable sketch of the distribution of a set of variables, used to estimate (weighted) quantiles.
+    The samples are stored exactly until their number exceeds twice the size of the sketch, then they are
+    compressed into "size" centroids, each one carrying (about) the same fraction of the total weight.
+    The quantiles are therefore exact as long as no compression happened, and their error is otherwise
+    bounded by (about) 1/size in probability.
+  """
+  def __init__(self, size=200):
+    """
+      Constructor, the sketch is empty
+      @ In, size, int, optional, number of centroids kept after each compression
+      @ Out, None
+    """
+    self.size       = size
+    self.shape      = None  # (#variables,#pivotValues)
+    self.values     = None  # [#variables*#pivotValues,#points] values of the points (samples or centroids)
+    self.weights    = None  # [#variables*#pivotValues,#points] weights of the points
+    self.compressed = False # True if the points are not the original samples anymore
+
+  def update(self, values, weights):
+    """
+      Adds a block of samples to the sketch
+      @ In, values, np.ndarray, [#samples,#variables,#pivotValues] the samples
+      @ In, weights, np.ndarray, [#samples,#variables] the weights of the samples (for each variable)
+      @ Out, None
+    """
+    values = np.asarray(values, dtype=float)
+    numSamples, numVars, numPivot = values.shape
+    if numSamples == 0:
+      return
+    rows = values.transpose(1,2,0).reshape(numVars*numPivot,numSamples)
+    rowWeights = np.broadcast_to(np.asarray(weights, dtype=float).T[:,np.newaxis,:],(numVars,numPivot,numSamples))
+    self.__append((numVars,numPivot), rows, rowWeights.reshape(numVars*numPivot,numSamples), False)
+
+  def merge(self, other):
+    """
+      Merges another sketch (built on different samples of the same variables) into this one
+      @ In, other, QuantileSketch, the sketch to merge
+      @ Out, None
+    """
+    if other.values is not None:
+      self.__append(other.shape, other.values, other.weights, other.compressed)
+
+  def __append(self, shape, values, weights, compressed):
+    """
+      Appends points to the sketch, compressing it if needed
+      @ In, shape, tuple, (#variables,#pivotValues)
+      @ In, values, np.ndarray, [#variables*#pivotValues,#points] values of the points
+      @ In, weights, np.ndarray, [#variables*#pivotValues,#points] weights of the points
+      @ In, compressed, bool, True if the points are centroids
+      @ Out, None
+    """
+    if self.values is None:
+      self.shape, self.values, self.weights = shape, np.array(values), np.array(weights)
+    else:
+      self.values = np.concatenate((self.values, values), axis=1)
+      self.weights = np.concatenate((self.weights, weights), axis=1)
+    self.compressed = self.compressed or compressed
+    if self.values.shape[1] > 2*self.size:
+      self.__compress()
+
+  def __sorted(self):
+    """
+      Sorts the points of each row of the sketch
+      @ In, None
+      @ Out, (values,weights,cumulative), tuple(np.ndarray), the sorted values and weights, and the cumulative weights
+    """
+    order = np.argsort(self.values, axis=1)
+    rows = np.arange(self.values.shape[0])[:,np.newaxis]
+    values = self.values[rows, order]
+    weights = self.weights[rows, order]
+    return values, weights, np.cumsum(weights, axis=1)
+
+  def __compress(self):
+    """
+      Replaces the points of each row by "size" centroids of (about) equal weight
+      @ In, None
+      @ Out, None
+    """
+    numRows = self.values.shape[0]
+    values, weights, cumulative = self.__sorted()
+    total = cumulative[:,-1:]
+    total = np.where(total > 0.0, total, 1.0)
+    # each point goes to the bin containing the cumulative weight preceding it
+    bins = np.minimum(((cumulative-weights)/total*self.size).astype(int), self.size-1)
+    bins += np.arange(numRows)[:,np.newaxis]*self.size
+    binWeights = np.bincount(bins.ravel(), weights=weights.ravel(), minlength=numRows*self.size).reshape(numRows,self.size)
+    binMoments = np.bincount(bins.ravel(), weights=(weights*values).ravel(), minlength=numRows*self.size).reshape(numRows,self.size)
+    filled = binWeights > 0.0
+    binValues = binMoments/np.where(filled, binWeights, 1.0)
+    # empty bins (a point heavier than a bin) get the value of the previous centroid and no weight
+    previous = np.maximum.accumulate(np.where(filled, np.arange(self.size), 0), axis=1)
+    self.values = binValues[np.arange(numRows)[:,np.newaxis], previous]
+    self.weights = binWeights
+    self.compressed = True
+
+  def quantile(self, percents, method='weighted'):
+    """
+      Estimates the quantiles of the variables
+      @ In, percents, list(float), the requested quantiles (between 0 and 1)
+      @ In, method, str, optional, 'weighted' for the weighted percentile computed by the BasicStatistics
+        post-processor (the first point whose cumulative weight is above the percent), 'lower' or 'midpoint' for
+        the numpy interpolations (the weights are then the number of samples)
+      @ Out, quantiles, np.ndarray, [#percents,#variables,#pivotValues] the quantiles
+    """
+    values, weights, cumulative = self.__sorted()
+    numPoints = values.shape[1]
+    rows = np.arange(values.shape[0])
+    total = cumulative[:,-1]
+
+    def atRank(rank):
+      """
+        Value of the sample at the given (0-based) rank of each row
+        @ In, rank, np.ndarray, [#rows] the rank
+        @ Out, value, np.ndarray, [#rows] the value
+      """
+      index = np.minimum(np.sum(cumulative <= rank[:,np.newaxis], axis=1), numPoints-1)
+      return values[rows, index]
+
+    if method == 'weighted':
+      # the weights are normalized before being accumulated, as in the post-processor, so that the percents
+      # falling on a cumulative weight are rounded the same way
+      normalized = np.cumsum(weights/self.weights.sum(axis=1)[:,np.newaxis], axis=1)
+    quantiles = []
+    for percent in percents:
+      if method == 'weighted':
+        # the first point whose cumulative weight is above the requested percent
+        index = np.minimum(np.sum(normalized <= percent, axis=1), numPoints-1)
+        quantile = values[rows, index]
+      else:
+        rank = percent*(total-1.0)
+        quantile = atRank(np.floor(rank))
+        if method == 'midpoint':
+          quantile = 0.5*(quantile+atRank(np.ceil(rank)))
+      quantiles.append(quantile.reshape(self.shape))
+    return np.asarray(quantiles)
@@ -34,6 +34,10 @@ import numpy
 import six
 from difflib import SequenceMatcher
 import importlib
+try:
+  from collections.abc import Mapping
+except ImportError:
+  from collections import Mapping
 
 class Object(object):
   """
@@ -398,6 +402,15 @@ def isString(s):
   """
   return isinstance(s, six.string_types)
 
+def isAMapping(obj):
+  """
+    Method to figure out if a variable is a dictionary-like {key:value} mapping, e.g. a dict, an OrderedDict
+    or a SampleRecord (the copy-on-write inputInfo the samplers provide, which is not a dict subclass).
+    @ In, obj, object, variable for which we need to assess if it is a mapping
+    @ Out, isAMapping, bool, true if variable is a mapping
+  """
+  return isinstance(obj, Mapping)
+
 def toBytesIterative(s):
   """
     Method aimed to convert all the string-compatible content of
@@ -407,7 +420,7 @@ def toBytesIterative(s):
   """
   if type(s) == list:
     return [toBytes(x) for x in s]
-  elif type(s) == dict:
+  elif isAMapping(s):
     if len(s.keys()) == 0:
       return None
     tempdict = {}
@@ -439,7 +452,7 @@ def toListFromNumpyOrC1arrayIterative(array):
   """
   if type(array) == list:
     return [toListFromNumpyOrC1array(x) for x in array]
-  elif type(array) == dict:
+  elif isAMapping(array):
     if len(array.keys()) == 0:
       return None
     tempdict = {}
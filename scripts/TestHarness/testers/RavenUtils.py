@@ -131,13 +131,27 @@ def moduleReport(module,version=''):
   except:
     return (False,'Failed to find module '+module,"NA")
 
+## names of the installed distributions of the modules, when they differ (see __importReport)
+__distributionNames = {"sklearn":"scikit-learn"}
+
 def __importReport(module):
   """ Directly checks the module version.
+  The version is read from the metadata of the installed package when it is
+  available, so that the (possibly slow to import) module is not imported.
   Returns (found_boolean,message,version)
   The found_boolean is true if the module is found.
   The message will be the result of print(module)
   The version is the version number or "NA" if not known.
   """
+  try:
+    from importlib import metadata
+    try:
+      foundVersion = metadata.version(__distributionNames.get(module,module))
+      return (True, 'Found '+module+' '+foundVersion+' (package metadata)', foundVersion)
+    except metadata.PackageNotFoundError:
+      pass
+  except ImportError:
+    pass
   try:
     loaded = importlib.import_module(module)
     foundVersion = loaded.__version__
@@ -0,0 +1,28 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Picks a string label from the sampled y
+"""
+
+def evaluate(self):
+  """
+    Returns the label
+    @ In, None
+    @ Out, label, str, the label
+  """
+  if self.y < 1.5:
+    label = 'short'
+  else:
+    label = 'long'
+  return label
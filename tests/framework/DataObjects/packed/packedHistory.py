@@ -0,0 +1,30 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Histories whose length and pivot values depend on the inputs
+"""
+import numpy as np
+
+def run(self,Input):
+  """
+    Evaluates the histories
+    @ In, Input, dict, the sampled variables
+    @ Out, None
+  """
+  x = float(Input['x'])
+  y = float(Input['y'])
+  steps = 2 + int(round(4.0*x))
+  self.time = np.linspace(0.0,y,steps)
+  self.ramp = x*self.time
+  self.wave = np.sin(self.time) + y
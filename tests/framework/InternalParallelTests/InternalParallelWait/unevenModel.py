@@ -0,0 +1,28 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Simple model whose run time depends on its inputs, so that the jobs
+  running in parallel finish in a different order than they were submitted.
+"""
+import time
+
+def run(self, Input):
+  """
+    Evaluates the model
+    @ In, self, object, the external model container
+    @ In, Input, dict, the sampled variables
+    @ Out, None
+  """
+  time.sleep(0.05*((3.0*self.x + 2.0*self.y) % 4))
+  self.ans = self.x**2 + 2.0*self.y
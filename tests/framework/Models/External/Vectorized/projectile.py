@@ -0,0 +1,35 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#***************************************
+#* Vectorized analytic ExternalModule  *
+#***************************************
+#
+# Height of a projectile launched with speed v0 and angle (degrees) angle, with a vectorized run:
+#     each input holds the values of all the samples of a batch.
+#
+import numpy as np
+
+def run(self,Input):
+  """
+    Computes the maximum height and the range of the projectile
+    @ In, Input, dict, the sampled variables
+    @ Out, None
+  """
+  vy = self.v0*np.sin(np.radians(self.angle))
+  vx = self.v0*np.cos(np.radians(self.angle))
+  self.ymax = vy**2/(2.*9.81)
+  self.r = 2.*vx*vy/9.81
+  # common to all the samples
+  self.g = 9.81
+run.vectorized = True
@@ -0,0 +1,35 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#***************************************
+#* Vectorized analytic ExternalModule  *
+#***************************************
+#
+# Trajectory of a projectile launched with speed v0 and angle (degrees) angle, with a vectorized run:
+#     each input holds the values of all the samples of a batch, each history is a row, and the pivot
+#     (1-D) is common to all the samples.
+#
+import numpy as np
+
+def run(self,Input):
+  """
+    Computes the height of the projectile along the flight time
+    @ In, Input, dict, the sampled variables
+    @ Out, None
+  """
+  vy = self.v0*np.sin(np.radians(self.angle))
+  # common to all the samples, not split along them (even if the batch has as many samples as time steps)
+  self.time = np.linspace(0.,1.,5)
+  self.y = vy[:,np.newaxis]*self.time - 0.5*9.81*self.time**2
+run.vectorized = True
+run.sharedOutputs = ['time']
@@ -72,6 +72,21 @@ low, high = Metrics.MetricUtilities._getBounds({"low":1.0,"high":3.0},{"low":2.0
 assert low == 1.0
 assert high == 3.0
 
+#Test exact integration of the empirical distributions
+shifted = [x + 1.0 for x in simple]
+cdfAreaDifference = Metrics.MetricUtilities._getCDFAreaDifference(simple, shifted)
+print("cdfAreaDifference shifted",cdfAreaDifference)
+assert abs(cdfAreaDifference - 1.0) < 1e-12
+
+cdfAreaDifferences = Metrics.MetricUtilities._getCDFAreaDifferences([(simple, simple), (simple, shifted), ((simple, simple_prob), shifted)])
+print("cdfAreaDifferences",cdfAreaDifferences)
+assert abs(cdfAreaDifferences[0]) < 1e-12 and abs(cdfAreaDifferences[1] - 1.0) < 1e-12 and abs(cdfAreaDifferences[2] - 1.0) < 1e-12
+
+pdfCommonAreas = Metrics.MetricUtilities._getPDFCommonAreas([(simple, simple), (simple, shifted)])
+print("pdfCommonAreas",pdfCommonAreas)
+assert abs(pdfCommonAreas[0] - Metrics.MetricUtilities._getPDFCommonArea(simple, simple)) < 1e-12
+assert 0.0 < pdfCommonAreas[1] < pdfCommonAreas[0]
+
 dist1 = Distributions.Normal(0.0, 1.0)
 dist1.initializeDistribution()
 
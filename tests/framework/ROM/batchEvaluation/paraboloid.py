@@ -0,0 +1,25 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Analytic model used to train the ROMs of the batch evaluation tests
+"""
+
+def run(self,Input):
+  """
+    Evaluates a paraboloid
+    @ In, self, object, the model variables
+    @ In, Input, dict, the input variables
+    @ Out, None
+  """
+  self.z = (self.x - 0.5)**2 + 2.0*(self.y - 0.25)**2
@@ -0,0 +1,207 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the GenericParser of the GenericCode interface.
+  The inputs written from the templates in GenericParser are compared with the ones written by the
+  parser before the templates were compiled once (gold/GenericParser), and the sharing of the
+  compiled templates between the parsers is checked.
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys, os
+import shutil
+import tempfile
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+sys.path.append(os.path.join(frameworkDir,'CodeInterfaces','Generic'))
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+
+import MessageHandler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'debug', 'callerLength':10, 'tagLength':10})
+
+import Files
+import GenericParser
+print('Module undergoing testing:')
+print(GenericParser)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,res,update=True):
+  """
+    This method is a pass-through for consistency and updating
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ Out, res, bool, True if test
+  """
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking bool",comment,'|',res,'is not True!')
+      results["fail"] += 1
+  return res
+
+def checkSame(comment,value,expected,update=True):
+  """
+    This method is aimed to compare two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking string",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
+testDir = os.path.dirname(os.path.abspath(__file__))
+templateDir = os.path.join(testDir,'GenericParser')
+goldDir = os.path.join(testDir,'gold','GenericParser')
+templateNames = ['template.inp','table.dat']
+workDir = tempfile.mkdtemp()
+
+def makeFile(directory,fileName):
+  """
+    Creates the Files object of a file
+    @ In, directory, string, the directory of the file
+    @ In, fileName, string, the name of the file
+    @ Out, inputFile, Files.UserGenerated, the file
+  """
+  inputFile = Files.UserGenerated()
+  inputFile.messageHandler = mh
+  inputFile.setAbsFile(os.path.join(directory,fileName))
+  return inputFile
+
+def stage(directory,sourceDir=templateDir):
+  """
+    Copies the templates in a run directory, as the Code model does
+    @ In, directory, string, the run directory (created)
+    @ In, sourceDir, string, optional, the directory of the templates
+    @ Out, inputFiles, list, the Files of the copies
+  """
+  os.mkdir(directory)
+  for fileName in templateNames:
+    shutil.copy(os.path.join(sourceDir,fileName),directory)
+  return [makeFile(directory,fileName) for fileName in templateNames]
+
+def readText(fileName):
+  """
+    Reads a text file
+    @ In, fileName, string, the file
+    @ Out, text, string, its content
+  """
+  with open(fileName,'r') as textFile:
+    return textFile.read()
+
+origFiles = [makeFile(templateDir,fileName) for fileName in templateNames]
+
+######################################
+#     outputs against the old parser #
+######################################
+# the same samples as used to write the golds with the previous parser
+samples = [{'title':'first','x':1.5,'y':0.125,'n':3,'z':-4.0},
+           {'x':-2.25,'n':12},
+           {'title':'third','x':1234.56789,'y':-7e-5,'n':7,'z':1e20}]
+for sample, sampledVars in enumerate(samples):
+  runDir = os.path.join(workDir,'sample_{}'.format(sample))
+  inputFiles = stage(runDir)
+  parser = GenericParser.GenericParser(inputFiles)
+  parser.modifyInternalDictionary(SampledVars=sampledVars,additionalEdits={'output':'outName'})
+  parser.writeNewInput(inputFiles,origFiles)
+  for fileName in templateNames:
+    checkSame('sample {} file {}'.format(sample,fileName),readText(os.path.join(runDir,fileName)),
+              readText(os.path.join(goldDir,'sample_{}'.format(sample),fileName)))
+
+######################################
+#     sharing of the templates       #
+######################################
+first = GenericParser.GenericParser(stage(os.path.join(workDir,'first')))
+second = GenericParser.GenericParser(stage(os.path.join(workDir,'second')))
+# the places, defaults and formats are read only, they are shared
+checkTrue('varPlaces shared',first.varPlaces is second.varPlaces)
+checkTrue('defaults shared',first.defaults is second.defaults)
+checkTrue('formats shared',first.formats is second.formats)
+checkSame('defaults',first.defaults,{'title':{'template.inp':'base'},'y':{'template.inp':'2.5','table.dat':'3.5'},'z':{'table.dat':'7'}})
+checkSame('varPlaces of x',sorted(first.varPlaces['x'].keys()),['table.dat','template.inp'])
+checkSame('places of x in template.inp',len(first.varPlaces['x']['template.inp']),3)
+# the segments receive the values, each parser has its own
+for fileName in templateNames:
+  checkTrue('segments of {} not shared'.format(fileName),first.segments[fileName] is not second.segments[fileName])
+  checkSame('segments of {} equal'.format(fileName),first.segments[fileName],second.segments[fileName])
+before = dict((fileName,list(segments)) for fileName, segments in second.segments.items())
+first.modifyInternalDictionary(SampledVars=samples[0],additionalEdits={'output':'outName'})
+checkSame('segments of the other parser untouched',second.segments,before)
+third = GenericParser.GenericParser(stage(os.path.join(workDir,'third')))
+checkSame('segments of a new parser untouched',third.segments,before)
+
+# the templates are identified by their content: an edited copy is parsed again
+editedDir = os.path.join(workDir,'edited')
+editedFiles = stage(editedDir)
+with open(os.path.join(editedDir,'table.dat'),'a') as table:
+  table.write('w $RAVEN-w:0.5$\n')
+edited = GenericParser.GenericParser(editedFiles)
+checkTrue('edited template compiled again',edited.varPlaces is not first.varPlaces)
+checkTrue('edited template new variable','w' in edited.varPlaces.keys())
+edited.modifyInternalDictionary(SampledVars=samples[0],additionalEdits={'output':'outName'})
+edited.writeNewInput(editedFiles,origFiles)
+checkSame('edited template written',readText(os.path.join(editedDir,'table.dat')),
+          readText(os.path.join(goldDir,'sample_0','table.dat'))+'w 0.5\n')
+# so are different delimiters
+otherDelimiters = GenericParser.GenericParser(stage(os.path.join(workDir,'delimiters')),defaultDelim='#')
+checkTrue('other delimiters compiled again',otherDelimiters.varPlaces is not first.varPlaces)
+
+# the cache is bounded, the least recently used templates are dropped
+for index in range(GenericParser._maxCompiledTemplates + 2):
+  uniqueDir = os.path.join(workDir,'unique_{}'.format(index))
+  uniqueFiles = stage(uniqueDir)
+  with open(os.path.join(uniqueDir,'template.inp'),'a') as template:
+    template.write('unique {}\n'.format(index))
+  GenericParser.GenericParser(uniqueFiles)
+checkSame('cache bounded',len(GenericParser._compiledTemplates),GenericParser._maxCompiledTemplates)
+fourth = GenericParser.GenericParser(stage(os.path.join(workDir,'fourth')))
+checkTrue('dropped template compiled again',fourth.varPlaces is not first.varPlaces)
+checkSame('dropped template compiled again, same places',fourth.varPlaces,first.varPlaces)
+
+shutil.rmtree(workDir)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.unit_test_GenericParser</name>
+    <author>agent</author>
+    <created>2026-10-17</created>
+    <classesTested>CodeInterfaces.Generic.GenericParser</classesTested>
+    <description>
+       This test is a Unit Test for the GenericParser class. It compares the inputs it writes with the
+       ones written by the previous parser, and checks that the compiled templates are shared.
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,186 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the attribute binders of the CustomCommandExecuter.
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys, os
+
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+import CustomCommandExecuter
+print('Module undergoing testing:')
+print(CustomCommandExecuter)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,res,update=True):
+  """
+    This method is a pass-through for consistency and updating
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ Out, res, bool, True if test
+  """
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking bool",comment,'|',res,'is not True!')
+      results["fail"] += 1
+  return res
+
+def checkSame(comment,value,expected,update=True):
+  """
+    This method is aimed to compare two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking string",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
+def checkRaises(comment,exception,function,args=None,update=True):
+  """
+    Checks if function raises the expected type of exception.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, exception, class, the expected exception type
+    @ In, function, method, function to evaluate that is expected to fail
+    @ In, args, list, optional, arguments to pass to function
+    @ In, update, bool, optional, if True then will update results
+    @ Out, res, bool, True if function raises exception
+  """
+  if args is None:
+    args = []
+  try:
+    function(*args)
+    res = False
+    msg = 'Function call did not error!'
+  except exception:
+    res = True
+  except Exception as e:
+    res = False
+    msg = 'Unexpected error {}: {}'.format(type(e).__name__,e)
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking error",comment,'|',msg)
+      results["fail"] += 1
+  return res
+
+class Container(object):
+  """
+    Object receiving the attributes
+  """
+  pass
+
+def makeContainer():
+  """
+    Creates a container with a nested container and a list
+    @ Out, container, Container, the container
+  """
+  container = Container()
+  container.inner = Container()
+  container.inner.deeper = Container()
+  container.values = [0.0, 0.0, 0.0]
+  return container
+
+setter = CustomCommandExecuter.attributeSetter
+getter = CustomCommandExecuter.attributeGetter
+
+######################################
+#     plain names                    #
+######################################
+container = makeContainer()
+setter('x')(container,1.5)
+checkSame('plain set',container.x,1.5)
+checkSame('plain get',getter('x')(container),1.5)
+setter('x')(container,'other')
+checkSame('plain set again',container.x,'other')
+setter('_private2')(container,3)
+checkSame('plain underscore get',getter('_private2')(container),3)
+# the binders are resolved once per name
+checkTrue('setter cached',setter('x') is setter('x'))
+checkTrue('getter cached',getter('x') is getter('x'))
+# same behavior as the statements they replace
+reference = makeContainer()
+CustomCommandExecuter.execCommand('self.x = object',self=reference,object=1.5)
+checkSame('plain set as execCommand',reference.x,1.5)
+checkSame('plain get of execCommand',getter('x')(reference),1.5)
+checkRaises('plain get missing',AttributeError,getter('missing'),[container])
+
+######################################
+#     dotted names                   #
+######################################
+setter('inner.y')(container,2.5)
+checkSame('dotted set',container.inner.y,2.5)
+checkSame('dotted get',getter('inner.y')(container),2.5)
+setter('inner.deeper.z')(container,-1)
+checkSame('dotted twice set',container.inner.deeper.z,-1)
+checkSame('dotted twice get',getter('inner.deeper.z')(container),-1)
+checkRaises('dotted set missing parent',AttributeError,setter('missing.y'),[container,1.0])
+
+######################################
+#     other expressions              #
+######################################
+# any other name that is valid after "self." is compiled once
+setter('values[1]')(container,4.0)
+checkSame('subscript set',container.values,[0.0,4.0,0.0])
+checkSame('subscript get',getter('values[1]')(container),4.0)
+checkTrue('subscript setter cached',setter('values[1]') is setter('values[1]'))
+setter('inner.__dict__["w w"]')(container,7)
+checkSame('expression get',getter('inner.__dict__["w w"]')(container),7)
+
+######################################
+#     keywords and invalid names     #
+######################################
+# a name that can not be an attribute raises SyntaxError, as the statement it replaces
+for name in ['class','lambda','inner.for','import.x']:
+  checkRaises('keyword setter '+name,SyntaxError,setter,[name])
+  checkRaises('keyword getter '+name,SyntaxError,getter,[name])
+for name in ['1x','x y','x$y','x.','.x','x..y','x = 1']:
+  checkRaises('invalid setter '+name,SyntaxError,setter,[name])
+  checkRaises('invalid getter '+name,SyntaxError,getter,[name])
+checkRaises('keyword as execCommand',SyntaxError,CustomCommandExecuter.execCommand,['self.class = object',reference,1.0])
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.unit_test_CustomCommandExecuter</name>
+    <author>agent</author>
+    <created>2026-10-17</created>
+    <classesTested>CustomCommandExecuter</classesTested>
+    <description>
+       This test is a Unit Test for the attribute binders of the CustomCommandExecuter (attributeSetter and
+       attributeGetter) with plain, dotted, keyword and invalid names.
+    </description>
+  </TestInfo>
+"""
@@ -429,6 +429,16 @@ checkRlz('Dataset append 2 idx 1',data.realization(index=1),rlz1,skip=['time'])
 checkRlz('Dataset append 2 idx -1',data.realization(index=-1),rlz3,skip=['time'])
 checkRlz('Dataset append 2 idx -3',data.realization(index=-3),rlz1,skip=['time'])
 
+# read chunks of realizations from the data, the collector and both
+checkArray('Dataset getChunk data "a"',data.getChunk(['a'],0,2)['a'].values,[1.0,11.0],float)
+checkArray('Dataset getChunk collector "a"',data.getChunk(['a'],3,4)['a'].values,[31.0],float)
+checkArray('Dataset getChunk collector "c"',data.getChunk(['c'],3,4)['c'].values[0],[33.0,33.1,33.2],float)
+chunk = data.getChunk(['a','c'],2,10)
+checkArray('Dataset getChunk both "a"',chunk['a'].values,[21.0,31.0],float)
+checkArray('Dataset getChunk both "c" 2',chunk['c'].values[0],[np.nan]*6+[23.0,23.1,23.2],float)
+checkArray('Dataset getChunk both "c" 3',chunk['c'].values[1],[33.0,33.1,33.2]+[np.nan]*6,float)
+checkSame('Dataset getChunk collector not collapsed',len(data._collector),1)
+
 data.asDataset()
 # check new sample IDs
 checkArray('Dataset first collapse sample IDs',data._data['RAVEN_sample_ID'].values,[0,1,2,3],float)
@@ -1037,6 +1047,35 @@ checkArray('Rename in both: index',data.indexes,['timelike'],str)
 # make sure adding a new realization without the renaming fails
 checkFails('Add old-named data after renaming variables','Provided realization does not have all requisite values for object \"DataSet\": \"alpha\"',data.addRealization,args=[rlz1])
 
+######################################
+#       REUSED REALIZATIONS          #
+######################################
+# the stored data does not change if the caller changes (or reuses) the realization after adding it
+xml = createElement('DataSet',attrib={'name':'test'})
+xml.append(createElement('Input', text='a'))
+xml.append(createElement('Output',text='b'))
+xml.append(createElement('Index',attrib={'var':'t'},text='b'))
+data = DataObjects.DataSet()
+data.messageHandler = mh
+data._readMoreXML(xml)
+data.addExpectedMeta(['info'])
+info = np.ndarray(1,dtype=object)
+info[0] = {'steps':[1,2]}
+rlz = {'a':np.array([1.0]),
+       'b':np.array([1.0, 1.1, 1.2]),
+       'info':info,
+       't':np.array([0.01, 0.02, 0.03])}
+data.addRealization(rlz)
+rlz['a'][0] = -1.0
+rlz['b'][:] = -1.0
+rlz['info'][0]['steps'].append(3)
+stored = data.realization(index=0)
+checkFloat('Reused realization: scalar',stored['a'],1.0)
+checkArray('Reused realization: history',stored['b'],[1.0, 1.1, 1.2],float)
+checkSame('Reused realization: object',stored['info']['steps'],[1,2])
+data.asDataset()
+checkSame('Reused realization: object in dataset',data.asDataset()['info'].values[0]['steps'],[1,2])
+
 
 
 print(results)
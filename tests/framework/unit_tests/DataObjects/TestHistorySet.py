@@ -36,6 +36,7 @@ find_crow(frameworkDir)
 import MessageHandler
 
 import DataObjects
+from utils import historyUtils
 
 mh = MessageHandler.MessageHandler()
 mh.initialize({'verbosity':'debug', 'callerLength':10, 'tagLength':10})
@@ -598,6 +599,49 @@ os.remove(csvname+'_1.csv')
 os.remove(csvname+'_2.csv')
 os.remove(csvname+'_3.csv')
 
+# to packed
+## the histories are not on the same pivot values (rlz1, rlz2 vs rlz0, rlz3) and "prefix" is a string
+packname = 'HistorySetUnitTest'
+data.write(packname,style='packed')
+checkTrue('Wrote to packed',os.path.isfile(packname+'.packed'))
+dataPacked = DataObjects.HistorySet()
+dataPacked.messageHandler = mh
+dataPacked._readMoreXML(xml)
+dataPacked.load(packname,style='packed')
+checkSame('Packed size',len(dataPacked),len(data))
+for i,rlz in enumerate([rlz0,rlz1,rlz2,rlz3]):
+  packedRlz = dataPacked.realization(index=i)
+  checkRlz('Packed idx {}'.format(i),packedRlz,rlz,skip=['Timelike'])
+  checkArray('Packed idx {} Timelike'.format(i),packedRlz['y']['Timelike'].values,rlz['Timelike'],float)
+checkSame('Packed metadata TestPP',ET.tostring(dataPacked._meta['TestPP'].tree.getroot()),ET.tostring(data._meta['TestPP'].tree.getroot()))
+## only the requested variables are packed
+data.write(packname,style='packed',**{'what':'input,y'})
+packed = historyUtils.PackedHistories(packname+'.packed')
+checkArray('Packed what scalars',sorted(packed.scalars.keys()),['a','b'],str)
+checkArray('Packed what histories',sorted(packed.histories.keys()),['Timelike','y'],str)
+del packed
+dataMissing = DataObjects.HistorySet()
+dataMissing.messageHandler = mh
+dataMissing._readMoreXML(xml)
+checkFails('Packed what missing','Not all variables requested for data object "HistorySet" were found in "{}.packed"! Missing: {}'.format(packname,set(['x'])),
+           dataMissing.load,args=[packname],kwargs={'style':'packed'})
+xmlWhat = createElement('HistorySet',attrib={'name':'test'})
+xmlWhat.append(createElement('Input',text='a,b'))
+xmlWhat.append(createElement('Output',text='y'))
+options = createElement('options')
+options.append(createElement('pivotParameter',text='Timelike'))
+xmlWhat.append(options)
+dataWhat = DataObjects.HistorySet()
+dataWhat.messageHandler = mh
+dataWhat._readMoreXML(xmlWhat)
+dataWhat.load(packname,style='packed')
+checkArray('Packed what vars',dataWhat.getVars(),['a','b','y'],str)
+for i,rlz in enumerate([rlz0,rlz1,rlz2,rlz3]):
+  packedRlz = dataWhat.realization(index=i)
+  checkRlz('Packed what idx {}'.format(i),packedRlz,dict((var,rlz[var]) for var in ['a','b','y']),skip=['Timelike'])
+  checkArray('Packed what idx {} Timelike'.format(i),packedRlz['y']['Timelike'].values,rlz['Timelike'],float)
+os.remove(packname+'.packed')
+
 
 ######################################
 #        ACCESS USING GETTERS        #
@@ -691,6 +735,17 @@ checkArray('Asynchronous histories, collector, time[1]',times[1],rlz2['time'],fl
 data.asDataset()
 checkRlz('Adding asynchronous histories, dataset[0]',data.realization(index=0),rlz1,skip=['time'])
 checkRlz('Adding asynchronous histories, dataset[1]',data.realization(index=1),rlz2,skip=['time'])
+# packed, the histories have different lengths
+data.write(packname,style='packed')
+dataPacked = DataObjects.HistorySet()
+dataPacked.messageHandler = mh
+dataPacked._readMoreXML(xml)
+dataPacked.load(packname,style='packed')
+checkRlz('Asynchronous histories, packed[0]',dataPacked.realization(index=0),rlz1,skip=['time'])
+checkRlz('Asynchronous histories, packed[1]',dataPacked.realization(index=1),rlz2,skip=['time'])
+checkArray('Asynchronous histories, packed, time[0]',dataPacked.realization(index=0)['x']['time'].values,rlz1['time'],float)
+checkArray('Asynchronous histories, packed, time[1]',dataPacked.realization(index=1)['x']['time'].values,rlz2['time'],float)
+os.remove(packname+'.packed')
 # ADD when EnsembleModel for times series is done
 # check expected error in case index and index-dependent variable have different shape
 #data = HistorySet.HistorySet()
@@ -363,6 +363,54 @@ checkArray('PointSet first collapse "a"',data._data['a'].values,[1.0,11.0,21.0,3
 # check string prefix
 checkArray('PointSet first collapse "prefix"',data._data['prefix'].values,['first','second','third','fourth'],str)
 
+######################################
+#         SEARCHING BY VALUE         #
+######################################
+# enough realizations to exercise the search index, split between data and collector
+search = DataObjects.PointSet()
+search.messageHandler = mh
+search._readMoreXML(xml)
+search.addExpectedMeta(['prefix'])
+def searchRlz(i):
+  """
+    Creates a realization for the search tests.
+    @ In, i, int, realization number
+    @ Out, rlz, dict, realization
+  """
+  rlz = {'a':0.5*i, 'b':float(i%7), 'x':1e6+i, 'z':-float(i), 'prefix':str(i)}
+  formatRealization(rlz)
+  return rlz
+for i in range(300):
+  search.addRealization(searchRlz(i))
+# search while everything is in the collector, then once it's collapsed
+checkSame('PointSet search collector prefix',search.realization(matchDict={'prefix':'250'})[0],250)
+search.asDataset()
+for i in range(300,600):
+  search.addRealization(searchRlz(i))
+# exact (string) matches, in data and in collector
+checkSame('PointSet search data prefix',search.realization(matchDict={'prefix':'12'})[0],12)
+checkSame('PointSet search collector prefix',search.realization(matchDict={'prefix':'450'})[0],450)
+checkNone('PointSet search missing prefix',search.realization(matchDict={'prefix':'bogus'})[1])
+# float matches
+idx,rlz = search.realization(matchDict={'a':7.0})
+checkSame('PointSet search data float index',idx,14)
+checkFloat('PointSet search data float value',rlz['x'],1e6+14)
+checkSame('PointSet search collector float index',search.realization(matchDict={'a':200.0})[0],400)
+checkSame('PointSet search float within tol',search.realization(matchDict={'x':1e6+3+1e-5},tol=1e-4)[0],3)
+checkSame('PointSet search float outside tol',search.realization(matchDict={'x':1e6+3+1e-5},tol=1e-6)[0],600)
+checkSame('PointSet search collector float within tol',search.realization(matchDict={'x':1e6+503+1e-5},tol=1e-9)[0],503)
+# mixed and multiple matches, first match is returned
+checkSame('PointSet search multiple float',search.realization(matchDict={'b':3.0,'z':-10.0})[0],10)
+checkSame('PointSet search first of many',search.realization(matchDict={'b':3.0})[0],3)
+checkSame('PointSet search float and string',search.realization(matchDict={'b':3.0,'prefix':'17'})[0],17)
+checkNone('PointSet search float and string mismatch',search.realization(matchDict={'b':2.0,'prefix':'17'})[1])
+# the index follows new realizations and changes
+search.addRealization(searchRlz(1000))
+checkSame('PointSet search after adding',search.realization(matchDict={'prefix':'1000','a':500.0})[0],600)
+search._changeVariableValue(5,'prefix','renamed')
+checkSame('PointSet search changed value',search.realization(matchDict={'prefix':'renamed'})[0],5)
+checkNone('PointSet search changed old value',search.realization(matchDict={'prefix':'5'})[1])
+
 ######################################
 #         GENERAL META DATA          #
 ######################################
@@ -0,0 +1,193 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the storage of the non-hierarchical realizations of the HDF5 database
+  in columns (round trip of realizations added one at a time and all at once, before and after reopening the file).
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys, os
+import shutil
+import tempfile
+import numpy as np
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+
+import MessageHandler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'silent', 'callerLength':10, 'tagLength':10})
+
+from h5py_interface_creator import hdf5Database
+print('Module undergoing testing:')
+print(hdf5Database)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkSame(comment,value,expected,update=True):
+  """
+    This method is aimed to compare two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking answer",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
+def checkRealization(comment,rlz,expected,update=True):
+  """
+    This method is aimed to compare two realizations
+    @ In, comment, string, a comment printed out if it fails
+    @ In, rlz, dict, the realization to compare
+    @ In, expected, dict, the expected realization
+    @ Out, res, bool, True if same
+  """
+  res = sorted(rlz.keys()) == sorted(expected.keys())
+  if not res:
+    print("checking realization",comment,'|','variables',sorted(rlz.keys()),"!=",sorted(expected.keys()))
+  else:
+    for var,value in expected.items():
+      same = np.shape(rlz[var]) == np.shape(value) and all(a == b for a,b in zip(np.ravel(rlz[var]),np.ravel(value)))
+      if not same:
+        print("checking realization",comment,'|',var,':',rlz[var],"!=",value)
+        res = False
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      results["fail"] += 1
+  return res
+
+def makeRealization(i):
+  """
+    Builds a realization with scalars, histories of varying length, strings and booleans; some variables are
+    missing in some realizations, and "late" is a scalar in the first realizations only
+    @ In, i, int, the index of the realization
+    @ Out, rlz, dict, the realization
+  """
+  rlz = {'prefix':np.array([str(i)]),
+         'x':np.array([0.5*i]),
+         'n':np.array([i]),
+         'time':np.arange(i%4+1,dtype=float),
+         'y':np.arange(i%4+1,dtype=float)*i,
+         'label':np.array(['sample{}'.format(i)]),
+         'flag':np.array([i%2 == 0])}
+  if i%3 != 0:
+    rlz['matrix'] = np.arange(2*(i%3),dtype=float).reshape(2,i%3)
+  rlz['late'] = np.array([float(i)]) if i < 5 else np.arange(i%3+1,dtype=float)
+  return rlz
+
+def expectedRealization(rlz):
+  """
+    The realization as stored by the database (numbers are stored as floats)
+    @ In, rlz, dict, the realization
+    @ Out, expected, dict, the stored realization
+  """
+  return dict((var,value.astype(float) if value.dtype.kind in 'iu' else value) for var,value in rlz.items())
+
+def checkDatabase(comment,database,rlzs):
+  """
+    Checks that the database holds the given realizations, read all at once and one at a time
+    @ In, comment, string, a comment printed out if it fails
+    @ In, database, hdf5Database, the database
+    @ In, rlzs, list(dict), the expected realizations, in insertion order
+    @ Out, None
+  """
+  names = [str(rlz['prefix'][0]) for rlz in rlzs]
+  stored = database.retrieveAllRealizations()
+  checkSame(comment+' names',[name for name,_ in stored],names)
+  for (name,rlz),expected in zip(stored,rlzs):
+    checkRealization(comment+' all '+name,rlz,expectedRealization(expected))
+  # reversed, so that each realization is read on its own
+  for name,expected in reversed(list(zip(names,rlzs))):
+    checkRealization(comment+' by name '+name,database._getRealizationByName(name)[0],expectedRealization(expected))
+
+workingDir = tempfile.mkdtemp()
+try:
+  rlzs = [makeRealization(i) for i in range(23)]
+
+  ### added one at a time, appended in several batches
+  database = hdf5Database('one',workingDir,mh,'one.h5',False)
+  database.appendBatchSize = 4
+  for rlz in rlzs:
+    database.addGroup(rlz)
+  checkDatabase('one at a time',database,rlzs)
+  # the stored offsets are those of the concatenated values
+  store = list(database.columnarStores.values())[0]
+  for c,column in enumerate(store.columns):
+    if not column['scalar']:
+      sizes = np.prod(store.group['shapes{}'.format(c)][:],axis=1)
+      checkSame('offsets of '+column['name'],store.group['offsets{}'.format(c)][:].tolist(),(np.cumsum(sizes)-sizes).tolist())
+  checkSame('non-scalar late',store.columns[store.columnIndex['late']]['scalar'],False)
+  checkSame('scalar x',store.columns[store.columnIndex['x']]['scalar'],True)
+  database.closeDatabaseW()
+  # reopened
+  database = hdf5Database('one',workingDir,mh,'one.h5',True)
+  checkDatabase('one at a time reopened',database,rlzs)
+  database.closeDatabaseW()
+
+  ### added all at once, with a single append
+  database = hdf5Database('all',workingDir,mh,'all.h5',False)
+  database.appendBatchSize = 4
+  database.addGroups(rlzs[:20])
+  checkSame('single append',len(database.pendingRealizations),0)
+  checkDatabase('all at once',database,rlzs[:20])
+  database.closeDatabaseW()
+  # reopened, then extended
+  database = hdf5Database('all',workingDir,mh,'all.h5',True)
+  database.addGroups(rlzs[20:])
+  checkDatabase('all at once extended',database,rlzs)
+  database.closeDatabaseW()
+
+  ### empty database
+  database = hdf5Database('empty',workingDir,mh,'empty.h5',False)
+  checkSame('empty database',database.retrieveAllRealizations(),[])
+  database.closeDatabaseW()
+finally:
+  shutil.rmtree(workingDir)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.HDF5</name>
+    <author>agent</author>
+    <created>2026-10-17</created>
+    <classesTested>h5py_interface_creator.hdf5Database, h5py_interface_creator.ColumnarStore</classesTested>
+    <description>
+       This test performs Unit Tests for the storage of the non-hierarchical realizations of the HDF5 database in
+       columns: realizations with scalars, histories of varying length, matrices, strings, booleans and missing
+       variables are added one at a time and all at once, and read back (all at once and one at a time) before and
+       after reopening the file.
+    </description>
+  </TestInfo>
+"""
@@ -35,6 +35,7 @@ find_crow(frameworkDir)
 
 import MessageHandler
 import Distributions
+from utils import randomUtils
 
 mh = MessageHandler.MessageHandler()
 mh.initialize({'verbosity':'debug'})
@@ -193,6 +194,8 @@ checkAnswer("log10Uniform cdf(1000.0)",log10Uniform.cdf(1000.0),1.0)
 checkAnswer("log10Uniform ppf(0.0)",log10Uniform.ppf(0.0),10)
 checkAnswer("log10Uniform ppf(0.5)",log10Uniform.ppf(0.5),100)
 checkAnswer("log10Uniform ppf(1.0)",log10Uniform.ppf(1.0),1000)
+checkAnswer("log10Uniform array ppf",log10Uniform.ppf(np.array([0.0,0.5,1.0]))[1],100)
+checkAnswer("log10Uniform array cdf",log10Uniform.cdf(np.array([10.0,100.0,1000.0]))[2],1.0)
 
 #Test Normal
 mean=1.0
@@ -238,6 +241,24 @@ checkAnswer("pnormal mode()",pnormal.untruncatedMode(),1.0)
 print(normal.rvs(5),normal.rvs())
 print(pnormal.rvs(5),pnormal.rvs())
 
+#check array evaluation, which must match the evaluation one point at a time
+normalCoords = np.array([[-3.0,0.0,1.0],[2.5,4.0,10.0]])
+normalCdfs = normal.cdf(normalCoords)
+normalPdfs = normal.pdf(normalCoords)
+normalPpfs = normal.ppf(normalCdfs)
+checkAnswer("normal array cdf shape",len(normalCdfs.shape),2)
+for i,x in enumerate(normalCoords.ravel()):
+  checkAnswer("normal array cdf(%f)" %x,normalCdfs.ravel()[i],normal.cdf(x))
+  checkAnswer("normal array pdf(%f)" %x,normalPdfs.ravel()[i],normal.pdf(x))
+  checkAnswer("normal array ppf(%f)" %normalCdfs.ravel()[i],normalPpfs.ravel()[i],normal.ppf(normalCdfs.ravel()[i]))
+checkAnswer("normal array ppf(0.1,0.9)",normal.ppf([0.1,0.9])[1],3.56310313109)
+#check rvs(size) draws the same samples as successive rvs() calls
+randomUtils.randomSeed(42)
+normalSamples = normal.rvs(5)
+randomUtils.randomSeed(42)
+for i in range(5):
+  checkAnswer("normal rvs(5) sample %i" %i,normalSamples[i],normal.rvs())
+
 #Test Truncated Normal
 
 truncNormalElement = ET.Element("Normal",{"name":"test"})
@@ -1088,6 +1109,11 @@ checkAnswer("Categorical  ppf(0.1)" , Categorical.ppf(0.1),10)
 checkAnswer("Categorical  ppf(0.5)" , Categorical.ppf(0.5),50)
 checkAnswer("Categorical  ppf(0.9)" , Categorical.ppf(0.9),60)
 
+categoricalPpfs = Categorical.ppf(np.array([0.05,0.1,0.5,0.9,1.0]))
+for i,expected in enumerate([10,10,50,60,60]):
+  checkAnswer("Categorical array ppf entry %i" %i, categoricalPpfs[i],expected)
+checkAnswer("Categorical array pdf", Categorical.pdf(categoricalPpfs)[2],0.4)
+
 # Test Custom1D
 Custom1DElement = ET.Element("Custom1D",{"name":"test"})
 Custom1DElement.append(createElement("dataFilename", text="PointSetFile2_dump.csv"))
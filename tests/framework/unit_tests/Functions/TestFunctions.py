@@ -0,0 +1,202 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the Functions class (evaluation of the external
+  functions point by point and in batches).
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys, os
+import numpy as np
+import xml.etree.ElementTree as ET
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+
+import MessageHandler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'debug', 'callerLength':10, 'tagLength':10})
+
+import Functions
+print('Module undergoing testing:')
+print(Functions)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,res,update=True):
+  """
+    This method is a pass-through for consistency and updating
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ Out, res, bool, True if test
+  """
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking bool",comment,'|',res,'is not True!')
+      results["fail"] += 1
+  return res
+
+def checkSame(comment,value,expected,update=True):
+  """
+    This method is aimed to compare two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking string",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
+def checkArray(comment,first,second,tol=1e-12,update=True):
+  """
+    This method is aimed to compare two float arrays
+    @ In, comment, string, a comment printed out if it fails
+    @ In, first, np.array, the values to compare
+    @ In, second, np.array, the expected values
+    @ In, tol, float, optional, the tolerance
+    @ Out, res, bool, True if same
+  """
+  first = np.asarray(first)
+  second = np.asarray(second)
+  if first.shape != second.shape:
+    res = False
+    print("checking array",comment,'|','shapes do not match:',first.shape,second.shape)
+  else:
+    res = bool(np.all(np.abs(first - second) <= tol*np.maximum(1.0,np.abs(second))))
+    if not res:
+      print("checking array",comment,'|',first,"!=",second)
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      results["fail"] += 1
+  return res
+
+def checkFails(comment,errstr,function,update=True,args=None,kwargs=None):
+  """
+    Checks if function will fail expectedly.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, errstr, str, message given by error to check against
+    @ In, function, method, function to evaluate that is expected to fail
+    @ In, update, bool, optional, if True then will update results
+    @ In, args, list, additional arguments to pass to function
+    @ In, kwargs, dict, additional keyword arguments to pass to function
+    @ Out, res, bool, True if function fails as expected.
+  """
+  print('Error testing ...')
+  if args is None:
+    args = []
+  if kwargs is None:
+    kwargs = {}
+  try:
+    function(*args,**kwargs)
+    res = False
+    msg = 'Function call did not error!'
+  except Exception as e:
+    res = checkSame('',e.args[0],errstr,update=False)
+    if not res:
+      msg = 'Unexpected error message.  \n    Received: "{}"\n    Expected: "{}"'.format(e.args[0],errstr)
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking error",comment,'|',msg)
+      results["fail"] += 1
+  print(' ... end Error testing')
+  print('')
+  return res
+
+testDir = os.path.dirname(os.path.abspath(__file__))
+node = ET.fromstring('<External name="batch" file="batchFunction"><variable>x</variable><variable>y</variable></External>')
+function = Functions.returnInstance('External',{'WorkingDir':testDir},None)
+function.messageHandler = mh
+function.readXML(node,mh)
+
+np.random.seed(42)
+numSamples = 50
+points = {'x':np.random.uniform(-1.0,2.0,numSamples),'y':np.random.uniform(-1.5,1.5,numSamples)}
+expected = np.exp(-points['x']) + points['y']**2 - 1.0
+
+######################################
+#     point by point                 #
+######################################
+single = np.array([function.evaluate('residuum',{'x':x,'y':y}) for x, y in zip(points['x'],points['y'])])
+checkArray('evaluate residuum',single,expected)
+checkSame('current setting',function.getCurrentSetting(),{'variable x has value':points['x'][-1],'variable y has value':points['y'][-1]})
+
+######################################
+#     batches                        #
+######################################
+# the method not flagged as vectorized is called once per point
+perPoint = function.evaluateBatch('residuum',points)
+checkArray('evaluateBatch per point',perPoint,expected)
+# the vectorized method is called once, and gives the same values
+vectorized = function.evaluateBatch('vectorizedResiduum',points)
+checkArray('evaluateBatch vectorized',vectorized,perPoint)
+checkArray('evaluateBatch vectorized sign',function.evaluateBatch('residuumSign',points),function.evaluateBatch('pointSign',points))
+checkArray('evaluateBatch vectorized sign values',function.evaluateBatch('residuumSign',points),np.where(expected > 0.0,1.0,-1.0))
+# the vectorized method also works on a single point
+checkArray('evaluate vectorized',function.evaluate('vectorizedResiduum',{'x':points['x'][0],'y':points['y'][0]}),expected[0])
+# lists are accepted, and the inputs that are not variables are ignored
+listPoints = {'x':list(points['x'][:5]),'y':list(points['y'][:5]),'z':[0.0]*5}
+checkArray('evaluateBatch lists',function.evaluateBatch('vectorizedResiduum',listPoints),expected[:5])
+# a single value is repeated for all the points
+checkArray('evaluateBatch constant',function.evaluateBatch('constant',points),np.full(numSamples,2.5))
+# no points
+emptyPoints = {'x':np.zeros(0),'y':np.zeros(0)}
+checkSame('evaluateBatch no points per point',len(function.evaluateBatch('residuum',emptyPoints)),0)
+checkSame('evaluateBatch no points constant',len(function.evaluateBatch('constant',emptyPoints)),0)
+
+######################################
+#     errors                         #
+######################################
+checkFails('unknown method','Method unknown not defined in batch',function.evaluateBatch,args=['unknown',points])
+checkFails('missing variable','The input variable y in external function seems not to be passed in',
+           function.evaluateBatch,args=['residuum',{'x':points['x']}])
+checkFails('wrong length','The vectorized method wrongLength of batch returned 49 values for 50 samples!',
+           function.evaluateBatch,args=['wrongLength',points])
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.unit_test_Functions</name>
+    <author>agent</author>
+    <created>2026-10-17</created>
+    <classesTested>Functions.Function</classesTested>
+    <description>
+       This test is a Unit Test for the Functions class: the evaluation of the methods point by point, in
+       batches point by point, and in batches with a single call for the methods flagged as vectorized.
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,71 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  External function of the Functions unit test: the same expressions are given
+  point by point and flagged as vectorized.
+"""
+import math
+import numpy as np
+
+def residuum(self):
+  """
+    Residuum, written for a single point
+    @ In, self, object, the function container
+    @ Out, residuum, float, the residuum
+  """
+  return math.exp(-self.x) + self.y**2 - 1.0
+
+def vectorizedResiduum(self):
+  """
+    Residuum, written with array operations
+    @ In, self, object, the function container
+    @ Out, residuum, np.array, the residuum of each point
+  """
+  return np.exp(-self.x) + self.y**2 - 1.0
+vectorizedResiduum.vectorized = True
+
+def residuumSign(self):
+  """
+    Sign of the residuum, written with array operations
+    @ In, self, object, the function container
+    @ Out, sign, np.array, the sign of the residuum of each point
+  """
+  return np.where(np.exp(-self.x) + self.y**2 > 1.0, 1.0, -1.0)
+residuumSign.vectorized = True
+
+def pointSign(self):
+  """
+    Sign of the residuum, written for a single point
+    @ In, self, object, the function container
+    @ Out, sign, float, the sign of the residuum
+  """
+  return 1.0 if math.exp(-self.x) + self.y**2 > 1.0 else -1.0
+
+def constant(self):
+  """
+    Same value for all the points
+    @ In, self, object, the function container
+    @ Out, constant, float, the value
+  """
+  return 2.5
+constant.vectorized = True
+
+def wrongLength(self):
+  """
+    Returns a value less than the number of points
+    @ In, self, object, the function container
+    @ Out, wrong, np.array, the values
+  """
+  return self.x[:-1]
+wrongLength.vectorized = True
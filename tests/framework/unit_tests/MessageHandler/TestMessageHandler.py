@@ -0,0 +1,255 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the MessageHandler: suppressed messages, buffered output and message log.
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys, os
+import copy
+import json
+import pickle
+import tempfile
+import threading
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+
+import MessageHandler
+import Files
+print('Module undergoing testing:')
+print(MessageHandler)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,res,update=True):
+  """
+    This method is a pass-through for consistency and updating
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ Out, res, bool, True if test
+  """
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking bool",comment,'|',res,'is not True!')
+      results["fail"] += 1
+  return res
+
+def checkSame(comment,value,expected,update=True):
+  """
+    This method is aimed to compare two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking string",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
+def writerAlive():
+  """
+    Checks if the background thread of a MessageWriter is running
+    @ In, None
+    @ Out, alive, bool, True if it is running
+  """
+  return any(thread.name == 'MessageWriter' and thread.is_alive() for thread in threading.enumerate())
+
+def loggedMessages(logName):
+  """
+    Reads the messages of the structured log
+    @ In, logName, string, the name of the log file
+    @ Out, messages, list(dict), the records of the log
+  """
+  with open(logName) as logFile:
+    return list(json.loads(line) for line in logFile if line.strip())
+
+class Counter(object):
+  """
+    Message argument counting how many times it is converted to a string
+  """
+  def __init__(self):
+    """
+      Constructor
+      @ In, None
+      @ Out, None
+    """
+    self.calls = 0
+
+  def __str__(self):
+    """
+      Converts to string, counting the call
+      @ In, None
+      @ Out, __str__, string, the string representation
+    """
+    self.calls += 1
+    return 'counted'
+
+class Entity(MessageHandler.MessageUser):
+  """
+    Minimal entity raising messages
+  """
+  def __init__(self,messageHandler,name):
+    """
+      Constructor
+      @ In, messageHandler, MessageHandler, the message handler
+      @ In, name, string, the print tag of the entity
+      @ Out, None
+    """
+    self.messageHandler = messageHandler
+    self.printTag = name
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+entity = Entity(mh,'ENTITY')
+
+###################
+# isEnabled       #
+###################
+checkSame('enabled warning',mh.isEnabled(entity,'quiet'),True)
+checkSame('disabled message',mh.isEnabled(entity,'all'),False)
+checkSame('forced message',mh.isEnabled(entity,'debug',forcePrint=True),True)
+
+###################
+# short-circuit   #
+###################
+counter = Counter()
+entity.raiseADebug('suppressed debug',counter)
+checkSame('suppressed debug not formatted',counter.calls,0)
+entity.raiseAMessage('suppressed message',counter)
+checkSame('suppressed message not formatted',counter.calls,0)
+entity.raiseAWarning('suppressed warning',counter,verbosity='all')
+checkSame('suppressed warning not formatted',counter.calls,0)
+checkSame('suppressed warning not collected',len(mh.warnings),0)
+checkSame('suppressed warning counted',mh.suppressedWarnings,{'ENTITY':1})
+entity.raiseAMessage('forced message',counter,forcePrint=True)
+checkSame('forced message formatted',counter.calls,1)
+entity.raiseAWarning('printed warning',counter)
+checkSame('printed warning formatted',counter.calls,2)
+checkSame('printed warning collected',mh.warnings,['printed warning counted'])
+
+# the local verbosity of the entity prevails on the global one
+entity.verbosity = 'debug'
+entity.raiseADebug('local debug',counter)
+checkSame('local verbosity debug formatted',counter.calls,3)
+entity.verbosity = 'silent'
+entity.raiseAWarning('silent warning',counter)
+checkSame('local verbosity warning not formatted',counter.calls,3)
+checkSame('local verbosity warning not collected',mh.warningCount,[1])
+checkSame('local verbosity warning counted',mh.suppressedWarnings,{'ENTITY':2})
+# the deep copies of the handler keep the counts, but count on their own
+mhCopy = copy.deepcopy(mh)
+checkTrue('deepcopy of handler without writer',mhCopy is not mh and mhCopy.writer is None)
+checkSame('deepcopy keeps the counts',mhCopy.suppressedWarnings,{'ENTITY':2})
+mhCopy.skipMessage(entity,'Warning')
+checkSame('deepcopy counts on its own',(mhCopy.suppressedWarnings['ENTITY'],mh.suppressedWarnings['ENTITY']),(3,2))
+
+###################
+# buffered output #
+###################
+logName = os.path.join(tempfile.mkdtemp(),'messages.jsonl')
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'debug', 'callerLength':10, 'tagLength':10, 'flushInterval':0.05, 'messageLog':logName})
+checkTrue('writer started',mh.writer is not None and writerAlive())
+checkTrue('log opened',mh.messageLog is not None)
+
+entity = Entity(mh,'ORIGINAL')
+entity.raiseAMessage('before copy')
+
+###################
+# deep copies     #
+###################
+# the deep copies of an entity copy the handler, but share its writer and log
+entityCopy = copy.deepcopy(entity)
+checkTrue('deepcopy copies the handler',entityCopy.messageHandler is not mh)
+checkTrue('deepcopy shares the writer',entityCopy.messageHandler.writer is mh.writer)
+checkTrue('deepcopy shares the log',entityCopy.messageHandler.messageLog is mh.messageLog)
+checkSame('deepcopy keeps the verbosity',entityCopy.messageHandler.verbosity,'debug')
+# as the input files deep copied by the Code model for each sample
+inputFile = Files.RAVENGenerated()
+inputFile.messageHandler = mh
+inputFile.setAbsFile(os.path.join(os.path.dirname(logName),'input.i'))
+fileCopy = copy.deepcopy(inputFile)
+checkTrue('deepcopy of file shares the writer',fileCopy.messageHandler.writer is mh.writer)
+checkSame('deepcopy of file name',fileCopy.getFilename(),'input.i')
+entityCopy.printTag = 'COPY'
+entityCopy.raiseAMessage('from copy')
+checkTrue('writer alive after deepcopy',mh.writer is not None and writerAlive())
+
+###################
+# pickling        #
+###################
+unpickled = pickle.loads(pickle.dumps(entity))
+checkTrue('unpickled handler is a new instance',unpickled.messageHandler is not mh)
+checkTrue('unpickled handler has no writer',unpickled.messageHandler.writer is None)
+checkTrue('unpickled handler has no log',unpickled.messageHandler.messageLog is None)
+checkSame('unpickled handler verbosity',unpickled.messageHandler.verbosity,'debug')
+# the unpickled handler prints each message directly
+unpickled.printTag = 'UNPICKLED'
+unpickled.raiseAMessage('from unpickled')
+# the original handler keeps its writer and log
+checkTrue('writer alive after pickle',mh.writer is not None and writerAlive())
+checkTrue('log open after pickle',mh.messageLog is not None and not mh.messageLog.closed)
+entity.raiseAMessage('after pickle')
+entity.raiseADebug('debug after pickle')
+
+###################
+# log content     #
+###################
+mh.flush()
+logged = loggedMessages(logName)
+checkSame('logged messages',list(record['message'] for record in logged),['before copy','from copy','after pickle','debug after pickle'])
+checkSame('logged callers',list(record['caller'] for record in logged),['ORIGINAL','COPY','ORIGINAL','ORIGINAL'])
+checkSame('logged verbosity',logged[-1]['verbosity'],'debug')
+
+mh.closeMessageLog()
+mh.setFlushInterval(0)
+checkTrue('writer thread stopped',not writerAlive())
+checkTrue('log closed',mh.messageLog is None)
+checkTrue('writer stopped',mh.writer is None)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.unit_test_MessageHandler</name>
+    <author>agent</author>
+    <created>2026-10-17</created>
+    <classesTested>MessageHandler</classesTested>
+    <description>
+       This test is a Unit Test for the MessageHandler: the arguments of the debug messages, messages and
+       warnings suppressed by the verbosity are not converted to strings (the suppressed warnings are only
+       counted), and the writer thread and the message log survive the deep copies and the pickling of the
+       entities using the handler.
+    </description>
+  </TestInfo>
+"""
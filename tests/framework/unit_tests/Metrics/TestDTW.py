@@ -0,0 +1,284 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the DTW metric, comparing the batched anti-diagonal sweeps with a
+  plain O(r*c) dynamic time warping.
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys, os
+import numpy as np
+import scipy.spatial.distance as spatialDistance
+import xml.etree.ElementTree as ET
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils import utils
+utils.find_crow(frameworkDir)
+# the process pool runner needs the parallel python modules
+if sys.version_info.major == 2:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp'))
+else:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp3'))
+
+import MessageHandler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'silent', 'callerLength':10, 'tagLength':10})
+
+import Metrics
+from Metrics.DTW import pairwiseBatches
+from Runners.ProcessPoolRunner import ProcessPool
+print('Module undergoing testing:')
+print(Metrics.returnClass('DTW',None))
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkFloat(comment,value,expected,tol=1e-10,update=True):
+  """
+    This method is aimed to compare two floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the relative tolerance
+    @ Out, res, bool, True if same
+  """
+  if np.isinf(value) and np.isinf(expected):
+    res = True
+  else:
+    res = abs(value - expected) <= tol*max(1.0,abs(expected))
+  if update:
+    if not res:
+      print("checking float",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+    else:
+      results["pass"] += 1
+  return res
+
+def checkTrue(comment,res,update=True):
+  """
+    This method is a pass-through for consistency and updating
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ Out, res, bool, True if test
+  """
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking bool",comment,'|',res,'is not True!')
+      results["fail"] += 1
+  return res
+
+def checkArray(comment,first,second,tol=1e-10,update=True):
+  """
+    This method is aimed to compare two arrays of floats
+    @ In, comment, string, a comment printed out if it fails
+    @ In, first, np.array, the values to compare
+    @ In, second, np.array, the expected values
+    @ In, tol, float, optional, the relative tolerance
+    @ Out, res, bool, True if same
+  """
+  first = np.asarray(first).ravel()
+  second = np.asarray(second).ravel()
+  res = len(first) == len(second) and all(checkFloat(comment,a,b,tol,update=False) for a,b in zip(first,second))
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking array",comment,'|',first,"!=",second)
+      results["fail"] += 1
+  return res
+
+# the names of the local distances for scipy
+scipyNames = {'l2':'euclidean', 'l1':'cityblock', 'manhattan':'cityblock'}
+
+def referenceDTW(x, y, localDistance, window=None):
+  """
+    Plain dynamic time warping, filling the whole (banded) cumulative cost matrix
+    @ In, x, np.array, first history, shape (n_variables, r)
+    @ In, y, np.array, second history, shape (n_variables, c)
+    @ In, localDistance, string, the local distance
+    @ In, window, int, optional, the half width of the Sakoe-Chiba band (widened to |r-c|)
+    @ Out, distance, float, the DTW distance
+  """
+  cost = spatialDistance.cdist(x.T, y.T, metric=scipyNames.get(localDistance,localDistance))
+  r, c = cost.shape
+  window = max(r, c) if window is None else max(window, abs(r-c))
+  D = np.full((r+1, c+1), np.inf)
+  D[0, 0] = 0.0
+  for i in range(r):
+    for j in range(max(0, i-window), min(c, i+window+1)):
+      D[i+1, j+1] = cost[i, j] + min(D[i, j], D[i, j+1], D[i+1, j])
+  return D[r, c]
+
+def referenceLBKeogh(x, y, localDistance, window=None):
+  """
+    LB_Keogh lower bound, computed point by point
+    @ In, x, np.array, first history, shape (n_variables, n)
+    @ In, y, np.array, second history, shape (n_variables, n)
+    @ In, localDistance, string, the local distance
+    @ In, window, int, optional, the half width of the Sakoe-Chiba band
+    @ Out, bound, float, the lower bound
+  """
+  n = x.shape[1]
+  window = n if window is None else window
+  bound = 0.0
+  for i in range(n):
+    envelope = y[:, max(0, i-window):min(n, i+window+1)]
+    closest = np.clip(x[:, i], envelope.min(axis=1), envelope.max(axis=1))
+    bound += spatialDistance.cdist(x[:, i:i+1].T, closest[:, np.newaxis].T, metric=scipyNames.get(localDistance,localDistance))[0, 0]
+  return bound
+
+def createDTW(localDistance, order=0, window=None):
+  """
+    Creates a DTW metric from its XML input
+    @ In, localDistance, string, the local distance
+    @ In, order, int, optional, the order of the DTW
+    @ In, window, int, optional, the window of the DTW
+    @ Out, dtw, DTW, the metric
+  """
+  node = ET.fromstring('<DTW name="dtw"><order>{}</order><localDistance>{}</localDistance></DTW>'.format(order,localDistance))
+  if window is not None:
+    ET.SubElement(node,'window').text = str(window)
+  dtw = Metrics.returnInstance('DTW',None)
+  dtw.messageHandler = mh
+  dtw._readMoreXML(node)
+  return dtw
+
+np.random.seed(42)
+# random walks, so that the warping paths are not trivial
+histories = list(np.cumsum(np.random.normal(size=(2, length)), axis=1) for length in [12, 12, 12, 9, 15, 12, 9])
+
+##############################
+# batch of pairs             #
+##############################
+for localDistance in ['euclidean', 'sqeuclidean', 'cityblock', 'chebyshev', 'cosine']:
+  for window in [None, 0, 2, 5]:
+    dtw = createDTW(localDistance, window=window)
+    for lengths in [(12, 12), (12, 9), (9, 15)]:
+      X = np.asarray(list(h for h in histories if h.shape[1] == lengths[0]))
+      Y = np.asarray(list(h for h in histories[::-1] if h.shape[1] == lengths[1]))
+      numPairs = min(len(X), len(Y))
+      X, Y = X[:numPairs], Y[:numPairs]
+      values = dtw._DTW__dtwBatch(X, Y)
+      expected = list(referenceDTW(x, y, localDistance, window) for x, y in zip(X, Y))
+      checkArray('batch {} window {} lengths {}'.format(localDistance, window, lengths), values, expected)
+
+##############################
+# pairwise matrix            #
+##############################
+for localDistance in ['euclidean', 'cosine']:
+  for order in [0, 1]:
+    for window in [None, 3]:
+      dtw = createDTW(localDistance, order=order, window=window)
+      distances = dtw.evaluatePairwiseHistories(histories)
+      data = list(np.gradient(h, axis=-1) if order == 1 else h for h in histories)
+      expected = np.zeros((len(data), len(data)))
+      for i in range(len(data)):
+        for j in range(len(data)):
+          if i != j:
+            expected[i, j] = referenceDTW(data[i], data[j], localDistance, window)
+      comment = 'pairwise {} order {} window {}'.format(localDistance, order, window)
+      checkArray(comment, distances, expected)
+      checkArray(comment+' symmetric', distances, distances.T, tol=0.0)
+      # the single pair evaluation of the metric is the same
+      checkFloat(comment+' evaluate', dtw.evaluate(histories[0], histories[3], axis=1), expected[0, 3])
+
+# many pairs, processed in several memory bounded batches
+dtw = createDTW('euclidean', window=2)
+manyHistories = list(np.cumsum(np.random.normal(size=(1, 10)), axis=1) for _ in range(40))
+dtw._DTW__maxChunkCells = 50
+distances = dtw.evaluatePairwiseHistories(manyHistories)
+checkFloat('chunked pairwise', distances[3, 17], referenceDTW(manyHistories[3], manyHistories[17], 'euclidean', 2))
+checkFloat('chunked pairwise last', distances[38, 39], referenceDTW(manyHistories[38], manyHistories[39], 'euclidean', 2))
+
+# on a pool of processes (histories of different lengths, several batches per worker)
+if __name__ == '__main__':
+  pool = ProcessPool(3)
+  poolHistories = histories+list(np.cumsum(np.random.normal(size=(2, length)), axis=1) for length in [12, 9, 15, 12, 9, 12])
+  try:
+    for localDistance in ['euclidean', 'cosine']:
+      dtw = createDTW(localDistance, window=2)
+      expected = dtw.evaluatePairwiseHistories(poolHistories)
+      dtw.pooledPairs = 0
+      dtw._DTW__maxChunkCells = 100
+      distances = dtw.evaluatePairwiseHistories(poolHistories, pool)
+      checkArray('pool pairwise '+localDistance, distances, expected, tol=0.0)
+    # the workers compute the batches (the metric can be sent to them)
+    batches = [(np.array([0, 1]), np.array([1, 2])), (np.array([3]), np.array([6]))]
+    responses = pool.map(pairwiseBatches, (dtw, histories), [(batches,)])
+    checkTrue('pool batches succeeded', responses[0][0])
+    checkArray('pool batches', np.concatenate(responses[0][1]) if responses[0][0] else np.zeros(0),
+               list(referenceDTW(histories[i], histories[j], 'cosine', 2) for i, j in [(0, 1), (1, 2), (3, 6)]))
+    # below the number of pooled pairs the pool is not used
+    dtw = createDTW('euclidean')
+    checkArray('pool few pairs', dtw.evaluatePairwiseHistories(histories, pool), dtw.evaluatePairwiseHistories(histories), tol=0.0)
+  finally:
+    pool.terminate()
+
+##############################
+# LB_Keogh and cutoff        #
+##############################
+x, y = histories[0], histories[1]
+for localDistance in ['euclidean', 'sqeuclidean', 'cityblock', 'chebyshev']:
+  for window in [None, 0, 2]:
+    dtw = createDTW(localDistance, window=window)
+    comment = '{} window {}'.format(localDistance, window)
+    exact = referenceDTW(x, y, localDistance, window)
+    bound = dtw.lbKeogh(x, y)
+    checkFloat('lbKeogh '+comment, bound, referenceLBKeogh(x, y, localDistance, window))
+    checkTrue('lbKeogh is a lower bound '+comment, bound <= exact*(1.0+1e-12))
+    checkFloat('no cutoff '+comment, dtw.dtwDistance(x, y), exact)
+    checkFloat('cutoff above '+comment, dtw.dtwDistance(x, y, cutoff=exact*1.001), exact)
+    checkFloat('cutoff below '+comment, dtw.dtwDistance(x, y, cutoff=exact*0.999), np.inf)
+    # a cutoff below the lower bound abandons the pair before the sweep
+    checkFloat('cutoff below bound '+comment, dtw.dtwDistance(x, y, cutoff=bound*0.5), np.inf)
+    # the cutoff of a batch only abandons the pairs above it
+    X, Y = np.asarray(histories[:3]), np.asarray(histories[1:3]+histories[5:6])
+    expected = np.asarray(list(referenceDTW(a, b, localDistance, window) for a, b in zip(X, Y)))
+    cutoff = np.median(expected)
+    checkArray('batch cutoff '+comment, dtw._DTW__dtwBatch(X, Y, cutoff), np.where(expected > cutoff, np.inf, expected))
+
+# no lower bound for different lengths or local distances that are not norms
+checkFloat('lbKeogh lengths', createDTW('euclidean').lbKeogh(histories[0], histories[3]), 0.0)
+checkFloat('lbKeogh cosine', createDTW('cosine').lbKeogh(histories[0], histories[1]), 0.0)
+dtw = createDTW('cosine', window=2)
+exact = referenceDTW(histories[0], histories[1], 'cosine', 2)
+checkFloat('cosine cutoff above', dtw.dtwDistance(histories[0], histories[1], cutoff=exact*1.001), exact)
+checkFloat('cosine cutoff below', dtw.dtwDistance(histories[0], histories[1], cutoff=exact*0.999), np.inf)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.unit_test_DTW</name>
+    <author>agent</author>
+    <created>2026-10-17</created>
+    <classesTested>Metrics.DTW</classesTested>
+    <description>
+       This test is a Unit Test for the DTW metric: the batched sweeps (with and without window and cutoff),
+       the pairwise distance matrix (in process and on a pool of processes) and the LB_Keogh lower bound are
+       compared with a plain O(r*c) DTW.
+    </description>
+  </TestInfo>
+"""
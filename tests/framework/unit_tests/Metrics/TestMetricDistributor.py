@@ -0,0 +1,191 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the MetricDistributor, checking that the metrics comparing many pairs of
+  data at once evaluate all the (feature, target) pairs of a Metric post-processor in a single call.
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys, os
+import numpy as np
+import xml.etree.ElementTree as ET
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils import utils
+utils.find_crow(frameworkDir)
+
+import MessageHandler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'silent', 'callerLength':10, 'tagLength':10})
+
+import Metrics
+import MetricDistributor
+print('Module undergoing testing:')
+print(MetricDistributor)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkFloat(comment,value,expected,tol=1e-10,update=True):
+  """
+    This method is aimed to compare two floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the relative tolerance
+    @ Out, res, bool, True if same
+  """
+  if np.isinf(value) and np.isinf(expected):
+    res = True
+  else:
+    res = abs(value - expected) <= tol*max(1.0,abs(expected))
+  if update:
+    if not res:
+      print("checking float",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+    else:
+      results["pass"] += 1
+  return res
+
+def checkTrue(comment,res,update=True):
+  """
+    This method is a pass-through for consistency and updating
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ Out, res, bool, True if test
+  """
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking bool",comment,'|',res,'is not True!')
+      results["fail"] += 1
+  return res
+
+def checkArray(comment,first,second,tol=1e-10,update=True):
+  """
+    This method is aimed to compare two arrays of floats
+    @ In, comment, string, a comment printed out if it fails
+    @ In, first, np.array, the values to compare
+    @ In, second, np.array, the expected values
+    @ In, tol, float, optional, the relative tolerance
+    @ Out, res, bool, True if same
+  """
+  first = np.asarray(first).ravel()
+  second = np.asarray(second).ravel()
+  res = len(first) == len(second) and all(checkFloat(comment,a,b,tol,update=False) for a,b in zip(first,second))
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking array",comment,'|',first,"!=",second)
+      results["fail"] += 1
+  return res
+
+class Caller(MessageHandler.MessageUser):
+  """
+    Minimal entity sharing the message handler with the distributor
+  """
+  def __init__(self):
+    """
+      Constructor
+      @ In, None
+      @ Out, None
+    """
+    self.messageHandler = mh
+    self.printTag = 'CALLER'
+
+def createMetric(metricType):
+  """
+    Creates a metric from its XML input, counting the calls to its evaluatePairs
+    @ In, metricType, string, the type of the metric
+    @ Out, metric, Metric, the metric
+  """
+  metric = Metrics.returnInstance(metricType,None)
+  metric.messageHandler = mh
+  metric._readMoreXML(ET.fromstring('<{0} name="{0}"/>'.format(metricType)))
+  metric.pairsCalls = 0
+  evaluatePairs = metric.evaluatePairs
+  def countedEvaluatePairs(pairs):
+    """
+      Counts the calls to evaluatePairs
+      @ In, pairs, list(tuple), the pairs of data
+      @ Out, values, numpy.ndarray, the metric result for each pair
+    """
+    metric.pairsCalls += 1
+    return evaluatePairs(pairs)
+  metric.evaluatePairs = countedEvaluatePairs
+  return metric
+
+def stepData(data, step):
+  """
+    Gets the data of a time step, as given to the metric
+    @ In, data, tuple, (values, probabilityWeight)
+    @ In, step, int, the time step
+    @ Out, stepData, tuple or numpy.ndarray, the data of the time step
+  """
+  values, weight = data
+  return values[:, step] if weight is None else (values[:, step], weight)
+
+np.random.seed(42)
+numSamples, numSteps = 50, 4
+weights = np.random.uniform(0.5, 1.5, size=numSamples)
+# (feature, target) pairs as built by the Metric post-processor, with and without probability weights
+measureList = [((np.random.normal(size=(numSamples, numSteps)), None), (np.random.normal(1.0, size=(numSamples, numSteps)), None)),
+               ((np.random.uniform(size=(numSamples, 1)), weights), (np.random.uniform(size=(numSamples, 1)), weights)),
+               ((np.random.normal(size=(numSamples, numSteps)), weights), (np.random.normal(size=(numSamples, numSteps)), None))]
+
+caller = Caller()
+for metricType in ['CDFAreaDifference', 'PDFCommonArea']:
+  metric = createMetric(metricType)
+  distributor = MetricDistributor.returnInstance('MetricDistributor', metric, caller)
+  checkTrue('{} compares many pairs'.format(metricType), distributor.canHandleManyPairs)
+  for multiOutput in ['mean', 'max', 'raw_values']:
+    metric.pairsCalls = 0
+    outputs = distributor.evaluateAll(measureList, multiOutput=multiOutput)
+    checkTrue('{} {} single call'.format(metricType, multiOutput), metric.pairsCalls == 1)
+    checkTrue('{} {} number of outputs'.format(metricType, multiOutput), len(outputs) == len(measureList))
+    for cnt, pairedData in enumerate(measureList):
+      expected = distributor.evaluate(pairedData, multiOutput=multiOutput)
+      checkArray('{} {} pair {}'.format(metricType, multiOutput, cnt), outputs[cnt], expected)
+      # each time step is compared by itself
+      steps = np.asarray(pairedData[0][0]).shape[1]
+      single = list(metric.evaluate(stepData(pairedData[0], step), stepData(pairedData[1], step)) for step in range(steps))
+      if multiOutput == 'raw_values':
+        checkArray('{} pair {} steps'.format(metricType, cnt), outputs[cnt], single)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.unit_test_MetricDistributor</name>
+    <author>agent</author>
+    <created>2026-10-17</created>
+    <classesTested>MetricDistributor</classesTested>
+    <description>
+       This test is a Unit Test for the MetricDistributor: the CDFAreaDifference and PDFCommonArea metrics
+       evaluate all the (feature, target) pairs given at once with a single call of evaluatePairs, and give the
+       same values as the evaluation of each pair and of each time step.
+    </description>
+  </TestInfo>
+"""
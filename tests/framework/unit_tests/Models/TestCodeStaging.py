@@ -0,0 +1,285 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the staging of the input files of the Code model
+  (copy, hardlink or symlink in the run directories).
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys, os
+import shutil
+import tempfile
+import xml.etree.ElementTree as ET
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+
+import MessageHandler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'debug', 'callerLength':10, 'tagLength':10})
+
+import Files
+import Models
+import CodeInterfaces
+print('Module undergoing testing:')
+print(Models.Code)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,res,update=True):
+  """
+    This method is a pass-through for consistency and updating
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ Out, res, bool, True if test
+  """
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking bool",comment,'|',res,'is not True!')
+      results["fail"] += 1
+  return res
+
+def checkSame(comment,value,expected,update=True):
+  """
+    This method is aimed to compare two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking string",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
+def checkFails(comment,errstr,function,update=True,args=None,kwargs=None):
+  """
+    Checks if function will fail expectedly.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, errstr, str, message given by error to check against
+    @ In, function, method, function to evaluate that is expected to fail
+    @ In, update, bool, optional, if True then will update results
+    @ In, args, list, additional arguments to pass to function
+    @ In, kwargs, dict, additional keyword arguments to pass to function
+    @ Out, res, bool, True if function fails as expected.
+  """
+  print('Error testing ...')
+  if args is None:
+    args = []
+  if kwargs is None:
+    kwargs = {}
+  try:
+    function(*args,**kwargs)
+    res = False
+    msg = 'Function call did not error!'
+  except Exception as e:
+    res = checkSame('',e.args[0],errstr,update=False)
+    if not res:
+      msg = 'Unexpected error message.  \n    Received: "{}"\n    Expected: "{}"'.format(e.args[0],errstr)
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking error",comment,'|',msg)
+      results["fail"] += 1
+  print(' ... end Error testing')
+  print('')
+  return res
+
+workDir = tempfile.mkdtemp()
+sourceDir = os.path.join(workDir,'source')
+os.mkdir(sourceDir)
+for fileName in ['table.dat','model.inp']:
+  with open(os.path.join(sourceDir,fileName),'w') as source:
+    source.write('content of '+fileName+'\n')
+
+def makeFile(fileName,staging=None):
+  """
+    Creates the Files object of an input file, as read from the <Files> block
+    @ In, fileName, string, the name of the file in the source directory
+    @ In, staging, string, optional, the staging attribute (not given if None)
+    @ Out, inputFile, Files.UserGenerated, the file
+  """
+  node = ET.Element('Input',{'name':fileName})
+  if staging is not None:
+    node.attrib['staging'] = staging
+  node.text = os.path.join(sourceDir,fileName)
+  inputFile = Files.UserGenerated()
+  inputFile.messageHandler = mh
+  inputFile._readMoreXML(node)
+  return inputFile
+
+def runDirectory(name):
+  """
+    Creates a run directory
+    @ In, name, string, the name of the directory
+    @ Out, directory, string, the run directory
+  """
+  directory = os.path.join(workDir,name)
+  os.mkdir(directory)
+  return directory
+
+def sameInode(first,second):
+  """
+    Checks if two paths are the same file on disk
+    @ In, first, string, the first path
+    @ In, second, string, the second path
+    @ Out, same, bool, True if they share the inode
+  """
+  return os.stat(first).st_ino == os.stat(second).st_ino
+
+def readText(fileName):
+  """
+    Reads a text file
+    @ In, fileName, string, the file
+    @ Out, text, string, its content
+  """
+  with open(fileName,'r') as textFile:
+    return textFile.read()
+
+code = Models.Code({})
+code.messageHandler = mh
+code.code = CodeInterfaces.returnCodeInterface('GenericCode',code)
+code.code.setInputExtension(['inp'])
+warningsRaised = []
+def recordWarning(*args,**kwargs):
+  """
+    Records the warnings of the Code model
+    @ In, args, list, the message
+    @ In, kwargs, dict, the options
+    @ Out, None
+  """
+  warningsRaised.append(' '.join(str(a) for a in args))
+code.raiseAWarning = recordWarning
+
+tableSource = os.path.join(sourceDir,'table.dat')
+modelSource = os.path.join(sourceDir,'model.inp')
+
+######################################
+#     attribute                      #
+######################################
+checkSame('default staging',makeFile('table.dat').getStaging(),'copy')
+checkSame('staging read',makeFile('table.dat',' HardLink ').getStaging(),'hardlink')
+checkFails('unknown staging','Unknown staging "move" for file '+tableSource+'! Available are "copy", "hardlink" and "symlink".',
+           makeFile,args=['table.dat','move'])
+
+######################################
+#     copy                           #
+######################################
+directory = runDirectory('copy')
+code._stageInputFile(makeFile('table.dat'),directory)
+staged = os.path.join(directory,'table.dat')
+checkTrue('copy exists',os.path.isfile(staged))
+checkTrue('copy is not a link',not os.path.islink(staged))
+checkTrue('copy is a new file',not sameInode(staged,tableSource))
+checkSame('copy content',readText(staged),'content of table.dat\n')
+
+######################################
+#     hardlink                       #
+######################################
+directory = runDirectory('hardlink')
+code._stageInputFile(makeFile('table.dat','hardlink'),directory)
+staged = os.path.join(directory,'table.dat')
+checkTrue('hardlink is not a symlink',not os.path.islink(staged))
+checkTrue('hardlink shares the inode',sameInode(staged,tableSource))
+# staged again in the same directory (e.g. a restarted realization): the link is replaced
+code._stageInputFile(makeFile('table.dat','hardlink'),directory)
+checkTrue('hardlink staged again',sameInode(staged,tableSource))
+
+######################################
+#     symlink                        #
+######################################
+directory = runDirectory('symlink')
+code._stageInputFile(makeFile('table.dat','symlink'),directory)
+staged = os.path.join(directory,'table.dat')
+checkTrue('symlink is a link',os.path.islink(staged))
+checkSame('symlink target',os.readlink(staged),tableSource)
+checkSame('symlink content',readText(staged),'content of table.dat\n')
+code._stageInputFile(makeFile('table.dat','symlink'),directory)
+checkSame('symlink staged again',os.readlink(staged),tableSource)
+
+######################################
+#     input extensions               #
+######################################
+# the files the interface writes in are always copied, whatever their staging
+for staging in ['hardlink','symlink']:
+  directory = runDirectory('input_'+staging)
+  code._stageInputFile(makeFile('model.inp',staging),directory)
+  staged = os.path.join(directory,'model.inp')
+  checkTrue('input file with '+staging+' is not a link',not os.path.islink(staged))
+  checkTrue('input file with '+staging+' is copied',not sameInode(staged,modelSource))
+  checkSame('input file with '+staging+' content',readText(staged),'content of model.inp\n')
+checkSame('no warning',warningsRaised,[])
+
+######################################
+#     fallback to copy               #
+######################################
+def failingLink(source,destination):
+  """
+    Stands for a link that cannot be made (e.g. a hard link across file systems)
+    @ In, source, string, the file to link
+    @ In, destination, string, the link
+    @ Out, None
+  """
+  raise OSError(18,'Invalid cross-device link')
+
+for staging, function in [('hardlink','link'),('symlink','symlink')]:
+  directory = runDirectory('fallback_'+staging)
+  original = getattr(os,function)
+  setattr(os,function,failingLink)
+  try:
+    code._stageInputFile(makeFile('table.dat',staging),directory)
+  finally:
+    setattr(os,function,original)
+  staged = os.path.join(directory,'table.dat')
+  checkTrue('fallback of '+staging+' is not a link',not os.path.islink(staged))
+  checkTrue('fallback of '+staging+' is copied',not sameInode(staged,tableSource))
+  checkSame('fallback of '+staging+' content',readText(staged),'content of table.dat\n')
+  checkSame('fallback of '+staging+' warned',len(warningsRaised),1)
+  checkTrue('fallback of '+staging+' warning',warningsRaised.pop().startswith('Could not '+staging+' the file table.dat'))
+
+shutil.rmtree(workDir)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.unit_test_CodeStaging</name>
+    <author>agent</author>
+    <created>2026-10-17</created>
+    <classesTested>Models.Code</classesTested>
+    <description>
+       This test is a Unit Test for the staging of the input files of the Code model: copies, hard and
+       symbolic links, the files of the input extensions of the code (always copied) and the copy made when
+       a link cannot be created.
+    </description>
+  </TestInfo>
+"""
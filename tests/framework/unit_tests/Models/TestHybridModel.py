@@ -0,0 +1,276 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the HybridModel: crowding distances, retrain schedule
+  and training of the ROMs (warm starts and cross validation).
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys, os
+import copy
+import numpy as np
+from numpy import linalg
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+
+import MessageHandler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'debug', 'callerLength':10, 'tagLength':10})
+
+import Models
+print('Module undergoing testing:')
+print(Models.HybridModel)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkSame(comment,value,expected,update=True):
+  """
+    This method is aimed to compare two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking string",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
+def checkArray(comment,first,second,tol=1e-10,update=True):
+  """
+    This method is aimed to compare two arrays of floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, first, np.array, the first array
+    @ In, second, np.array, the second array
+    @ In, tol, float, optional, the tolerance
+    @ In, update, bool, optional, if True updates global results
+    @ Out, res, bool, True if same
+  """
+  res = first.shape == second.shape and np.allclose(first,second,rtol=tol,atol=0.)
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking array",comment,'|',first,"!=",second)
+      results["fail"] += 1
+  return res
+
+def loopCrowdingDistance(trainSet):
+  """
+    Reference crowding distances, computed with loops over the pairs of points
+    @ In, trainSet, numpy.array, array of points (one per column)
+    @ Out, crowdingDist, numpy.array, crowding distances
+  """
+  dim = trainSet.shape[1]
+  distMat = np.zeros((dim, dim))
+  for i in range(dim):
+    for j in range(i):
+      distMat[i,j] = linalg.norm(trainSet[:,i] - trainSet[:,j])
+      distMat[j,i] = distMat[i,j]
+  return np.sum(distMat,axis=1)
+
+def loopUpdateCrowdingDistance(oldSet, newSet, crowdingDistance):
+  """
+    Reference update of the crowding distances, computed with loops over the pairs of points
+    @ In, oldSet, numpy.array, array of the old points (one per column)
+    @ In, newSet, numpy.array, array of the new points (one per column)
+    @ In, crowdingDistance, numpy.array, crowding distances of the old points
+    @ Out, newCrowdingDistance, numpy.array, crowding distances of all the points
+  """
+  oldSize = oldSet.shape[1]
+  newSize = newSet.shape[1]
+  newCrowdingDistance = np.zeros(oldSize+newSize)
+  distMatAppend = np.zeros((oldSize,newSize))
+  for i in range(oldSize):
+    for j in range(newSize):
+      distMatAppend[i,j] = linalg.norm(oldSet[:,i] - newSet[:,j])
+  distMatNew = loopCrowdingDistance(newSet)
+  for i in range(oldSize):
+    newCrowdingDistance[i] = crowdingDistance[i] + np.sum(distMatAppend[i,:])
+  for i in range(newSize):
+    newCrowdingDistance[i+oldSize] = distMatNew[i] + np.sum(distMatAppend[:,i])
+  return newCrowdingDistance
+
+class FakeROM(object):
+  """
+    ROM recording how it is reset and trained
+  """
+  def __init__(self,name,warmStart):
+    """
+      Constructor
+      @ In, name, string, the name of the ROM
+      @ In, warmStart, bool, True if the ROM can be retrained without being reset
+      @ Out, None
+    """
+    self.name = name
+    self.warmStart = warmStart
+    self.events = []
+
+  def canWarmStart(self):
+    """
+      Tells if the ROM can be retrained without being reset
+      @ In, None
+      @ Out, canWarmStart, bool, True if it can
+    """
+    return self.warmStart
+
+  def reset(self):
+    """
+      Resets the ROM
+      @ In, None
+      @ Out, None
+    """
+    self.events.append('reset')
+
+  def train(self,trainingSet):
+    """
+      Trains the ROM
+      @ In, trainingSet, list, the training set
+      @ Out, None
+    """
+    self.events.append(len(trainingSet))
+
+class FakeCV(object):
+  """
+    Cross validation training the ROM it receives, as the CrossValidation PostProcessor does
+  """
+  def __init__(self,splits):
+    """
+      Constructor
+      @ In, splits, int, the number of folds
+      @ Out, None
+    """
+    self.interface = type('Interface',(object,),{'initializationOptionDict':{'SciKitLearn':{'n_splits':str(splits)}}})()
+    self.received = []
+
+  def evaluateSample(self,myInput,samplerType,kwargs):
+    """
+      Trains the ROM on the training set
+      @ In, myInput, list, the ROM and the training set
+      @ In, samplerType, string, the type of sampler
+      @ In, kwargs, dict, the sampler information
+      @ Out, evaluation, tuple, (input, metrics)
+    """
+    rom, trainingSet = myInput
+    self.received.append(rom)
+    rom.train(trainingSet)
+    return None, {}
+
+hybrid = Models.HybridModel({})
+hybrid.messageHandler = mh
+
+###################
+# crowding        #
+###################
+randomState = np.random.RandomState(42)
+points = randomState.uniform(-1.,1.,(3,40))
+for size in [1,2,17,40]:
+  checkArray('crowding distance {} points'.format(size),hybrid.computeCrowdingDistance(points[:,:size]),loopCrowdingDistance(points[:,:size]))
+for oldSize,newSize in [(1,1),(10,1),(10,25),(39,1)]:
+  oldSet = points[:,:oldSize]
+  newSet = points[:,oldSize:oldSize+newSize]
+  old = loopCrowdingDistance(oldSet)
+  checkArray('updated crowding distance {}+{} points'.format(oldSize,newSize),hybrid.updateCrowdingDistance(oldSet,newSet,old),
+             loopUpdateCrowdingDistance(oldSet,newSet,old))
+# incremental updates give the distances of the whole set
+crowding = hybrid.computeCrowdingDistance(points[:,:5])
+for size in range(6,41,7):
+  crowding = hybrid.updateCrowdingDistance(points[:,:crowding.size],points[:,crowding.size:size],crowding)
+checkArray('incremental crowding distance',crowding,loopCrowdingDistance(points[:,:crowding.size]))
+
+###################
+# retrain         #
+###################
+hybrid.romTrainStartSize = 10
+hybrid.existTrainSize = 0
+hybrid.oldTrainingSize = 0
+hybrid.tempTargetEvaluation = list(range(9))
+checkSame('not ready before initial size',hybrid.amIReadyToTrainROM(),False)
+hybrid.tempTargetEvaluation = list(range(10))
+checkSame('ready at initial size',hybrid.amIReadyToTrainROM(),True)
+hybrid.oldTrainingSize = 10
+hybrid.tempTargetEvaluation = list(range(11))
+checkSame('growth 1 ready with one new sample',hybrid.amIReadyToTrainROM(),True)
+hybrid.romRetrainGrowth = 2.0
+checkSame('growth 2 not ready with one new sample',hybrid.amIReadyToTrainROM(),False)
+hybrid.tempTargetEvaluation = list(range(19))
+checkSame('growth 2 not ready before doubling',hybrid.amIReadyToTrainROM(),False)
+hybrid.tempTargetEvaluation = list(range(20))
+checkSame('growth 2 ready once doubled',hybrid.amIReadyToTrainROM(),True)
+hybrid.romRetrainGrowth = 1.5
+hybrid.oldTrainingSize = 15
+hybrid.tempTargetEvaluation = list(range(23))
+checkSame('growth 1.5 not ready before growth',hybrid.amIReadyToTrainROM(),False)
+hybrid.tempTargetEvaluation = list(range(24))
+checkSame('growth 1.5 ready (rounded up)',hybrid.amIReadyToTrainROM(),True)
+
+###################
+# training        #
+###################
+cold = FakeROM('cold',False)
+warm = FakeROM('warm',True)
+# as in initialize, the cross validations run on untrained copies of the roms
+hybrid.romsDictionary = {}
+for rom in [cold,warm]:
+  hybrid.romsDictionary[rom.name] = {'Instance':rom, 'Untrained':copy.deepcopy(rom), 'Converged':False, 'Valid':False, 'CrowdingDistance':None}
+hybrid.cvInstance = FakeCV(5)
+hybrid.isRomConverged = lambda outputDict: True
+hybrid.tempTargetEvaluation = list(range(4))
+hybrid.trainRom('MonteCarlo',{})
+checkSame('no cross validation below the number of folds',len(hybrid.cvInstance.received),0)
+checkSame('training size recorded',hybrid.oldTrainingSize,4)
+for size in [10,20]:
+  hybrid.tempTargetEvaluation = list(range(size))
+  hybrid.trainRom('MonteCarlo',{})
+checkSame('training size recorded after retraining',hybrid.oldTrainingSize,20)
+checkSame('cross validation on the untrained copies',list(rom.name for rom in hybrid.cvInstance.received),['cold','warm','cold','warm'])
+checkSame('cross validation not on the roms',any(rom is cold or rom is warm for rom in hybrid.cvInstance.received),False)
+# the roms that can not warm start are reset before each retraining, the others are not
+checkSame('cold rom events',cold.events,['reset','reset',10,'reset',20])
+checkSame('warm rom events',warm.events,[10,20])
+# the copies used by the cross validation always start from scratch
+for name in ['cold','warm']:
+  checkSame(name+' cross validation copy events',hybrid.romsDictionary[name]['Untrained'].events,['reset',10,'reset',20])
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.unit_test_HybridModel</name>
+    <author>agent</author>
+    <created>2026-10-17</created>
+    <classesTested>Models.HybridModel</classesTested>
+    <description>
+       This test is a Unit Test for the HybridModel: the vectorized crowding distances match the ones computed
+       with loops over the pairs of points, the ROMs are retrained according to the retrainGrowthFactor, the ROMs
+       that can warm start are not reset, and the cross validation runs on reset copies of the ROMs.
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,224 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the vectorized sparse grid kernels of the Quadratures module
+  (Smolyak coefficients, tensor grids, merge of the common points), compared with the scalar algorithms
+  they replace, in process and on a pool of processes.
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys, os
+import itertools
+import collections
+import numpy as np
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils import utils
+utils.find_crow(frameworkDir)
+# the JobHandler (imported by the Quadratures) needs the parallel python modules
+if sys.version_info.major == 2:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp'))
+else:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp3'))
+
+import Quadratures
+from Runners.ProcessPoolRunner import ProcessPool
+print('Module undergoing testing:')
+print(Quadratures)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkArray(comment,first,second,tol=1e-12,update=True):
+  """
+    This method is aimed to compare two float arrays
+    @ In, comment, string, a comment printed out if it fails
+    @ In, first, np.array, the values to compare
+    @ In, second, np.array, the expected values
+    @ In, tol, float, optional, the relative tolerance
+    @ Out, res, bool, True if same
+  """
+  first = np.atleast_1d(np.asarray(first,dtype=float))
+  second = np.atleast_1d(np.asarray(second,dtype=float))
+  if first.shape != second.shape:
+    res = False
+    print("checking array",comment,'|','shapes do not match:',first.shape,second.shape)
+  else:
+    error = np.abs(first - second) - tol*np.maximum(1.0,np.abs(second))
+    res = bool(np.all(error <= 0.0))
+    if not res:
+      worst = np.unravel_index(np.argmax(error),error.shape)
+      print("checking array",comment,'|','entry',worst,':',first[worst],"!=",second[worst])
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      results["fail"] += 1
+  return res
+
+def checkSame(comment,value,expected,update=True):
+  """
+    This method is aimed to compare two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking answer",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
+def scalarCoefficients(indexSet):
+  """
+    Smolyak combination coefficients, one pair of index set entries at a time
+    @ In, indexSet, np.array, shape = [n_entries,n_dims], the index set (in increasing order)
+    @ Out, coeffs, np.array, shape = [n_entries], the coefficients
+  """
+  coeffs = np.ones(len(indexSet))
+  for i,idx in enumerate(indexSet):
+    for jdx in indexSet[i+1:]:
+      d = jdx-idx
+      if all(np.logical_and(d>=0,d<=1)):
+        coeffs[i] += (-1)**sum(d)
+  return coeffs
+
+def scalarGrid(rules, orders, coeffs):
+  """
+    Sparse grid combining tensor grids, one point at a time
+    @ In, rules, dict, {(dim,number of points):(points,weights)}, 1-D rules
+    @ In, orders, np.array, shape = [n_grids,n_dims], number of points of each tensor grid in each dimension
+    @ In, coeffs, np.array, shape = [n_grids], the combination coefficients
+    @ Out, grid, collections.OrderedDict, {point:weight}, the grid
+  """
+  grid = collections.OrderedDict()
+  for m,coeff in zip(orders,coeffs):
+    pointLists,weightLists = zip(*(rules[(n,int(mn))] for n,mn in enumerate(m)))
+    for point,weights in zip(itertools.product(*pointLists),itertools.product(*weightLists)):
+      grid[point] = grid.get(point,0.0) + np.prod(weights)*coeff
+  return grid
+
+def nestedRules(orders):
+  """
+    Nested 1-D rules (Clenshaw-Curtis points, with arbitrary weights summing to n+1 in dimension n), so that the
+    tensor grids share points
+    @ In, orders, np.array, shape = [n_grids,n_dims], number of points of each tensor grid in each dimension
+    @ Out, rules, dict, {(dim,number of points):(points,weights)}, the 1-D rules
+  """
+  rules = {}
+  for n in range(orders.shape[1]):
+    for m in np.unique(orders[:,n]):
+      m = int(m)
+      points = np.zeros(1) if m == 1 else -np.cos(np.pi*np.arange(m)/(m-1))
+      rules[(n,m)] = (points,np.linspace(1.,2.,m)/(1.5*m)*(n+1))
+  return rules
+
+def orders(indexSet):
+  """
+    Number of points of the tensor grid of each index set entry (nested rule, 2^i+1 points)
+    @ In, indexSet, np.array, shape = [n_entries,n_dims], the index set
+    @ Out, orders, np.array, shape = [n_entries,n_dims], the number of points
+  """
+  return np.where(indexSet == 0,1,2**indexSet+1)
+
+# index sets (in increasing order, as built by the IndexSets)
+totalDegree = np.array(sorted((i for i in itertools.product(range(5),repeat=3) if sum(i) <= 4), key=lambda i:(sum(i),i[::-1])))
+hyperbolicCross = np.array(sorted((i for i in itertools.product(range(9),repeat=2) if (i[0]+1)*(i[1]+1) <= 9), key=lambda i:(sum(i),i[::-1])))
+mixedOrders = np.array(sorted((i for i in itertools.product(range(4),range(2),range(3),range(2)) if sum(i) <= 4), key=lambda i:(sum(i),i[::-1])))
+indexSets = {'total degree 3D':totalDegree,'hyperbolic cross 2D':hyperbolicCross,'mixed orders 4D':mixedOrders}
+
+for name,indexSet in indexSets.items():
+  ### coefficients
+  reference = scalarCoefficients(indexSet)
+  checkArray(name+' coefficients',Quadratures.smolyakCoefficients(indexSet),reference)
+  partial = np.concatenate(list(Quadratures.smolyakCoefficients(indexSet,(first,min(first+3,len(indexSet)))) for first in range(0,len(indexSet),3)))
+  checkArray(name+' coefficients by entry ranges',partial,reference)
+  ### grids
+  survive = reference != 0
+  gridOrders = orders(indexSet[survive])
+  rules = nestedRules(gridOrders)
+  expected = scalarGrid(rules,gridOrders,reference[survive])
+  points,weights = Quadratures.mergeGridPoints(*Quadratures.tensorProductGrids(rules,gridOrders,reference[survive]))
+  checkSame(name+' grid points',list(map(tuple,points.tolist())),list(expected.keys()))
+  checkArray(name+' grid weights',weights,list(expected.values()))
+  # the combination coefficients sum to 1
+  checkArray(name+' total weight',weights.sum(),np.prod(np.arange(indexSet.shape[1])+1.))
+
+checkArray('empty index set',Quadratures.smolyakCoefficients(np.zeros((0,2),dtype=int)),np.zeros(0))
+# high dimension: only the neighbors in the index set are looked up, not the 2^40 offsets of each entry
+numDims = 40
+unit = np.eye(numDims,dtype=int)
+highDimension = np.concatenate([np.zeros((1,numDims),dtype=int),unit]+list(unit[k]+unit[k:] for k in range(numDims)))
+highCoefficients = Quadratures.smolyakCoefficients(highDimension)
+checkArray('high dimension coefficients',highCoefficients,scalarCoefficients(highDimension))
+checkArray('high dimension coefficients sum',highCoefficients.sum(),1.)
+highDimension = np.concatenate([highDimension,3*unit[:1]])
+checkArray('high dimension coefficients, larger radix',Quadratures.smolyakCoefficients(highDimension),scalarCoefficients(highDimension))
+# an index set that is not downward closed, the coefficients are computed comparing all the entries
+notClosed = np.array([[0,0],[0,1],[2,0],[1,1]])
+checkArray('not downward closed coefficients',Quadratures.smolyakCoefficients(notClosed),[1.,0.,1.,1.])
+
+### on a pool of processes: the same results, and the pool does not keep the arguments of the calls
+if __name__ == '__main__':
+  pool = ProcessPool(2)
+  try:
+    indexSet = totalDegree
+    half = len(indexSet)//2
+    responses = pool.map(Quadratures.smolyakCoefficients,indexSet,[((0,half),),((half,len(indexSet)),)])
+    checkSame('pool coefficients succeeded',list(succeeded for succeeded,_ in responses),[True,True])
+    checkArray('pool coefficients',np.concatenate(list(response for _,response in responses)),scalarCoefficients(indexSet))
+    reference = scalarCoefficients(indexSet)
+    survive = reference != 0
+    gridOrders = orders(indexSet[survive])
+    rules = nestedRules(gridOrders)
+    chunks = [(gridOrders[:5],reference[survive][:5]),(gridOrders[5:],reference[survive][5:])]
+    responses = pool.map(Quadratures.tensorProductGrids,rules,chunks)
+    points = np.concatenate(list(response[0] for _,response in responses))
+    weights = np.concatenate(list(response[1] for _,response in responses))
+    points,weights = Quadratures.mergeGridPoints(points,weights)
+    expected = scalarGrid(rules,gridOrders,reference[survive])
+    checkSame('pool grid points',list(map(tuple,points.tolist())),list(expected.keys()))
+    checkArray('pool grid weights',weights,list(expected.values()))
+    checkSame('pool keeps no map argument',len(pool._ProcessPool__shared),0)
+  finally:
+    pool.terminate()
+
+  print(results)
+
+  sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.Quadratures</name>
+    <author>agent</author>
+    <created>2026-10-17</created>
+    <classesTested>Quadratures.smolyakCoefficients, Quadratures.tensorProductGrids, Quadratures.mergeGridPoints</classesTested>
+    <description>
+       This test performs Unit Tests for the vectorized sparse grid kernels (Smolyak coefficients, tensor grids and
+       merge of their common points), compared with the scalar algorithms on total degree, hyperbolic cross and
+       mixed order index sets, in process and on a pool of processes.
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,205 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the batched generation of the ARMA synthetic histories, compared with the
+  generation of one history at a time and with the statsmodels VARMA simulation.
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys, os
+import xml.etree.ElementTree as ET
+import numpy as np
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+
+import MessageHandler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'silent', 'callerLength':10, 'tagLength':10})
+
+from Models.ROM import ROM
+from SupervisedLearning.ARMA import ARMA
+print('Module undergoing testing:')
+print(ARMA)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkArray(comment,first,second,tol=1e-10,update=True):
+  """
+    This method is aimed to compare two float arrays
+    @ In, comment, string, a comment printed out if it fails
+    @ In, first, np.array, the values to compare
+    @ In, second, np.array, the expected values
+    @ In, tol, float, optional, the relative tolerance
+    @ Out, res, bool, True if same
+  """
+  first = np.asarray(first)
+  second = np.asarray(second)
+  if first.shape != second.shape:
+    res = False
+    print("checking array",comment,'|','shapes do not match:',first.shape,second.shape)
+  else:
+    error = np.abs(first - second) - tol*np.maximum(1.0,np.abs(second))
+    res = bool(np.all(error <= 0.0))
+    if not res:
+      worst = np.unravel_index(np.argmax(error),error.shape)
+      print("checking array",comment,'|','entry',worst,':',first[worst],"!=",second[worst])
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      results["fail"] += 1
+  return res
+
+def checkTrue(comment,res,update=True):
+  """
+    This method is a pass-through for consistency and updating
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ Out, res, bool, True if test
+  """
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking bool",comment,'|',res,'is not True!')
+      results["fail"] += 1
+  return res
+
+def trainARMA(xml,data):
+  """
+    Trains an ARMA ROM
+    @ In, xml, string, the ROM input node
+    @ In, data, dict, {target:np.array}, the training history (including the pivot parameter "Time")
+    @ Out, arma, ARMA, the trained ROM
+  """
+  node = ET.fromstring(xml)
+  paramInput = ROM.getInputSpecification()()
+  paramInput.parseNode(node)
+  kwargs = {'paramInput':paramInput}
+  for child in node:
+    if child.tag == 'ZeroFilter':
+      kwargs[child.tag] = {child.text:child.attrib}
+    elif child.tag in ['Pmax','Pmin','Qmax','Qmin','seed']:
+      kwargs[child.tag] = int(child.text)
+    else:
+      kwargs[child.tag] = child.text
+  arma = ARMA(mh,**kwargs)
+  tdict = dict((name,[np.asarray(values,dtype=float)]) for name,values in data.items())
+  tdict['scaling'] = np.ones(1)
+  arma.train(tdict)
+  return arma
+
+def checkBatch(comment,arma,numHistories=4,seed=42):
+  """
+    Checks that generating several histories at once gives the histories generated one at a time
+    @ In, comment, string, a comment printed out if it fails
+    @ In, arma, ARMA, the trained ROM
+    @ In, numHistories, int, optional, the number of histories
+    @ In, seed, int, optional, the random seed
+    @ Out, None
+  """
+  arma.reseed(seed)
+  batch = arma.generateHistories(numHistories)
+  arma.reseed(seed)
+  singles = [arma.generateHistories(1) for _ in range(numHistories)]
+  for target in arma.target:
+    checkArray(comment+' '+target,batch[target],np.concatenate([single[target] for single in singles]))
+  # the histories are independent
+  for target in arma.target:
+    if target != arma.zeroFilterTarget:
+      checkTrue(comment+' independent '+target,np.abs(batch[target][0]-batch[target][1]).max() > 1e-6)
+
+# training histories: A and B correlated, C independent, D zero for half of the times (as a night solar irradiance)
+randomState = np.random.RandomState(12)
+time = np.arange(120,dtype=float)
+baseA = randomState.uniform(-0.5,0.5,time.size)
+data = {'Time':time,
+        'A':baseA,
+        'B':0.9*baseA + 0.1*randomState.uniform(-0.5,0.5,time.size),
+        'C':randomState.uniform(-0.5,0.5,time.size),
+        'D':np.where(np.sin(2.*np.pi*time/24.) > 0.,1.+randomState.uniform(0.,1.,time.size),0.)}
+
+### uncorrelated ARMAs
+arma = trainARMA('<ROM name="arma" subType="ARMA"><Target>A,C,Time</Target><Features>scaling</Features>'
+                 '<pivotParameter>Time</pivotParameter><seed>3</seed>'
+                 '<Pmax>2</Pmax><Pmin>2</Pmin><Qmax>1</Qmax><Qmin>1</Qmin></ROM>',
+                 dict((k,data[k]) for k in ['Time','A','C']))
+checkBatch('ARMA',arma)
+
+### VARMA and uncorrelated ARMA
+varma = trainARMA('<ROM name="varma" subType="ARMA"><Target>A,B,C,Time</Target><Features>scaling</Features>'
+                  '<pivotParameter>Time</pivotParameter><seed>3</seed><correlate>A,B</correlate>'
+                  '<Pmax>1</Pmax><Pmin>1</Pmin><Qmax>0</Qmax><Qmin>0</Qmin></ROM>',
+                  dict((k,data[k]) for k in ['Time','A','B','C']))
+checkBatch('VARMA',varma)
+
+### the batched propagation of the VARMA is the statsmodels simulation of each history
+model = varma.varmaResult[0]
+noiseDist = varma.varmaNoise[0]
+initDist = varma.varmaInit[0]
+numSamples = 15
+coordinates = randomState.normal(size=(3,numSamples*noiseDist.rank+initDist.rank))
+batch = varma._generateVARMASignal(model,numSamples=numSamples,rvsIndex=0,numHistories=3,coordinates=coordinates)
+for h in range(3):
+  stateShocks = varma._transformMultivariateNormal(noiseDist,coordinates[h,:numSamples*noiseDist.rank])
+  init = varma._transformMultivariateNormal(initDist,coordinates[h,numSamples*noiseDist.rank:])[0]
+  obs,_ = model.ssm.simulate(numSamples,
+                             initial_state = init,
+                             measurement_shocks = np.zeros((numSamples,batch.shape[2])),
+                             state_shocks = stateShocks)
+  checkArray('VARMA simulation history {}'.format(h),batch[h],obs)
+
+### zero filtered VARMA, the zeroed correlated targets being a VARMA
+zeroed = trainARMA('<ROM name="zeroed" subType="ARMA"><Target>A,B,C,D,Time</Target><Features>scaling</Features>'
+                   '<pivotParameter>Time</pivotParameter><seed>3</seed><correlate>A,B,D</correlate>'
+                   '<ZeroFilter tol="1e-10">D</ZeroFilter>'
+                   '<Pmax>1</Pmax><Pmin>1</Pmin><Qmax>0</Qmax><Qmin>0</Qmin></ROM>',
+                   data)
+checkBatch('zero filtered VARMA',zeroed)
+
+### zero filtered VARMA, the zeroed correlated target being an ARMA
+zeroedArma = trainARMA('<ROM name="zeroedArma" subType="ARMA"><Target>A,C,D,Time</Target><Features>scaling</Features>'
+                       '<pivotParameter>Time</pivotParameter><seed>3</seed><correlate>A,D</correlate>'
+                       '<ZeroFilter tol="1e-10">D</ZeroFilter>'
+                       '<Pmax>1</Pmax><Pmin>1</Pmin><Qmax>0</Qmax><Qmin>0</Qmin></ROM>',
+                       dict((k,data[k]) for k in ['Time','A','C','D']))
+checkBatch('zero filtered ARMA',zeroedArma)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.ARMA</name>
+    <author>agent</author>
+    <created>2026-10-17</created>
+    <classesTested>SupervisedLearning.ARMA</classesTested>
+    <description>
+       This test performs Unit Tests for the batched generation of the ARMA synthetic histories: generating several
+       histories at once gives the histories generated one at a time with the same seed (uncorrelated ARMAs, VARMA,
+       zero filtered VARMA and ARMA), and the batched VARMA propagation gives the statsmodels simulation of each history.
+    </description>
+  </TestInfo>
+"""
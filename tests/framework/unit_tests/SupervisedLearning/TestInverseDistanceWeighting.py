@@ -0,0 +1,173 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the InverseDistanceWeighting engine of the NDinvDistWeight ROM,
+  compared with a brute-force inverse distance weighting.
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys, os
+import numpy as np
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+
+from SupervisedLearning.NDinvDistWeight import InverseDistanceWeighting
+print('Module undergoing testing:')
+print(InverseDistanceWeighting)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkArray(comment,first,second,tol=1e-10,update=True):
+  """
+    This method is aimed to compare two float arrays
+    @ In, comment, string, a comment printed out if it fails
+    @ In, first, np.array, the values to compare
+    @ In, second, np.array, the expected values
+    @ In, tol, float, optional, the relative tolerance
+    @ Out, res, bool, True if same
+  """
+  first = np.asarray(first)
+  second = np.asarray(second)
+  if first.shape != second.shape:
+    res = False
+    print("checking array",comment,'|','shapes do not match:',first.shape,second.shape)
+  else:
+    error = np.abs(first - second) - tol*np.maximum(1.0,np.abs(second))
+    res = bool(np.all(error <= 0.0))
+    if not res:
+      worst = np.unravel_index(np.argmax(error),error.shape)
+      print("checking array",comment,'|','entry',worst,':',first[worst],"!=",second[worst])
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      results["fail"] += 1
+  return res
+
+def bruteForce(points,values,queries,p,neighbors=None,radius=None):
+  """
+    Inverse distance weighting, one query at a time, with all the distances
+    @ In, points, np.array, the training points, [n_points,n_dimensions]
+    @ In, values, np.array, the training values, [n_points,n_targets]
+    @ In, queries, np.array, the query points, [n_queries,n_dimensions]
+    @ In, p, float, the order of the Minkowski distance
+    @ In, neighbors, int, optional, the number of nearest training points used (all if None)
+    @ In, radius, float, optional, the maximum distance of the training points used (no limit if None)
+    @ Out, result, np.array, the interpolated values, [n_queries,n_targets]
+  """
+  result = np.zeros((len(queries),values.shape[1]))
+  for q, query in enumerate(queries):
+    distances = np.array([np.sum(np.abs(query - point)**p)**(1.0/p) for point in points])
+    order = np.argsort(distances,kind='mergesort')
+    used = [i for i in order if radius is None or distances[i] <= radius]
+    if neighbors is not None:
+      used = used[:neighbors]
+    if len(used) == 0:
+      # no training point in the radius, the nearest one
+      result[q] = values[order[0]]
+      continue
+    exact = [i for i in used if distances[i] == 0.0]
+    if len(exact) > 0:
+      result[q] = values[min(exact)]
+      continue
+    weights = np.array([distances[i]**(-(points.shape[1]+1.0)) for i in used])
+    result[q] = np.dot(weights,values[used])/np.sum(weights)
+  return result
+
+def makeSet(numPoints,dimensions,seed):
+  """
+    Creates training points and values
+    @ In, numPoints, int, the number of points
+    @ In, dimensions, int, the number of dimensions
+    @ In, seed, int, the random seed
+    @ Out, (points,values), tuple, the points in [0,1]^dimensions and two targets
+  """
+  rng = np.random.RandomState(seed)
+  points = rng.uniform(0.0,1.0,(numPoints,dimensions))
+  values = np.stack((np.sin(3.0*points[:,0]) + points[:,-1]**2,np.sum(points,axis=1)),axis=1)
+  return points, values
+
+modes = [('full',None,None),('knn',5,None),('radius',None,0.25),('knn and radius',5,0.25)]
+
+for dimensions, p in [(2,2.0),(3,1.0),(2,3.0)]:
+  points, values = makeSet(120,dimensions,dimensions + int(p))
+  rng = np.random.RandomState(7)
+  # random queries, queries on training points, queries far from any training point
+  queries = np.concatenate((rng.uniform(-0.1,1.1,(60,dimensions)),points[[0,17,119]],np.full((2,dimensions),3.0)))
+  for mode, neighbors, radius in modes:
+    label = '{} p={} dim={}'.format(mode,p,dimensions)
+    ########################
+    #     fit              #
+    ########################
+    expected = bruteForce(points,values,queries,p,neighbors,radius)
+    interpolator = InverseDistanceWeighting(p,neighbors,radius)
+    interpolator.fit(points,values)
+    checkArray(label+' fit',interpolator.interpolateAt(queries),expected)
+    # blocks of queries
+    interpolator.maxChunkCells = 7*len(points)
+    checkArray(label+' fit in blocks',interpolator.interpolateAt(queries),expected)
+    # a single query
+    checkArray(label+' single query',interpolator.interpolateAt(queries[5]),expected[5:6])
+    ########################
+    #     add              #
+    ########################
+    # a few points at a time (kept in the buffer), then many at once (the tree is rebuilt)
+    incremental = InverseDistanceWeighting(p,neighbors,radius)
+    incremental.fit(points[:40],values[:40])
+    checkArray(label+' before add',incremental.interpolateAt(queries),bruteForce(points[:40],values[:40],queries,p,neighbors,radius))
+    for start, end in [(40,43),(43,50),(50,52)]:
+      incremental.add(points[start:end],values[start:end])
+      checkArray(label+' add to {}'.format(end),incremental.interpolateAt(queries),bruteForce(points[:end],values[:end],queries,p,neighbors,radius))
+    if neighbors is not None or radius is not None:
+      checkArray(label+' buffered points',[incremental.treeSize],[40])
+    incremental.add(points[52:],values[52:])
+    if neighbors is not None or radius is not None:
+      checkArray(label+' tree rebuilt',[incremental.treeSize],[len(points)])
+    checkArray(label+' add all',incremental.interpolateAt(queries),expected)
+
+# duplicated training points: the value of the first one
+points, values = makeSet(30,2,11)
+points = np.concatenate((points,points[:3]))
+values = np.concatenate((values,values[:3] + 10.0))
+interpolator = InverseDistanceWeighting(2.0)
+interpolator.fit(points,values)
+checkArray('duplicated points',interpolator.interpolateAt(points[:3]),values[:3])
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.unit_test_InverseDistanceWeighting</name>
+    <author>agent</author>
+    <created>2026-10-17</created>
+    <classesTested>SupervisedLearning.NDinvDistWeight.InverseDistanceWeighting</classesTested>
+    <description>
+       This test is a Unit Test for the inverse distance weighting engine of the NDinvDistWeight ROM. It is
+       compared with a brute-force weighting using all the training points, the k nearest ones, the ones
+       within a radius and both, after a fit and after adding training points incrementally.
+    </description>
+  </TestInfo>
+"""
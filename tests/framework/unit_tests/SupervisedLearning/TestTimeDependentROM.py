@@ -0,0 +1,179 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the chain of time-dependent SciKitLearn ROMs (one ROM per pivot value):
+  training all the pivot values at once and on a pool of processes, compared with the training of one ROM per step.
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys, os
+import xml.etree.ElementTree as ET
+import numpy as np
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+
+from utils import utils
+utils.find_crow(frameworkDir)
+# the pool of processes needs the parallel python modules
+if sys.version_info.major == 2:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp'))
+else:
+  utils.add_path_recursively(os.path.join(frameworkDir,'contrib','pp3'))
+
+import MessageHandler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'silent', 'callerLength':10, 'tagLength':10})
+
+from Models.ROM import ROM
+import LearningGate
+print('Module undergoing testing:')
+print(LearningGate.supervisedLearningGate)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkArray(comment,first,second,tol=1e-10,update=True):
+  """
+    This method is aimed to compare two float arrays
+    @ In, comment, string, a comment printed out if it fails
+    @ In, first, np.array, the values to compare
+    @ In, second, np.array, the expected values
+    @ In, tol, float, optional, the relative tolerance
+    @ Out, res, bool, True if same
+  """
+  first = np.asarray(first)
+  second = np.asarray(second)
+  if first.shape != second.shape:
+    res = False
+    print("checking array",comment,'|','shapes do not match:',first.shape,second.shape)
+  else:
+    error = np.abs(first - second) - tol*np.maximum(1.0,np.abs(second))
+    res = bool(np.all(error <= 0.0))
+    if not res:
+      worst = np.unravel_index(np.argmax(error),error.shape)
+      print("checking array",comment,'|','entry',worst,':',first[worst],"!=",second[worst])
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      results["fail"] += 1
+  return res
+
+def checkSame(comment,value,expected,update=True):
+  """
+    This method is aimed to compare two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking answer",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
+def trainGate(xml,data,together=True):
+  """
+    Trains the supervised gate of a time-dependent ROM, as the ROM model does
+    @ In, xml, string, the ROM input node
+    @ In, data, dict, the training set ({feature:np.array, target:[history]})
+    @ In, together, bool, optional, False to train one ROM per pivot value even if they can be trained at once
+    @ Out, gate, supervisedLearningGate, the trained gate
+  """
+  node = ET.fromstring(xml)
+  paramInput = ROM.getInputSpecification()()
+  paramInput.parseNode(node)
+  kwargs = {'name':node.attrib['name'],'paramInput':paramInput}
+  for child in paramInput.subparts:
+    kwargs[child.getName()] = utils.tryParse(child.value) if utils.isString(child.value) else child.value
+  gate = LearningGate.supervisedLearningGate('SciKitLearn',mh,**kwargs)
+  if not together:
+    gate.supervisedContainer[0].sharedFeatureFit = False
+  gate.train(data)
+  return gate
+
+# training histories, the features being the same for all the pivot values
+randomState = np.random.RandomState(5)
+numSamples, numSteps = 25, 7
+time = np.linspace(0.,1.,numSteps)
+features = randomState.uniform(0.,1.,(numSamples,2))
+data = {'a':features[:,0],
+        'b':features[:,1],
+        'y':list(np.outer(features[:,0],1.+time) + np.outer(features[:,1]**2,np.sin(3.*time)) + 0.01*randomState.normal(size=(numSamples,numSteps))),
+        'z':list(np.outer(features[:,0]*features[:,1],time**2)),
+        'time':list(np.tile(time,(numSamples,1)))}
+request = {'a':randomState.uniform(0.,1.,10),'b':randomState.uniform(0.,1.,10)}
+
+roms = {'LinearRegression':'<SKLtype>linear_model|LinearRegression</SKLtype>',
+        'Ridge':'<SKLtype>linear_model|Ridge</SKLtype><alpha>0.1</alpha>',
+        'KNeighborsRegressor':'<SKLtype>neighbors|KNeighborsRegressor</SKLtype><n_neighbors>3</n_neighbors><weights>distance</weights>'}
+
+for name,options in sorted(roms.items()):
+  xml = '<ROM name="{}" subType="SciKitLearn"><Features>a,b</Features><Target>y,z,time</Target><pivotParameter>time</pivotParameter>{}</ROM>'
+  together = trainGate(xml.format(name,options),data)
+  chained = trainGate(xml.format(name,options),data,together=False)
+  parallel = trainGate(xml.format(name,options+'<trainingProcesses>3</trainingProcesses>'),data,together=False)
+  checkSame(name+' trained together',together.slicesTrainedTogether,True)
+  checkSame(name+' chained',chained.slicesTrainedTogether,False)
+  checkSame(name+' parallel',parallel.slicesTrainedTogether,False)
+  checkSame(name+' parallel number of ROMs',len(parallel.supervisedContainer),numSteps)
+  reference = chained.evaluate(request)
+  for target in ['y','z']:
+    checkArray(name+' together '+target,together.evaluate(request)[target],reference[target])
+    checkArray(name+' parallel '+target,parallel.evaluate(request)[target],reference[target])
+    # each ROM of the chain trained at once evaluates its own pivot value
+    for ts in [0,numSteps-1]:
+      checkArray(name+' together step {} '.format(ts)+target,together.supervisedContainer[ts].evaluate(request)[target],
+                 chained.supervisedContainer[ts].evaluate(request)[target])
+  # the ROMs trained by the pool report to the message handler of the gate
+  checkSame(name+' parallel message handler',all(rom.messageHandler is mh for rom in parallel.supervisedContainer),True)
+
+### a ROM that can not be trained at once, chained on a pool of processes
+xml = '<ROM name="svr" subType="SciKitLearn"><Features>a,b</Features><Target>y,z,time</Target><pivotParameter>time</pivotParameter>' \
+      '<SKLtype>svm|SVR</SKLtype><kernel>rbf</kernel><C>10.0</C><tol>0.0001</tol>{}</ROM>'
+chained = trainGate(xml.format(''),data)
+parallel = trainGate(xml.format('<trainingProcesses>2</trainingProcesses>'),data)
+checkSame('SVR chained',chained.slicesTrainedTogether,False)
+reference = chained.evaluate(request)
+for target in ['y','z']:
+  checkArray('SVR parallel '+target,parallel.evaluate(request)[target],reference[target])
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.TimeDependentROM</name>
+    <author>agent</author>
+    <created>2026-10-17</created>
+    <classesTested>LearningGate.supervisedLearningGate, SupervisedLearning.SciKitLearn</classesTested>
+    <description>
+       This test performs Unit Tests for the chain of time-dependent SciKitLearn ROMs (one ROM per pivot value):
+       the LinearRegression, Ridge and KNeighborsRegressor ROMs trained at once for all the pivot values, and
+       trained one per pivot value on a pool of processes (trainingProcesses), give the same evaluations as the
+       training of one ROM per pivot value; an SVR ROM trained on a pool of processes gives the serial evaluations.
+    </description>
+  </TestInfo>
+"""
@@ -99,6 +99,60 @@ else:
   print('checking string representation does not match:\n'+msg,'\n!=\n'+right)
   results['fail']+=1
 
+#test columnar collector
+collector = cached_ndarray.cColumnarArray(width=3,length=2)
+for i in range(5):
+  collector.append([float(i),'p'+str(i),np.arange(3.)+i])
+checkAnswer('columnar length',len(collector),5)
+checkAnswer('columnar float column type',collector.getColumn(0).dtype == float,True)
+checkAnswer('columnar float column',collector.getColumn(0)[3],3.0)
+checkAnswer('columnar string column',collector.getColumn(1)[4] == 'p4',True)
+stacked = collector.getStacked(2)
+checkAnswer('columnar stacked shape',stacked.shape == (5,3),True)
+checkAnswer('columnar stacked value',stacked[4,2],6.0)
+#test appended arrays are copied
+history = np.arange(3.)
+collector.append([5.0,'p5',history])
+history[0] = -1.0
+checkAnswer('columnar history copied',collector.getRow(-1)[2][0],0.0)
+#test ragged histories
+collector.append([6.0,'p6',np.arange(4.)])
+checkAnswer('columnar ragged not stacked',collector.getStacked(2) is None,True)
+checkAnswer('columnar ragged length',len(collector.getValue(6,2)),4)
+#test ranges of samples
+checkAnswer('columnar range stacked shape',collector.getStacked(2,2,6).shape == (4,3),True)
+checkAnswer('columnar range stacked value',collector.getStacked(2,2,6)[0,0],2.0)
+checkAnswer('columnar range ragged not stacked',collector.getStacked(2,5,7) is None,True)
+checkAnswer('columnar range ragged column',[len(h) for h in collector.getColumn(2,5,7)] == [3,4],True)
+checkAnswer('columnar range float column',list(collector.getColumn(0,5)) == [5.0,6.0],True)
+checkAnswer('columnar empty range',collector.getStacked(2,7,7) is None,True)
+#test mutable entries are copied
+entity = {'key':[1.0]}
+objects = cached_ndarray.cColumnarArray(width=1)
+objects.append([entity])
+entity['key'].append(2.0)
+checkAnswer('columnar mutable entry copied',len(objects.getValue(0,0)['key']),1)
+entity = [3.0]
+objects.setValue(0,0,entity)
+entity[0] = -1.0
+checkAnswer('columnar mutable set value copied',objects.getValue(0,0)[0],3.0)
+#test type fallback
+collector.append(['seven','p7',np.arange(2.)])
+checkAnswer('columnar object fallback',collector.getColumn(0).dtype == object,True)
+checkAnswer('columnar object fallback value',collector.getValue(2,0),2.0)
+#test set value, add and remove entity
+collector.setValue(-1,1,'a longer prefix')
+checkAnswer('columnar set value',collector.getValue(7,1) == 'a longer prefix',True)
+collector.addEntity([True]*len(collector))
+checkAnswer('columnar add entity',collector.width,4)
+checkAnswer('columnar added value',collector.getRow(3)[3],True)
+collector.removeEntity(1)
+checkAnswer('columnar remove entity',collector.width,3)
+#test construction from columns
+collector = cached_ndarray.cColumnarArray.fromColumns([np.arange(3.),np.ones((3,2))])
+checkAnswer('columnar from columns',collector.getValue(2,0),2.0)
+checkAnswer('columnar from columns stacked',collector.getStacked(1).shape == (3,2),True)
+
 print(results)
 
 sys.exit(results["fail"])
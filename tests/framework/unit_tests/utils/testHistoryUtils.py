@@ -0,0 +1,127 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the historyUtils methods
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os,sys
+import tempfile
+import numpy as np
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+from utils import historyUtils
+
+results = {"pass":0,"fail":0}
+
+def checkArray(comment,value,expected,tol=1e-10):
+  """
+    This method is aimed to compare two arrays of floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, np.ndarray, the values to compare
+    @ In, expected, np.ndarray, the expected values
+    @ In, tol, float, optional, the (relative) tolerance
+    @ Out, None
+  """
+  value = np.asarray(value)
+  expected = np.asarray(expected)
+  if value.shape != expected.shape or not np.allclose(value,expected,rtol=tol,atol=tol):
+    print("checking answer",comment,':',value,"!=",expected)
+    results["fail"] += 1
+  else:
+    results["pass"] += 1
+
+# three histories of different lengths, as stored in a HistorySet
+times = np.empty(3,dtype=object)
+values = np.empty(3,dtype=object)
+times[0], values[0] = np.array([0.0, 1.0, 2.0]), np.array([0.0, 10.0, 30.0])
+times[1], values[1] = np.array([0.5, 1.5]), np.array([1.0, 3.0])
+times[2], values[2] = np.array([1.0, 2.0, 3.0, 4.0]), np.array([4.0, 3.0, 2.0, 5.0])
+
+### packing
+packed, offsets = historyUtils.packHistories(values)
+checkArray('packed values',packed,[0,10,30,1,3,4,3,2,5])
+checkArray('offsets',offsets,[0,3,5,9])
+unpacked = historyUtils.unpackHistories(packed,offsets)
+for h in range(3):
+  checkArray('unpacked history '+str(h),unpacked[h],values[h])
+
+### resampling on a common grid
+grid = np.array([0.0, 0.5, 1.25, 2.0, 3.5])
+linear = historyUtils.resampleHistories(times,{'v':values},grid)['v']
+checkArray('linear extended',linear,[[ 0.0, 5.0, 15.0, 30.0, 30.0],
+                                     [ 1.0, 1.0,  2.5,  3.0,  3.0],
+                                     [ 4.0, 4.0, 3.75,  3.0,  3.5]])
+zeroed = historyUtils.resampleHistories(times,{'v':values},grid,extension='zeroed')['v']
+checkArray('linear zeroed',zeroed,[[ 0.0, 5.0, 15.0, 30.0, 0.0],
+                                   [ 0.0, 1.0,  2.5,  0.0, 0.0],
+                                   [ 0.0, 0.0, 3.75,  3.0, 3.5]])
+step = historyUtils.resampleHistories(times,{'v':values},grid,method='step')['v']
+checkArray('step extended',step,[[ 0.0, 0.0, 10.0, 30.0, 30.0],
+                                 [ 1.0, 1.0,  1.0,  3.0,  3.0],
+                                 [ 4.0, 4.0,  4.0,  3.0,  2.0]])
+### resampling on a grid per history
+ownGrids = np.array([[0.0, 2.0], [0.5, 1.0], [1.0, 4.0]])
+checkArray('linear own grids',historyUtils.resampleHistories(times,{'v':values},ownGrids)['v'],[[0.0,30.0],[1.0,2.0],[4.0,5.0]])
+
+### snapshots
+checkArray('minimum',historyUtils.extremumIndices(packed,offsets,'min'),[0,3,7])
+checkArray('maximum',historyUtils.extremumIndices(packed,offsets,'max'),[2,4,8])
+checkArray('first passage',historyUtils.firstPassageIndices(packed,offsets,3.5),[1,-1,1])
+checkArray('averages',historyUtils.trapezoidalAverages(times,values),[12.5,2.0,9.5/3.0])
+
+### packed files
+labels = np.array(['a','bb','c'],dtype=object)
+packedFile = os.path.join(tempfile.mkdtemp(),'histories.packed')
+historyUtils.writePackedHistories(packedFile,{'x':np.array([1.0,2.0,3.0]),'label':labels},
+                                  {'time':historyUtils.packHistories(times)[0],'v':packed},offsets,
+                                  extra={'blob':np.frombuffer(b'meta',dtype=np.uint8)},info={'pivotParameter':'time'})
+reloaded = historyUtils.PackedHistories(packedFile)
+checkArray('packed file length',len(reloaded),3)
+checkArray('packed file offsets',reloaded.offsets,offsets)
+checkArray('packed file values',reloaded.histories['v'],packed)
+checkArray('packed file scalars',reloaded.scalars['x'],[1.0,2.0,3.0])
+checkArray('packed file strings',reloaded.scalars['label'] == np.array(['a','bb','c']),[True,True,True])
+checkArray('packed file extra',reloaded.extra['blob'].tobytes() == b'meta',True)
+checkArray('packed file info',reloaded.info['pivotParameter'] == 'time',True)
+single = reloaded.history(2)
+checkArray('single history time',single['time'],times[2])
+checkArray('single history values',single['v'],values[2])
+checkArray('single history scalar',single['x'],3.0)
+checkArray('last history values',reloaded.history(-1)['v'],values[2])
+del reloaded, single
+os.remove(packedFile)
+os.rmdir(os.path.dirname(packedFile))
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.historyUtils</name>
+    <author>agent</author>
+    <created>2026-10-16</created>
+    <classesTested>utils.historyUtils</classesTested>
+    <description>
+       This test performs Unit Tests for the historyUtils methods (packing of the histories, vectorized
+       re-sampling and snapshots of all the histories of a HistorySet, packed files)
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,113 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the importerUtils methods
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os,sys
+import collections
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+print('framework:',frameworkDir)
+sys.path.append(frameworkDir)
+
+from utils import importerUtils
+
+results = {"pass":0,"fail":0}
+
+def checkSame(comment,value,expected,updateResults=True):
+  """
+    This method is aimed to compare two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, updateResults, bool, optional, if True updates global results
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if res:
+    if updateResults:
+      results["pass"] += 1
+  else:
+    print("checking answer",comment,value,"!=",expected)
+    if updateResults:
+      results["fail"] += 1
+  return res
+
+# standard library modules that are not imported by this test otherwise
+lazyName = 'colorsys'
+registryName = 'fractions'
+profiledName = 'wave'
+for name in [lazyName,registryName,profiledName]:
+  sys.modules.pop(name,None)
+
+### lazy modules
+lazy = importerUtils.importModuleLazy(lazyName)
+checkSame('Lazy module not imported at creation',lazyName in sys.modules,False)
+checkSame('Lazy module attribute',lazy.rgb_to_hsv(1.0,0.0,0.0),(0.0,1.0,1.0))
+checkSame('Lazy module imported on use',lazyName in sys.modules,True)
+checkSame('Lazy module missing attribute',hasattr(lazy,'notAnAttribute'),False)
+checkSame('Already imported module returned as is',importerUtils.importModuleLazy('collections') is collections,True)
+
+### lazy class registry
+registry = importerUtils.LazyClassRegistry()
+registry['Fraction'] = registryName+'.Fraction'
+registry['Ordered' ] = ('collections.NotAClass','collections.OrderedDict')
+registry['Missing' ] = 'collections.NotAClass'
+registry['Direct'  ] = collections.Counter
+checkSame('Registry keys',sorted(registry.keys()),['Direct','Fraction','Missing','Ordered'])
+checkSame('Registry contains',('Fraction' in registry,'Unknown' in registry),(True,False))
+checkSame('Registry does not import on registration',registryName in sys.modules,False)
+checkSame('Registry class',registry['Fraction'](1,2),sys.modules[registryName].Fraction(2,4))
+checkSame('Registry imports on request',registryName in sys.modules,True)
+checkSame('Registry alternatives',registry['Ordered'] is collections.OrderedDict,True)
+checkSame('Registry direct class',registry['Direct'] is collections.Counter,True)
+checkSame('Registry get missing',registry.get('Missing','default'),'default')
+for key in ['Missing','Unknown']:
+  try:
+    registry[key]
+    checkSame('Registry KeyError '+key,False,True)
+  except KeyError:
+    checkSame('Registry KeyError '+key,True,True)
+checkSame('Registry values skip missing',len(registry.values()),3)
+
+### import profiling
+importerUtils.startImportProfiling()
+import wave
+importerUtils.stopImportProfiling()
+report = importerUtils.importProfilingReport()
+checkSame('Profiled module in report',any(line.split()[-1] == profiledName for line in report.split('\n')[2:]),True)
+checkSame('Builtin import restored',__import__('os') is os,True)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.importerUtils</name>
+    <author>agent</author>
+    <created>2026-10-16</created>
+    <classesTested>utils.importerUtils</classesTested>
+    <description>
+       This test performs Unit Tests for the importerUtils methods (lazy modules, lazy class registries
+       of the factories and import profiling)
+    </description>
+  </TestInfo>
+"""
@@ -272,6 +272,44 @@ engine.seed(42)
 sampled = [engine.random() for _ in range(5)]
 checkArray('Independent RNG, seeded',sampled,correct)
 
+# counter-based random numbers
+## Philox4x32-10 known answers (Random123)
+for counter,key,correct in [((0,0,0,0),(0,0),[0x6627e8d5,0xe169c58d,0xbc57ac4c,0x9b00dbd8]),
+                            ((0x243f6a88,0x85a308d3,0x13198a2e,0x03707344),(0xa4093822,0x299f31d0),[0xd16cfe09,0x94fdcceb,0x5001e420,0x24126ea1])]:
+  words = randomUtils._philox4x32([np.array([c]) for c in counter],key)
+  checkArray('Philox4x32-10 known answer',[int(word[0]) for word in words],correct)
+## values addressed by seed, sample, stream and component
+sampled = randomUtils.counterRandom(42,[0,1,1000],'x',3)
+correct = [[0.52566906, 0.59076075, 0.92576027],
+           [0.10291558, 0.95476581, 0.86770113],
+           [0.06970108, 0.82260052, 0.9680391 ]]
+for i in range(3):
+  checkArray('counterRandom sample %i' %i,sampled[i],correct[i])
+checkArray('counterRandom same sample alone',randomUtils.counterRandom(42,1000,'x',2)[0],correct[2][:2])
+checkArray('counterRandom stream name',randomUtils.counterRandom(42,[1],randomUtils.streamKey('x'),3)[0],correct[1])
+checkTrue('counterRandom other stream',randomUtils.counterRandom(42,[0],'y')[0,0] != correct[0][0],True)
+checkTrue('counterRandom other seed',randomUtils.counterRandom(43,[0],'x')[0,0] != correct[0][0],True)
+checkArray('counterRandomNormal',randomUtils.counterRandomNormal(42,[3],'x',3)[0],[-1.3030329,0.93271854,-1.06179321])
+## moments
+sampled = randomUtils.counterRandom(7,np.arange(100000),0,2)
+checkAnswer('counterRandom mean',np.average(sampled),0.5,tol=5e-3)
+checkAnswer('counterRandom variance',np.var(sampled),1.0/12.0,tol=5e-3)
+
+# bulk draws, in the same order as one value at a time
+randomUtils.randomSeed(42)
+single = [randomUtils.random() for _ in range(12)]
+randomUtils.randomSeed(42)
+bulk = randomUtils.random(4,3)
+checkArray('random bulk draw',bulk.ravel(),single)
+randomUtils.randomSeed(42)
+generator = randomUtils.BoxMullerGenerator()
+single = [generator.generate() for _ in range(9)]
+randomUtils.randomSeed(42)
+generator = randomUtils.BoxMullerGenerator()
+# odd sizes leave a value in the queue, used first by the next draw
+bulk = np.concatenate((generator.generateArray(3),[generator.generate()],generator.generateArray(5)))
+checkArray('Box Muller bulk draw',bulk,single)
+
 print(results)
 
 sys.exit(results["fail"])
@@ -0,0 +1,133 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the SampleRecord class
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os,sys
+import copy
+import pickle
+import collections
+import numpy as np
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+from utils.sampleRecord import SampleRecord
+from utils import utils, mathUtils
+
+results = {"pass":0,"fail":0}
+
+def checkSame(comment,value,expected):
+  """
+    This method is aimed to compare two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ Out, None
+  """
+  if value == expected:
+    results["pass"] += 1
+  else:
+    print("checking answer",comment,':',value,"!=",expected)
+    results["fail"] += 1
+
+# a sampler inputInfo
+inputInfo = {'SampledVars':{'x':1.0,'y':2,'v':np.array([1.0,2.0])},
+             'SampledVarsPb':{'x':0.5,'y':0.25,'v':1.0},
+             'ProbabilityWeight-x':1.0,
+             'prefix':'1',
+             'crowDist':{}}
+
+### snapshot
+record = SampleRecord.fromDict(inputInfo)
+inputInfo['SampledVars']['x'] = -1.0
+inputInfo['SampledVars']['v'][0] = -1.0
+inputInfo['prefix'] = '2'
+checkSame('snapshot scalar',record['SampledVars']['x'],1.0)
+checkSame('snapshot array',record['SampledVars']['v'][0],1.0)
+checkSame('snapshot top level',record['prefix'],'1')
+checkSame('keys',sorted(record.keys()),sorted(inputInfo.keys()))
+checkSame('types preserved',type(record['SampledVars']['y']),int)
+checkSame('equal to dict',record['SampledVarsPb'] == {'x':0.5,'y':0.25,'v':1.0},True)
+checkSame('contains',('x' in record['SampledVars'],'z' in record['SampledVars']),(True,False))
+checkSame('shared schema',record['SampledVarsPb']._schema is SampleRecord.fromDict(inputInfo)['SampledVarsPb']._schema,True)
+
+### keyword arguments, deep copies and copy-on-write
+kwargs = dict(**record)
+clone = copy.deepcopy(kwargs)
+clone['SampledVars']['x'] = 3.0
+clone['SampledVars']['v'][1] = 3.0
+clone['SampledVarsPb'].pop('y')
+checkSame('modified copy',(clone['SampledVars']['x'],clone['SampledVars']['v'][1],len(clone['SampledVarsPb'])),(3.0,3.0,2))
+checkSame('original unchanged',(kwargs['SampledVars']['x'],kwargs['SampledVars']['v'][1],len(kwargs['SampledVarsPb'])),(1.0,2.0,3))
+shallow = record['SampledVars'].copy()
+shallow.update({'z':4.0})
+checkSame('shallow copy on write',('z' in shallow,'z' in record['SampledVars']),(True,False))
+
+### numpy, as for a dictionary
+wrapped = np.atleast_1d(record['SampledVarsPb'])
+checkSame('numpy wraps the record',(wrapped.shape,wrapped[0] is record['SampledVarsPb']),((1,),True))
+wrapped = np.atleast_1d(SampleRecord.fromDict({}))
+checkSame('numpy wraps the empty record',(wrapped.shape,len(wrapped[0])),((1,),0))
+
+### pickling
+unpickled = pickle.loads(pickle.dumps(record,2))
+checkSame('pickled values',(unpickled['SampledVars']['x'],list(unpickled['SampledVars']['v'])),(1.0,[1.0,2.0]))
+checkSame('pickled shared schema',unpickled['SampledVars']._schema is record['SampledVars']._schema,True)
+
+### array-backed values and probabilities
+sampled = SampleRecord.fromDict({'x':1.0,'y':0.5,'z':-2.0})
+names,values = sampled.vector()
+checkSame('array backed',(names,isinstance(values,np.ndarray),values.flags.writeable),(('x','y','z'),True,False))
+checkSame('array values',list(values),[1.0,0.5,-2.0])
+checkSame('array python floats',(type(sampled['y']),sampled['y']),(float,0.5))
+numpyFloats = SampleRecord.fromDict({'x':np.float64(1.0),'y':np.float64(0.5)})
+checkSame('array numpy floats',(isinstance(numpyFloats.vector()[1],np.ndarray),type(numpyFloats['y'])),(True,np.float64))
+checkSame('mixed types in a tuple',isinstance(SampleRecord.fromDict({'x':1.0,'y':np.float64(0.5)}).vector()[1],tuple),True)
+checkSame('nested array backed',isinstance(record['SampledVarsPb'].vector()[1],np.ndarray),True)
+checkSame('nested not all floats',isinstance(record['SampledVars'].vector()[1],tuple),True)
+deep = copy.deepcopy(sampled)
+deep['x'] = 3.0
+checkSame('array copy on write',(deep['x'],sampled['x'],deep.vector()[1] is not values),(3.0,1.0,True))
+checkSame('array shared by copies',copy.deepcopy(sampled).vector()[1] is values,True)
+unpickled = pickle.loads(pickle.dumps(sampled,2))
+checkSame('pickled array',(dict(unpickled) == dict(sampled),type(unpickled['x']),unpickled.vector()[1].flags.writeable),(True,float,False))
+
+# the dictionary checks of the framework accept the records
+checkSame('records are mappings',(utils.isAMapping(record),utils.isAMapping(record['SampledVars']),utils.isAMapping(sampled)),(True,True,True))
+checkSame('other mappings',(utils.isAMapping({}),utils.isAMapping(collections.OrderedDict()),utils.isAMapping([('x',1.0)])),(True,True,False))
+converted = mathUtils.convertNumpyToLists(SampleRecord.fromDict({'v':np.array([1.0,2.0]),'x':1.0}))
+checkSame('converted record',(converted['v'],converted['x']),([1.0,2.0],1.0))
+checkSame('record to bytes',utils.toBytesIterative(SampleRecord.fromDict({'x':'a'})),{b'x':b'a'})
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.sampleRecord</name>
+    <author>agent</author>
+    <created>2026-10-16</created>
+    <classesTested>utils.sampleRecord.SampleRecord</classesTested>
+    <description>
+       This test performs Unit Tests for the SampleRecord class (copy-on-write snapshots of the sampler information)
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,182 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the streamingStatistics module
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os,sys
+import numpy as np
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+from utils import streamingStatistics
+print (streamingStatistics)
+
+results = {"pass":0,"fail":0}
+
+def checkArray(comment,value,expected,tol=1e-10):
+  """
+    This method is aimed to compare two arrays of floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, np.ndarray, the values to compare
+    @ In, expected, np.ndarray, the expected values
+    @ In, tol, float, optional, the (relative) tolerance
+    @ Out, None
+  """
+  value = np.asarray(value)
+  expected = np.asarray(expected)
+  if value.shape != expected.shape or not np.allclose(value,expected,rtol=tol,atol=tol):
+    print("checking answer",comment,':',value,"!=",expected)
+    results["fail"] += 1
+  else:
+    results["pass"] += 1
+
+def checkTrue(comment,value,expected):
+  """
+    Takes a value and checks it against the expected one.
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ Out, None
+  """
+  if value == expected:
+    results["pass"] += 1
+  else:
+    print("checking answer",comment,value,"!=",expected)
+    results["fail"] += 1
+
+# samples shaped as (#samples,#variables,#pivotValues)
+rng = np.random.RandomState(42)
+numSamples, numVars, numPivot = 503, 3, 4
+samples = rng.normal(size=(numSamples,numVars,numPivot))**3
+weights = rng.uniform(size=(numSamples,numVars))
+rlzWeights = rng.uniform(size=numSamples)
+unitWeights = np.ones((numSamples,numVars))
+chunks = [slice(start,start+100) for start in range(0,numSamples,100)]
+
+#
+# WeightedMoments
+#
+whole = streamingStatistics.WeightedMoments.fromSamples(samples,weights)
+chunked = streamingStatistics.WeightedMoments()
+for chunk in chunks:
+  chunked.update(samples[chunk],weights[chunk])
+checkTrue('moments count',chunked.count,numSamples)
+for moment in ['mean','m2','m3','m4','minimum','maximum']:
+  checkArray('moments chunked '+moment,getattr(chunked,moment),getattr(whole,moment))
+# merging two accumulators is the same as accumulating all the samples
+first = streamingStatistics.WeightedMoments.fromSamples(samples[:200],weights[:200])
+first.merge(streamingStatistics.WeightedMoments.fromSamples(samples[200:],weights[200:]))
+checkArray('moments merged variance',first.variance(),whole.variance())
+checkArray('moments merged kurtosis',first.kurtosis(),whole.kurtosis())
+# weighted mean and variance
+normWeights = weights/weights.sum(axis=0)
+mean = np.sum(normWeights[:,:,None]*samples,axis=0)
+v2 = np.sum(normWeights**2,axis=0)[:,None]
+checkArray('moments weighted mean',chunked.mean,mean)
+checkArray('moments weighted variance',chunked.variance(),np.sum(normWeights[:,:,None]*(samples-mean)**2,axis=0)/(1.0-v2))
+checkArray('moments biased weighted variance',chunked.variance(True),np.sum(normWeights[:,:,None]*(samples-mean)**2,axis=0))
+# with unit weights the unweighted estimators are obtained
+unweighted = streamingStatistics.WeightedMoments()
+for chunk in chunks:
+  unweighted.update(samples[chunk],unitWeights[chunk])
+n = float(numSamples)
+deviation = samples - samples.mean(axis=0)
+checkArray('moments variance',unweighted.variance(),samples.var(axis=0,ddof=1))
+checkArray('moments biased variance',unweighted.variance(True),samples.var(axis=0))
+checkArray('moments skewness',unweighted.skewness(),np.sum(deviation**3,axis=0)/n*n**2/((n-1)*(n-2))/samples.var(axis=0,ddof=1)**1.5)
+checkArray('moments biased skewness',unweighted.skewness(True),np.mean(deviation**3,axis=0)/samples.var(axis=0)**1.5)
+c0 = n*(n**2-2*n+3)/((n-1)*(n-2)*(n-3))
+c1 = 3*n*(2*n-3)/((n-1)*(n-2)*(n-3))
+checkArray('moments kurtosis',unweighted.kurtosis(),-3.0+(np.mean(deviation**4,axis=0)*c0-samples.var(axis=0)**2*c1)/samples.var(axis=0,ddof=1)**2)
+checkArray('moments biased kurtosis',unweighted.kurtosis(True),-3.0+np.mean(deviation**4,axis=0)/samples.var(axis=0)**2)
+checkArray('moments minimum',unweighted.minimum,samples.min(axis=0),0.0)
+checkArray('moments maximum',unweighted.maximum,samples.max(axis=0),0.0)
+# a constant variable has no spread, even if the rounding of its sums does not give back its value
+constant = streamingStatistics.WeightedMoments()
+for chunk in [slice(0,3),slice(3,4)]:
+  constant.update(np.full((4,1,1),0.1)[chunk],np.ones((4,1))[chunk])
+checkArray('moments constant mean',constant.mean,np.full((1,1),0.1),0.0)
+checkArray('moments constant variance',constant.variance(),np.zeros((1,1)),0.0)
+
+#
+# WeightedCoMoments
+#
+coMoments = streamingStatistics.WeightedCoMoments()
+for chunk in chunks:
+  coMoments.update(samples[chunk],rlzWeights[chunk])
+covariance = coMoments.covariance()
+for t in range(numPivot):
+  checkArray('covariance pivot '+str(t),covariance[t],np.cov(samples[:,:,t].T,aweights=rlzWeights))
+  checkArray('biased covariance pivot '+str(t),coMoments.covariance(True)[t],np.cov(samples[:,:,t].T,aweights=rlzWeights,bias=True))
+# deviations from other means
+means = np.zeros((numPivot,numVars))
+shifted = np.sum(rlzWeights[:,None,None,None]*samples.transpose(0,2,1)[:,:,:,None]*samples.transpose(0,2,1)[:,:,None,:],axis=0)/rlzWeights.sum()
+checkArray('biased second moment',coMoments.covariance(True,means),shifted)
+# constant variables have no spread
+constant = streamingStatistics.WeightedCoMoments()
+constant.update(np.full((3,2,1),0.1),np.ones(3))
+checkArray('constant covariance',constant.covariance(),np.zeros((1,2,2)),0.0)
+
+#
+# QuantileSketch
+#
+sketch = streamingStatistics.QuantileSketch(size=numSamples)
+for chunk in chunks:
+  sketch.update(samples[chunk],unitWeights[chunk])
+checkTrue('sketch exact',sketch.compressed,False)
+percents = [0.05,0.5,0.95]
+lower = np.asarray([np.sort(samples,axis=0)[int(np.floor(p*(numSamples-1)))] for p in percents])
+checkArray('sketch lower quantiles',sketch.quantile(percents,'lower'),lower,0.0)
+checkArray('sketch median',sketch.quantile([0.5],'midpoint')[0],np.median(samples,axis=0),0.0)
+# weighted percentile, the first point with cumulative weight above the percent
+weightedSketch = streamingStatistics.QuantileSketch(size=numSamples)
+weightedSketch.update(samples,weights)
+order = np.argsort(samples[:,0,0])
+cdf = np.cumsum(weights[order,0])/weights[:,0].sum()
+expected = samples[order,0,0][np.sum(cdf <= 0.3)]
+checkArray('sketch weighted percentile',weightedSketch.quantile([0.3])[0,0,0],expected,0.0)
+# compressed sketches give approximated quantiles
+small = streamingStatistics.QuantileSketch(size=50)
+other = streamingStatistics.QuantileSketch(size=50)
+for c, chunk in enumerate(chunks):
+  (small if c%2 else other).update(samples[chunk],unitWeights[chunk])
+small.merge(other)
+checkTrue('sketch compressed',small.compressed,True)
+checkTrue('sketch size',small.values.shape[1] <= 100,True)
+estimated = small.quantile(percents,'lower')
+ranks = np.asarray([[[np.searchsorted(np.sort(samples[:,v,t]),estimated[p,v,t]) for t in range(numPivot)] for v in range(numVars)] for p in range(len(percents))])
+checkTrue('sketch compressed accuracy',np.all(np.abs(ranks/float(numSamples)-np.asarray(percents)[:,None,None]) < 0.05),True)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.streamingStatistics</name>
+    <author>agent</author>
+    <created>2026-10-16</created>
+    <classesTested>utils.streamingStatistics</classesTested>
+    <description>
+       This test performs Unit Tests for the mergeable accumulators of the streamingStatistics module
+       It cannot be considered part of the active code but of the regression test system
+    </description>
+  </TestInfo>
+"""
@@ -172,7 +172,38 @@ checkSame('Equivalency only text !=:',a!=b,False)
 ##############
 # Tree Tests #
 ##############
-# TODO
+# node index
+root = TS.HierarchicalNode(mh,'root')
+tree = TS.HierarchicalTree(mh,root)
+branch = TS.HierarchicalNode(mh,'branch1')
+root.appendBranch(branch)
+subBranch = TS.HierarchicalNode(mh,'branch1-1')
+branch.appendBranch(subBranch)
+checkSame('Node index root:',tree.getNode('root') is root,True)
+checkSame('Node index branch:',tree.getNode('branch1') is branch,True)
+checkSame('Node index sub-branch:',tree.getNode('branch1-1') is subBranch,True)
+checkSame('Node index missing:',tree.getNode('branch2'),None)
+# subtrees built before being appended are indexed as well
+detached = TS.HierarchicalNode(mh,'branch2')
+detached.appendBranch(TS.HierarchicalNode(mh,'branch2-1'))
+branch.insertBranch(0,detached)
+checkSame('Node index appended subtree:',tree.getNode('branch2-1') is detached.findBranch('branch2-1'),True)
+detached.appendBranch(TS.HierarchicalNode(mh,'branch2-2'))
+checkSame('Node index appended to subtree:',tree.getNode('branch2-2').getParentName(),'branch2')
+# same result as iterating over the tree
+checkSame('Node index vs iter:',tree.getNode('branch2-2') is list(tree.iter('branch2-2'))[0],True)
+# removed subtrees are not indexed anymore
+branch.removeBranch(detached)
+checkSame('Node index removed subtree:',tree.getNode('branch2'),None)
+checkSame('Node index removed sub-branch:',tree.getNode('branch2-1'),None)
+# renamed nodes are indexed with their new name
+tree.updateNodeName('branch1','renamed')
+checkSame('Node index old name:',tree.getNode('branch1'),None)
+checkSame('Node index new name:',tree.getNode('renamed') is branch,True)
+tree.updateNodeName('root','newRoot')
+checkSame('Node index new root name:',tree.getNode('newRoot') is root,True)
+branch.clearBranch()
+checkSame('Node index cleared branch:',tree.getNode('branch1-1'),None)
 
 ##################
 # Metadata Tests #